@@ -710,7 +710,7 @@ EOF
             echo "Installiere Flask..."
             echo "XXX"
             "$INSTALL_DIR/venv/bin/pip" install --quiet --upgrade pip >/dev/null 2>&1
-            "$INSTALL_DIR/venv/bin/pip" install --quiet flask >/dev/null 2>&1
+            "$INSTALL_DIR/venv/bin/pip" install --quiet flask gunicorn >/dev/null 2>&1
             
             # Erstelle Verzeichnisstruktur
             echo "80"
@@ -728,6 +728,7 @@ EOF
             cat > "$INSTALL_DIR/services/disk2iso-web/requirements.txt" <<'EOFREQ'
 # disk2iso Web-Server Dependencies
 flask>=2.0.0
+gunicorn>=20.1.0
 EOFREQ
             
             echo "100"
@@ -1150,7 +1151,7 @@ EOF
             echo "Installiere Flask..."
             echo "XXX"
             "$INSTALL_DIR/venv/bin/pip" install --quiet --upgrade pip >/dev/null 2>&1
-            "$INSTALL_DIR/venv/bin/pip" install --quiet flask >/dev/null 2>&1
+            "$INSTALL_DIR/venv/bin/pip" install --quiet flask gunicorn >/dev/null 2>&1
             
             # Erstelle Verzeichnisstruktur
             echo "80"
@@ -1168,6 +1169,7 @@ EOF
             cat > "$INSTALL_DIR/services/disk2iso-web/requirements.txt" <<'EOFREQ'
 # disk2iso Web-Server Dependencies
 flask>=2.0.0
+gunicorn>=20.1.0
 EOFREQ
             
             echo "100"
@@ -2044,7 +2046,7 @@ install_web_server() {
             echo "60"
             
             "$INSTALL_DIR/venv/bin/pip" install --upgrade pip --quiet >/dev/null 2>&1
-            "$INSTALL_DIR/venv/bin/pip" install flask >/dev/null 2>&1
+            "$INSTALL_DIR/venv/bin/pip" install flask gunicorn >/dev/null 2>&1
             
             # Erstelle Web-Verzeichnisstruktur
             echo "XXX"
@@ -2076,7 +2078,7 @@ install_web_server() {
         
         print_info "Installiere Flask..."
         "$INSTALL_DIR/venv/bin/pip" install --upgrade pip >/dev/null 2>&1
-        "$INSTALL_DIR/venv/bin/pip" install flask >/dev/null 2>&1
+        "$INSTALL_DIR/venv/bin/pip" install flask gunicorn >/dev/null 2>&1
         
         print_info "Erstelle Verzeichnisstruktur..."
         mkdir -p "$INSTALL_DIR/services/disk2iso-web/templates"
@@ -2094,6 +2096,7 @@ install_web_server() {
 # Install: /opt/disk2iso/venv/bin/pip install -r requirements.txt
 
 flask>=2.0.0
+gunicorn>=20.1.0
 EOF
     
     # Installiere Web-Server Service (disk2iso-web)
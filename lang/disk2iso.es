@@ -34,6 +34,15 @@ readonly MSG_FIX_PERMISSIONS="Ejecute: sudo chmod -R 777"
 readonly MSG_STATE_MACHINE_STARTED="Máquina de estados iniciada"
 readonly MSG_ERROR_UNKNOWN_STATE="ERROR: Estado desconocido:"
 
+# ============================================================================
+# VARIAS UNIDADES
+# ============================================================================
+
+readonly MSG_MULTI_DRIVE_STARTED="Modo multiunidad, unidades supervisadas:"
+readonly MSG_DRIVE_WORKER_STARTED="Proceso de unidad iniciado:"
+readonly MSG_DRIVE_WORKER_RESTARTED="Proceso de unidad terminado, reiniciando:"
+readonly MSG_ERROR_DRIVE_API_INIT="ERROR: No se puede crear el directorio API de la unidad:"
+
 # ============================================================================
 # CONTROL DEL SERVICIO
 # ============================================================================
@@ -81,6 +81,7 @@ readonly MSG_INSTALL_GENISOIMAGE_GDDRESCUE="Instalación: apt-get install geniso
 # ============================================================================
 
 readonly MSG_METHOD_DDRESCUE="Método: Copia robusta"
+readonly MSG_METHOD_NATIVE="Método: Motor de copia (bloques grandes)"
 
 # ============================================================================
 # PROCESO DE COPIA (DISCO DE DATOS)
@@ -95,6 +96,19 @@ readonly MSG_COPYING_COMPLETE_DISC="Copiando disco completo (isoinfo no disponib
 readonly MSG_DATA_PROGRESS="Progreso disco de datos:"
 readonly MSG_DATA_DISC_SUCCESS_DDRESCUE="✓ Disco de datos copiado exitosamente"
 readonly MSG_ERROR_DDRESCUE_FAILED="ERROR: ddrescue falló"
+readonly MSG_DATA_DISC_SUCCESS_NATIVE="✓ Disco de datos copiado correctamente"
+readonly MSG_ERROR_NATIVE_FAILED="ERROR: El motor de copia falló"
+readonly MSG_WARNING_NATIVE_BAD_SECTORS="Sectores defectuosos rellenados con ceros:"
+readonly MSG_CHECKSUM_WRITTEN="Suma de verificación escrita:"
+readonly MSG_WARNING_NO_CHECKSUMS="No se calcularon sumas de verificación - faltan archivos auxiliares"
+readonly MSG_WARNING_CHECKSUM_WRITE_FAILED="No se pudo escribir el archivo de suma de verificación:"
+readonly MSG_VERIFY_PROGRESS="Verificación:"
+readonly MSG_INFO_VERIFY_START="Comparando la ISO con el disco"
+readonly MSG_INFO_VERIFY_OK="✓ Verificación: la ISO coincide con el disco"
+readonly MSG_WARNING_VERIFY_REPAIRED="Verificación: sectores divergentes releídos y reparados:"
+readonly MSG_ERROR_VERIFY_MISMATCH="ERROR: Verificación - sectores divergentes:"
+readonly MSG_ERROR_VERIFY_FAILED="ERROR: La verificación falló"
+readonly MSG_WARNING_VERIFY_UNAVAILABLE="Verificación no disponible (falta python3 o copy_engine.py)"
 
 readonly MSG_PROGRESS="Progreso:"
 readonly MSG_PROGRESS_OF="MB /"
@@ -115,6 +129,9 @@ readonly MSG_STATUS_WAITING_MEDIA="Esperando medio..."
 readonly MSG_WARNING_TEMP_DIR_DELETE_FAILED="⚠ No se pudo eliminar el directorio temporal, intentando con permisos elevados"
 readonly MSG_REMAINING="Restante"
 readonly MSG_COPIED="copiado"
+readonly MSG_WARNING_COPY_STALLED="⚠ Copia detenida - sin progreso desde hace"
+readonly MSG_INFO_COPY_RESUMED="La copia continúa"
+readonly MSG_READ_ERRORS="errores de lectura"
 
 # ============================================================================
 # MENSAJES DE ERROR (VERIFICACIÓN DE DEPENDENCIAS)
@@ -132,8 +149,10 @@ readonly MSG_ERROR_AUDIO_MODULE_NOT_INSTALLED="El módulo de audio (libaudio.sh)
 readonly MSG_INFO_INSTALL_AUDIO_MODULE="Instale el módulo de audio para copiar Audio-CDs (cdparanoia + lame)"
 
 readonly MSG_INFO_COPY_WITH_DDRESCUE="Copiando disco de datos con ddrescue (robusto)"
+readonly MSG_INFO_COPY_WITH_NATIVE="Copiando disco de datos con el motor de copia (rápido)"
 readonly MSG_INFO_COPY_WITH_DD="Copiando disco de datos con dd (estándar)"
 readonly MSG_WARNING_DDRESCUE_FALLBACK="ddrescue falló - intentando alternativa con dd"
+readonly MSG_WARNING_NATIVE_FALLBACK="El motor de copia falló - intentando alternativa con dd"
 readonly MSG_ERROR_DD_COPY_FAILED="La copia del disco de datos con dd falló"
 
 # ============================================================================
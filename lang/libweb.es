@@ -17,6 +17,7 @@ readonly MSG_INDEX_HEADER="Estado Actual"
 readonly MSG_INDEX_STATE="Estado"
 readonly MSG_INDEX_DISC_TYPE="Tipo de Medio"
 readonly MSG_INDEX_DISC_NAME="Medio"
+readonly MSG_INDEX_MODE="Modo"
 readonly MSG_INDEX_PROGRESS="Progreso"
 readonly MSG_INDEX_NO_DRIVE="Unidad no detectada"
 readonly MSG_INDEX_NO_MEDIA="No hay medio insertado"
@@ -185,6 +186,7 @@ readonly MSG_API_ERROR_RELEASE_ID_REQUIRED="Se requiere ID de lanzamiento de Mus
 readonly MSG_API_ERROR_REMASTER_FAILED="Error al remasterizar el ISO de audio"
 readonly MSG_API_ERROR_REMASTER_TIMEOUT="Tiempo de espera: El proceso de remasterización tarda demasiado"
 readonly MSG_API_SUCCESS_REMASTER="ISO de audio recreado exitosamente con etiquetas correctas"
+readonly MSG_API_SUCCESS_REMASTER_STARTED="Remasterización iniciada"
 readonly MSG_API_SUCCESS_SELECTION="Seleccionado por el usuario"
 
 # Modal TMDB/MusicBrainz
@@ -9,6 +9,9 @@
 #   - Schreibt JSON für Web-UI und externe Tools
 #   - api_write_json(), api_update_status(), api_update_progress()
 #   - api_add_history()
+#   - api_set_verify_result() (Ergebnis der Verifikation in attributes.json)
+#   - api_init_drive(), api_write_drives() (mehrere Laufwerke: Status je
+#     Laufwerk unter api/drives/<name>/, Liste in api/drives.json)
 #
 #
 # -----------------------------------------------------------------------------
@@ -69,6 +72,10 @@ api_check_dependencies() {
 # API-Verzeichnis (via libfolders.sh)
 API_DIR=""
 
+# Dateien mit Disc-Status, die im Laufwerks-Worker (DRIVE_NAME gesetzt) im
+# Namensraum des Laufwerks liegen: api/drives/<name>/<datei>
+readonly API_DRIVE_FILES="status.json attributes.json progress.json"
+
 # ===========================================================================
 # api_check_dependencies (Alias-Kommentar für Initialisierung)
 # ---------------------------------------------------------------------------
@@ -99,26 +106,102 @@ api_init() {
     return 0
 }
 
-# TODO: Ab hier ist das Modul noch nicht fertig implementiert!
+# ===========================================================================
+# api_init_drive
+# ---------------------------------------------------------------------------
+# Funktion.: Initialisiere den API-Namensraum des Laufwerks-Workers
+# Parameter: keine (nutzt DRIVE_NAME)
+# Rückgabe.: 0 = OK, 1 = Verzeichnis nicht erstellbar
+# Extras...: Erstellt api/drives/<name>/ - den ersten Status schreibt die
+# .........  State Machine beim Start (STATE_INITIALIZING)
+# ===========================================================================
+api_init_drive() {
+    [[ -n "$DRIVE_NAME" ]] || return 0
+    
+    mkdir -p "${API_DIR}/drives/${DRIVE_NAME}" 2>/dev/null || return 1
+    chmod 755 "${API_DIR}/drives" "${API_DIR}/drives/${DRIVE_NAME}" 2>/dev/null || true
+    
+    return 0
+}
 
+# ===========================================================================
+# api_write_drives
+# ---------------------------------------------------------------------------
+# Funktion.: Schreibe die Liste der überwachten Laufwerke (drives.json)
+# Parameter: $@ = Device-Pfade, das erste ist das primäre Laufwerk
+# Rückgabe.: 0 = OK, 1 = Fehler
+# Extras...: Die Web-UI liest den Status je Laufwerk aus api/drives/<name>/
+# .........  Ohne Parameter (Einzelbetrieb) ist die Liste leer
+# ===========================================================================
+api_write_drives() {
+    local entries=()
+    local device primary="true"
+    
+    for device in "$@"; do
+        entries+=("{\"name\": \"$(drivestat_drive_name "$device")\", \"device\": \"${device}\", \"primary\": ${primary}}")
+        primary="false"
+    done
+    
+    local timestamp drives_json
+    printf -v timestamp '%(%Y-%m-%dT%H:%M:%S)T' -1
+    local IFS=','
+    printf -v drives_json '{\n  "drives": [%s],\n  "timestamp": "%s"\n}' "${entries[*]}" "$timestamp"
+    
+    api_write_json "drives.json" "${drives_json}"
+}
 
 # ============================================================================
 # LOW-LEVEL HELPER
 # ============================================================================
 
+# ===========================================================================
+# api_file_path
+# ---------------------------------------------------------------------------
+# Funktion.: Pfad einer API-Datei
+# Parameter: $1 = Dateiname (z.B. "status.json")
+# Ausgabe..: ${API_DIR}/<datei> bzw. für Disc-Status im Laufwerks-Worker
+# .........  ${API_DIR}/drives/<name>/<datei>
+# ===========================================================================
+api_file_path() {
+    local filename="$1"
+    
+    if [[ -n "$DRIVE_NAME" ]] && [[ " $API_DRIVE_FILES " == *" $filename "* ]]; then
+        echo "${API_DIR}/drives/${DRIVE_NAME}/${filename}"
+    else
+        echo "${API_DIR}/${filename}"
+    fi
+}
+
 # Funktion: Schreibe JSON in API-Datei (atomic write)
 # Parameter: $1 = Dateiname (z.B. "status.json"), $2 = JSON-Content
 # Rückgabe: 0 = OK, 1 = Fehler
+# Hinweis: Im Laufwerks-Worker landet der Disc-Status in api/drives/<name>/,
+#          das primäre Laufwerk spiegelt ihn zusätzlich nach api/ (bisherige
+#          Leser wie MQTT und ältere Web-UI-Seiten)
 api_write_json() {
     local filename="$1"
     local json_content="$2"
     
     # Schreibe JSON-Datei (atomar mit temp-file)
     # API_DIR wurde bereits in api_init() via folders_get_api_dir() erstellt
-    local temp_file="${API_DIR}/.${filename}.tmp"
+    # Zielpfad wie api_file_path(), aber ohne Subshell (Fortschritt jede Sekunde)
+    local target="${API_DIR}/${filename}"
+    if [[ -n "$DRIVE_NAME" ]] && [[ " $API_DRIVE_FILES " == *" $filename "* ]]; then
+        target="${API_DIR}/drives/${DRIVE_NAME}/${filename}"
+    fi
+    local temp_file="${target%/*}/.${filename}.tmp"
     echo "$json_content" > "$temp_file" 2>/dev/null || return 1
-    mv -f "$temp_file" "${API_DIR}/${filename}" 2>/dev/null || return 1
-    chmod 644 "${API_DIR}/${filename}" 2>/dev/null || true
+    mv -f "$temp_file" "$target" 2>/dev/null || return 1
+    chmod 644 "$target" 2>/dev/null || true
+    
+    # Spiegel des primären Laufwerks in api/
+    if [[ "$target" != "${API_DIR}/${filename}" ]]; then
+        [[ "${DRIVE_PRIMARY:-true}" == "true" ]] || return 0
+        temp_file="${API_DIR}/.${filename}.tmp"
+        echo "$json_content" > "$temp_file" 2>/dev/null || return 1
+        mv -f "$temp_file" "${API_DIR}/${filename}" 2>/dev/null || return 1
+        chmod 644 "${API_DIR}/${filename}" 2>/dev/null || true
+    fi
     
     # Benachrichtige Observer über Änderung
     notify_api_update "$filename"
@@ -136,7 +219,8 @@ api_write_json() {
 # ===========================================================================
 api_read_json() {
     local filename="$1"
-    local filepath="${API_DIR}/${filename}"
+    local filepath
+    filepath=$(api_file_path "$filename")
     
     # Prüfe ob Datei existiert
     if [[ ! -f "$filepath" ]]; then
@@ -179,10 +263,46 @@ notify_api_update() {
     return 0
 }
 
+# ===========================================================================
+# api_notify_archive_change
+# ---------------------------------------------------------------------------
+# Funktion.: Meldet eine geänderte Archiv-Datei an den Archiv-Index der
+# .........  Web-UI (archive_index.py), damit dieser nicht das komplette
+# .........  Ausgabeverzeichnis neu durchsuchen muss
+# Parameter: $1 = Pfad der ISO-Datei (oder Verzeichnis) im Ausgabeverzeichnis
+# Rückgabe.: 0 (Fehler werden ignoriert - Index fällt auf Rescan zurück)
+# Beschr...: Hängt den Pfad an ${API_DIR}/archive_changes.queue an. Die
+# .........  Web-UI übernimmt die Queue per rename und gleicht die
+# .........  betroffenen Verzeichnisse ab (ISO, .nfo, -thumb.jpg)
+# ===========================================================================
+api_notify_archive_change() {
+    local changed_path="$1"
+    
+    [[ -z "$changed_path" ]] && return 0
+    [[ -z "$API_DIR" ]] && return 0
+    
+    # Einzeiliges Append ist atomar (< PIPE_BUF), Leser benennt Datei um
+    printf '%s\n' "$changed_path" >> "${API_DIR}/archive_changes.queue" 2>/dev/null || true
+    
+    return 0
+}
+
 # ============================================================================
 # STATUS UPDATES
 # ============================================================================
 
+# Ergebnis der letzten Verifikation (JSON-Objekt), bleibt bis zur Analyse
+# der nächsten Disc in attributes.json erhalten
+API_VERIFY_RESULT=""
+
+# Funktion: Setze Ergebnis der Verifikation
+# Parameter:
+#   $1 = JSON-Objekt (Bericht von copy_engine.py verify)
+# Hinweis: Erscheint beim nächsten api_update_status() als "verify"
+api_set_verify_result() {
+    API_VERIFY_RESULT="$1"
+}
+
 # Funktion: Update Status
 # Parameter:
 #   $1 = Status (idle/waiting/copying/completed/error)
@@ -198,6 +318,9 @@ api_update_status() {
     
     local timestamp=$(date '+%Y-%m-%dT%H:%M:%S')
     
+    # Neue Disc: Ergebnis der letzten Verifikation verwerfen
+    [[ "$status" == "analyzing" ]] && API_VERIFY_RESULT=""
+    
     # Schreibe status.json
     local status_json=$(cat <<EOF
 {
@@ -228,6 +351,7 @@ EOF
   "filename": "${filename}",
   "method": "${method}",
   "container_type": "${container}",
+  "verify": ${API_VERIFY_RESULT:-null},
   "error_message": ${error_msg:+"\"${error_msg}\""}${error_msg:-null}
 }
 EOF
@@ -252,26 +376,26 @@ EOF
 #   $2 = Kopierte MB
 #   $3 = Gesamt MB
 #   $4 = ETA (Format: "HH:MM:SS" oder leer)
+#   $5 = Durchsatz in MB/s (optional, z.B. "12.5")
+#   $6 = Stillstand erkannt (optional, "true"/"false")
 # Schreibt: progress.json
+# Hinweis: Wird während des Kopierens bis zu einmal pro Sekunde aufgerufen,
+#          daher ohne Subshells (printf statt date/cat)
 api_update_progress() {
     local percent="$1"
     local copied_mb="${2:-0}"
     local total_mb="${3:-0}"
     local eta="${4:-}"
+    local speed="${5:-0}"
+    local stalled="${6:-false}"
     
-    local timestamp=$(date '+%Y-%m-%dT%H:%M:%S')
+    local timestamp
+    printf -v timestamp '%(%Y-%m-%dT%H:%M:%S)T' -1
     
     # Schreibe progress.json
-    local progress_json=$(cat <<EOF
-{
-  "percent": ${percent},
-  "copied_mb": ${copied_mb},
-  "total_mb": ${total_mb},
-  "eta": "${eta}",
-  "timestamp": "${timestamp}"
-}
-EOF
-)
+    local progress_json
+    printf -v progress_json '{\n  "percent": %s,\n  "copied_mb": %s,\n  "total_mb": %s,\n  "eta": "%s",\n  "speed_mb_s": %s,\n  "stalled": %s,\n  "timestamp": "%s"\n}' \
+        "$percent" "$copied_mb" "$total_mb" "$eta" "$speed" "$stalled" "$timestamp"
     api_write_json "progress.json" "${progress_json}"
     
     return 0
@@ -289,6 +413,8 @@ EOF
 #   $4 = Ergebnis (success/error)
 #   $5 = Fehlermeldung (optional, bei error)
 # Schreibt: history.json (append)
+# Hinweis: Mehrere Laufwerks-Worker teilen sich die Datei, daher
+#          Lesen-Ändern-Schreiben unter flock
 api_add_history() {
     local status="$1"
     local label="$2"
@@ -298,17 +424,11 @@ api_add_history() {
     
     local timestamp=$(date '+%Y-%m-%dT%H:%M:%S')
     
-    # Lese bestehende History (max 50 Einträge)
-    local history_file="${API_DIR}/history.json"
-    local history="[]"
-    if [[ -f "$history_file" ]]; then
-        history=$(cat "$history_file" 2>/dev/null || echo "[]")
-    fi
-    
     # Neuer Eintrag
     local entry=$(cat <<EOF
 {
   "timestamp": "${timestamp}",
+  "drive": "${DRIVE_NAME}",
   "label": "${label}",
   "type": "${type}",
   "status": "${status}",
@@ -318,16 +438,28 @@ api_add_history() {
 EOF
 )
     
-    # Füge Eintrag hinzu (am Anfang, neueste zuerst)
-    # Nutze jq falls verfügbar, sonst einfaches JSON-Array-Append
-    if command -v jq >/dev/null 2>&1; then
-        history=$(echo "$history" | jq ". |= [${entry}] + . | .[0:50]" 2>/dev/null || echo "[]")
-    else
-        # Fallback ohne jq: Einfaches Prepend (nicht schön aber funktioniert)
-        history="[${entry}]"
-    fi
-    
-    api_write_json "history.json" "${history}"
+    local history_file="${API_DIR}/history.json"
+    (
+        # Ohne flock (oder bei Timeout) wie bisher ungeschützt schreiben
+        command -v flock >/dev/null 2>&1 && flock -w 10 9
+        
+        # Lese bestehende History (max 50 Einträge)
+        local history="[]"
+        if [[ -f "$history_file" ]]; then
+            history=$(cat "$history_file" 2>/dev/null || echo "[]")
+        fi
+        
+        # Füge Eintrag hinzu (am Anfang, neueste zuerst)
+        # Nutze jq falls verfügbar, sonst einfaches JSON-Array-Append
+        if command -v jq >/dev/null 2>&1; then
+            history=$(echo "$history" | jq ". |= [${entry}] + . | .[0:50]" 2>/dev/null || echo "[]")
+        else
+            # Fallback ohne jq: Einfaches Prepend (nicht schön aber funktioniert)
+            history="[${entry}]"
+        fi
+        
+        api_write_json "history.json" "${history}"
+    ) 9>"${API_DIR}/.history.lock"
     
     return 0
 }
@@ -7,7 +7,14 @@
 # Beschreibung:
 #   Gemeinsame Kern-Funktionen fr alle Module
 #   - common_copy_data_disc(), common_copy_data_disc_ddrescue()
+#   - common_copy_data_disc_native() (copy_engine.py: groe Blcke,
+#     Lese-/Schreib-Thread, sektorweise Fehlerbehandlung)
+#   - Prfsummen im Kopier-Durchlauf: common_hash_stream(),
+#     common_write_checksums() (.md5/.sha256/.b3 neben der ISO)
+#   - Verifikation nach dem Kopieren: common_verify_copy() (VERIFY_COPY)
 #   - common_cleanup_disc_operation(), common_monitor_copy_progress()
+#   - Fortschritt: common_read_copy_progress() (dd/ddrescue Statusausgabe),
+#     common_progress_update() (EWMA-Durchsatz, Stillstand, progress.json)
 #   - Fehler-Tracking: common_register_disc_failure(), common_clear_disc_failures()
 #   
 #   Hinweis: systeminfo_check_disk_space() ist in libsysteminfo.sh
@@ -98,7 +105,9 @@ common_check_dependencies() {
 # Parameter: keine (nutzt globale Variablen: disc_label, disc_type, iso_filename)
 # Rckgabe.: 0 = Erfolg
 # .........  1 = Fehler
-# Extras...: Nutzt common_copy_data_disc_ddrescue() und common_copy_data_disc_dd()
+# Extras...: Nutzt common_copy_data_disc_ddrescue(), danach
+# .........  common_copy_data_disc_native() (NATIVE_COPY) und zuletzt
+# .........  common_copy_data_disc_dd()
 # ===========================================================================
 common_copy_data_disc() {
     #-- Prfe Disc-Typ: Audio-CDs knnen nicht als ISO kopiert werden -------
@@ -126,7 +135,19 @@ common_copy_data_disc() {
         fi
     fi
     
-    #-- 2. Versuch: dd verwenden --------------------------------------------
+    #-- 2. Versuch: Copy-Engine (groe Blcke statt dd bs=2048) -------------
+    if common_native_copy_available && [[ $failure_count -le 1 ]]; then
+        log_info "$MSG_INFO_COPY_WITH_NATIVE"
+        if common_copy_data_disc_native; then
+            [[ $failure_count -gt 0 ]] && common_clear_disc_failures
+            return 0
+        else
+            common_register_disc_failure
+            log_warning "$MSG_WARNING_NATIVE_FALLBACK"
+        fi
+    fi
+    
+    #-- 3. Versuch: dd verwenden --------------------------------------------
     log_info "$MSG_INFO_COPY_WITH_DD"
     if common_copy_data_disc_dd; then
         #-- Erfolg - lsche Fehler-Historie falls vorhanden -----------------
@@ -144,8 +165,8 @@ common_copy_data_disc() {
 # common_copy_data_disc_ddrescue
 # ---------------------------------------------------------------------------
 # Funktion.: Kopiert Daten-Discs mit ddrescue (robust, mit Fehlerkorrektur)
-# .........  Nutzt vorberechnete DISC_INFO-Werte und zeitgesteuertes
-# .........  Fortschritts-Monitoring (alle 60 Sekunden).
+# .........  Nutzt vorberechnete DISC_INFO-Werte und liest den Fortschritt
+# .........  direkt aus der ddrescue-Statusausgabe (rescued/read errors).
 # Parameter: keine (nutzt DISC_INFO Array)
 # Rckgabe.: 0 = Erfolg
 # .........  1 = Fehler (Speicherplatz, Kopiervorgang fehlgeschlagen)
@@ -183,23 +204,32 @@ common_copy_data_disc_ddrescue() {
         fi
     fi
     
-    #-- Starte ddrescue im Hintergrund (mit oder ohne Grenbeschrnkung) ---
-    if [[ $total_bytes -gt 0 ]]; then
-        ddrescue -b "${block_size:-2048}" -r "$DDRESCUE_RETRIES" -s "$total_bytes" "$CD_DEVICE" "$iso_filename" "$mapfile" &>>"$copy_log_filename" &
-    else
-        ddrescue -b "${block_size:-2048}" -r "$DDRESCUE_RETRIES" "$CD_DEVICE" "$iso_filename" "$mapfile" &>>"$copy_log_filename" &
-    fi
+    #-- ddrescue-Kommando (mit oder ohne Grenbeschrnkung) ----------------
+    local -a ddrescue_cmd=(ddrescue -b "${block_size:-2048}" -r "$DDRESCUE_RETRIES")
+    [[ $total_bytes -gt 0 ]] && ddrescue_cmd+=(-s "$total_bytes")
+    ddrescue_cmd+=("$CD_DEVICE" "$iso_filename" "$mapfile")
+    
+    #-- Starte ddrescue im Hintergrund, Statusausgabe an den Leser ----------
+    local progress_fifo=$(common_create_progress_fifo)
+    "${ddrescue_cmd[@]}" &>>"${progress_fifo:-$copy_log_filename}" &
     local ddrescue_pid=$!
     
-    #-- berwache Fortschritt (alle 60 Sekunden) ----------------------------
-    common_monitor_copy_progress "$ddrescue_pid" "$total_bytes" "$iso_filename"
+    #-- berwache Fortschritt (laufend aus der Statusausgabe) ---------------
+    common_monitor_copy_progress "$ddrescue_pid" "$total_bytes" "$iso_filename" "$progress_fifo" "ddrescue" "$copy_log_filename"
     
     #-- Warte auf ddrescue Prozess-Ende und hole Exit-Code ------------------
     wait "$ddrescue_pid"
     local ddrescue_exit=$?
+    [[ -n "$progress_fifo" ]] && rm -f "$progress_fifo"
     
     #-- Prfe Ergebnis ------------------------------------------------------
     if [[ $ddrescue_exit -eq 0 ]]; then
+        #-- ddrescue schreibt nicht sequentiell: Prfsummen aus der ISO -----
+        if common_checksums_enabled; then
+            local checksum_file="${temp_pathname}/$(basename "${iso_filename}").checksums"
+            common_hash_stream "$checksum_file" "$iso_filename"
+            common_write_checksums "$checksum_file"
+        fi
         log_copying "$MSG_DATA_DISC_SUCCESS_DDRESCUE"
         finish_copy_log
         return 0
@@ -210,20 +240,127 @@ common_copy_data_disc_ddrescue() {
     fi
 }
 
+# ===========================================================================
+# common_native_copy_available
+# ---------------------------------------------------------------------------
+# Funktion.: Prft ob die Copy-Engine genutzt werden kann
+# Parameter: keine
+# Rckgabe.: 0 = Verfgbar (NATIVE_COPY aktiv, python3 und Engine vorhanden)
+# .........  1 = Nicht verfgbar
+# ===========================================================================
+common_native_copy_available() {
+    [[ "${NATIVE_COPY:-true}" == "true" ]] || return 1
+    command -v python3 >/dev/null 2>&1 || return 1
+    [[ -f "${INSTALL_DIR}/services/disk2iso/copy_engine.py" ]]
+}
+
+# ===========================================================================
+# common_copy_data_disc_native
+# ---------------------------------------------------------------------------
+# Funktion.: Kopiert Daten-Discs mit der Copy-Engine (copy_engine.py):
+# .........  groe ausgerichtete Blcke (NATIVE_COPY_CHUNK_MB), getrennte
+# .........  Lese- und Schreib-Threads, optional O_DIRECT
+# Parameter: keine (nutzt DISC_INFO Array)
+# Rckgabe.: 0 = Erfolg (auch mit aufgefllten defekten Sektoren)
+# .........  1 = Fehler (Speicherplatz, Kopiervorgang fehlgeschlagen)
+# Extras...: Lesefehler: betroffener Block wird sektorweise gelesen,
+# .........  unlesbare Sektoren mit Nullen aufgefllt (wie dd conv=sync)
+# .........  und in einer Map (ddrescue-Format) im .temp Ordner notiert
+# .........  Sendet Fortschritt via API, MQTT und systemd-notify
+# ===========================================================================
+common_copy_data_disc_native() {
+    #-- Initialisiere Kopiervorgang-Log -------------------------------------
+    init_copy_log "$(discinfo_get_label)" "data"
+    log_copying "$MSG_METHOD_NATIVE"
+    
+    #-- Setze verwendete Kopiermethode --------------------------------------
+    discinfo_set_copy_method "native"
+    
+    #-- Lese aus DISC_INFO Array die bentigten Werte -----------------------
+    local iso_filename=$(discinfo_get_iso_filename)
+    local temp_pathname=$(discinfo_get_temp_pathname)
+    local copy_log_filename=$(discinfo_get_log_filename)
+    local size_mb=$(discinfo_get_size_mb)
+    local volume_size=$(discinfo_get_size_sectors)
+    local block_size=$(discinfo_get_block_size)
+    local total_bytes=$((size_mb * 1024 * 1024))
+    
+    #-- Sektor-Map und Prfsummen (im .temp Ordner, wird auto-gelscht) ----
+    local badmap="${temp_pathname}/$(basename "${iso_filename}").badmap"
+    local checksum_file="${temp_pathname}/$(basename "${iso_filename}").checksums"
+    
+    #-- Speicherplatz Prfung (falls Gre bekannt) -------------------------
+    if [[ $size_mb -gt 0 ]]; then
+        #-- Logge erkannte Disc-Gre ---------------------------------------
+        log_copying "$MSG_ISO_VOLUME_DETECTED $volume_size $MSG_ISO_BLOCKS_SIZE ${block_size:-2048} $MSG_ISO_BYTES (${size_mb} $MSG_PROGRESS_MB)"
+        
+        #-- Prfe Speicherplatz mit vorberechneter Gre (inkl. Overhead) ---
+        if ! systeminfo_check_disk_space "$(discinfo_get_estimated_size_mb)"; then
+            return 1
+        fi
+    fi
+    
+    #-- Engine-Kommando (exakte Gre aus Sektoren, sonst bis Disc-Ende) ----
+    local -a engine_cmd=(python3 "${INSTALL_DIR}/services/disk2iso/copy_engine.py" copy
+        "$CD_DEVICE" "$iso_filename"
+        --chunk-mb "${NATIVE_COPY_CHUNK_MB:-4}"
+        --sector-size "${block_size:-2048}"
+        --retries "${DDRESCUE_RETRIES:-1}"
+        --badmap "$badmap")
+    [[ $volume_size -gt 0 ]] && engine_cmd+=(--size $((volume_size * ${block_size:-2048})))
+    [[ "${NATIVE_COPY_DIRECT:-false}" == "true" ]] && engine_cmd+=(--direct)
+    common_checksums_enabled && engine_cmd+=(--algorithms "${CHECKSUM_ALGORITHMS-md5 sha256}" --checksums "$checksum_file")
+    
+    #-- Starte Engine im Hintergrund, Statusausgabe (stderr) an den Leser ---
+    local progress_fifo=$(common_create_progress_fifo)
+    "${engine_cmd[@]}" 2>>"${progress_fifo:-$copy_log_filename}" &
+    local engine_pid=$!
+    
+    #-- berwache Fortschritt (laufend aus der Statusausgabe) ---------------
+    common_monitor_copy_progress "$engine_pid" "$total_bytes" "$iso_filename" "$progress_fifo" "native" "$copy_log_filename"
+    
+    #-- Warte auf Engine Prozess-Ende und hole Exit-Code --------------------
+    wait "$engine_pid"
+    local engine_exit=$?
+    [[ -n "$progress_fifo" ]] && rm -f "$progress_fifo"
+    
+    #-- Defekte Sektoren melden (Map bleibt fr die Auswertung erhalten) ----
+    if [[ ${COPY_PROGRESS[errors]:-0} -gt 0 ]]; then
+        log_warning "$MSG_WARNING_NATIVE_BAD_SECTORS ${COPY_PROGRESS[errors]} ($badmap)"
+    fi
+    
+    #-- Prfe Ergebnis ------------------------------------------------------
+    if [[ $engine_exit -eq 0 ]]; then
+        common_checksums_enabled && common_write_checksums "$checksum_file"
+        log_copying "$MSG_DATA_DISC_SUCCESS_NATIVE"
+        finish_copy_log
+        return 0
+    else
+        log_error "$MSG_ERROR_NATIVE_FAILED"
+        finish_copy_log
+        return 1
+    fi
+}
+
 # ===========================================================================
 # common_copy_data_disc_dd
 # ---------------------------------------------------------------------------
 # Funktion.: Kopiert Daten-Discs mit dd (Fallback-Methode, immer verfgbar)
-# .........  Nutzt vorberechnete DISC_INFO-Werte und zeitgesteuertes
-# .........  Fortschritts-Monitoring (alle 60 Sekunden).
+# .........  Nutzt vorberechnete DISC_INFO-Werte und liest den Fortschritt
+# .........  direkt aus der Ausgabe von dd status=progress.
 # Parameter: keine (nutzt DISC_INFO Array)
 # Rckgabe.: 0 = Erfolg
 # .........  1 = Fehler (Speicherplatz, Kopiervorgang fehlgeschlagen)
 # Extras...: Langsamste Methode, aber immer verfgbar (keine Abhngigkeiten)
 # .........  Untersttzt Kopieren mit/ohne Grenangabe
+# .........  Prfsummen: dd | tee ISO | common_hash_stream (ein Durchlauf)
 # .........  Sendet Fortschritt via API, MQTT und systemd-notify
 # ===========================================================================
 common_copy_data_disc_dd() {
+    #-- pipefail nur in dieser Funktion (Exit-Code von dd/tee im Pipe) ------
+    local -
+    set -o pipefail
+    
     #-- Initialisiere Kopiervorgang-Log -------------------------------------
     init_copy_log "$(discinfo_get_label)" "data"    
     log_copying "$MSG_METHOD_DD"
@@ -233,6 +370,7 @@ common_copy_data_disc_dd() {
 
     #-- Lese aus DISC_INFO Array die bentigten Werte -----------------------
     local iso_filename=$(discinfo_get_iso_filename)
+    local temp_pathname=$(discinfo_get_temp_pathname)
     local copy_log_filename=$(discinfo_get_log_filename)
     local size_mb=$(discinfo_get_size_mb)
     local volume_size=$(discinfo_get_size_sectors)
@@ -250,23 +388,36 @@ common_copy_data_disc_dd() {
         fi
     fi
     
-    #-- Starte dd im Hintergrund (mit oder ohne count-Parameter) ------------
-    if [[ $volume_size -gt 0 ]]; then
-        dd if="$CD_DEVICE" of="$iso_filename" bs="$block_size" count="$volume_size" conv=noerror,sync status=progress 2>>"$copy_log_filename" &
+    #-- dd-Kommando (mit oder ohne count-Parameter) -------------------------
+    local -a dd_cmd=(dd if="$CD_DEVICE" bs="$block_size")
+    [[ $volume_size -gt 0 ]] && dd_cmd+=(count="$volume_size")
+    dd_cmd+=(conv=noerror,sync status=progress)
+    
+    #-- Starte dd im Hintergrund, Statusausgabe (stderr) an den Leser -------
+    local progress_fifo=$(common_create_progress_fifo)
+    local checksum_file=""
+    if common_checksums_enabled; then
+        #-- Prfsummen im selben Durchlauf: dd | tee ISO | Hash -------------
+        checksum_file="${temp_pathname}/$(basename "${iso_filename}").checksums"
+        "${dd_cmd[@]}" 2>>"${progress_fifo:-$copy_log_filename}" \
+            | tee -- "$iso_filename" 2>>"$copy_log_filename" \
+            | common_hash_stream "$checksum_file" &
     else
-        dd if="$CD_DEVICE" of="$iso_filename" bs="$block_size" conv=noerror,sync status=progress 2>>"$copy_log_filename" &
+        "${dd_cmd[@]}" of="$iso_filename" 2>>"${progress_fifo:-$copy_log_filename}" &
     fi
     local dd_pid=$!
     
-    #-- berwache Fortschritt (alle 60 Sekunden) ----------------------------
-    common_monitor_copy_progress "$dd_pid" "$total_bytes" "$iso_filename"
+    #-- berwache Fortschritt (laufend aus der Statusausgabe) ---------------
+    common_monitor_copy_progress "$dd_pid" "$total_bytes" "$iso_filename" "$progress_fifo" "dd" "$copy_log_filename"
     
     #-- Warte auf dd Prozess-Ende und hole Exit-Code ------------------------
     wait "$dd_pid"
     local dd_exit=$?
+    [[ -n "$progress_fifo" ]] && rm -f "$progress_fifo"
     
     #-- Prfe Ergebnis ------------------------------------------------------
     if [[ $dd_exit -eq 0 ]]; then
+        [[ -n "$checksum_file" ]] && common_write_checksums "$checksum_file"
         finish_copy_log
         return 0
     else
@@ -276,6 +427,196 @@ common_copy_data_disc_dd() {
 }
 
 
+# ============================================================================
+# PRFSUMMEN
+# ============================================================================
+
+# ===========================================================================
+# common_checksums_enabled
+# ---------------------------------------------------------------------------
+# Funktion.: Prft ob beim Kopieren Prfsummen berechnet werden sollen
+# Parameter: keine
+# Rckgabe.: 0 = Ja (CHECKSUM_ALGORITHMS nicht leer, Standard "md5 sha256"
+# .........  wie in disk2iso.conf)
+# .........  1 = Nein (CHECKSUM_ALGORITHMS="")
+# ===========================================================================
+common_checksums_enabled() {
+    [[ -n "${CHECKSUM_ALGORITHMS-md5 sha256}" ]]
+}
+
+# ===========================================================================
+# common_hash_stream
+# ---------------------------------------------------------------------------
+# Funktion.: Berechnet die Prfsummen (CHECKSUM_ALGORITHMS) aus stdin oder
+# .........  einer Datei und schreibt "<algorithmus> <hex>" Zeilen
+# Parameter: $1 = Ergebnisdatei
+# .........  $2 = Eingabedatei (optional, Standard: stdin)
+# Rckgabe.: 0 (immer - stdin wird vollstndig gelesen, damit ein Fehler
+# .........  beim Hashen die Kopie in der Pipe nicht abbricht)
+# Extras...: Nutzt copy_engine.py hash (md5, sha256, blake3), ohne python3
+# .........  nur md5sum
+# ===========================================================================
+common_hash_stream() {
+    local result_file="$1"
+    local input="${2:--}"
+    local engine="${INSTALL_DIR}/services/disk2iso/copy_engine.py"
+    local -a hash_cmd
+    local sum
+    
+    rm -f "$result_file" 2>/dev/null
+    
+    if command -v python3 >/dev/null 2>&1 && [[ -f "$engine" ]]; then
+        hash_cmd=(python3 "$engine" hash --algorithms "${CHECKSUM_ALGORITHMS-md5 sha256}" --checksums "$result_file")
+        [[ "$input" != "-" ]] && hash_cmd+=(--input "$input")
+        "${hash_cmd[@]}" 2>/dev/null && return 0
+    else
+        read -r sum _ < <(md5sum -- "$input" 2>/dev/null)
+        [[ -n "$sum" ]] && printf 'md5 %s\n' "$sum" > "$result_file" && return 0
+    fi
+    
+    #-- Fehlgeschlagen: restliche Daten verwerfen (tee nicht blockieren) ----
+    [[ "$input" == "-" ]] && cat > /dev/null
+    rm -f "$result_file" 2>/dev/null
+    return 0
+}
+
+# ===========================================================================
+# common_write_checksums
+# ---------------------------------------------------------------------------
+# Funktion.: Schreibt die Prfsummen einer erfolgreichen Kopie als
+# .........  Sidecar-Dateien neben die ISO (md5 -> DISC_INFO[md5_filename],
+# .........  sha256 -> .sha256, blake3 -> .b3)
+# Parameter: $1 = Ergebnisdatei von common_hash_stream() bzw. copy_engine.py
+# Rckgabe.: 0 = Erfolg, 1 = keine Prfsummen vorhanden
+# Extras...: Format wie md5sum/sha256sum/b3sum ("<hex>  <iso>", prfbar mit
+# .........  -c), Schreiben atomar ber .tmp + mv
+# .........  Der Archiv-Index der Web-UI bernimmt die Werte aus den Dateien
+# ===========================================================================
+common_write_checksums() {
+    local result_file="$1"
+    local iso_filename=$(discinfo_get_iso_filename)
+    local iso_name=$(basename "$iso_filename")
+    local algorithm value sidecar
+    
+    if [[ ! -s "$result_file" ]]; then
+        log_warning "$MSG_WARNING_NO_CHECKSUMS"
+        return 1
+    fi
+    
+    while read -r algorithm value; do
+        case "$algorithm" in
+            md5)    sidecar=$(discinfo_get_md5_filename) || sidecar="${iso_filename%.iso}.md5" ;;
+            sha256) sidecar="${iso_filename%.iso}.sha256" ;;
+            blake3) sidecar="${iso_filename%.iso}.b3" ;;
+            *)      continue ;;
+        esac
+        
+        if printf '%s  %s\n' "$value" "$iso_name" > "${sidecar}.tmp" 2>/dev/null \
+                && mv -f "${sidecar}.tmp" "$sidecar"; then
+            log_copying "$MSG_CHECKSUM_WRITTEN ${algorithm} ${value}"
+        else
+            rm -f "${sidecar}.tmp" 2>/dev/null
+            log_warning "$MSG_WARNING_CHECKSUM_WRITE_FAILED $sidecar"
+        fi
+    done < "$result_file"
+    
+    rm -f "$result_file" 2>/dev/null
+    return 0
+}
+
+# ============================================================================
+# VERIFIKATION
+# ============================================================================
+
+# ===========================================================================
+# common_verify_copy
+# ---------------------------------------------------------------------------
+# Funktion.: Vergleicht die fertige ISO mit der Disc (copy_engine.py verify)
+# .........  und repariert abweichende Sektoren durch gezieltes Neulesen
+# Parameter: keine (nutzt DISC_INFO Array)
+# Rckgabe.: 0 = ISO stimmt mit der Disc berein (ggf. nach Reparatur)
+# .........  1 = Abweichungen verbleiben oder Prfung nicht mglich
+# Extras...: Disc wird sequentiell in groen Blcken gelesen, ISO-Lesen und
+# .........  Hashen laufen parallel (VERIFY_WORKERS Threads)
+# .........  Abweichende Bereiche landen im Kopiervorgang-Log, das Ergebnis
+# .........  ber api_set_verify_result() in attributes.json
+# .........  Nach einer Reparatur werden die Prfsummen neu geschrieben
+# ===========================================================================
+common_verify_copy() {
+    local engine="${INSTALL_DIR}/services/disk2iso/copy_engine.py"
+    if ! command -v python3 >/dev/null 2>&1 || [[ ! -f "$engine" ]]; then
+        log_warning "$MSG_WARNING_VERIFY_UNAVAILABLE"
+        return 1
+    fi
+    
+    #-- Lese aus DISC_INFO Array die bentigten Werte -----------------------
+    local iso_filename=$(discinfo_get_iso_filename)
+    local temp_pathname=$(discinfo_get_temp_pathname)
+    local copy_log_filename=$(discinfo_get_log_filename)
+    local block_size=$(discinfo_get_block_size)
+    local iso_bytes=$(stat -c %s "$iso_filename" 2>/dev/null || echo 0)
+    local report="${temp_pathname}/$(basename "${iso_filename}").verify"
+    
+    log_info "$MSG_INFO_VERIFY_START"
+    
+    #-- Verifikations-Kommando ----------------------------------------------
+    local -a verify_cmd=(python3 "$engine" verify "$CD_DEVICE" "$iso_filename"
+        --chunk-mb "${NATIVE_COPY_CHUNK_MB:-4}"
+        --sector-size "${block_size:-2048}"
+        --workers "${VERIFY_WORKERS:-2}"
+        --retries "${DDRESCUE_RETRIES:-1}"
+        --report "$report")
+    [[ "${VERIFY_REPAIR:-true}" == "true" ]] && verify_cmd+=(--repair)
+    
+    #-- Starte Prfung im Hintergrund, Statusausgabe an den Leser -----------
+    local progress_fifo=$(common_create_progress_fifo)
+    "${verify_cmd[@]}" 2>>"${progress_fifo:-$copy_log_filename}" &
+    local verify_pid=$!
+    
+    common_monitor_copy_progress "$verify_pid" "$iso_bytes" "" "$progress_fifo" "native" "$copy_log_filename" "$MSG_VERIFY_PROGRESS"
+    
+    wait "$verify_pid"
+    local verify_exit=$?
+    [[ -n "$progress_fifo" ]] && rm -f "$progress_fifo"
+    
+    #-- Ergebnis auswerten --------------------------------------------------
+    if [[ ! -s "$report" ]]; then
+        log_error "$MSG_ERROR_VERIFY_FAILED"
+        api_set_verify_result '{"status":"error"}'
+        return 1
+    fi
+    local result
+    result=$(<"$report")
+    api_set_verify_result "$result"
+    
+    local status="" repaired=0 mismatched=0
+    [[ "$result" =~ \"status\":\"([a-z]+)\" ]] && status="${BASH_REMATCH[1]}"
+    [[ "$result" =~ \"mismatched_sectors\":([0-9]+) ]] && mismatched="${BASH_REMATCH[1]}"
+    [[ "$result" =~ \"repaired_sectors\":([0-9]+) ]] && repaired="${BASH_REMATCH[1]}"
+    
+    #-- Reparierte ISO: Prfsummen neu berechnen ----------------------------
+    if [[ $repaired -gt 0 ]] && common_checksums_enabled; then
+        local checksum_file="${temp_pathname}/$(basename "${iso_filename}").checksums"
+        common_hash_stream "$checksum_file" "$iso_filename"
+        common_write_checksums "$checksum_file"
+    fi
+    
+    case "$status" in
+        ok)
+            log_info "$MSG_INFO_VERIFY_OK"
+            return 0
+            ;;
+        repaired)
+            log_warning "$MSG_WARNING_VERIFY_REPAIRED $repaired"
+            return 0
+            ;;
+        *)
+            log_error "$MSG_ERROR_VERIFY_MISMATCH $mismatched (exit $verify_exit)"
+            return 1
+            ;;
+    esac
+}
+
 # ============================================================================
 # FEHLER-TRACKING SYSTEM (fr alle Disc-Typen)
 # ============================================================================
@@ -406,8 +747,10 @@ common_clear_disc_failures() {
 # .........  $2 = Gesamtgre in Bytes (0 = unbekannt)
 # .........  $3 = Start-Zeit (Unix-Timestamp)
 # .........  $4 = Log-Prfix (z.B. "DATA", "DVD", "BLURAY")
+# .........  $5 = Aktueller Durchsatz in Bytes/s (optional, z.B. EWMA)
 # Rckgabe.: keine (setzt globale Variablen $percent und $eta)
-# Extras...: Berechnet ETA basierend auf bisheriger Geschwindigkeit
+# Extras...: Berechnet ETA aus $5, sonst aus der bisherigen Geschwindigkeit
+# .........  Fr dd/ddrescue siehe common_progress_update()
 # .........  Loggt alle erforderlichen Informationen (Prozent, MB, ETA)
 # .........  API/MQTT/systemd Updates erfolgen automatisch
 # ===========================================================================
@@ -416,6 +759,7 @@ common_calculate_and_log_progress() {
     local total_bytes=$2
     local start_time=$3
     local log_prefix=$4
+    local rate=${5:-0}
     
     # Konvertiere zu MB fr Anzeige
     local current_mb=$((current_bytes / 1024 / 1024))
@@ -433,9 +777,15 @@ common_calculate_and_log_progress() {
         # Berechne geschtzte Restzeit
         local current_time=$(date +%s)
         local total_elapsed=$((current_time - start_time))
-        if [[ $percent -gt 0 ]]; then
-            local estimated_total=$((total_elapsed * 100 / percent))
-            local remaining=$((estimated_total - total_elapsed))
+        if [[ $rate -gt 0 ]] || [[ $percent -gt 0 ]]; then
+            local remaining
+            if [[ $rate -gt 0 ]]; then
+                remaining=$(( (total_bytes - current_bytes) / rate ))
+                [[ $remaining -lt 0 ]] && remaining=0
+            else
+                local estimated_total=$((total_elapsed * 100 / percent))
+                remaining=$((estimated_total - total_elapsed))
+            fi
             local hours=$((remaining / 3600))
             local minutes=$(((remaining % 3600) / 60))
             local seconds=$((remaining % 60))
@@ -465,45 +815,307 @@ common_calculate_and_log_progress() {
     fi
 }
 
+# ===========================================================================
+# common_progress_reset
+# ---------------------------------------------------------------------------
+# Funktion.: Initialisiert den Fortschritts-Zustand (COPY_PROGRESS Array)
+# .........  fr einen neuen Kopiervorgang
+# Parameter: $1 = Gesamtgre in Bytes (0 = unbekannt)
+# .........  $2 = Log-Prfix (optional, Standard: $MSG_DATA_PROGRESS)
+# Rckgabe.: keine
+# ===========================================================================
+common_progress_reset() {
+    local now_us=${EPOCHREALTIME/[.,]/}
+    declare -gA COPY_PROGRESS=(
+        [total_bytes]="${1:-0}"
+        [prefix]="${2:-$MSG_DATA_PROGRESS}"
+        [bytes]=0
+        [errors]=0
+        [rate]=0
+        [start_us]=$now_us
+        [sample_us]=$now_us
+        [sample_bytes]=0
+        [change_us]=$now_us
+        [log_us]=$now_us
+        [stalled]=false
+        [percent]=-1
+        [payload]=""
+    )
+}
+
+# ===========================================================================
+# common_progress_update
+# ---------------------------------------------------------------------------
+# Funktion.: Verarbeitet den aktuellen Stand aus COPY_PROGRESS[bytes] und
+# .........  [errors]: gleitender Durchsatz (EWMA), Stillstands-Erkennung,
+# .........  ETA und Verffentlichung (API, MQTT, systemd-notify, Log)
+# Parameter: $1 = "final" am Ende des Kopiervorgangs (sofort verffentlichen,
+# .........       keine Stillstands-Meldung mehr)
+# Rckgabe.: keine
+# Extras...: Arbeitet hchstens alle PROGRESS_UPDATE_INTERVAL Sekunden
+# .........  (Standard 1), progress.json wird nur bei genderten Werten
+# .........  neu geschrieben. Startet keine Prozesse auer den Ausgaben.
+# ===========================================================================
+common_progress_update() {
+    local final="${1:-}"
+    local now_us=${EPOCHREALTIME/[.,]/}
+    local interval_us=$(( ${PROGRESS_UPDATE_INTERVAL:-1} * 1000000 ))
+    local elapsed_us=$(( now_us - COPY_PROGRESS[sample_us] ))
+    
+    [[ "$final" != "final" ]] && [[ $elapsed_us -lt $interval_us ]] && return 0
+    [[ $elapsed_us -le 0 ]] && elapsed_us=1
+    
+    local bytes=${COPY_PROGRESS[bytes]}
+    local total_bytes=${COPY_PROGRESS[total_bytes]}
+    
+    #-- Durchsatz: EWMA ber die Intervalle (alpha = 0.3) --------------------
+    local delta=$(( bytes - COPY_PROGRESS[sample_bytes] ))
+    [[ $delta -lt 0 ]] && delta=0
+    local current_rate=$(( delta * 1000000 / elapsed_us ))
+    if [[ ${COPY_PROGRESS[sample_bytes]} -eq 0 ]] && [[ ${COPY_PROGRESS[rate]} -eq 0 ]]; then
+        COPY_PROGRESS[rate]=$current_rate
+    else
+        COPY_PROGRESS[rate]=$(( (3 * current_rate + 7 * COPY_PROGRESS[rate]) / 10 ))
+    fi
+    COPY_PROGRESS[sample_us]=$now_us
+    COPY_PROGRESS[sample_bytes]=$bytes
+    
+    #-- Stillstands-Erkennung ------------------------------------------------
+    local stall_us=$(( ${PROGRESS_STALL_TIMEOUT:-30} * 1000000 ))
+    if [[ $delta -gt 0 ]] || [[ "$final" == "final" ]]; then
+        COPY_PROGRESS[change_us]=$now_us
+        if [[ "${COPY_PROGRESS[stalled]}" == "true" ]]; then
+            COPY_PROGRESS[stalled]=false
+            [[ "$final" != "final" ]] && log_info "$MSG_INFO_COPY_RESUMED"
+        fi
+    elif [[ "${COPY_PROGRESS[stalled]}" == "false" ]] && [[ $(( now_us - COPY_PROGRESS[change_us] )) -ge $stall_us ]]; then
+        COPY_PROGRESS[stalled]=true
+        log_warning "$MSG_WARNING_COPY_STALLED ${PROGRESS_STALL_TIMEOUT:-30}s (${COPY_PROGRESS[errors]} $MSG_READ_ERRORS)"
+    fi
+    
+    #-- Anzeige-Werte --------------------------------------------------------
+    local rate=${COPY_PROGRESS[rate]}
+    local current_mb=$(( bytes / 1024 / 1024 ))
+    local total_mb=$(( total_bytes / 1024 / 1024 ))
+    local speed=$(( rate * 10 / 1024 / 1024 ))
+    speed="$(( speed / 10 )).$(( speed % 10 ))"
+    local percent=0
+    local eta="--:--:--"
+    if [[ $total_bytes -gt 0 ]]; then
+        percent=$(( bytes * 100 / total_bytes ))
+        [[ $percent -gt 100 ]] && percent=100
+        if [[ $bytes -ge $total_bytes ]]; then
+            eta="00:00:00"
+        elif [[ $rate -gt 0 ]]; then
+            local remaining=$(( (total_bytes - bytes) / rate ))
+            printf -v eta "%02d:%02d:%02d" $(( remaining / 3600 )) $(( (remaining % 3600) / 60 )) $(( remaining % 60 ))
+        fi
+    fi
+    
+    #-- API: nur bei genderten Werten neu schreiben -------------------------
+    local payload="${percent}|${current_mb}|${total_mb}|${eta}|${speed}|${COPY_PROGRESS[stalled]}"
+    if [[ "$payload" != "${COPY_PROGRESS[payload]}" ]]; then
+        COPY_PROGRESS[payload]=$payload
+        if declare -f api_update_progress >/dev/null 2>&1; then
+            api_update_progress "$percent" "$current_mb" "$total_mb" "$eta" "$speed" "${COPY_PROGRESS[stalled]}"
+        fi
+    fi
+    
+    #-- MQTT und systemd-notify: nur bei neuem Prozentwert -------------------
+    if [[ $total_bytes -gt 0 ]] && [[ $percent -ne ${COPY_PROGRESS[percent]} ]]; then
+        COPY_PROGRESS[percent]=$percent
+        if is_mqtt_ready && declare -f mqtt_publish_progress >/dev/null 2>&1; then
+            mqtt_publish_progress "$percent" "$current_mb" "$total_mb" "$eta"
+        fi
+        if command -v systemd-notify >/dev/null 2>&1; then
+            systemd-notify --status="${COPY_PROGRESS[prefix]} ${current_mb} MB / ${total_mb} MB (${percent}%)" 2>/dev/null
+        fi
+    fi
+    
+    #-- Log: wie bisher hchstens alle 60 Sekunden ---------------------------
+    if [[ "$final" == "final" ]] || [[ $(( now_us - COPY_PROGRESS[log_us] )) -ge 60000000 ]]; then
+        COPY_PROGRESS[log_us]=$now_us
+        if [[ $total_bytes -gt 0 ]]; then
+            log_info "${COPY_PROGRESS[prefix]} $MSG_PROGRESS: ${current_mb} $MSG_PROGRESS_MB $MSG_PROGRESS_OF ${total_mb} $MSG_PROGRESS_MB (${percent}%) - ${speed} MB/s - $MSG_REMAINING: ${eta}"
+        else
+            log_info "${COPY_PROGRESS[prefix]} $MSG_PROGRESS: ${current_mb} $MSG_PROGRESS_MB $MSG_COPIED - ${speed} MB/s"
+        fi
+    fi
+}
+
+# ===========================================================================
+# common_size_to_bytes
+# ---------------------------------------------------------------------------
+# Funktion.: Wandelt eine ddrescue-Grenangabe (SI-Prfixe) in Bytes um
+# Parameter: $1 = Name der Zielvariable
+# .........  $2 = Zahl (Nachkommastellen werden ignoriert)
+# .........  $3 = Einheit (B, kB, MB, GB, TB, auch KiB, MiB, ...)
+# Rckgabe.: keine (setzt die Zielvariable per printf -v, ohne Subshell)
+# ===========================================================================
+common_size_to_bytes() {
+    local number="${2%%.*}"
+    local factor=1
+    case "$3" in
+        kB|KB) factor=1000 ;;
+        MB)    factor=1000000 ;;
+        GB)    factor=1000000000 ;;
+        TB)    factor=1000000000000 ;;
+        KiB)   factor=1024 ;;
+        MiB)   factor=1048576 ;;
+        GiB)   factor=1073741824 ;;
+        TiB)   factor=1099511627776 ;;
+    esac
+    printf -v "$1" '%d' $(( 10#${number:-0} * factor ))
+}
+
+# ===========================================================================
+# common_read_copy_progress
+# ---------------------------------------------------------------------------
+# Funktion.: Liest die Statusausgabe von dd (status=progress) bzw.
+# .........  ddrescue von stdin, sobald sie geschrieben wird, und
+# .........  aktualisiert COPY_PROGRESS ber common_progress_update()
+# Parameter: $1 = Format ("dd", "ddrescue" oder "native")
+# .........  $2 = Kopiervorgang-Log (brige Ausgabe wird dort angehngt)
+# .........  $3 = ISO-Datei (Fallback per stat, solange keine Statuszeile
+# .........       erkannt wurde)
+# Rckgabe.: keine (blockiert bis der Kopierprozess seine Ausgabe schliet)
+# Extras...: Statuszeilen enden mit \r und landen nicht im Log, nur der
+# .........  letzte Stand. read -t 1 sorgt dafr, dass Stillstnde auch
+# .........  ohne neue Ausgabe erkannt werden.
+# ===========================================================================
+common_read_copy_progress() {
+    local format="$1"
+    local copy_log="$2"
+    local iso_file="${3:-}"
+    local chunk pending="" line rc value
+    local last_status=""
+    local -a lines
+    
+    while true; do
+        IFS= read -r -d $'\r' -t 1 chunk
+        rc=$?
+        if [[ $rc -gt 128 ]]; then
+            #-- Timeout: unvollstndige Ausgabe aufheben ---------------------
+            pending+="$chunk"
+            if [[ -z "$last_status" ]] && [[ -f "$iso_file" ]]; then
+                COPY_PROGRESS[bytes]=$(stat -c %s "$iso_file" 2>/dev/null || echo 0)
+            fi
+            common_progress_update
+            continue
+        fi
+        chunk="${pending}${chunk}"
+        pending=""
+        
+        if [[ -n "$chunk" ]]; then
+            readarray -t lines <<< "$chunk"
+            for line in "${lines[@]}"; do
+                #-- Cursor-Steuerung von ddrescue entfernen ("ESC[5A") -------
+                [[ "$line" == *$'\e['* ]] && line="${line#*$'\e'\[*A}"
+                [[ -z "${line// /}" ]] && continue
+                
+                if [[ "$format" == "ddrescue" ]]; then
+                    if [[ "$line" =~ rescued:[[:space:]]*([0-9.]+)[[:space:]]*([kKMGT]?i?B) ]]; then
+                        common_size_to_bytes value "${BASH_REMATCH[1]}" "${BASH_REMATCH[2]}"
+                        COPY_PROGRESS[bytes]=$value
+                        last_status="$line"
+                        [[ "$line" =~ errors:[[:space:]]*([0-9]+) ]] && COPY_PROGRESS[errors]=${BASH_REMATCH[1]}
+                        continue
+                    fi
+                    if [[ "$line" =~ errors:[[:space:]]*([0-9]+) ]]; then
+                        COPY_PROGRESS[errors]=${BASH_REMATCH[1]}
+                        continue
+                    fi
+                    [[ "$line" =~ (ipos|opos|non-tried|non-trimmed|non-scraped|bad-sector|rate):|time\ since ]] && continue
+                    [[ "$line" =~ ^[[:space:]]*(Copying|Trimming|Scraping|Retrying|Sweeping) ]] && continue
+                elif [[ "$format" == "native" ]]; then
+                    if [[ "$line" =~ ^progress\ ([0-9]+)\ ([0-9]+) ]]; then
+                        COPY_PROGRESS[bytes]=${BASH_REMATCH[1]}
+                        COPY_PROGRESS[errors]=${BASH_REMATCH[2]}
+                        last_status="$line"
+                        continue
+                    fi
+                elif [[ "$line" =~ ^([0-9]+)\ bytes ]]; then
+                    COPY_PROGRESS[bytes]=${BASH_REMATCH[1]}
+                    last_status="$line"
+                    continue
+                elif [[ "$line" == *"error reading"* ]]; then
+                    COPY_PROGRESS[errors]=$(( COPY_PROGRESS[errors] + 1 ))
+                fi
+                
+                printf '%s\n' "$line" >> "$copy_log" 2>/dev/null
+            done
+        fi
+        
+        [[ $rc -ne 0 ]] && break
+        common_progress_update
+    done
+    
+    #-- Letzten Stand ins Log bernehmen und verffentlichen ----------------
+    [[ -n "$last_status" ]] && printf '%s\n' "$last_status" >> "$copy_log" 2>/dev/null
+    common_progress_update final
+}
+
+# ===========================================================================
+# common_create_progress_fifo
+# ---------------------------------------------------------------------------
+# Funktion.: Legt eine Named Pipe fr die Statusausgabe eines
+# .........  Kopierprozesses an
+# Parameter: keine
+# Rckgabe.: 0 = Erfolg, 1 = mkfifo fehlgeschlagen
+# Ausgabe..: Pfad der Pipe (leer bei Fehler)
+# Extras...: Liegt lokal in TMPDIR (Ausgabeverzeichnis kann eine
+# .........  Netzwerkfreigabe ohne FIFO-Untersttzung sein)
+# ===========================================================================
+common_create_progress_fifo() {
+    local fifo="${TMPDIR:-/tmp}/disk2iso-progress.${BASHPID}.${RANDOM}"
+    rm -f "$fifo" 2>/dev/null
+    mkfifo -m 600 "$fifo" 2>/dev/null || return 1
+    echo "$fifo"
+}
+
 # ===========================================================================
 # common_monitor_copy_progress
 # ---------------------------------------------------------------------------
 # Funktion.: berwacht Kopierfortschritt fr dd/ddrescue im Hintergrund
-# .........  Nutzt zeitgesteuertes Monitoring (alle 60 Sekunden)
 # Parameter: $1 = PID des Kopierprozesses
 # .........  $2 = Gesamtgre in Bytes (fr Prozentberechnung)
 # .........  $3 = ISO-Dateiname (zur Grenermittlung via stat)
+# .........  $4 = Named Pipe mit der Statusausgabe (optional)
+# .........  $5 = Format der Statusausgabe: "dd", "ddrescue" oder "native"
+# .........  $6 = Kopiervorgang-Log fr die brige Ausgabe
+# .........  $7 = Prfix der Fortschritts-Logzeile (optional,
+# .........       Standard: MSG_DATA_PROGRESS)
 # Rckgabe.: keine (blockiert bis Prozess beendet ist)
-# Extras...: Nutzt common_calculate_and_log_progress() fr Fortschrittsberechnung
-# .........  Konsistent mit Web-UI (60 Sekunden Intervall)
+# Extras...: Mit Pipe: ereignisgesteuert ber common_read_copy_progress()
+# .........  Ohne Pipe: stat der ISO-Datei im Update-Intervall
+# .........  Verffentlichung gedrosselt auf PROGRESS_UPDATE_INTERVAL
 # .........  Macht KEIN wait - aufrufende Funktion muss wait ausfhren!
 # ===========================================================================
 common_monitor_copy_progress() {
     local copy_pid=$1
     local total_bytes=$2
     local iso_file=$3
-    local start_time=$(date +%s)
-    local last_log_time=$start_time
+    local progress_source="${4:-}"
+    local format="${5:-dd}"
+    local copy_log="${6:-/dev/null}"
+    local prefix="${7:-$MSG_DATA_PROGRESS}"
     
-    while kill -0 "$copy_pid" 2>/dev/null; do
-        sleep 30
-        
-        local current_time=$(date +%s)
-        local elapsed=$((current_time - last_log_time))
-        
-        # Log alle 60 Sekunden
-        if [[ $elapsed -ge 60 ]]; then
-            local current_bytes=0
+    common_progress_reset "$total_bytes" "$prefix"
+    
+    if [[ -p "$progress_source" ]]; then
+        #-- Ereignisgesteuert: Statusausgabe lesen bis der Prozess endet ----
+        common_read_copy_progress "$format" "$copy_log" "$iso_file" < "$progress_source"
+    else
+        #-- Fallback: Dateigre der ISO abfragen ---------------------------
+        while kill -0 "$copy_pid" 2>/dev/null; do
+            sleep "${PROGRESS_UPDATE_INTERVAL:-1}"
             if [[ -f "$iso_file" ]]; then
-                current_bytes=$(stat -c %s "$iso_file" 2>/dev/null || echo 0)
+                COPY_PROGRESS[bytes]=$(stat -c %s "$iso_file" 2>/dev/null || echo 0)
             fi
-            
-            # Nutze zentrale Fortschrittsberechnung
-            common_calculate_and_log_progress "$current_bytes" "$total_bytes" "$start_time" "$MSG_DATA_PROGRESS"
-            
-            last_log_time=$current_time
-        fi
-    done
+            common_progress_update
+        done
+        common_progress_update final
+    fi
     
     # Abschluss-Status
     if command -v systemd-notify >/dev/null 2>&1; then
@@ -590,6 +590,13 @@ discinfo_detect_type() {
                     discinfo_set_size "$volume_size" 2048
                 fi
             fi
+        elif [[ -f "$CD_DEVICE" ]]; then
+            # Image-Datei als Laufwerk (Test ohne Hardware)
+            local image_size=$(stat -c %s "$CD_DEVICE" 2>/dev/null)
+            if [[ "$image_size" =~ ^[0-9]+$ ]] && [[ $image_size -gt 0 ]]; then
+                volume_size=$((image_size / 2048))
+                discinfo_set_size "$volume_size" 2048
+            fi
         fi
     fi
     
@@ -7,6 +7,7 @@
 # Beschreibung:
 #   Überwacht den Status des optischen Laufwerks (Schublade, Medium)
 #   - detect_device() - Findet erstes optisches Laufwerk
+#   - drivestat_list_drives() - Listet alle Laufwerke (Mehrfach-Betrieb)
 #   - is_drive_closed(), is_disc_inserted()
 #   - wait_for_disc_change(), wait_for_disc_ready()
 #   - Erkennt Änderungen im Drive-Status für automatisches Disc-Handling
@@ -67,6 +68,10 @@ drivestat_check_dependencies() {
 # GLOBAL VARIABLEN DES MODUL
 # ===========================================================================
 CD_DEVICE=""            # Standard CD/DVD-Laufwerk (wird dynamisch ermittelt)
+DRIVE_NAME=""           # Name des Laufwerks im Worker-Prozess (z.B. "sr0")
+                        # leer = Einzelbetrieb mit automatischer Erkennung
+DRIVE_PRIMARY=true      # Erstes Laufwerk: spiegelt Status nach api/ und
+                        # sammelt System-Informationen
 
 # ============================================================================
 # DRIVE INFORMATION COLLECTION (JSON-BASED)
@@ -135,6 +140,12 @@ drivestat_get_drive_info() {
 # Return.....: 0 = Device gefunden, 1 = Kein Device gefunden
 # ===========================================================================
 detect_device() {
+    # Laufwerks-Worker: Device ist fest zugeordnet, nur Existenz prüfen
+    if [[ -n "$DRIVE_NAME" ]]; then
+        [[ -e "$CD_DEVICE" ]]
+        return
+    fi
+    
     # Methode 1: lsblk mit TYPE=rom
     if [[ -z "$CD_DEVICE" ]] && command -v lsblk >/dev/null 2>&1; then
         CD_DEVICE=$(lsblk -ndo NAME,TYPE 2>/dev/null | awk '$2=="rom" {print "/dev/" $1; exit}')
@@ -171,6 +182,62 @@ detect_device() {
     fi
 }
 
+# ===========================================================================
+# drivestat_list_drives
+# ---------------------------------------------------------------------------
+# Funktion.: Listet alle optischen Laufwerke für den Mehrfach-Betrieb
+# Parameter: keine
+# Rückgabe.: 0 = mindestens ein Laufwerk gefunden, 1 = keines
+# Ausgabe..: Device-Pfade, einer pro Zeile (stdout)
+# Extras...: OPTICAL_DRIVES (disk2iso.conf) überschreibt die Erkennung,
+# .........  darf auch Loop-Devices oder Image-Dateien enthalten (Test
+# .........  ohne Hardware). Sonst: lsblk TYPE=rom, /sys/class/block/sr*,
+# .........  /dev/cdrom
+# ===========================================================================
+drivestat_list_drives() {
+    local drives=()
+    local dev
+    
+    #-- Konfigurierte Laufwerke ---------------------------------------------
+    if [[ -n "${OPTICAL_DRIVES:-}" ]]; then
+        read -r -a drives <<< "$OPTICAL_DRIVES"
+    fi
+    
+    #-- Methode 1: lsblk mit TYPE=rom ---------------------------------------
+    if [[ ${#drives[@]} -eq 0 ]] && command -v lsblk >/dev/null 2>&1; then
+        mapfile -t drives < <(lsblk -ndo NAME,TYPE 2>/dev/null | awk '$2=="rom" {print "/dev/" $1}')
+    fi
+    
+    #-- Methode 2: /sys/class/block Durchsuchen -----------------------------
+    if [[ ${#drives[@]} -eq 0 ]]; then
+        for dev in /sys/class/block/sr*; do
+            [[ -e "$dev" ]] && drives+=("/dev/$(basename "$dev")")
+        done
+    fi
+    
+    #-- Methode 3: Fallback auf /dev/cdrom Symlink --------------------------
+    if [[ ${#drives[@]} -eq 0 ]] && [[ -L "/dev/cdrom" ]]; then
+        drives+=("$(readlink -f "/dev/cdrom")")
+    fi
+    
+    [[ ${#drives[@]} -gt 0 ]] || return 1
+    printf '%s\n' "${drives[@]}"
+    return 0
+}
+
+# ===========================================================================
+# drivestat_drive_name
+# ---------------------------------------------------------------------------
+# Funktion.: Kurzname eines Laufwerks für Log-Präfix und API-Namensraum
+# Parameter: $1 = Device-Pfad (z.B. /dev/sr0 oder /tmp/disc1.iso)
+# Rückgabe.: 0
+# Ausgabe..: Name ohne Pfad, nur [A-Za-z0-9_-] (z.B. "sr0", "disc1_iso")
+# ===========================================================================
+drivestat_drive_name() {
+    local name="${1##*/}"
+    echo "${name//[^A-Za-z0-9_-]/_}"
+}
+
 # ===========================================================================
 # TODO: Ab hier ist das Modul noch nicht fertig implementiert!
 # ===========================================================================
@@ -188,6 +255,11 @@ ensure_device_ready() {
         return 1
     fi
     
+    # Image-Datei als Laufwerk (Test ohne Hardware) - nichts vorzubereiten
+    if [[ -f "$device" ]]; then
+        return 0
+    fi
+    
     # Prüfe und lade sr_mod Kernel-Modul für sr* Devices
     if [[ "$device" =~ ^/dev/sr[0-9]+$ ]]; then
         if ! lsmod | grep -q "^sr_mod "; then
@@ -233,8 +305,8 @@ ensure_device_ready() {
 # Vereinfacht: Nutze nur dd-Test (robuster für USB-Laufwerke)
 # Rückgabe: 0 = geschlossen, 1 = offen
 is_drive_closed() {
-    # Prüfe ob Device existiert
-    if [[ ! -b "$CD_DEVICE" ]]; then
+    # Prüfe ob Device existiert (Image-Datei gilt als geschlossenes Laufwerk)
+    if [[ ! -b "$CD_DEVICE" ]] && [[ ! -f "$CD_DEVICE" ]]; then
         return 1
     fi
     
@@ -254,7 +326,11 @@ is_disc_inserted() {
     # Versuche mit dd ein paar Bytes zu lesen
     # Timeout von 2 Sekunden für langsame USB-Laufwerke
     # Versuche zuerst mit bs=2048 (Daten-CDs/DVDs/Blu-ray)
-    if timeout 2 dd if="$CD_DEVICE" of=/dev/null bs=2048 count=1 2>/dev/null; then
+    # Gezählt werden gelesene Bytes: leere Image-Dateien und Loop-Devices
+    # ohne Backing-File liefern EOF ohne Fehler
+    local bytes
+    bytes=$(timeout 2 dd if="$CD_DEVICE" bs=2048 count=1 2>/dev/null | wc -c)
+    if [[ "${bytes:-0}" -gt 0 ]]; then
         return 0
     fi
     
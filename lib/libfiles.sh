@@ -7,7 +7,7 @@
 # Beschreibung:
 #   Verwaltung von Dateinamen und Datei-Operationen
 #   - Dateinamen-Bereinigung (sanitize_filename)
-#   - ISO-Dateinamen-Generierung
+#   - ISO-Dateinamen-Generierung (mit Reservierung bei mehreren Laufwerken)
 #   - MD5/LOG-Dateinamen-Ableitung
 #   - Basename-Extraktion
 #
@@ -136,6 +136,7 @@ sanitize_filename() {
 #            $2 = base_name (Basis-Name ohne .iso)
 #            $3 = existing_file (optional, existierende Datei die umbenannt wird)
 # Rückgabe.: Eindeutiger Pfad (mit _1, _2 etc. falls nötig)
+# Extras...: Von anderen Laufwerks-Workern reservierte Pfade gelten als belegt
 # ===========================================================================
 get_unique_iso_path() {
     local target_dir="$1"
@@ -147,7 +148,7 @@ get_unique_iso_path() {
     
     # Prüfe ob Datei bereits existiert und füge Nummer hinzu
     local counter=1
-    while [[ -f "$full_path" ]] && [[ "$full_path" != "$existing_file" ]]; do
+    while { [[ -f "$full_path" ]] || files_iso_path_reserved "$full_path"; } && [[ "$full_path" != "$existing_file" ]]; do
         base_filename="${base_name}_${counter}.iso"
         full_path="${target_dir}/${base_filename}"
         ((counter++))
@@ -156,6 +157,65 @@ get_unique_iso_path() {
     echo "$full_path"
 }
 
+# ===========================================================================
+# files_iso_path_reserved
+# ---------------------------------------------------------------------------
+# Funktion.: Prüft ob ein anderer Laufwerks-Worker den ISO-Pfad reserviert
+# .........  hat (Disc mit gleichem Label, Datei evtl. noch nicht angelegt)
+# Parameter: $1 = ISO-Pfad
+# Rückgabe.: 0 = reserviert, 1 = frei (im Einzelbetrieb immer frei)
+# Extras...: Reservierungen liegen als iso.reserved im Temp-Verzeichnis des
+# .........  jeweiligen Laufwerks und verschwinden mit dessen Bereinigung
+# ===========================================================================
+files_iso_path_reserved() {
+    local iso_path="$1"
+    
+    [[ -n "$DRIVE_NAME" ]] || return 1
+    
+    local own_dir reserved
+    own_dir=$(folders_get_temp_dir) || return 1
+    
+    for reserved in "${own_dir%/*}"/*/iso.reserved; do
+        [[ -f "$reserved" ]] || continue
+        [[ "$reserved" == "${own_dir}/iso.reserved" ]] && continue
+        [[ "$(<"$reserved")" == "$iso_path" ]] && return 0
+    done
+    
+    return 1
+}
+
+# ===========================================================================
+# files_reserve_iso_path
+# ---------------------------------------------------------------------------
+# Funktion.: Ermittelt einen eindeutigen ISO-Pfad und reserviert ihn für den
+# .........  Laufwerks-Worker (atomar unter flock)
+# Parameter: $1 = target_dir (Zielverzeichnis)
+# .........  $2 = base_name (Basis-Name ohne .iso)
+# Rückgabe.: Eindeutiger Pfad (wie get_unique_iso_path)
+# Extras...: Verhindert, dass zwei Laufwerke mit gleichem Disc-Label
+# .........  dieselbe ISO-Datei schreiben
+# ===========================================================================
+files_reserve_iso_path() {
+    local target_dir="$1"
+    local base_name="$2"
+    
+    local temp_dir
+    if ! temp_dir=$(folders_get_temp_dir); then
+        get_unique_iso_path "$target_dir" "$base_name"
+        return
+    fi
+    
+    (
+        # Ohne flock (oder bei Timeout) bleibt nur die Prüfung der Reservierungen
+        command -v flock >/dev/null 2>&1 && flock -w 10 9
+        
+        local iso_path
+        iso_path=$(get_unique_iso_path "$target_dir" "$base_name")
+        echo "$iso_path" > "${temp_dir}/iso.reserved"
+        echo "$iso_path"
+    ) 9>"${temp_dir%/*}/.iso_names.lock"
+}
+
 # ============================================================================
 # FILENAME INITIALIZATION
 # ============================================================================
@@ -177,12 +237,12 @@ init_filenames() {
     local disc_type
     
     if ! disc_label=$(discinfo_get_label); then
-        log_error \"init_filenames: disc_label nicht gesetzt!\"
+        log_error "init_filenames: disc_label nicht gesetzt!"
         return 1
     fi
     
     if ! disc_type=$(discinfo_get_type); then
-        log_error \"init_filenames: disc_type nicht gesetzt!\"
+        log_error "init_filenames: disc_type nicht gesetzt!"
         return 1
     fi
     
@@ -205,37 +265,42 @@ init_filenames() {
             target_dir=$(folders_get_modul_output_dir)
             ;;
     esac
-    local iso_path=$(get_unique_iso_path \"$target_dir\" \"$disc_label\")
-    discinfo_set_iso_filename \"$iso_path\"
+    local iso_path
+    if [[ -n "$DRIVE_NAME" ]]; then
+        iso_path=$(files_reserve_iso_path "$target_dir" "$disc_label")
+    else
+        iso_path=$(get_unique_iso_path "$target_dir" "$disc_label")
+    fi
+    discinfo_set_iso_filename "$iso_path"
     
     # 2. MD5-Dateinamen ableiten
-    local md5_path=\"${iso_path%.iso}.md5\"
-    discinfo_set_md5_filename \"$md5_path\"
+    local md5_path="${iso_path%.iso}.md5"
+    discinfo_set_md5_filename "$md5_path"
     
     # 3. Log-Dateinamen ableiten (im separaten log/ Verzeichnis)
-    local base_name=$(basename \"${iso_path%.iso}\")
+    local base_name=$(basename "${iso_path%.iso}")
     local log_path="$(folders_get_log_dir)/${base_name}.log"
-    discinfo_set_log_filename \"$log_path\"
+    discinfo_set_log_filename "$log_path"
     
     # 4. ISO-Basisname extrahieren
-    local iso_base=$(basename \"$iso_path\")
-    discinfo_set_iso_basename \"$iso_base\"
+    local iso_base=$(basename "$iso_path")
+    discinfo_set_iso_basename "$iso_base"
     
     # 5. Temp-Pathname erstellen (falls nicht bereits vorhanden)
     local temp_path
     if ! temp_path=$(discinfo_get_temp_pathname); then
         temp_path=$(folders_get_temp_dir)
-        discinfo_set_temp_pathname \"$temp_path\"
+        discinfo_set_temp_pathname "$temp_path"
     fi
     
     # Setze alte globale Variablen für Rückwärtskompatibilität (DEPRECATED)
-    iso_filename=\"$iso_path\"
-    md5_filename=\"$md5_path\"
-    log_filename=\"$log_path\"
-    iso_basename=\"$iso_base\"
-    temp_pathname=\"$temp_path\"
+    iso_filename="$iso_path"
+    md5_filename="$md5_path"
+    log_filename="$log_path"
+    iso_basename="$iso_base"
+    temp_pathname="$temp_path"
     
-    log_debug \"init_filenames: ISO='$iso_path', MD5='$md5_path', LOG='$log_path', TEMP='$temp_path'\"
+    log_debug "init_filenames: ISO='$iso_path', MD5='$md5_path', LOG='$log_path', TEMP='$temp_path'"
     return 0
 }
 
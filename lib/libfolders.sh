@@ -196,6 +196,9 @@ folders_get_output_dir() {
 # Rückgabe.: Pfad zum Temp-Verzeichnis (ohne trailing slash)
 # .........  Return-Code: 0 = Erfolg, 1 = Fehler (nicht erstellbar)
 # Hinweis..: Nutzt Lazy Initialization - wird nur einmal pro Session geprüft
+# .........  Im Laufwerks-Worker (DRIVE_NAME gesetzt) eigenes Unterverzeichnis
+# .........  .temp/<name>, da common_cleanup_disc_operation() das Temp-
+# .........  Verzeichnis nach jeder Disc komplett löscht
 # ===========================================================================
 folders_get_temp_dir() {
     #-- Ermitteln des kompletten Verzeichnis-Pfad ---------------------------
@@ -226,6 +229,15 @@ folders_get_temp_dir() {
         fi
     fi
 
+    #-- Unterverzeichnis des Laufwerks (nach jeder Disc neu anlegen) --------
+    if [[ -n "$DRIVE_NAME" ]]; then
+        temp_dir="${temp_dir%/}/${DRIVE_NAME}"
+        if [[ ! -d "$temp_dir" ]] && ! mkdir -p "$temp_dir" 2>/dev/null; then
+            log_error "$MSG_ERROR_TEMP_DIR_CREATE_FAILED $temp_dir$MSG_SUFFIX_MISSING_PERMISSIONS" >&2
+            return 1
+        fi
+    fi
+
     #-- Gebe Verzeichnis zurück geben ---------------------------------------
     echo "${temp_dir%/}"
     return 0
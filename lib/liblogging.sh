@@ -125,11 +125,15 @@ fi
 # LOGGING FUNCTIONS
 # ============================================================================
 
+# Präfix für alle Meldungen dieses Prozesses (z.B. "[sr0] " im
+# Laufwerks-Worker bei mehreren Laufwerken, sonst leer)
+LOG_PREFIX=""
+
 # Funktion für allgemeines Logging (Service/System)
 # Parameter: $1 = Nachricht zum Loggen
 # Ausgabe: Konsole (kein File-Logging für Service-Messages)
 log_message() {
-    local message="$1"
+    local message="${LOG_PREFIX}$1"
     local timestamp="$(date '+%Y-%m-%d %H:%M:%S')"
     
     # Optional: Caller-Info (Datei:Funktion:Zeile)
@@ -146,7 +150,7 @@ log_message() {
 # Funktion für Info-Logging (alias für log_message)
 # Parameter: $1 = Info-Nachricht
 log_info() {
-    local message="- INFO: $1"
+    local message="- INFO: ${LOG_PREFIX}$1"
     local timestamp="$(date '+%Y-%m-%d %H:%M:%S')"
     
     # Optional: Caller-Info
@@ -164,7 +168,7 @@ log_info() {
 # Parameter: $1 = Warning-Nachricht
 # Ausgabe: Konsole + stderr
 log_warning() {
-    local message="- WARNING: $1"
+    local message="- WARNING: ${LOG_PREFIX}$1"
     local timestamp="$(date '+%Y-%m-%d %H:%M:%S')"
     
     # Optional: Caller-Info
@@ -182,7 +186,7 @@ log_warning() {
 # Parameter: $1 = Error-Nachricht
 # Ausgabe: Konsole + stderr
 log_error() {
-    local message="- ERROR: $1"
+    local message="- ERROR: ${LOG_PREFIX}$1"
     local timestamp="$(date '+%Y-%m-%d %H:%M:%S')"
     
     # Optional: Caller-Info
@@ -201,7 +205,7 @@ log_error() {
 # Ausgabe: Nur wenn DEBUG=1 gesetzt ist
 log_debug() {
     if [[ "${DEBUG:-0}" == "1" ]]; then
-        local message="- DEBUG: $1"
+        local message="- DEBUG: ${LOG_PREFIX}$1"
         local timestamp="$(date '+%Y-%m-%d %H:%M:%S')"
         
         # Debug-Modus zeigt IMMER Caller-Info (überschreibt LOG_CALLER_INFO)
@@ -6,9 +6,10 @@
 #
 # Beschreibung:
 #   Service-Status und -Steuerung für systemd Services
+#   - service_get_status_all() - Status mehrerer Services (ein systemctl-Aufruf)
 #   - service_collect_status_info() - Sammelt Service-Status
 #   - service_get_status_info() - Liest Service-Status aus JSON
-#   - Unterstützt: disk2iso, disk2iso-web, disk2iso-volatile-updater
+#   - Unterstützt: disk2iso, disk2iso-web, disk2iso-updater
 #
 # ---------------------------------------------------------------------------
 # Dependencies: liblogging, libsettings
@@ -39,47 +40,122 @@ service_check_dependencies() {
 }
 
 # ===========================================================================
-# service_get_status
+# service_status_json
 # ---------------------------------------------------------------------------
-# Funktion.: Ermittle Status eines systemd Service
-# Parameter: $1 = Service-Name (ohne .service)
-# Rückgabe.: 0 = Erfolg, 1 = Fehler
-# Ausgabe..: JSON mit status (active/inactive/error/not_installed) und running (true/false)
+# Funktion.: Wandle systemd Unit-Properties in Status-JSON um
+# Parameter: $1 = LoadState, $2 = ActiveState, $3 = UnitFileState
+# Rückgabe.: 0 = Erfolg
+# Ausgabe..: JSON mit status (active/inactive/error/not_installed), running
+#            und enabled (true/false)
 # ===========================================================================
-service_get_status() {
-    local service_name="$1"
+service_status_json() {
+    local load_state="$1"
+    local active_state="$2"
+    local file_state="$3"
+    local status="inactive"
+    local running=false
+    local enabled=false
     
-    # Prüfe ob Service existiert
-    if ! systemctl list-unit-files "${service_name}.service" 2>/dev/null | grep -q "${service_name}.service"; then
-        echo '{"status":"not_installed","running":false}'
+    if [[ -z "$load_state" ]] || [[ "$load_state" == "not-found" ]]; then
+        echo '{"status":"not_installed","running":false,"enabled":false}'
         return 0
     fi
     
-    # Prüfe Service-Status
-    local status_text=$(systemctl is-active "${service_name}" 2>/dev/null)
-    local status="inactive"
-    local running=false
-    
-    case "$status_text" in
+    case "$active_state" in
         active)
             status="active"
             running=true
             ;;
-        inactive)
-            status="inactive"
-            running=false
-            ;;
         failed)
             status="error"
-            running=false
             ;;
         *)
             status="inactive"
-            running=false
             ;;
     esac
     
-    echo "{\"status\":\"${status}\",\"running\":${running}}"
+    [[ "$file_state" == "enabled" ]] && enabled=true
+    
+    echo "{\"status\":\"${status}\",\"running\":${running},\"enabled\":${enabled}}"
+}
+
+# ===========================================================================
+# service_get_status_all
+# ---------------------------------------------------------------------------
+# Funktion.: Ermittle Status mehrerer systemd Services mit EINEM systemctl-Aufruf
+# Parameter: $@ = Service-Namen (ohne .service)
+#            Ohne Parameter: disk2iso, disk2iso-web, disk2iso-updater
+# Rückgabe.: 0 = Erfolg, 1 = Fehler (systemctl nicht nutzbar)
+# Ausgabe..: JSON-Objekt {"<service>": {status, running, enabled}, ...}
+# ===========================================================================
+service_get_status_all() {
+    local services=("$@")
+    [[ ${#services[@]} -eq 0 ]] && services=("disk2iso" "disk2iso-web" "disk2iso-updater")
+    
+    local units=()
+    local name
+    for name in "${services[@]}"; do
+        units+=("${name}.service")
+    done
+    
+    # Ein Block pro Unit (Key=Value), Blöcke durch Leerzeilen getrennt
+    local output
+    output=$(systemctl show --property=Id,LoadState,ActiveState,UnitFileState "${units[@]}" 2>/dev/null) || return 1
+    
+    local -A load_states=() active_states=() file_states=()
+    local id="" load_state="" active_state="" file_state="" key value line
+    while IFS= read -r line || [[ -n "$id" ]]; do
+        if [[ -z "$line" ]]; then
+            if [[ -n "$id" ]]; then
+                load_states[$id]="$load_state"
+                active_states[$id]="$active_state"
+                file_states[$id]="$file_state"
+            fi
+            id="" load_state="" active_state="" file_state=""
+            continue
+        fi
+        key="${line%%=*}"
+        value="${line#*=}"
+        case "$key" in
+            Id) id="${value%.service}" ;;
+            LoadState) load_state="$value" ;;
+            ActiveState) active_state="$value" ;;
+            UnitFileState) file_state="$value" ;;
+        esac
+    done <<< "$output"
+    
+    local json="{"
+    local separator=""
+    for name in "${services[@]}"; do
+        json+="${separator}\"${name}\":$(service_status_json "${load_states[$name]:-}" "${active_states[$name]:-}" "${file_states[$name]:-}")"
+        separator=","
+    done
+    json+="}"
+    
+    echo "$json"
+}
+
+# ===========================================================================
+# service_get_status
+# ---------------------------------------------------------------------------
+# Funktion.: Ermittle Status eines systemd Service
+# Parameter: $1 = Service-Name (ohne .service)
+# Rückgabe.: 0 = Erfolg, 1 = Fehler
+# Ausgabe..: JSON mit status (active/inactive/error/not_installed), running
+#            und enabled (true/false)
+# ===========================================================================
+service_get_status() {
+    local service_name="$1"
+    local all_status
+    
+    all_status=$(service_get_status_all "$service_name") || {
+        echo '{"status":"error","running":false,"enabled":false}'
+        return 1
+    }
+    
+    # {"<name>":{...}} -> {...}
+    all_status="${all_status#*:}"
+    echo "${all_status%\}}"
 }
 
 # ===========================================================================
@@ -89,26 +165,19 @@ service_get_status() {
 # Parameter: keine
 # Rückgabe.: 0 = Erfolg, 1 = Fehler
 # Hinweis..: FLÜCHTIG - zyklisch ausführen (z.B. alle 10s)
+#            Alle Units werden mit einem systemctl-Aufruf abgefragt
 # Schreibt.: api/service_status.json
 # ===========================================================================
 service_collect_status_info() {
     local api_dir=$(folders_get_api_dir) || return 1
     local json_file="${api_dir}/service_status.json"
     
-    # Sammle Status aller Services
-    local disk2iso_status=$(service_get_status "disk2iso")
-    local webui_status=$(service_get_status "disk2iso-web")
-    local updater_status=$(service_get_status "disk2iso-volatile-updater")
-    
-    # Erstelle JSON
-    local json="{
-  \"disk2iso\": ${disk2iso_status},
-  \"disk2iso-web\": ${webui_status},
-  \"disk2iso-volatile-updater\": ${updater_status},
-  \"timestamp\": \"$(date -Iseconds)\"
-}"
+    local all_status
+    all_status=$(service_get_status_all) || return 1
     
-    echo "$json" > "$json_file"
+    # Zeitstempel ergänzen und atomar ersetzen (Leser sehen nie halbe Dateien)
+    echo "${all_status%\}},\"timestamp\":\"$(date -Iseconds)\"}" > "${json_file}.tmp" || return 1
+    mv -f "${json_file}.tmp" "$json_file"
 }
 
 # ===========================================================================
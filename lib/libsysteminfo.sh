@@ -456,13 +456,7 @@ systeminfo_collect_software_info() {
         python_version=$(python3 --version 2>&1 | grep -oP '\d+\.\d+(\.\d+)?' || echo "installed")
     fi
 
-    if python3 -c "import flask" 2>/dev/null; then
-        flask_version=$(python3 -c "import importlib.metadata; print(importlib.metadata.version('flask'))" 2>/dev/null || echo "installed")
-    elif [[ -f "/opt/disk2iso/venv/bin/python3" ]]; then
-        if /opt/disk2iso/venv/bin/python3 -c "import flask" 2>/dev/null; then
-            flask_version=$(/opt/disk2iso/venv/bin/python3 -c "import importlib.metadata; print(importlib.metadata.version('flask'))" 2>/dev/null || echo "installed")
-        fi
-    fi
+    flask_version=$(systeminfo_get_python_module_version "flask")
 
     if command -v mosquitto >/dev/null 2>&1; then
         mosquitto_version=$(mosquitto -h 2>&1 | grep -oP 'version \K\d+\.\d+(\.\d+)?' || echo "installed")
@@ -485,6 +479,33 @@ systeminfo_collect_software_info() {
 # SOFTWARE VERSION DETECTION (Zentrale Hilfsfunktionen)
 # ============================================================================
 
+# ===========================================================================
+# systeminfo_get_python_module_version
+# ---------------------------------------------------------------------------
+# Funktion.: Ermittle Version eines Python-Moduls (System-Python, dann venv)
+# Parameter: $1 = Modul-/Paketname (z.B. "flask")
+# Rückgabe.: 0 = gefunden, 1 = nicht gefunden
+# Ausgabe..: Version-String oder "Not installed"
+# Hinweis..: Ein Python-Start pro Interpreter (Metadaten statt Import)
+# ===========================================================================
+systeminfo_get_python_module_version() {
+    local module_name="$1"
+    local python_bin
+    local version
+    
+    for python_bin in python3 /opt/disk2iso/venv/bin/python3; do
+        command -v "$python_bin" >/dev/null 2>&1 || continue
+        version=$("$python_bin" -c "import importlib.metadata, sys; print(importlib.metadata.version(sys.argv[1]))" "$module_name" 2>/dev/null)
+        if [[ -n "$version" ]]; then
+            echo "$version"
+            return 0
+        fi
+    done
+    
+    echo "Not installed"
+    return 1
+}
+
 # ===========================================================================
 # systeminfo_get_software_version
 # ---------------------------------------------------------------------------
@@ -502,15 +523,7 @@ systeminfo_get_software_version() {
     if ! command -v "$software_name" >/dev/null 2>&1; then
         # Spezialfall: Python-Module prüfen
         if [[ "$software_name" == "flask" ]] || [[ "$software_name" == "musicbrainzngs" ]] || [[ "$software_name" == "requests" ]]; then
-            # Versuche mit System-Python
-            if python3 -c "import ${software_name}" 2>/dev/null; then
-                version=$(python3 -c "import importlib.metadata; print(importlib.metadata.version('${software_name}'))" 2>/dev/null || echo "installed")
-            # Versuche mit venv-Python
-            elif [[ -f "/opt/disk2iso/venv/bin/python3" ]]; then
-                if /opt/disk2iso/venv/bin/python3 -c "import ${software_name}" 2>/dev/null; then
-                    version=$(/opt/disk2iso/venv/bin/python3 -c "import importlib.metadata; print(importlib.metadata.version('${software_name}'))" 2>/dev/null || echo "installed")
-                fi
-            fi
+            version=$(systeminfo_get_python_module_version "$software_name")
         fi
         
         echo "$version"
@@ -590,11 +603,31 @@ systeminfo_get_available_version() {
     return 0
 }
 
+# ===========================================================================
+# systeminfo_get_available_versions
+# ---------------------------------------------------------------------------
+# Funktion.: Ermittle verfügbare Versionen mehrerer Pakete (ein apt-cache)
+# Parameter: $@ = Paketnamen
+# Rückgabe.: 0 = Erfolg
+# Ausgabe..: Zeilen "<paket> <version>" (nur Pakete mit Candidate)
+# ===========================================================================
+systeminfo_get_available_versions() {
+    [[ $# -eq 0 ]] && return 0
+    command -v apt-cache >/dev/null 2>&1 || return 0
+    
+    LC_ALL=C apt-cache policy "$@" 2>/dev/null | awk '
+        /^[^ \t].*:$/ { pkg = substr($0, 1, length($0) - 1); sub(/:.*/, "", pkg); next }
+        pkg != "" && $1 == "Candidate:" && $2 != "(none)" { print pkg, $2; pkg = "" }
+    '
+    return 0
+}
+
 # ===========================================================================
 # systeminfo_check_software_list
 # ---------------------------------------------------------------------------
 # Funktion.: Zentrale Software-Versions-Prüfung mit Update-Check
-# Parameter: $@ = Liste von Software-Namen (z.B. "cdparanoia lame ddrescue")
+# Parameter: $@ = Liste von Software-Namen (z.B. "cdparanoia lame ddrescue"
+# .........  oder komma-separiert "cdparanoia,lame,ddrescue")
 # Rückgabe.: 0 = Erfolg
 # Ausgabe..: JSON-Array mit Software-Informationen (stdout)
 # Format...: [{"name":"cdparanoia","installed":"10.2","available":"10.2",
@@ -602,11 +635,22 @@ systeminfo_get_available_version() {
 # Nutzung..: Wird von Modulen aufgerufen für ihre Dependencies
 # ===========================================================================
 systeminfo_check_software_list() {
-    local software_list=("$@")
+    local software_list=()
     local json_array="["
     local first=true
     
+    # Komma- und Leerzeichen-getrennte Listen (INI-Dependencies) aufteilen
+    IFS=', ' read -r -a software_list <<< "$*"
+    
+    # Alle Candidate-Versionen mit einem apt-cache Aufruf
+    local -A available_versions=()
+    local pkg_name pkg_version
+    while read -r pkg_name pkg_version; do
+        [[ -n "$pkg_name" ]] && available_versions["$pkg_name"]="$pkg_version"
+    done < <(systeminfo_get_available_versions "${software_list[@]}")
+    
     for software_name in "${software_list[@]}"; do
+        [[ -z "$software_name" ]] && continue
         # Komma zwischen Einträgen
         if [[ "$first" == "false" ]]; then
             json_array+=","
@@ -616,11 +660,8 @@ systeminfo_check_software_list() {
         # 1. Installierte Version ermitteln
         local installed_version=$(systeminfo_get_software_version "$software_name")
         
-        # 2. Verfügbare Version ermitteln (nur wenn installiert oder apt verfügbar)
-        local available_version="Unknown"
-        if [[ "$installed_version" != "Not installed" ]] || command -v apt-cache >/dev/null 2>&1; then
-            available_version=$(systeminfo_get_available_version "$software_name")
-        fi
+        # 2. Verfügbare Version (aus der gebündelten apt-cache Abfrage)
+        local available_version="${available_versions[$software_name]:-Unknown}"
         
         # 3. Status bestimmen
         local status="unknown"
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso API Events - Server-Sent Events für Änderungen im api/ Verzeichnis
+Version 1.3.0
+
+Ein einzelner Hintergrund-Thread pro Prozess beobachtet das API-Verzeichnis
+(inotify via fswatch.py) und verteilt typisierte Events an alle verbundenen
+SSE-Clients. Ein Event wird nur gesendet, wenn sich der Inhalt einer Datei
+tatsächlich geändert hat (api_write_json schreibt oft identische Inhalte).
+
+Ohne inotify wird grob gepollt. Der Thread läuft nur, solange Clients
+verbunden sind: nach dem letzten unsubscribe() schließt er den Watcher und
+endet, der nächste subscribe() startet ihn neu (Stand wird neu eingelesen).
+
+Bei mehreren Laufwerken schreibt jeder Laufwerks-Worker seinen Disc-Status
+nach api/drives/<name>/ - diese Dateien lösen ebenfalls 'status' aus.
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import hashlib
+import threading
+from typing import Callable, Dict, Optional, Set
+
+import fswatch
+
+
+# Pfade (analog zu den Widget-Blueprints überschreibbar per Environment)
+INSTALL_DIR = os.environ.get('DISK2ISO_INSTALL_DIR', '/opt/disk2iso')
+API_DIR = os.path.join(INSTALL_DIR, 'api')
+
+# API-Datei -> Event-Typ
+EVENT_FILES = {
+    'status.json': 'status',
+    'attributes.json': 'status',
+    'progress.json': 'status',
+    'drives.json': 'status',
+    'history.json': 'history',
+    'musicbrainz_selection.json': 'musicbrainz',
+    'musicbrainz_releases.json': 'musicbrainz',
+    'archive_changes.queue': 'archive',
+}
+
+# Disc-Status je Laufwerk (drives/<name>/status.json usw., Event 'status')
+DRIVES_SUBDIR = 'drives'
+DRIVE_FILES = ('status.json', 'attributes.json', 'progress.json')
+
+# Präfix-Regeln für dynamische Dateinamen (z.B. tmdb_results.json)
+EVENT_PREFIXES = {
+    'musicbrainz_': 'musicbrainz',
+    'tmdb_': 'tmdb',
+}
+
+# Sammelzeit für zusammengehörige Schreibvorgänge (status + attributes + progress)
+COALESCE_DELAY = 0.02
+
+# Polling-Intervall ohne inotify (nur bei verbundenen Clients)
+POLL_INTERVAL = 2.0
+
+# Mit inotify: so oft prüfen, ob noch Clients verbunden sind (Sekunden)
+IDLE_CHECK_INTERVAL = 1.0
+
+# Keepalive-Kommentar für SSE-Verbindungen (erkennt getrennte Clients)
+KEEPALIVE_INTERVAL = 30
+
+# Maximale Anzahl ungesendeter Events pro Client
+CLIENT_QUEUE_SIZE = 32
+
+
+def event_type_for(filename: str) -> Optional[str]:
+    """
+    Ordnet eine Datei im API-Verzeichnis einem Event-Typ zu.
+
+    Args:
+        filename: Dateiname relativ zum API-Verzeichnis
+
+    Returns:
+        Event-Typ oder None (Datei nicht relevant)
+    """
+    if '/' in filename:
+        # Nur der Disc-Status je Laufwerk: drives/<name>/<datei>
+        parts = filename.split('/')
+        if len(parts) == 3 and parts[0] == DRIVES_SUBDIR and parts[2] in DRIVE_FILES:
+            return 'status'
+        return None
+    if filename.startswith('.'):
+        return None
+    event_type = EVENT_FILES.get(filename)
+    if event_type:
+        return event_type
+    for prefix, prefix_type in EVENT_PREFIXES.items():
+        if filename.startswith(prefix) and filename.endswith('.json'):
+            return prefix_type
+    return None
+
+
+def format_sse(event_type: str, payload: Dict) -> str:
+    """Formatiert ein Event im text/event-stream Format."""
+    data = json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+    return f'event: {event_type}\ndata: {data}\n\n'
+
+
+class EventHub:
+    """
+    Verteilt Änderungen im API-Verzeichnis an SSE-Abonnenten.
+
+    Payloads werden pro Änderung einmal erzeugt (nicht pro Client). Für
+    Event-Typen ohne registrierten Builder wird {'files': [...]} gesendet.
+    """
+
+    def __init__(self, api_dir: str = API_DIR):
+        self.api_dir = api_dir
+        self._subscribers: Set[queue.Queue] = set()
+        self._lock = threading.Lock()
+        self._has_subscribers = threading.Event()
+        self._builders: Dict[str, Callable[[], Dict]] = {}
+        self._digests: Dict[str, Optional[str]] = {}
+        self._thread: Optional[threading.Thread] = None
+        self.watch_mode = 'none'
+
+    def register_builder(self, event_type: str, builder: Callable[[], Dict]):
+        """
+        Registriert eine Funktion, die den Payload eines Event-Typs erzeugt.
+
+        Args:
+            event_type: z.B. 'status'
+            builder: Funktion ohne Parameter, liefert JSON-serialisierbares Dict
+        """
+        self._builders[event_type] = builder
+
+    def build_payload(self, event_type: str, files=()) -> Dict:
+        """Erzeugt den Payload eines Events (Builder oder Dateiliste)."""
+        builder = self._builders.get(event_type)
+        if builder is not None:
+            return builder()
+        return {'files': sorted(files)}
+
+    def subscribe(self) -> queue.Queue:
+        """
+        Meldet einen Client an und startet bei Bedarf den Watcher-Thread.
+
+        Returns:
+            Queue mit (event_type, payload) Tupeln
+        """
+        subscription = queue.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers.add(subscription)
+            self._has_subscribers.set()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='api-events', daemon=True)
+                self._thread.start()
+        return subscription
+
+    def unsubscribe(self, subscription: queue.Queue):
+        """Meldet einen Client ab."""
+        with self._lock:
+            self._subscribers.discard(subscription)
+            if not self._subscribers:
+                self._has_subscribers.clear()
+
+    @property
+    def subscriber_count(self) -> int:
+        """Anzahl verbundener Clients."""
+        return len(self._subscribers)
+
+    def _changed(self, filename: str) -> bool:
+        """Prüft per Content-Hash, ob sich eine Datei wirklich geändert hat."""
+        try:
+            with open(os.path.join(self.api_dir, filename), 'rb') as f:
+                digest = hashlib.sha1(f.read()).hexdigest()
+        except OSError:
+            digest = None
+        if self._digests.get(filename, '') == digest:
+            return False
+        self._digests[filename] = digest
+        return True
+
+    def _dispatch(self, filenames):
+        """Gruppiert geänderte Dateien nach Event-Typ und verteilt die Events."""
+        by_type: Dict[str, Set[str]] = {}
+        for filename in set(filenames):
+            event_type = event_type_for(filename)
+            if event_type and self._changed(filename):
+                by_type.setdefault(event_type, set()).add(filename)
+
+        if not by_type:
+            return
+
+        with self._lock:
+            subscribers = list(self._subscribers)
+        if not subscribers:
+            return
+
+        for event_type, files in by_type.items():
+            try:
+                payload = self.build_payload(event_type, files)
+            except Exception as e:
+                print(f"Fehler beim Erzeugen von Event '{event_type}': {e}", file=sys.stderr)
+                continue
+            self._broadcast(subscribers, event_type, payload)
+
+    @staticmethod
+    def _broadcast(subscribers, event_type: str, payload: Dict):
+        for subscription in subscribers:
+            try:
+                subscription.put_nowait((event_type, payload))
+            except queue.Full:
+                # Langsamer Client: ältestes Event verwerfen
+                try:
+                    subscription.get_nowait()
+                    subscription.put_nowait((event_type, payload))
+                except (queue.Empty, queue.Full):
+                    pass
+
+    def publish(self, event_type: str, payload: Optional[Dict] = None):
+        """
+        Verteilt ein Event, das nicht aus dem API-Verzeichnis stammt
+        (z.B. neue Query-Datei im Metadaten-Spool).
+
+        Args:
+            event_type: Event-Typ
+            payload: Payload oder None (Builder des Event-Typs verwenden)
+        """
+        with self._lock:
+            subscribers = list(self._subscribers)
+        if not subscribers:
+            return
+        if payload is None:
+            try:
+                payload = self.build_payload(event_type)
+            except Exception as e:
+                print(f"Fehler beim Erzeugen von Event '{event_type}': {e}", file=sys.stderr)
+                return
+        self._broadcast(subscribers, event_type, payload)
+
+    def _scan(self):
+        """
+        Relevante Dateien im API-Verzeichnis inkl. drives/<name>/.
+
+        Yields:
+            (Pfad relativ zum API-Verzeichnis, os.DirEntry)
+        """
+        with os.scandir(self.api_dir) as entries:
+            for entry in entries:
+                if event_type_for(entry.name):
+                    yield entry.name, entry
+        try:
+            with os.scandir(os.path.join(self.api_dir, DRIVES_SUBDIR)) as drives:
+                drive_dirs = [d.name for d in drives if d.is_dir() and not d.name.startswith('.')]
+        except OSError:
+            return
+        for drive in drive_dirs:
+            try:
+                with os.scandir(os.path.join(self.api_dir, DRIVES_SUBDIR, drive)) as entries:
+                    for entry in entries:
+                        relpath = f'{DRIVES_SUBDIR}/{drive}/{entry.name}'
+                        if event_type_for(relpath):
+                            yield relpath, entry
+            except OSError:
+                continue
+
+    def _prime(self):
+        """Merkt sich den aktuellen Stand aller relevanten Dateien."""
+        try:
+            for relpath, _entry in self._scan():
+                self._changed(relpath)
+        except OSError:
+            pass
+
+    def _run(self):
+        while True:
+            self._run_once()
+            with self._lock:
+                # Während des Beendens neu verbunden -> weiterlaufen
+                if not self._subscribers:
+                    self._thread = None
+                    return
+
+    def _run_once(self):
+        """Beobachtet das API-Verzeichnis, solange Clients verbunden sind."""
+        self._digests.clear()
+        self._prime()
+
+        watcher = None
+        if fswatch.available() and os.path.isdir(self.api_dir):
+            try:
+                watcher = fswatch.Watcher(fswatch.IN_CLOSE_WRITE | fswatch.IN_MOVED_TO | fswatch.IN_DELETE)
+                watcher.add(self.api_dir, recursive=True)
+                self.watch_mode = 'inotify'
+            except OSError as e:
+                print(f"inotify für {self.api_dir} nicht nutzbar ({e}), nutze Polling", file=sys.stderr)
+                if watcher is not None:
+                    watcher.close()
+                watcher = None
+
+        try:
+            if watcher is not None:
+                self._watch_loop(watcher)
+            else:
+                self.watch_mode = 'polling'
+                self._poll_loop()
+        finally:
+            if watcher is not None:
+                watcher.close()
+            self.watch_mode = 'none'
+
+    def _watch_loop(self, watcher: 'fswatch.Watcher'):
+        while self._has_subscribers.is_set():
+            events = watcher.read_events(timeout=IDLE_CHECK_INTERVAL)
+            if not events:
+                continue
+            events.extend(watcher.read_events(timeout=COALESCE_DELAY))
+            try:
+                if any(mask & fswatch.IN_Q_OVERFLOW for _, mask in events):
+                    # Events verloren: alle Dateien prüfen, der Content-Hash
+                    # filtert die unveränderten heraus
+                    self._dispatch([relpath for relpath, _ in self._scan()])
+                else:
+                    self._dispatch(os.path.relpath(path, self.api_dir) for path, _ in events if path)
+            except Exception as e:
+                print(f"Fehler beim Verteilen von API-Events: {e}", file=sys.stderr)
+
+    def _poll_loop(self):
+        stamps: Dict[str, tuple] = {}
+        while self._has_subscribers.is_set():
+            changed = []
+            try:
+                for relpath, entry in self._scan():
+                    st = entry.stat()
+                    stamp = (st.st_mtime_ns, st.st_size)
+                    if stamps.get(relpath) != stamp:
+                        stamps[relpath] = stamp
+                        changed.append(relpath)
+                self._dispatch(changed)
+            except OSError as e:
+                print(f"Fehler beim Polling von {self.api_dir}: {e}", file=sys.stderr)
+            time.sleep(POLL_INTERVAL)
+
+
+_hub: Optional[EventHub] = None
+_hub_lock = threading.Lock()
+
+
+def get_hub() -> EventHub:
+    """Liefert den EventHub des Prozesses (lazy erzeugt)."""
+    global _hub
+    with _hub_lock:
+        if _hub is None:
+            _hub = EventHub()
+        return _hub
@@ -8,139 +8,53 @@ Description: Flask-basierte Web-OberflÃ¤che fÃ¼r disk2iso Monitoring
 from flask import Flask, render_template, jsonify, request, Response, g, send_file
 import os
 import sys
+import posixpath
 import time
 import json
+import queue
 import subprocess
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from i18n import get_translations
+from werkzeug.utils import safe_join
+import i18n
+import settings_cache
+import lib_broker
+import archive_index
+import api_events
+import dashboard
+import service_status
+import log_tail
+import jobs
+import tmdb_posters
+import metadata_cache
+import metadata_spool
+import software_inventory
+import plugin_registry
+import metrics
+import profiling
+import request_timeouts
 
 app = Flask(__name__)
 
+# Request-Latenzen, Bash-Aufrufe und Cache-Treffer unter /metrics
+metrics.init_app(app)
+
+# Opt-in Server-Timing/Profiling (WEB_PROFILING bzw. Header X-Disk2iso-Profile)
+profiling.init_app(app)
+
+# Zeitbudget pro Routen-Klasse (WEB_TIMEOUT_*), kürzt Bash-/Subprozess-Timeouts
+request_timeouts.init_app(app)
+
 # Register Blueprints fÃ¼r modulare Routen
 # DEPRECATED: Core Config API removed - now using widget-specific endpoints
 # Was: from routes import config_bp
 # Config is now managed via routes/widgets/*_widget_settings.py
 
-# Widget Settings Blueprints (Core Widgets)
-try:
-    from routes.widgets.settings_config import settings_config_bp
-    from routes.widgets.settings_common import common_settings_bp
-    from routes.widgets.settings_drivestat import drivestat_settings_bp
-    from routes.widgets.settings_metadata import metadata_widget_settings_bp
-    app.register_blueprint(settings_config_bp)
-    app.register_blueprint(common_settings_bp)
-    app.register_blueprint(drivestat_settings_bp)
-    app.register_blueprint(metadata_widget_settings_bp)
-    print("INFO: Core widget settings loaded", file=sys.stderr)
-except ImportError as e:
-    print(f"WARNING: Some widget settings failed to load: {e}", file=sys.stderr)
-
-# Widget Status/Info Blueprints (Systeminfo, Status, etc.)
-try:
-    from routes.widgets.status_disk2iso import status_disk2iso_bp
-    from routes.widgets.status_disk2iso_web import status_disk2iso_web_bp
-    from routes.widgets.sysinfo_systeminfo import sysinfo_systeminfo_bp
-    from routes.widgets.outputdir_systeminfo import outputdir_systeminfo_bp
-    from routes.widgets.archiv_systeminfo import archiv_systeminfo_bp
-    from routes.widgets.softwarecheck_systeminfo import softwarecheck_systeminfo_bp
-    from routes.widgets.dependencies_systeminfo import dependencies_systeminfo_bp
-    
-    app.register_blueprint(status_disk2iso_bp)
-    app.register_blueprint(status_disk2iso_web_bp)
-    app.register_blueprint(sysinfo_systeminfo_bp)
-    app.register_blueprint(outputdir_systeminfo_bp)
-    app.register_blueprint(archiv_systeminfo_bp)
-    app.register_blueprint(softwarecheck_systeminfo_bp)
-    app.register_blueprint(dependencies_systeminfo_bp)
-    print("INFO: Widget status/info modules loaded", file=sys.stderr)
-except ImportError as e:
-    print(f"WARNING: Some widget modules failed to load: {e}", file=sys.stderr)
-
-# Module Dependencies-Widgets (optionale externe Module)
-# Erweitere Python-Path für Submodul-Importe
-MODULE_BASE_DIR = Path("/opt")  # Basis-Verzeichnis für alle disk2iso-Module
-
-try:
-    # Audio-Modul Dependencies
-    audio_path = MODULE_BASE_DIR / "disk2iso-audio" / "www"
-    if audio_path.exists():
-        sys.path.insert(0, str(audio_path))
-        from routes.widgets.dependencies_audio import dependencies_audio_bp
-        app.register_blueprint(dependencies_audio_bp)
-        print("INFO: Audio dependencies widget loaded", file=sys.stderr)
-except ImportError as e:
-    print(f"INFO: Audio dependencies widget not available: {e}", file=sys.stderr)
-
-try:
-    # DVD-Modul Dependencies
-    dvd_path = MODULE_BASE_DIR / "disk2iso-dvd" / "www"
-    if dvd_path.exists():
-        sys.path.insert(0, str(dvd_path))
-        from routes.widgets.dependencies_dvd import dependencies_dvd_bp
-        app.register_blueprint(dependencies_dvd_bp)
-        print("INFO: DVD dependencies widget loaded", file=sys.stderr)
-except ImportError as e:
-    print(f"INFO: DVD dependencies widget not available: {e}", file=sys.stderr)
-
-try:
-    # Bluray-Modul Dependencies
-    bluray_path = MODULE_BASE_DIR / "disk2iso-bluray" / "www"
-    if bluray_path.exists():
-        sys.path.insert(0, str(bluray_path))
-        from routes.widgets.dependencies_bluray import dependencies_bluray_bp
-        app.register_blueprint(dependencies_bluray_bp)
-        print("INFO: Bluray dependencies widget loaded", file=sys.stderr)
-except ImportError as e:
-    print(f"INFO: Bluray dependencies widget not available: {e}", file=sys.stderr)
-
-try:
-    # Metadata-Modul Dependencies
-    metadata_path = MODULE_BASE_DIR / "disk2iso-metadata" / "www"
-    if metadata_path.exists():
-        sys.path.insert(0, str(metadata_path))
-        from routes.widgets.dependencies_metadata import dependencies_metadata_bp
-        from routes.widgets.dependencies_cdtext import dependencies_cdtext_bp
-        app.register_blueprint(dependencies_metadata_bp)
-        app.register_blueprint(dependencies_cdtext_bp)
-        print("INFO: Metadata/CDText dependencies widgets loaded", file=sys.stderr)
-except ImportError as e:
-    print(f"INFO: Metadata dependencies widgets not available: {e}", file=sys.stderr)
-
-try:
-    # MusicBrainz-Modul Dependencies
-    musicbrainz_path = MODULE_BASE_DIR / "disk2iso-musicbrainz" / "www"
-    if musicbrainz_path.exists():
-        sys.path.insert(0, str(musicbrainz_path))
-        from routes.widgets.dependencies_musicbrainz import dependencies_musicbrainz_bp
-        app.register_blueprint(dependencies_musicbrainz_bp)
-        print("INFO: MusicBrainz dependencies widget loaded", file=sys.stderr)
-except ImportError as e:
-    print(f"INFO: MusicBrainz dependencies widget not available: {e}", file=sys.stderr)
-
-try:
-    # TMDB-Modul Dependencies
-    tmdb_path = MODULE_BASE_DIR / "disk2iso-tmdb" / "www"
-    if tmdb_path.exists():
-        sys.path.insert(0, str(tmdb_path))
-        from routes.widgets.dependencies_tmdb import dependencies_tmdb_bp
-        app.register_blueprint(dependencies_tmdb_bp)
-        print("INFO: TMDB dependencies widget loaded", file=sys.stderr)
-except ImportError as e:
-    print(f"INFO: TMDB dependencies widget not available: {e}", file=sys.stderr)
-
-try:
-    # MQTT-Modul Dependencies + Status
-    mqtt_path = MODULE_BASE_DIR / "disk2iso-mqtt" / "www"
-    if mqtt_path.exists():
-        sys.path.insert(0, str(mqtt_path))
-        from routes.widgets.dependencies_mqtt import dependencies_mqtt_bp
-        from routes.widgets.status_mqtt import status_mqtt_bp
-        app.register_blueprint(dependencies_mqtt_bp)
-        app.register_blueprint(status_mqtt_bp)
-        print("INFO: MQTT dependencies + status widgets loaded", file=sys.stderr)
-except ImportError as e:
-    print(f"INFO: MQTT widgets not available: {e}", file=sys.stderr)
+# Widget-Blueprints (Core + optionale Module unter /opt/disk2iso-<modul>/www)
+# Die Registry legt beim Start nur URL-Stubs aus dem Manifest an und
+# importiert ein Widget erst beim ersten Request (siehe plugin_registry.py)
+plugins = plugin_registry.PluginRegistry(app)
+plugins.setup()
 
 # MQTT-Modul Detection (externes Plugin - Legacy Routes)
 MQTT_MODULE_AVAILABLE = False
@@ -153,11 +67,15 @@ except ImportError:
     pass  # Normal wenn nur neue Widget-Struktur verwendet wird
 
 # Konfiguration
-INSTALL_DIR = Path("/opt/disk2iso")
+INSTALL_DIR = Path(os.environ.get("DISK2ISO_INSTALL_DIR", "/opt/disk2iso"))
 SETTINGS_FILE = INSTALL_DIR / "conf" / "disk2iso.conf"
 VERSION_FILE = INSTALL_DIR / "VERSION"
 API_DIR = INSTALL_DIR / "api"
 
+# Thumbnails mit relativem Pfad: nur aus dem Poster-Cache und nur Bilder
+THUMBNAIL_SUBDIR = '.temp/tmdb/thumbs/'
+THUMBNAIL_TYPES = {'.jpg': 'image/jpeg', '.jpeg': 'image/jpeg', '.png': 'image/png'}
+
 def get_version():
     """Liest Version aus VERSION-Datei"""
     try:
@@ -169,38 +87,30 @@ def get_version():
 
 def get_setting_value(key, default=""):
     """
-    Liest EINZELNEN Wert aus disk2iso.conf via libsettings.sh
-    Architektur-Prinzip: Python = Middleware, BASH = Settings-Logic
+    Liest EINZELNEN Wert aus disk2iso.conf via settings_cache
+    Parsing mit derselben Semantik wie settings_get_value_conf (libsettings.sh),
+    Datei wird nur bei Änderung (mtime/Inode) neu eingelesen.
     """
+    return settings_cache.get_value_conf("disk2iso", key, default)
+
+def get_setting_int(key, default):
+    """Liest Integer-Wert aus disk2iso.conf, Fallback bei ungültigem Wert"""
     try:
-        script = f"""
-        source {INSTALL_DIR}/lib/libsettings.sh
-        settings_get_value_conf "disk2iso" "{key}" "{default}"
-        """
-        result = subprocess.run(
-            ['/bin/bash', '-c', script],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-        return default
-    except Exception as e:
-        print(f"Fehler beim Lesen von {key}: {e}", file=sys.stderr)
+        return int(get_setting_value(key, str(default)))
+    except ValueError:
         return default
 
 def get_settings():
     """
-    Liest Core-Konfiguration via libsettings.sh (BASH)
-    Python macht KEIN direktes File-Parsing - Architektur vor Performance!
+    Liest Core-Konfiguration aus dem In-Process Settings-Cache
+    Lesen erfolgt ohne Bash-Fork, Schreiben weiterhin via libsettings.sh (BASH)
     """
     settings = {
         "output_dir": get_setting_value("DEFAULT_OUTPUT_DIR", "/media/iso"),
-        "mp3_quality": int(get_setting_value("MP3_QUALITY", "2")),
-        "ddrescue_retries": int(get_setting_value("DDRESCUE_RETRIES", "1")),
-        "usb_detection_attempts": int(get_setting_value("USB_DRIVE_DETECTION_ATTEMPTS", "5")),
-        "usb_detection_delay": int(get_setting_value("USB_DRIVE_DETECTION_DELAY", "10")),
+        "mp3_quality": get_setting_int("MP3_QUALITY", 2),
+        "ddrescue_retries": get_setting_int("DDRESCUE_RETRIES", 1),
+        "usb_detection_attempts": get_setting_int("USB_DRIVE_DETECTION_ATTEMPTS", 5),
+        "usb_detection_delay": get_setting_int("USB_DRIVE_DETECTION_DELAY", 10),
         "tmdb_api_key": get_setting_value("TMDB_API_KEY", ""),
         # Module-Schalter
         "metadata_enabled": get_setting_value("METADATA_ENABLED", "true") == "true",
@@ -221,13 +131,13 @@ def get_settings():
 
 @app.before_request
 def before_request():
-    """LÃ¤dt Ãœbersetzungen vor jedem Request"""
-    g.t = get_translations()
+    """Stellt Übersetzungen bereit (Katalog wird erst beim ersten Zugriff geladen)"""
+    g.t = i18n.translations
 
 @app.context_processor
 def inject_translations():
     """Macht Ãœbersetzungen in allen Templates verfÃ¼gbar"""
-    return {'t': g.get('t', {})}
+    return {'t': g.get('t', i18n.translations)}
 
 def get_service_status_detailed(service_name):
     """PrÃ¼ft detaillierten Status eines systemd Service
@@ -239,36 +149,8 @@ def get_service_status_detailed(service_name):
         dict mit 'status' (not_installed|inactive|active|error) und 'running' (bool)
     """
     try:
-        # PrÃ¼fe ob Service existiert
-        result_exists = subprocess.run(
-            ['/usr/bin/systemctl', 'list-unit-files', f'{service_name}.service'],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        
-        if service_name not in result_exists.stdout:
-            return {'status': 'not_installed', 'running': False}
-        
-        # PrÃ¼fe Service-Status
-        result = subprocess.run(
-            ['/usr/bin/systemctl', 'is-active', service_name],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        
-        status_text = result.stdout.strip()
-        
-        if status_text == 'active':
-            return {'status': 'active', 'running': True}
-        elif status_text == 'inactive':
-            return {'status': 'inactive', 'running': False}
-        elif status_text == 'failed':
-            return {'status': 'error', 'running': False}
-        else:
-            return {'status': 'inactive', 'running': False}
-            
+        # Gebündelte, kurz gecachte Abfrage aller disk2iso Units
+        return service_status.get_status(service_name)
     except:
         return {'status': 'error', 'running': False}
 
@@ -295,106 +177,39 @@ def get_disk_space(path):
         return {'free_gb': 0, 'total_gb': 0, 'used_percent': 0, 'free_percent': 0}
 
 def count_iso_files(path):
-    """ZÃ¤hlt ISO-Dateien im Ausgabeverzeichnis"""
+    """Zählt ISO-Dateien im Ausgabeverzeichnis (aus dem Archiv-Index)"""
     try:
-        if not os.path.exists(path):
-            return 0
-        count = 0
-        for root, dirs, files in os.walk(path):
-            count += len([f for f in files if f.lower().endswith('.iso')])
-        return count
-    except:
+        return archive_index.get_index(path).total()
+    except Exception as e:
+        print(f"Fehler beim Lesen des Archiv-Index: {e}", file=sys.stderr)
         return 0
 
+def get_archive_counts(path):
+    """Anzahl ISOs je Typ (aus dem Archiv-Index)"""
+    try:
+        return archive_index.get_index(path).counts()
+    except Exception as e:
+        print(f"Fehler beim Lesen des Archiv-Index: {e}", file=sys.stderr)
+        return {'data': 0, 'audio': 0, 'dvd': 0, 'bluray': 0}
+
 def get_iso_files_by_type(path):
-    """Holt alle ISO-Dateien gruppiert nach Typ"""
-    result = {
-        'audio': [],
-        'dvd': [],
-        'bluray': [],
-        'data': []
-    }
+    """Holt alle ISO-Dateien gruppiert nach Typ (aus dem Archiv-Index)
     
+    Der Index (archive_index.py) wird per inotify bzw. mtime-Rescan und
+    über den Daemon-Hook api_notify_archive_change() aktuell gehalten.
+    """
     try:
-        if not os.path.exists(path):
-            return result
-        
-        for root, dirs, files in os.walk(path):
-            for filename in files:
-                if not filename.lower().endswith('.iso'):
-                    continue
-                
-                filepath = os.path.join(root, filename)
-                try:
-                    stat = os.stat(filepath)
-                    file_info = {
-                        'name': filename,
-                        'path': filepath,
-                        'size': stat.st_size,
-                        'created': datetime.fromtimestamp(stat.st_ctime).strftime('%Y-%m-%d %H:%M:%S'),
-                        'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-                    }
-                    
-                    # PrÃ¼fe ob .nfo Metadaten existieren
-                    nfo_path = filepath.replace('.iso', '.nfo')
-                    if os.path.exists(nfo_path):
-                        try:
-                            with open(nfo_path, 'r', encoding='utf-8') as nfo:
-                                nfo_data = {}
-                                for line in nfo:
-                                    if '=' in line:
-                                        key, value = line.strip().split('=', 1)
-                                        nfo_data[key.lower()] = value
-                                file_info['metadata'] = nfo_data
-                        except:
-                            pass
-                    
-                    # PrÃ¼fe ob Thumbnail existiert
-                    thumb_path = filepath.replace('.iso', '-thumb.jpg')
-                    if os.path.exists(thumb_path):
-                        file_info['thumbnail'] = os.path.basename(thumb_path)
-                    
-                    # Determine type based on directory structure (primary) or filename pattern (fallback)
-                    # Normalisiere Pfad-Komponenten
-                    path_parts = os.path.normpath(root).split(os.sep)
-                    filename_lower = filename.lower()
-                    
-                    # PrÃ¼fe zuerst Ordnerstruktur
-                    if 'audio' in path_parts:
-                        result['audio'].append(file_info)
-                    elif 'dvd' in path_parts:
-                        result['dvd'].append(file_info)
-                    elif 'bluray' in path_parts or 'blu-ray' in path_parts or 'bd' in path_parts:
-                        result['bluray'].append(file_info)
-                    elif 'data' in path_parts:
-                        result['data'].append(file_info)
-                    # Fallback: Dateiname-Pattern
-                    elif '_audio-cd_' in filename_lower or '_audiocd_' in filename_lower:
-                        result['audio'].append(file_info)
-                    elif '_bluray_' in filename_lower or '_bd_' in filename_lower or '_blu-ray_' in filename_lower:
-                        result['bluray'].append(file_info)
-                    elif '_dvd_' in filename_lower or '_dvd-video_' in filename_lower:
-                        result['dvd'].append(file_info)
-                    else:
-                        result['data'].append(file_info)
-                except Exception as e:
-                    print(f"Fehler beim Lesen von {filename}: {e}", file=sys.stderr)
-        
-        # Sort each list by modified date (newest first)
-        for type_key in result:
-            result[type_key].sort(key=lambda x: x['modified'], reverse=True)
-    
+        return archive_index.get_index(path).files_by_type()
     except Exception as e:
         print(f"Fehler beim Durchsuchen des Archivs: {e}", file=sys.stderr)
-    
-    return result
+        return {'audio': [], 'dvd': [], 'bluray': [], 'data': []}
 
 def read_api_json(filename):
     """Liest JSON-Datei aus API-Verzeichnis"""
     try:
         file_path = API_DIR / filename
         if file_path.exists():
-            with open(file_path, 'r') as f:
+            with profiling.span('file', filename), open(file_path, 'r') as f:
                 return json.load(f)
     except Exception as e:
         print(f"Fehler beim Lesen von {filename}: {e}", file=sys.stderr)
@@ -406,10 +221,7 @@ def get_os_info():
     Nutzt systeminfo_get_os_info() aus libsysteminfo.sh
     """
     try:
-        result = subprocess.run(
-            ['bash', '-c', f'source {INSTALL_DIR}/lib/libsysteminfo.sh && systeminfo_get_os_info'],
-            capture_output=True, text=True, timeout=5
-        )
+        result = lib_broker.call('systeminfo_get_os_info', timeout=5)
         if result.returncode == 0:
             return json.loads(result.stdout.strip())
         return {}
@@ -423,10 +235,7 @@ def get_storage_info():
     Nutzt systeminfo_get_storage_info() aus libsysteminfo.sh
     """
     try:
-        result = subprocess.run(
-            ['bash', '-c', f'source {INSTALL_DIR}/lib/libsysteminfo.sh && source {INSTALL_DIR}/lib/libfolders.sh && systeminfo_get_storage_info'],
-            capture_output=True, text=True, timeout=5
-        )
+        result = lib_broker.call('systeminfo_get_storage_info', timeout=5)
         if result.returncode == 0:
             return json.loads(result.stdout.strip())
         return {}
@@ -440,10 +249,7 @@ def get_archiv_info():
     Nutzt systeminfo_get_archiv_info() aus libsysteminfo.sh
     """
     try:
-        result = subprocess.run(
-            ['bash', '-c', f'source {INSTALL_DIR}/lib/libsysteminfo.sh && source {INSTALL_DIR}/lib/libfolders.sh && systeminfo_get_archiv_info'],
-            capture_output=True, text=True, timeout=5
-        )
+        result = lib_broker.call('systeminfo_get_archiv_info', timeout=5)
         if result.returncode == 0:
             return json.loads(result.stdout.strip())
         return {}
@@ -457,10 +263,7 @@ def get_software_info():
     Nutzt systeminfo_get_software_info() aus libsysteminfo.sh
     """
     try:
-        result = subprocess.run(
-            ['bash', '-c', f'source {INSTALL_DIR}/lib/libsysteminfo.sh && systeminfo_get_software_info'],
-            capture_output=True, text=True, timeout=5
-        )
+        result = lib_broker.call('systeminfo_get_software_info', timeout=5)
         if result.returncode == 0:
             return json.loads(result.stdout.strip())
         return {}
@@ -468,10 +271,20 @@ def get_software_info():
         print(f"Fehler beim Abrufen von Software-Informationen: {e}", file=sys.stderr)
         return {}
 
-def get_live_status():
-    """Liest Live-Status aus API JSON-Dateien"""
-    status = read_api_json('status.json') or {'status': 'idle', 'timestamp': ''}
-    attributes = read_api_json('attributes.json') or {
+def _valid_drive_name(name):
+    """Laufwerksname wie von drivestat_drive_name() erzeugt ([A-Za-z0-9_-])"""
+    return bool(name) and all(c.isalnum() or c in '-_' for c in name) and name.isascii()
+
+def get_live_status(drive=None):
+    """Liest Live-Status aus API JSON-Dateien
+    
+    Args:
+        drive: Laufwerksname (api/drives/<name>/) oder None für api/
+               (Einzelbetrieb bzw. primäres Laufwerk)
+    """
+    prefix = f"{api_events.DRIVES_SUBDIR}/{drive}/" if drive else ''
+    status = read_api_json(prefix + 'status.json') or {'status': 'idle', 'timestamp': ''}
+    attributes = read_api_json(prefix + 'attributes.json') or {
         'disc_label': '',
         'disc_type': '',
         'disc_size_mb': 0,
@@ -484,7 +297,7 @@ def get_live_status():
         'container_type': 'none',
         'error_message': None
     }
-    progress = read_api_json('progress.json') or {
+    progress = read_api_json(prefix + 'progress.json') or {
         'percent': 0,
         'copied_mb': 0,
         'total_mb': 0,
@@ -509,11 +322,42 @@ def get_live_status():
         'progress_mb': progress.get('copied_mb', 0),
         'total_mb': total_value,
         'eta': progress.get('eta', ''),
+        'speed_mb_s': progress.get('speed_mb_s', 0),
+        'stalled': progress.get('stalled', False),
         'filename': attributes.get('filename', ''),
         'method': attributes.get('method', 'unknown'),
+        'verify': attributes.get('verify'),
         'error_message': attributes.get('error_message')
     }
 
+def get_drives_status():
+    """Live-Status aller Laufwerke im Mehrfach-Betrieb
+    
+    Returns:
+        Liste (Reihenfolge aus drives.json, primäres Laufwerk zuerst) mit
+        name, device, primary und den Feldern von get_live_status() -
+        leer im Einzelbetrieb
+    """
+    drives = (read_api_json('drives.json') or {}).get('drives') or []
+    result = []
+    for drive in drives:
+        name = drive.get('name', '')
+        if not _valid_drive_name(name):
+            continue
+        result.append({
+            'name': name,
+            'device': drive.get('device', ''),
+            'primary': bool(drive.get('primary')),
+            **get_live_status(name)
+        })
+    return result
+
+# Payload für SSE-Events vom Typ 'status' (einmal pro Änderung, nicht pro Client)
+api_events.get_hub().register_builder('status', lambda: {
+    'live_status': get_live_status(),
+    'drives': get_drives_status()
+})
+
 def get_history():
     """Liest AktivitÃ¤ts-History"""
     history = read_api_json('history.json')
@@ -565,26 +409,20 @@ def index():
     
     # MQTT-Status wird nicht mehr hier Ã¼bergeben - Widget lÃ¤dt dynamisch via /api/mqtt/widget
     
-    disk_space = get_disk_space(config['output_dir'])
-    iso_count = count_iso_files(config['output_dir'])
+    disk_space = get_disk_space(settings['output_dir'])
     live_status = get_live_status()
     status_text = get_status_text(live_status, service_running)
     
     # Archive nach Typen
-    archives = get_iso_files_by_type(config['output_dir'])
-    archive_counts = {
-        'data': len(archives['data']),
-        'audio': len(archives['audio']),
-        'dvd': len(archives['dvd']),
-        'bluray': len(archives['bluray'])
-    }
+    archive_counts = get_archive_counts(settings['output_dir'])
+    iso_count = sum(archive_counts.values())
     
     return render_template('index.html',
         version=version,
         service_running=service_running,
         disk2iso_status=disk2iso_status,
         webui_status=webui_status,
-        config=config,
+        config=settings,
         disk_space=disk_space,
         iso_count=iso_count,
         archive_counts=archive_counts,
@@ -608,7 +446,7 @@ def settings_page():
     
     return render_template('settings.html',
         version=version,
-        config=config,
+        config=settings,
         active_page='settings',
         page_title='SETTINGS_TITLE'
     )
@@ -713,17 +551,8 @@ def api_modules():
     
     # Funktion um enabled-Status aus INI zu lesen
     def get_module_enabled(module_name, default=True):
-        try:
-            result = subprocess.run(
-                ['bash', '-c', f'source {INSTALL_DIR}/lib/libsettings.sh && config_get_value_ini "{module_name}" "module" "enabled" "{str(default).lower()}"'],
-                capture_output=True, text=True, timeout=2
-            )
-            if result.returncode == 0:
-                value = result.stdout.strip().lower()
-                return value in ['true', '1', 'yes', 'on']
-            return default
-        except:
-            return default
+        value = settings_cache.get_value_ini(module_name, "module", "enabled", str(default).lower())
+        return value.lower() in ['true', '1', 'yes', 'on']
     
     # Lese Status aus INI-Dateien
     enabled_modules['metadata'] = get_module_enabled('metadata', True)
@@ -740,6 +569,14 @@ def api_modules():
         'timestamp': datetime.now().isoformat()
     })
 
+@app.route('/api/plugins')
+def api_plugins():
+    """API-Endpoint für Widget-Plugins (Zustand und Importzeit)"""
+    return jsonify({
+        **plugins.report(),
+        'timestamp': datetime.now().isoformat()
+    })
+
 @app.route('/api/service/status/<service_name>')
 def api_service_status(service_name):
     """API-Endpoint fÃ¼r Service-Status
@@ -747,13 +584,9 @@ def api_service_status(service_name):
     Nutzt libservice.sh fÃ¼r Service-Management
     """
     try:
-        result = subprocess.run(
-            ['bash', '-c', f'source {INSTALL_DIR}/lib/liblogging.sh && source {INSTALL_DIR}/lib/libfolders.sh && source {INSTALL_DIR}/lib/libsettings.sh && source {INSTALL_DIR}/lib/libservice.sh && service_get_status "{service_name}"'],
-            capture_output=True, text=True, timeout=5
-        )
+        status_data = service_status.get_status(service_name)
         
-        if result.returncode == 0:
-            status_data = json.loads(result.stdout.strip())
+        if 'error' not in status_data:
             return jsonify({
                 'success': True,
                 **status_data,
@@ -766,6 +599,12 @@ def api_service_status(service_name):
                 'error': 'Service status check failed',
                 'timestamp': datetime.now().isoformat()
             }), 500
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'timestamp': datetime.now().isoformat()
+        }), 400
     except Exception as e:
         return jsonify({
             'success': False,
@@ -780,10 +619,8 @@ def api_service_restart(service_name):
     Nutzt libservice.sh fÃ¼r Service-Management
     """
     try:
-        result = subprocess.run(
-            ['bash', '-c', f'source {INSTALL_DIR}/lib/liblogging.sh && source {INSTALL_DIR}/lib/libservice.sh && service_restart "{service_name}"'],
-            capture_output=True, text=True, timeout=10
-        )
+        result = lib_broker.call('service_restart', service_name, timeout=10)
+        service_status.invalidate(service_name)
         
         if result.returncode == 0:
             return jsonify({
@@ -833,10 +670,7 @@ def api_module_software(module_name):
             }), 404
         
         # Rufe Modul-Funktion auf
-        result = subprocess.run(
-            ['bash', '-c', f'source {INSTALL_DIR}/lib/liblogging.sh && source {INSTALL_DIR}/lib/libfolders.sh && source {INSTALL_DIR}/lib/libsettings.sh && source {INSTALL_DIR}/lib/libsysteminfo.sh && source {module_lib} && {module_name}_get_software_info'],
-            capture_output=True, text=True, timeout=5
-        )
+        result = lib_broker.call(f'{module_name}_get_software_info', timeout=5, libs=[module_lib])
         
         if result.returncode == 0:
             software_list = json.loads(result.stdout.strip())
@@ -873,6 +707,8 @@ def api_software_install(software_name):
     
     Nutzt systeminfo_install_software() aus libsysteminfo.sh
     ACHTUNG: BenÃ¶tigt sudo-Rechte!
+    
+    Läuft als Hintergrund-Job - Antwort 202 mit job_id, Status über /api/jobs/<id>
     """
     try:
         # SicherheitsprÃ¼fung: Nur alphanumerische Namen + Bindestriche
@@ -883,32 +719,23 @@ def api_software_install(software_name):
                 'timestamp': datetime.now().isoformat()
             }), 400
         
-        # Rufe Installation auf (mit sudo wenn verfÃ¼gbar)
-        result = subprocess.run(
-            ['sudo', 'bash', '-c', f'source {INSTALL_DIR}/lib/liblogging.sh && source {INSTALL_DIR}/lib/libsysteminfo.sh && systeminfo_install_software "{software_name}"'],
-            capture_output=True, text=True, timeout=120  # 2 Minuten Timeout
+        # Installation als Hintergrund-Job (Status via /api/jobs/<id>)
+        job = jobs.get_manager().submit(
+            'software_install',
+            ['sudo', 'bash', '-c', f'source {INSTALL_DIR}/lib/liblogging.sh && source {INSTALL_DIR}/lib/libsysteminfo.sh && systeminfo_install_software "$1"', '--', software_name],
+            title=f'Installation {software_name}',
+            timeout=120,  # 2 Minuten Timeout
+            params={'software': software_name}
         )
         
-        if result.returncode == 0:
-            return jsonify({
-                'success': True,
-                'message': f'Software {software_name} erfolgreich installiert/aktualisiert',
-                'software': software_name,
-                'timestamp': datetime.now().isoformat()
-            })
-        else:
-            return jsonify({
-                'success': False,
-                'message': f'Fehler bei Installation von {software_name}',
-                'error': result.stderr,
-                'timestamp': datetime.now().isoformat()
-            }), 500
-    except subprocess.TimeoutExpired:
         return jsonify({
-            'success': False,
-            'error': 'Installation timeout (>2min)',
+            'success': True,
+            'message': f'Installation von {software_name} gestartet',
+            'software': software_name,
+            'job_id': job.id,
+            'job': job.to_dict(),
             'timestamp': datetime.now().isoformat()
-        }), 504
+        }), 202
     except Exception as e:
         return jsonify({
             'success': False,
@@ -916,67 +743,88 @@ def api_software_install(software_name):
             'timestamp': datetime.now().isoformat()
         }), 500
 
-@app.route('/api/system')
-def api_system():
-    """API-Endpoint fÃ¼r System-Informationen (OS, Hardware, Software)
+@app.route('/api/live_status')
+def api_live_status():
+    """API-Endpoint für Live-Status (für Service-Restart-Warnung)
     
-    Nutzt die neuen Bash-Funktionen:
-    - systeminfo_get_os_info() fÃ¼r OS-Daten
-    - systeminfo_get_software_info() fÃ¼r Software-Dependencies
+    Query-Parameter:
+        drive: Laufwerksname (optional, Default: primäres Laufwerk)
     """
-    try:
-        # OS-Informationen abrufen
-        os_info = get_os_info()
-        
-        # Software-Informationen abrufen
-        software_info = get_software_info()
-        
-        return jsonify({
-            'success': True,
-            'os': os_info,
-            'software': software_info,
-            'timestamp': datetime.now().isoformat()
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }), 500
+    drive = request.args.get('drive')
+    if drive and not _valid_drive_name(drive):
+        return jsonify({'success': False, 'error': 'Ungültiger Laufwerksname'}), 400
+    return jsonify(get_live_status(drive))
+
+@app.route('/api/drives')
+def api_drives():
+    """API-Endpoint für den Live-Status aller Laufwerke (Mehrfach-Betrieb)"""
+    return jsonify({
+        'drives': get_drives_status(),
+        'timestamp': datetime.now().isoformat()
+    })
 
-@app.route('/api/archive')
-def api_archive():
-    """API-Endpoint fÃ¼r Archiv- und Speicherplatz-Informationen
+@app.route('/api/events')
+def api_events_stream():
+    """Server-Sent Events Stream für Live-Status und Metadaten-Auswahl
     
-    Nutzt die neuen Bash-Funktionen:
-    - systeminfo_get_storage_info() fÃ¼r Speicherplatz
-    - systeminfo_get_archiv_info() fÃ¼r Archiv-ZÃ¤hler
+    Events (nur bei tatsächlicher Änderung der API-Dateien):
+        status: {'live_status': ...} - status/attributes/progress.json
+        history: history.json
+        musicbrainz / tmdb: Metadaten-Auswahl (BEFORE Copy Strategy)
+        archive: Archiv wurde vom Daemon geändert
+        metadata: Offene Metadaten-Auswahl (wie /api/metadata/pending)
+    
+    Beim Verbindungsaufbau wird der aktuelle Live-Status sofort gesendet.
     """
+    hub = api_events.get_hub()
+    subscription = hub.subscribe()
+    # Spool-Watcher starten, damit neue Query-Dateien gepusht werden
     try:
-        # Speicherplatz-Informationen abrufen
-        storage_info = get_storage_info()
-        
-        # Archiv-Informationen abrufen
-        archiv_info = get_archiv_info()
-        
-        return jsonify({
-            'success': True,
-            'output_dir': storage_info.get('output_dir'),
-            'disk_space': storage_info.get('disk_space'),
-            'archive_counts': archiv_info.get('archive_counts'),
-            'timestamp': datetime.now().isoformat()
-        })
+        get_metadata_spool()
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }), 500
+        print(f"Metadata-Spool nicht verfügbar: {e}", file=sys.stderr)
+    
+    def generate():
+        try:
+            yield 'retry: 3000\n\n'
+            yield api_events.format_sse('status', hub.build_payload('status'))
+            while True:
+                try:
+                    event_type, payload = subscription.get(timeout=api_events.KEEPALIVE_INTERVAL)
+                except queue.Empty:
+                    yield ': keepalive\n\n'
+                    continue
+                yield api_events.format_sse(event_type, payload)
+        finally:
+            hub.unsubscribe(subscription)
+    
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
 
-@app.route('/api/live_status')
-def api_live_status():
-    """API-Endpoint fÃ¼r Live-Status (fÃ¼r Service-Restart-Warnung)"""
-    return jsonify(get_live_status())
+@app.route('/api/dashboard')
+def api_dashboard():
+    """Aggregierter Endpoint für alle Dashboard-Widgets
+    
+    Query-Parameter:
+        widgets: Kommagetrennte Widget-Namen (Default: alle verfügbaren)
+    
+    Die Payloads entsprechen den einzelnen Widget-Endpoints und werden
+    parallel erzeugt. Jedes Widget hat eine eigene TTL (siehe dashboard.py),
+    innerhalb derer der gecachte Payload geliefert wird.
+    """
+    names = [n for value in request.args.getlist('widgets') for n in value.split(',') if n]
+    try:
+        widgets = dashboard.get_dashboard(app).collect(names or None)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    return jsonify({
+        'success': True,
+        'widgets': widgets,
+        'timestamp': datetime.now().isoformat()
+    })
 
 @app.route('/api/status')
 def api_status():
@@ -985,23 +833,18 @@ def api_status():
     live_status = get_live_status()
     
     # Archive-Counts ermitteln
-    all_files = get_iso_files_by_type(config['output_dir'])
-    archive_counts = {
-        'data': len(all_files.get('data', [])),
-        'audio': len(all_files.get('audio', [])),
-        'dvd': len(all_files.get('dvd', [])),
-        'bluray': len(all_files.get('bluray', []))
-    }
+    archive_counts = get_archive_counts(settings['output_dir'])
     
     # MQTT-Status nur wenn Modul verfÃ¼gbar
     result = {
         'version': get_version(),
         'service_running': get_service_status(),
-        'output_dir': config['output_dir'],
-        'disk_space': get_disk_space(config['output_dir']),
-        'iso_count': count_iso_files(config['output_dir']),
+        'output_dir': settings['output_dir'],
+        'disk_space': get_disk_space(settings['output_dir']),
+        'iso_count': sum(archive_counts.values()),
         'archive_counts': archive_counts,
         'live_status': live_status,
+        'drives': get_drives_status(),
         'timestamp': datetime.now().isoformat()
     }
     
@@ -1026,6 +869,19 @@ def api_musicbrainz_releases():
     if not releases:
         return jsonify({'status': 'no_data', 'releases': []}), 404
     
+    # Releases pro Disc-ID im Metadaten-Cache ablegen (Offline-Suche)
+    disc_id = releases.get('disc_id', '')
+    if disc_id:
+        try:
+            cache = metadata_cache.get_cache()
+            cached = cache.get('musicbrainz', metadata_cache.KEY_DISCID, disc_id)
+            if not cached or not cached['fresh']:
+                cache.put('musicbrainz', {metadata_cache.KEY_DISCID: disc_id},
+                          {'releases': releases.get('releases', []), 'track_count': releases.get('track_count', 0)},
+                          entries=_musicbrainz_cache_entries(releases.get('releases', [])))
+        except Exception as e:
+            print(f"[WARN] Metadaten-Cache: {e}", file=sys.stderr)
+    
     return jsonify({
         'status': selection.get('status', 'unknown') if selection else 'unknown',
         'releases': releases.get('releases', []),
@@ -1055,8 +911,9 @@ def api_musicbrainz_cover(release_id):
         fetch_coverart "{release_id}"
         """
         
-        result = subprocess.run(
+        result = lib_broker.run(
             ['/bin/bash', '-c', script],
+            label='fetch_coverart',
             capture_output=True,
             text=True,
             timeout=15
@@ -1186,34 +1043,142 @@ def api_tmdb_select():
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
+def _parse_archive_time(value, end=False):
+    """Parst Datumsangabe der Archiv-API (YYYY-MM-DD, ISO-Format oder Unix-Zeit)
+    
+    Bei reinem Datum als Obergrenze wird der ganze Tag eingeschlossen.
+    """
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    timestamp = datetime.fromisoformat(value).timestamp()
+    if end and len(value) == 10:
+        timestamp += 86400
+    return timestamp
+
+def _parse_archive_int(value):
+    """Parst optionale Integer-Parameter der Archiv-API"""
+    if not value:
+        return None
+    return int(value)
+
 @app.route('/api/archive')
 def api_archive():
-    """API-Endpoint fÃ¼r Archiv-Daten gruppiert nach Typ"""
+    """API-Endpoint für Archiv-Daten (gefiltert, sortiert, seitenweise)
+    
+    Query-Parameter:
+        type: Typ-Filter (audio, dvd, bluray, data - mehrfach oder kommagetrennt)
+        q: Teilstring im Dateinamen
+        from / to: Änderungsdatum (YYYY-MM-DD, ISO-Format oder Unix-Zeit)
+        min_size / max_size: Größe in Bytes
+        sort: modified (Default), created, name, size
+        order: desc (Default) oder asc
+        limit: Seitengröße (Default 50, max. 500)
+        cursor: next_cursor der vorherigen Antwort
+    
+    Antwortet aus dem Archiv-Index. ETag/Last-Modified basieren auf
+    Generation und Änderungszähler bzw. letzter Änderung des Index,
+    unveränderte Abfragen liefern 304.
+    """
     settings = get_settings()
-    archives = get_iso_files_by_type(config['output_dir'])
+    index = archive_index.get_index(settings['output_dir'])
+    
+    # ETag hängt nur vom Index-Stand ab (die Query ist Teil der URL); die
+    # Generation unterscheidet Zählerstände verschiedener Index-Aufbauten
+    etag = f'archive-{index.generation}-{index.change_counter}'
+    
+    # Last-Modified hat nur Sekunden-Auflösung: beide Seiten auf ganze
+    # Sekunden abgeschnitten vergleichen. Liegt die letzte Änderung in der
+    # laufenden Sekunde, entfällt der Header, da eine weitere Änderung in
+    # derselben Sekunde sonst unbemerkt bliebe (ETag reicht dann)
+    last_change = int(index.last_change)
+    last_modified = None
+    if last_change < int(time.time()):
+        last_modified = datetime.fromtimestamp(last_change, tz=timezone.utc)
+    
+    if request.if_none_match:
+        not_modified = request.if_none_match.contains_weak(etag)
+    else:
+        not_modified = last_modified is not None and request.if_modified_since is not None \
+            and int(request.if_modified_since.timestamp()) >= last_change
     
-    total = sum(len(files) for files in archives.values())
+    if not_modified:
+        response = Response(status=304)
+    else:
+        types = [t for value in request.args.getlist('type') for t in value.split(',') if t]
+        try:
+            page = index.query(
+                types=types or None,
+                name=request.args.get('q') or None,
+                modified_from=_parse_archive_time(request.args.get('from')),
+                modified_to=_parse_archive_time(request.args.get('to'), end=True),
+                size_min=_parse_archive_int(request.args.get('min_size')),
+                size_max=_parse_archive_int(request.args.get('max_size')),
+                sort=request.args.get('sort', 'modified'),
+                order=request.args.get('order', 'desc'),
+                limit=_parse_archive_int(request.args.get('limit')) or 50,
+                cursor=request.args.get('cursor') or None
+            )
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+    
+        response = jsonify({
+            'total': page['total'],
+            'counts': index.counts(),
+            'items': page['items'],
+            'next_cursor': page['next_cursor']
+        })
     
-    return jsonify({
-        'total': total,
-        'by_type': archives,
-        'timestamp': datetime.now().isoformat()
-    })
+    response.set_etag(etag, weak=True)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 @app.route('/api/archive/thumbnail/<path:filename>')
 def api_archive_thumbnail(filename):
-    """API-Endpoint zum Abrufen von ISO-Thumbnails"""
+    """API-Endpoint zum Abrufen von ISO-Thumbnails
+    
+    Dateinamen werden über den Archiv-Index aufgelöst (kein Verzeichnis-Scan),
+    relative Pfade nur unterhalb von .temp/tmdb/thumbs/ im Ausgabeverzeichnis.
+    Erlaubt sind nur Bilder (.jpg/.jpeg/.png), alles andere liefert 404.
+    Der Content-Hash dient als Strong ETag; URLs mit passendem ?v=<hash> sind
+    unveränderlich und dürfen dauerhaft gecacht werden.
+    """
     try:
         settings = get_settings()
-        output_dir = Path(config['output_dir'])
-        
-        # Suche Thumbnail in allen Unterverzeichnissen
-        for root, dirs, files in os.walk(output_dir):
-            if filename in files:
-                thumb_path = os.path.join(root, filename)
-                return send_file(thumb_path, mimetype='image/jpeg')
-        
-        return jsonify({'error': g.t.get('API_ERROR_THUMBNAIL_NOT_FOUND', 'Thumbnail not found')}), 404
+        thumb_path = None
+        mimetype = THUMBNAIL_TYPES.get(os.path.splitext(filename)[1].lower())
+        
+        if mimetype is not None and '/' in filename:
+            relative = posixpath.normpath(filename)
+            if relative.startswith(THUMBNAIL_SUBDIR):
+                candidate = safe_join(settings['output_dir'], relative)
+                if candidate and os.path.isfile(candidate):
+                    thumb_path = candidate
+        elif mimetype is not None:
+            found = archive_index.get_index(settings['output_dir']).find_thumbnail(filename)
+            if found and os.path.isfile(found[0]):
+                thumb_path = found[0]
+        
+        if thumb_path is None:
+            return jsonify({'error': g.t.get('API_ERROR_THUMBNAIL_NOT_FOUND', 'Thumbnail not found')}), 404
+        
+        content_hash = archive_index.cached_file_hash(thumb_path)
+        response = send_file(thumb_path, mimetype=mimetype,
+                             etag=content_hash or True, conditional=True)
+        
+        if content_hash and request.args.get('v') == content_hash:
+            response.cache_control.no_cache = None
+            response.cache_control.public = True
+            response.cache_control.max_age = 31536000
+            response.cache_control.immutable = True
+        else:
+            response.cache_control.no_cache = True
+        return response
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -1221,6 +1186,46 @@ def api_archive_thumbnail(filename):
 # METADATA BEFORE COPY - NEW ENDPOINTS
 # ============================================================================
 
+def get_metadata_spool():
+    """Spool-Index der Query-Dateien (.mbquery/.tmdbquery) im Ausgabeverzeichnis"""
+    output_dir = get_settings().get('output_dir', '/media/iso')
+    return metadata_spool.get_index(output_dir, on_change=lambda: api_events.get_hub().publish('metadata'))
+
+def get_metadata_pending():
+    """Offene Metadaten-Auswahl aus dem Spool-Index (kein Archiv-Scan, kein Bash)"""
+    entry = get_metadata_spool().pending()
+    if entry is None:
+        # Keine Metadaten-Auswahl pending
+        return {'pending': False}
+    
+    # Timeout-Start = Zeitpunkt der Query-Datei
+    timeout_total = get_setting_int('METADATA_SELECTION_TIMEOUT', 60)
+    timeout_remaining = max(0, timeout_total - int(time.time() - entry['mtime']))
+    data = entry['data']
+    
+    if entry['type'] == '.mbquery':
+        # Audio-CD
+        return {
+            'pending': True,
+            'disc_type': 'audio-cd',
+            'disc_id': entry['disc_id'],
+            'timeout': timeout_remaining,
+            'releases': data.get('releases', []),
+            'track_count': data.get('track_count', 0)
+        }
+    
+    # DVD/Blu-ray
+    return {
+        'pending': True,
+        'disc_type': data.get('media_type', 'dvd'),
+        'disc_id': entry['disc_id'],
+        'timeout': timeout_remaining,
+        'results': data.get('results', [])
+    }
+
+# Payload für SSE-Events vom Typ 'metadata' (neue/erledigte Query-Datei)
+api_events.get_hub().register_builder('metadata', get_metadata_pending)
+
 @app.route('/api/metadata/pending')
 def api_metadata_pending():
     """
@@ -1234,68 +1239,7 @@ def api_metadata_pending():
     }
     """
     try:
-        # PrÃ¼fe ob .mbquery oder .tmdbquery Datei existiert
-        settings = get_settings()
-        output_dir = settings.get('output_dir', '/media/iso')
-        
-        # Suche nach .mbquery Dateien (Audio-CD)
-        mbquery_files = list(Path(output_dir).glob('**/*.mbquery'))
-        if mbquery_files:
-            mbquery_file = mbquery_files[0]
-            with open(mbquery_file, 'r') as f:
-                releases_data = json.load(f)
-            
-            # Lese Timeout-Startzeit aus Datei-Metadaten
-            file_mtime = mbquery_file.stat().st_mtime
-            elapsed = int(time.time() - file_mtime)
-            
-            # Lese Timeout aus Config
-            bash_cmd = f'source {SETTINGS_FILE} && echo "$METADATA_SELECTION_TIMEOUT"'
-            result = subprocess.run(
-                ['bash', '-c', bash_cmd],
-                capture_output=True, text=True, timeout=5
-            )
-            timeout_total = int(result.stdout.strip() or '60')
-            timeout_remaining = max(0, timeout_total - elapsed)
-            
-            return jsonify({
-                'pending': True,
-                'disc_type': 'audio-cd',
-                'disc_id': mbquery_file.stem.replace('_mb', ''),
-                'timeout': timeout_remaining,
-                'releases': releases_data.get('releases', []),
-                'track_count': releases_data.get('track_count', 0)
-            })
-        
-        # Suche nach .tmdbquery Dateien (DVD/Blu-ray)
-        tmdbquery_files = list(Path(output_dir).glob('**/*.tmdbquery'))
-        if tmdbquery_files:
-            tmdbquery_file = tmdbquery_files[0]
-            with open(tmdbquery_file, 'r') as f:
-                results_data = json.load(f)
-            
-            file_mtime = tmdbquery_file.stat().st_mtime
-            elapsed = int(time.time() - file_mtime)
-            
-            bash_cmd = f'source {SETTINGS_FILE} && echo "$METADATA_SELECTION_TIMEOUT"'
-            result = subprocess.run(
-                ['bash', '-c', bash_cmd],
-                capture_output=True, text=True, timeout=5
-            )
-            timeout_total = int(result.stdout.strip() or '60')
-            timeout_remaining = max(0, timeout_total - elapsed)
-            
-            return jsonify({
-                'pending': True,
-                'disc_type': results_data.get('media_type', 'dvd'),
-                'disc_id': tmdbquery_file.stem.replace('_tmdb', ''),
-                'timeout': timeout_remaining,
-                'results': results_data.get('results', [])
-            })
-        
-        # Keine Metadaten-Auswahl pending
-        return jsonify({'pending': False})
-        
+        return jsonify(get_metadata_pending())
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
@@ -1375,19 +1319,9 @@ def restart_service():
         if service_name not in ['disk2iso', 'disk2iso-web']:
             return jsonify({'success': False, 'message': 'UngÃ¼ltiger Service-Name'}), 400
         
-        # Rufe Bash-Funktion auf
-        script = f"""
-        # DEPRECATED: Use libservice.sh instead
-        source {INSTALL_DIR}/lib/libservice.sh
-        service_restart '{service_name}'
-        """
-        
-        result = subprocess.run(
-            ['/bin/bash', '-c', script],
-            capture_output=True,
-            text=True,
-            timeout=15
-        )
+        # Rufe Bash-Funktion auf (libservice.sh via Lib-Broker)
+        result = lib_broker.call('service_restart', service_name, timeout=15)
+        service_status.invalidate(service_name)
         
         # Parse Response
         if result.returncode == 0:
@@ -1488,12 +1422,30 @@ def browse_directories():
             'message': f'Fehler: {str(e)}'
         }), 500
 
+def _read_log(log_file, max_lines, offset=None):
+    """Liest das Ende einer Log-Datei oder nur die seit offset neuen Zeilen
+    
+    Returns:
+        dict mit logs, lines, offset (Cursor für den nächsten Abruf),
+        reset (Client muss Anzeige ersetzen statt anhängen) und truncated
+    """
+    if offset is None:
+        result = log_tail.tail(str(log_file), max_lines)
+        result['reset'] = True
+        return result
+    return log_tail.read_from(str(log_file), offset, max_lines)
+
 @app.route('/api/logs/current')
 def api_logs_current():
-    """API-Endpoint fÃ¼r aktuelles Log"""
+    """API-Endpoint fÃ¼r aktuelles Log
+    
+    Query-Parameter:
+        offset: Byte-Cursor der vorherigen Antwort - liefert nur neue Zeilen
+        file: Dateiname der vorherigen Antwort (neue Log-Datei = reset)
+    """
     try:
         settings = get_settings()
-        output_dir = Path(config['output_dir'])
+        output_dir = Path(settings['output_dir'])
         log_dir = output_dir / '.log'
         
         # Finde die neueste Log-Datei
@@ -1508,18 +1460,19 @@ def api_logs_current():
                 'lines': 0
             })
         
-        # Lese die neueste Log-Datei (letzte 500 Zeilen)
+        # Neueste Log-Datei: letzte 500 Zeilen bzw. nur neue Zeilen ab offset
         latest_log = log_files[0]
-        with open(latest_log, 'r', encoding='utf-8', errors='replace') as f:
-            lines = f.readlines()
-            # Zeige die letzten 500 Zeilen
-            recent_lines = lines[-500:] if len(lines) > 500 else lines
-            log_content = ''.join(recent_lines)
+        try:
+            offset = log_tail.parse_offset(request.args.get('offset'))
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        if request.args.get('file') not in (None, latest_log.name):
+            offset = None
+        result = _read_log(latest_log, 500, offset)
         
         return jsonify({
             'success': True,
-            'logs': log_content,
-            'lines': len(recent_lines),
+            **result,
             'filename': latest_log.name
         })
     except Exception as e:
@@ -1535,7 +1488,7 @@ def api_logs_system():
     """API-Endpoint fÃ¼r System-Log (journalctl)"""
     try:
         # Lese die letzten 200 Zeilen aus journalctl fÃ¼r disk2iso Service
-        result = subprocess.run(
+        result = lib_broker.run(
             ['journalctl', '-u', 'disk2iso', '-n', '200', '--no-pager'],
             capture_output=True,
             text=True,
@@ -1575,7 +1528,7 @@ def api_logs_archived():
     """API-Endpoint fÃ¼r Liste der archivierten Log-Dateien"""
     try:
         settings = get_settings()
-        output_dir = Path(config['output_dir'])
+        output_dir = Path(settings['output_dir'])
         log_dir = output_dir / '.log'
         
         if not log_dir.exists():
@@ -1607,7 +1560,11 @@ def api_logs_archived():
 
 @app.route('/api/logs/archived/<filename>')
 def api_logs_archived_file(filename):
-    """API-Endpoint fÃ¼r eine spezifische archivierte Log-Datei"""
+    """API-Endpoint fÃ¼r eine spezifische archivierte Log-Datei
+    
+    Query-Parameter:
+        offset: Byte-Cursor der vorherigen Antwort - liefert nur neue Zeilen
+    """
     try:
         # Sicherheitscheck: Nur .log Dateien erlauben und keine Pfad-Traversierung
         if not filename.endswith('.log') or '/' in filename or '\\' in filename or '..' in filename:
@@ -1619,7 +1576,7 @@ def api_logs_archived_file(filename):
             }), 400
         
         settings = get_settings()
-        output_dir = Path(config['output_dir'])
+        output_dir = Path(settings['output_dir'])
         log_dir = output_dir / '.log'
         log_file = log_dir / filename
         
@@ -1631,17 +1588,16 @@ def api_logs_archived_file(filename):
                 'lines': 0
             }), 404
         
-        # Lese die Log-Datei (letzte 1000 Zeilen)
-        with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
-            lines = f.readlines()
-            # Zeige die letzten 1000 Zeilen
-            recent_lines = lines[-1000:] if len(lines) > 1000 else lines
-            log_content = ''.join(recent_lines)
+        # Letzte 1000 Zeilen bzw. nur neue Zeilen ab offset
+        try:
+            offset = log_tail.parse_offset(request.args.get('offset'))
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        result = _read_log(log_file, 1000, offset)
         
         return jsonify({
             'success': True,
-            'logs': log_content,
-            'lines': len(recent_lines),
+            **result,
             'filename': filename
         })
     except Exception as e:
@@ -1652,219 +1608,15 @@ def api_logs_archived_file(filename):
             'lines': 0
         })
 
-def get_command_version(command, args=None):
-    """Holt Version eines Kommandozeilen-Tools"""
-    try:
-        cmd = [command]
-        if args:
-            cmd.extend(args if isinstance(args, list) else [args])
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=3
-        )
-        
-        output = result.stdout + result.stderr
-        # Extrahiere Version aus Ausgabe
-        import re
-        version_match = re.search(r'(\d+\.[\d.]+)', output)
-        if version_match:
-            return version_match.group(1)
-        return 'Installiert'
-    except:
-        return None
-
-def get_package_version(package_name):
-    """Holt installierte Version eines Debian-Pakets"""
-    try:
-        result = subprocess.run(
-            ['dpkg', '-s', package_name],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        
-        if result.returncode == 0:
-            for line in result.stdout.split('\n'):
-                if line.startswith('Version:'):
-                    version = line.split(':', 1)[1].strip()
-                    # KÃ¼rze Debian-Versionsnummern
-                    if '-' in version:
-                        version = version.split('-')[0]
-                    if '+' in version:
-                        version = version.split('+')[0]
-                    return version
-        return None
-    except:
-        return None
-
-def get_available_package_version(package_name):
-    """Holt verfÃ¼gbare Version eines Pakets aus den Repositories"""
-    try:
-        result = subprocess.run(
-            ['apt-cache', 'policy', package_name],
-            capture_output=True,
-            text=True,
-            timeout=3
-        )
-        
-        if result.returncode == 0:
-            for line in result.stdout.split('\n'):
-                if 'Candidate:' in line:
-                    version = line.split(':', 1)[1].strip()
-                    if version and version != '(none)':
-                        # KÃ¼rze Debian-Versionsnummern
-                        if '-' in version:
-                            version = version.split('-')[0]
-                        if '+' in version:
-                            version = version.split('+')[0]
-                        return version
-        return 'Unbekannt'
-    except:
-        return 'Unbekannt'
-
 def check_software_versions():
-    """Sammelt alle Software-Versionen"""
-    software_list = []
-    
-    # Audio-CD Tools
-    software_list.extend([
-        {
-            'name': 'cdparanoia',
-            'display_name': 'cdparanoia',
-            'package': 'cdparanoia',
-            'version_cmd': ['cdparanoia', '--version']
-        },
-        {
-            'name': 'abcde',
-            'display_name': 'abcde',
-            'package': 'abcde',
-            'version_cmd': ['abcde', '-v']
-        },
-        {
-            'name': 'lame',
-            'display_name': 'LAME MP3 Encoder',
-            'package': 'lame',
-            'version_cmd': ['lame', '--version']
-        },
-        {
-            'name': 'flac',
-            'display_name': 'FLAC',
-            'package': 'flac',
-            'version_cmd': ['flac', '--version']
-        },
-        {
-            'name': 'vorbis-tools',
-            'display_name': 'Vorbis Tools',
-            'package': 'vorbis-tools',
-            'version_cmd': None  # Package version only
-        }
-    ])
-    
-    # DVD/Blu-ray Tools
-    software_list.extend([
-        {
-            'name': 'makemkv',
-            'display_name': 'MakeMKV',
-            'package': 'makemkv-bin',
-            'version_cmd': ['makemkvcon', '--version']
-        },
-        {
-            'name': 'dvdbackup',
-            'display_name': 'dvdbackup',
-            'package': 'dvdbackup',
-            'version_cmd': None
-        },
-        {
-            'name': 'libbluray',
-            'display_name': 'libbluray',
-            'package': 'libbluray2',
-            'version_cmd': None
-        }
-    ])
-    
-    # System Tools
-    software_list.extend([
-        {
-            'name': 'ddrescue',
-            'display_name': 'GNU ddrescue',
-            'package': 'gddrescue',
-            'version_cmd': ['ddrescue', '--version']
-        },
-        {
-            'name': 'wodim',
-            'display_name': 'wodim',
-            'package': 'wodim',
-            'version_cmd': ['wodim', '--version']
-        },
-        {
-            'name': 'genisoimage',
-            'display_name': 'genisoimage',
-            'package': 'genisoimage',
-            'version_cmd': ['genisoimage', '--version']
-        },
-        {
-            'name': 'isoinfo',
-            'display_name': 'isoinfo',
-            'package': 'genisoimage',
-            'version_cmd': ['isoinfo', '--version']
-        }
-    ])
-    
-    # Sammle Versionen
-    results = []
-    for soft in software_list:
-        installed_version = None
-        available_version = 'Unbekannt'
-        
-        # Versuche Paket-Version
-        if soft['package']:
-            installed_version = get_package_version(soft['package'])
-            available_version = get_available_package_version(soft['package'])
-        
-        # Falls kein Paket oder Kommando angegeben, versuche Command-Version
-        if not installed_version and soft['version_cmd']:
-            installed_version = get_command_version(soft['version_cmd'][0], 
-                                                    soft['version_cmd'][1:] if len(soft['version_cmd']) > 1 else None)
-        
-        # PrÃ¼fe ob Update verfÃ¼gbar
-        update_available = False
-        if installed_version and available_version and available_version != 'Unbekannt':
-            try:
-                # Einfacher String-Vergleich
-                if installed_version != available_version:
-                    update_available = True
-            except:
-                pass
-        
-        results.append({
-            'name': soft['name'],
-            'display_name': soft['display_name'],
-            'installed_version': installed_version,
-            'available_version': available_version,
-            'update_available': update_available
-        })
-    
-    return results
+    """Sammelt alle Software-Versionen (gecachtes Inventar, ein dpkg-query/apt-cache Aufruf)"""
+    return software_inventory.get_inventory().get()
 
 def get_os_info():
     """Liest OS-Informationen aus Bash (systeminfo_get_os_info)"""
     try:
         # Rufe Bash-Funktion systeminfo_get_os_info() auf
-        script = f"""
-source {INSTALL_DIR}/lib/libfolders.sh 2>/dev/null
-source {INSTALL_DIR}/lib/libsettings.sh 2>/dev/null
-source {INSTALL_DIR}/lib/libsysteminfo.sh 2>/dev/null
-systeminfo_get_os_info
-"""
-        result = subprocess.run(
-            ['bash', '-c', script],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        result = lib_broker.call('systeminfo_get_os_info', timeout=5)
         
         if result.returncode == 0 and result.stdout.strip():
             return json.loads(result.stdout)
@@ -1887,18 +1639,7 @@ systeminfo_get_os_info
 def get_storage_info():
     """Liest Storage-Informationen aus Bash (systeminfo_get_storage_info)"""
     try:
-        script = f"""
-source {INSTALL_DIR}/lib/libfolders.sh 2>/dev/null
-source {INSTALL_DIR}/lib/libsettings.sh 2>/dev/null
-source {INSTALL_DIR}/lib/libsysteminfo.sh 2>/dev/null
-systeminfo_get_storage_info
-"""
-        result = subprocess.run(
-            ['bash', '-c', script],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        result = lib_broker.call('systeminfo_get_storage_info', timeout=5)
         
         if result.returncode == 0 and result.stdout.strip():
             return json.loads(result.stdout)
@@ -1910,18 +1651,7 @@ systeminfo_get_storage_info
 def get_archiv_info():
     """Liest Archiv-Informationen aus Bash (systeminfo_get_archiv_info)"""
     try:
-        script = f"""
-source {INSTALL_DIR}/lib/libfolders.sh 2>/dev/null
-source {INSTALL_DIR}/lib/libsettings.sh 2>/dev/null
-source {INSTALL_DIR}/lib/libsysteminfo.sh 2>/dev/null
-systeminfo_get_archiv_info
-"""
-        result = subprocess.run(
-            ['bash', '-c', script],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        result = lib_broker.call('systeminfo_get_archiv_info', timeout=5)
         
         if result.returncode == 0 and result.stdout.strip():
             return json.loads(result.stdout)
@@ -1933,18 +1663,7 @@ systeminfo_get_archiv_info
 def get_software_info():
     """Liest Software-Informationen aus Bash (systeminfo_get_software_info)"""
     try:
-        script = f"""
-source {INSTALL_DIR}/lib/libfolders.sh 2>/dev/null
-source {INSTALL_DIR}/lib/libsettings.sh 2>/dev/null
-source {INSTALL_DIR}/lib/libsysteminfo.sh 2>/dev/null
-systeminfo_get_software_info
-"""
-        result = subprocess.run(
-            ['bash', '-c', script],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        result = lib_broker.call('systeminfo_get_software_info', timeout=5)
         
         if result.returncode == 0 and result.stdout.strip():
             return json.loads(result.stdout)
@@ -1964,20 +1683,12 @@ def get_disk2iso_info():
     
     try:
         # Service Status
-        if get_service_status():
-            info['service_status'] = 'active'
-        else:
-            result = subprocess.run(
-                ['systemctl', 'is-active', 'disk2iso'],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-            info['service_status'] = result.stdout.strip()
+        info['service_status'] = get_service_status_detailed('disk2iso')['status']
         
         # Python Version
-        result = subprocess.run(
+        result = lib_broker.run(
             [sys.executable, '--version'],
+            label='python_version',
             capture_output=True,
             text=True,
             timeout=1
@@ -2059,20 +1770,38 @@ def api_system():
             'message': f'Fehler beim Sammeln der Systeminformationen: {str(e)}'
         }), 500
 
-@app.route('/api/metadata/tmdb/search', methods=['POST'])
-def api_tmdb_search():
-    """API-Endpoint: Suche Film/TV-Serie in TMDB (Python-basierte Verarbeitung wie MusicBrainz)"""
-    try:
-        import requests
-        
-        data = request.get_json()
-        iso_filename = data.get('iso_filename', '').strip()
-        
-        if not iso_filename:
-            return jsonify({'success': False, 'message': 'ISO-Dateiname erforderlich'}), 400
-        
-        # Schritt 1: Rufe Bash search_and_cache_tmdb() auf (nur raw API call)
-        script = f"""
+def _musicbrainz_cache_entries(releases):
+    """MusicBrainz-Releases als Volltext-Einträge für den Metadaten-Cache"""
+    return [{
+        'id': release.get('id'),
+        'title': release.get('title', ''),
+        'artist': release.get('artist', ''),
+        'extra': ' '.join(str(release.get(k) or '') for k in ('date', 'country', 'label')),
+        'data': release
+    } for release in releases if isinstance(release, dict)]
+
+def _tmdb_cache_entries(raw_results):
+    """TMDB-Treffer (raw) als Volltext-Einträge für den Metadaten-Cache"""
+    entries = []
+    for item in raw_results:
+        if not isinstance(item, dict):
+            continue
+        title = item.get('title') or item.get('name', '')
+        entries.append({
+            'id': item.get('id'),
+            'title': ' '.join(filter(None, {title, item.get('original_title') or item.get('original_name')})),
+            'extra': (item.get('release_date') or item.get('first_air_date') or '')[:4],
+            'data': item
+        })
+    return entries
+
+def _tmdb_search_raw(iso_filename, raw_cache_file):
+    """Führt die TMDB-Suche per Bash aus und liefert die raw Response
+    
+    Returns:
+        Dict (raw TMDB response) oder None bei Fehler/Timeout
+    """
+    script = f"""
 export PATH=/usr/local/bin:/usr/bin:/bin:/usr/local/sbin:/usr/sbin:/sbin
 source {INSTALL_DIR}/conf/disk2iso.conf 2>/dev/null
 source {INSTALL_DIR}/lib/lib-logging.sh 2>/dev/null
@@ -2089,24 +1818,58 @@ if [ $? -eq 0 ]; then
 else
     echo "FAILED"
 fi
-        """
-        
-        result = subprocess.run(
+    """
+    
+    try:
+        result = lib_broker.run(
             ['/bin/bash', '-c', script, '--', iso_filename],
+            label='search_and_cache_tmdb',
             capture_output=True,
             text=True,
             timeout=30,
             env={**os.environ, 'PATH': '/usr/local/bin:/usr/bin:/bin:/usr/local/sbin:/usr/sbin:/sbin'}
         )
+    except subprocess.TimeoutExpired:
+        print("[ERROR] search_and_cache_tmdb: Timeout", file=sys.stderr)
+        return None
+    
+    if "SUCCESS" not in result.stdout:
+        print(f"[ERROR] search_and_cache_tmdb failed: {result.stderr}", file=sys.stderr)
+        return None
+    
+    # Lese raw TMDB response
+    if not raw_cache_file.exists():
+        print(f"[ERROR] Raw cache nicht gefunden: {raw_cache_file}", file=sys.stderr)
+        return None
+    
+    with open(raw_cache_file, 'r', encoding='utf-8') as f:
+        raw_data = json.load(f)
+    
+    # Prüfe auf API-Fehler
+    if 'error' in raw_data:
+        print(f"[ERROR] TMDB-API-Fehler: {raw_data.get('error')}", file=sys.stderr)
+        return None
+    
+    return raw_data
+
+def _metadata_offline_results(provider, query):
+    """Volltextsuche im Metadaten-Cache, wenn die Online-Suche fehlschlägt"""
+    try:
+        return metadata_cache.get_cache().search(provider, query)
+    except Exception as e:
+        print(f"[WARN] Metadaten-Cache: {e}", file=sys.stderr)
+        return []
+
+@app.route('/api/metadata/tmdb/search', methods=['POST'])
+def api_tmdb_search():
+    """API-Endpoint: Suche Film/TV-Serie in TMDB (Python-basierte Verarbeitung wie MusicBrainz)"""
+    try:
+        data = request.get_json()
+        iso_filename = data.get('iso_filename', '').strip()
         
-        if "SUCCESS" not in result.stdout:
-            print(f"[ERROR] search_and_cache_tmdb failed: {result.stderr}", file=sys.stderr)
-            return jsonify({
-                'success': False,
-                'message': 'TMDB-Suche fehlgeschlagen'
-            }), 500
+        if not iso_filename:
+            return jsonify({'success': False, 'message': 'ISO-Dateiname erforderlich'}), 400
         
-        # Schritt 2: Python verarbeitet die raw response (wie bei MusicBrainz)
         iso_basename = iso_filename.replace('.iso', '')
         settings = get_settings()
         output_dir = settings.get('output_dir', '/media/iso')
@@ -2115,22 +1878,34 @@ fi
         raw_cache_file = cache_dir / f"{iso_basename}_raw.json"
         final_cache_file = cache_dir / f"{iso_basename}.json"
         
-        # Lese raw TMDB response
-        if not raw_cache_file.exists():
-            return jsonify({
-                'success': False,
-                'message': 'Raw cache nicht gefunden'
-            }), 500
+        # Metadaten-Cache: Schlüssel ohne Disc-Nummer, damit die zweite Disc
+        # einer Staffel die Treffer der ersten wiederverwendet
+        metadata = metadata_cache.get_cache()
+        cache_key = metadata_cache.strip_disc_number(metadata_cache.normalize_query(iso_basename))
+        cached = metadata.get('tmdb', metadata_cache.KEY_QUERY, cache_key)
+        raw_data = cached['payload'] if cached and cached['fresh'] else None
+        from_cache = raw_data is not None
+        offline = False
         
-        with open(raw_cache_file, 'r', encoding='utf-8') as f:
-            raw_data = json.load(f)
-        
-        # PrÃ¼fe auf API-Fehler
-        if 'error' in raw_data:
-            return jsonify({
-                'success': False,
-                'message': 'TMDB-API-Fehler'
-            }), 500
+        # Schritt 1: Rufe Bash search_and_cache_tmdb() auf (nur raw API call)
+        if raw_data is None:
+            raw_data = _tmdb_search_raw(iso_filename, raw_cache_file)
+            if raw_data is not None:
+                metadata.put('tmdb', {metadata_cache.KEY_QUERY: cache_key}, raw_data,
+                             entries=_tmdb_cache_entries(raw_data.get('results', [])))
+            elif cached:
+                # Online-Suche fehlgeschlagen: veralteten Cache-Eintrag nutzen
+                raw_data = cached['payload']
+                from_cache = offline = True
+            else:
+                results = _metadata_offline_results('tmdb', cache_key)
+                if not results:
+                    return jsonify({
+                        'success': False,
+                        'message': 'TMDB-Suche fehlgeschlagen'
+                    }), 500
+                raw_data = {'results': results, 'total_results': len(results)}
+                from_cache = offline = True
         
         # Extrahiere Suchbegriff (aus Bash-Script Ã¼bernommen)
         # Erkenne Media-Type
@@ -2146,8 +1921,17 @@ fi
         results = raw_data.get('results', [])[:10]
         total_results = raw_data.get('total_results', 0)
         
+        # Poster parallel laden (Cache nach URL-Hash, pro ISO verlinkt)
+        poster_cache = tmdb_posters.PosterCache(thumbs_dir)
+        posters = poster_cache.fetch_many(
+            [(item.get('poster_path'), f"{iso_basename}_{item.get('id')}.jpg")
+             for item in results if item.get('poster_path')],
+            timeout=tmdb_posters.SEARCH_WAIT
+        )
+        
         processed_results = []
         poster_count = 0
+        pending_count = 0
         
         for item in results:
             # Extrahiere relevante Felder
@@ -2161,24 +1945,17 @@ fi
             overview = item.get('overview', '')
             poster_path = item.get('poster_path')
             
-            # Download Poster wenn vorhanden
+            # Relativer Pfad ab OUTPUT_DIR; noch laufende Downloads lädt der Client nach
             local_poster = None
-            if poster_path:
-                poster_url = f"https://image.tmdb.org/t/p/w500{poster_path}"
-                local_poster_file = thumbs_dir / f"{iso_basename}_{tmdb_id}.jpg"
-                
-                try:
-                    headers = {'User-Agent': 'disk2iso/1.2.0 (DVD/Blu-ray Metadata Client)'}
-                    response = requests.get(poster_url, headers=headers, timeout=10)
-                    if response.status_code == 200:
-                        thumbs_dir.mkdir(parents=True, exist_ok=True)
-                        with open(local_poster_file, 'wb') as f:
-                            f.write(response.content)
-                        # Relativer Pfad ab OUTPUT_DIR
-                        local_poster = f".temp/tmdb/thumbs/{local_poster_file.name}"
-                        poster_count += 1
-                except Exception as e:
-                    print(f"[WARN] Poster download failed for {tmdb_id}: {e}", file=sys.stderr)
+            lazy_poster_url = None
+            poster = posters.get(f"{iso_basename}_{tmdb_id}.jpg") if poster_path else None
+            if poster == 'pending':
+                local_poster = f".temp/tmdb/thumbs/{iso_basename}_{tmdb_id}.jpg"
+                lazy_poster_url = f"/api/metadata/tmdb/poster{poster_path}"
+                pending_count += 1
+            elif poster:
+                local_poster = f".temp/tmdb/thumbs/{poster}"
+                poster_count += 1
             
             processed_results.append({
                 'id': tmdb_id,
@@ -2186,7 +1963,8 @@ fi
                 'year': year,
                 'overview': overview,
                 'poster_path': poster_path,
-                'local_poster': local_poster
+                'local_poster': local_poster,
+                'poster_url': lazy_poster_url
             })
         
         # Erstelle finale Cache-Struktur
@@ -2195,14 +1973,21 @@ fi
             'search_term': search_term,
             'media_type': media_type,
             'total_results': total_results,
-            'results': processed_results
+            'results': processed_results,
+            'cached': from_cache,
+            'offline': offline
         }
         
         # Speichere verarbeitete Daten
         with open(final_cache_file, 'w', encoding='utf-8') as f:
             json.dump(final_data, f, ensure_ascii=False, indent=2)
         
-        print(f"[INFO] TMDB: {total_results} Treffer, {poster_count} Poster heruntergeladen", file=sys.stderr)
+        print(f"[INFO] TMDB: {total_results} Treffer, {poster_count} Poster bereit, {pending_count} laden nach", file=sys.stderr)
+        
+        # Noch ladende Poster: Client nutzt poster_url (wartet auf den Download)
+        for entry in processed_results:
+            if entry['poster_url']:
+                entry['local_poster'] = None
         
         return jsonify(final_data)
             
@@ -2214,6 +1999,36 @@ fi
         traceback.print_exc()
         return jsonify({'success': False, 'message': f'Fehler: {str(e)}'}), 500
 
+@app.route('/api/metadata/tmdb/poster/<path:poster_name>')
+def api_tmdb_poster(poster_name):
+    """API-Endpoint: TMDB-Poster aus dem Poster-Cache (lädt bei Bedarf nach)
+    
+    Wird vom Client für Poster genutzt, deren Download bei der Suche noch
+    lief. Wartet auf den laufenden Download statt einen zweiten zu starten.
+    """
+    poster_path = '/' + poster_name
+    if not tmdb_posters.POSTER_PATH_PATTERN.match(poster_path):
+        return jsonify({'success': False, 'message': 'Ungültiger Poster-Pfad'}), 400
+    
+    settings = get_settings()
+    poster_cache = tmdb_posters.PosterCache(Path(settings['output_dir']) / '.temp' / 'tmdb' / 'thumbs')
+    
+    poster_file = poster_cache.cached(poster_path)
+    if poster_file is None and not poster_cache.known_missing(poster_path):
+        try:
+            poster_file = poster_cache.fetch(poster_path).result(timeout=tmdb_posters.REQUEST_TIMEOUT + 5)
+        except Exception as e:
+            print(f"[WARN] Poster download failed for {poster_path}: {e}", file=sys.stderr)
+            poster_file = None
+    
+    if poster_file is None:
+        return jsonify({'success': False, 'message': 'Poster nicht verfügbar'}), 404
+    
+    # Inhalt hängt nur vom Poster-Pfad ab
+    response = send_file(poster_file, max_age=86400)
+    response.cache_control.public = True
+    return response
+
 @app.route('/api/metadata/tmdb/apply', methods=['POST'])
 def api_tmdb_apply():
     """API-Endpoint: Wende TMDB-Metadaten auf ISO an"""
@@ -2231,7 +2046,7 @@ def api_tmdb_apply():
         if not tmdb_id:
             return jsonify({'success': False, 'message': 'TMDB-ID erforderlich'}), 400
         
-        # Rufe Bash-Funktion auf
+        # Bash-Funktion als Hintergrund-Job (Status via /api/jobs/<id>)
         script = f"""
 export PATH=/usr/local/bin:/usr/bin:/bin:/usr/local/sbin:/usr/sbin:/sbin
 source {INSTALL_DIR}/conf/disk2iso.conf
@@ -2241,56 +2056,32 @@ source {INSTALL_DIR}/lib/lib-logging.sh 2>/dev/null
 source {INSTALL_DIR}/lib/lib-common.sh 2>/dev/null
 source {INSTALL_DIR}/lib/lib-dvd-metadata.sh 2>/dev/null
 
-add_metadata_to_existing_iso "{iso_path}" "{title}" "{media_type}" "{tmdb_id}" 2>/dev/null
-result=$?
+add_metadata_to_existing_iso "$1" "$2" "$3" "$4" || {{ echo "FAILED"; exit 1; }}
 
-if [ $result -eq 0 ]; then
-    echo "SUCCESS"
-else
-    echo "FAILED"
+# Optional: ISO umbenennen
+if [ "$5" = "true" ] && [ -n "$2" ]; then
+    rename_iso_with_metadata "$1" "$2"
 fi
-        """.strip().split('\n')[-1]  # Nur letzte Zeile (SUCCESS/FAILED)
+
+echo "SUCCESS"
+        """
         
-        result = subprocess.run(
-            ['bash', '-c', script],
-            capture_output=True,
-            text=True,
+        job = jobs.get_manager().submit(
+            'tmdb_apply',
+            ['bash', '-c', script, '--', iso_path, title, media_type, str(tmdb_id), 'true' if rename_iso else 'false'],
+            title=f'TMDB: {title or os.path.basename(iso_path)}',
             timeout=60,
+            success_marker='SUCCESS',
+            params={'iso_path': iso_path, 'tmdb_id': tmdb_id},
             env={**os.environ, 'PATH': '/usr/local/bin:/usr/bin:/bin:/usr/local/sbin:/usr/sbin:/sbin'}
         )
         
-        if "SUCCESS" in result.stdout:
-            # Optional: ISO umbenennen
-            new_path = iso_path
-            if rename_iso and title:
-                rename_script = f"""
-source {INSTALL_DIR}/lib/config.sh
-source {INSTALL_DIR}/lib/lib-common.sh
-source {INSTALL_DIR}/lib/lib-logging.sh
-source {INSTALL_DIR}/lib/lib-dvd-metadata.sh
-
-new_path=$(rename_iso_with_metadata "{iso_path}" "{title}")
-echo "$new_path"
-                """
-                rename_result = subprocess.run(
-                    ['bash', '-c', rename_script],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                new_path = rename_result.stdout.strip()
-            
-            return jsonify({
-                'success': True,
-                'message': 'Metadaten erfolgreich hinzugefÃ¼gt',
-                'new_path': new_path
-            })
-        else:
-            return jsonify({
-                'success': False,
-                'message': 'Fehler beim HinzufÃ¼gen der Metadaten',
-                'error': result.stderr
-            }), 500
+        return jsonify({
+            'success': True,
+            'message': 'Metadaten werden hinzugefügt',
+            'job_id': job.id,
+            'job': job.to_dict()
+        }), 202
             
     except Exception as e:
         return jsonify({'success': False, 'message': f'Fehler: {str(e)}'}), 500
@@ -2311,8 +2102,9 @@ def api_musicbrainz_search():
                 # Mount ISO temporÃ¤r und zÃ¤hle MP3-Dateien
                 import tempfile
                 with tempfile.TemporaryDirectory() as mount_point:
-                    mount_result = subprocess.run(
+                    mount_result = lib_broker.run(
                         ['sudo', 'mount', '-o', 'loop,ro', iso_path, mount_point],
+                        label='mount',
                         capture_output=True,
                         timeout=5
                     )
@@ -2325,10 +2117,17 @@ def api_musicbrainz_search():
                             track_count = len(mp3_files)
                             print(f"[DEBUG] Gefunden: {track_count} MP3-Dateien in ISO", file=sys.stderr)
                         finally:
-                            subprocess.run(['sudo', 'umount', mount_point], timeout=5)
+                            lib_broker.run(['sudo', 'umount', mount_point], label='umount', deadline=False, timeout=5)
             except Exception as e:
                 print(f"[WARNING] Track-Anzahl konnte nicht ermittelt werden: {e}", file=sys.stderr)
         
+        # Metadaten-Cache: gleiche (normalisierte) Suche ohne Online-Abfrage
+        metadata = metadata_cache.get_cache()
+        cache_key = metadata_cache.normalize_query(artist, album, str(track_count))
+        cached = metadata.get('musicbrainz', metadata_cache.KEY_QUERY, cache_key)
+        if cached and cached['fresh']:
+            return jsonify({**cached['payload'], 'cached': True, 'offline': False})
+        
         # Rufe Bash-Funktion auf (mit allen Dependencies wie bei TMDB)
         script = f"""
 export PATH=/usr/local/bin:/usr/bin:/bin:/usr/local/sbin:/usr/sbin:/sbin
@@ -2344,13 +2143,28 @@ OUTPUT_DIR="${{DEFAULT_OUTPUT_DIR:-/media/iso}}"
 search_musicbrainz_json "$1" "$2" "$3" "$4"
         """
         
-        result = subprocess.run(
-            ['/bin/bash', '-c', script, '--', artist, album, iso_path, str(track_count)],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            env={**os.environ, 'PATH': '/usr/local/bin:/usr/bin:/bin:/usr/local/sbin:/usr/sbin:/sbin'}
-        )
+        try:
+            result = lib_broker.run(
+                ['/bin/bash', '-c', script, '--', artist, album, iso_path, str(track_count)],
+                label='search_musicbrainz_json',
+                capture_output=True,
+                text=True,
+                timeout=30,
+                env={**os.environ, 'PATH': '/usr/local/bin:/usr/bin:/bin:/usr/local/sbin:/usr/sbin:/sbin'}
+            )
+        except subprocess.TimeoutExpired:
+            result = None
+        
+        if result is None or result.returncode != 0:
+            # Offline/Fehler: veralteten Cache-Eintrag oder Volltextsuche nutzen
+            if cached:
+                return jsonify({**cached['payload'], 'cached': True, 'offline': True})
+            results = _metadata_offline_results('musicbrainz', f'{artist} {album}')
+            if results:
+                return jsonify({'success': True, 'results': results, 'used_mbquery': False,
+                                'cached': True, 'offline': True})
+            if result is None:
+                return jsonify({'success': False, 'message': 'MusicBrainz-Suche: Zeitüberschreitung'}), 500
         
         # Debug: Logge stdout und stderr
         print(f"[DEBUG] MusicBrainz Bash returncode: {result.returncode}", file=sys.stderr)
@@ -2371,7 +2185,12 @@ search_musicbrainz_json "$1" "$2" "$3" "$4"
             # Nimm letzte nicht-leere Zeile (Bash gibt JSON als letzte Zeile aus)
             json_line = result.stdout.strip().split('\n')[-1]
             response_data = json.loads(json_line)
-            return jsonify(response_data)
+            if response_data.get('success'):
+                # Ergebnisse aus einer .mbquery-Datei gehören zur ISO, nicht zur Suche
+                keys = {} if response_data.get('used_mbquery') else {metadata_cache.KEY_QUERY: cache_key}
+                metadata.put('musicbrainz', keys, response_data,
+                             entries=_musicbrainz_cache_entries(response_data.get('results', [])))
+            return jsonify({**response_data, 'cached': False, 'offline': False})
         except json.JSONDecodeError as e:
             return jsonify({
                 'success': False,
@@ -2402,14 +2221,14 @@ def api_musicbrainz_apply():
             print(f"[ERROR] Keine Release-ID", file=sys.stderr)
             return jsonify({'success': False, 'message': g.t.get('API_ERROR_RELEASE_ID_REQUIRED', 'MusicBrainz Release ID required')}), 400
         
-        # Starte Remaster-Prozess im Hintergrund
+        # Starte Remaster-Prozess im Hintergrund (kann 5-10 Minuten dauern)
         settings = get_settings()
         output_dir = settings.get('output_dir', '/media/iso')
         
         script = f"""
 export PATH=/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin
-export OUTPUT_DIR="{output_dir}"
-export DEFAULT_OUTPUT_DIR="{output_dir}"
+export OUTPUT_DIR="$3"
+export DEFAULT_OUTPUT_DIR="$3"
 
 # DEPRECATED: source {INSTALL_DIR}/lib/lib-config.sh
 source {INSTALL_DIR}/lib/lib-logging.sh
@@ -2418,7 +2237,7 @@ source {INSTALL_DIR}/lib/lib-folders.sh
 source {INSTALL_DIR}/lib/lib-common.sh
 source {INSTALL_DIR}/lib/lib-cd-metadata.sh
 
-remaster_audio_iso_with_metadata "{iso_path}" "{release_id}"
+remaster_audio_iso_with_metadata "$1" "$2"
 result=$?
 
 if [ $result -eq 0 ]; then
@@ -2428,46 +2247,75 @@ else
 fi
         """
         
-        print(f"[DEBUG] Starte Remaster-Prozess...", file=sys.stderr)
-        
-        # Timeout erhÃ¶hen (Remaster kann 5-10 Minuten dauern)
-        result = subprocess.run(
-            ['/bin/bash', '-c', script],
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 Minuten
+        job = jobs.get_manager().submit(
+            'remaster',
+            ['/bin/bash', '-c', script, '--', iso_path, release_id, output_dir],
+            title=f'Remaster: {os.path.basename(iso_path)}',
+            timeout=600,  # 10 Minuten
+            success_marker='SUCCESS',
+            params={'iso_path': iso_path, 'release_id': release_id}
         )
         
-        print(f"[DEBUG] Remaster beendet. Exit-Code: {result.returncode}", file=sys.stderr)
-        print(f"[DEBUG] STDOUT: {result.stdout[:500]}", file=sys.stderr)
-        print(f"[DEBUG] STDERR: {result.stderr[:500]}", file=sys.stderr)
-        
-        if "SUCCESS" in result.stdout:
-            return jsonify({
-                'success': True,
-                'message': g.t.get('API_SUCCESS_REMASTER', 'Audio ISO successfully recreated with correct tags')
-            })
-        else:
-            error_msg = result.stderr if result.stderr else "Unbekannter Fehler"
-            print(f"[ERROR] Remaster fehlgeschlagen: {error_msg}", file=sys.stderr)
-            return jsonify({
-                'success': False,
-                'message': g.t.get('API_ERROR_REMASTER_FAILED', 'Error remastering audio ISO'),
-                'error': error_msg
-            }), 500
-            
-    except subprocess.TimeoutExpired:
-        print(f"[ERROR] Remaster-Timeout", file=sys.stderr)
         return jsonify({
-            'success': False,
-            'message': g.t.get('API_ERROR_REMASTER_TIMEOUT', 'Timeout: Remaster process takes too long')
-        }), 500
+            'success': True,
+            'message': g.t.get('API_SUCCESS_REMASTER_STARTED', 'Remaster started'),
+            'job_id': job.id,
+            'job': job.to_dict()
+        }), 202
+            
     except Exception as e:
         print(f"[ERROR] Exception in api_musicbrainz_apply: {str(e)}", file=sys.stderr)
         import traceback
         traceback.print_exc(file=sys.stderr)
         return jsonify({'success': False, 'message': f'Fehler: {str(e)}'}), 500
 
+@app.route('/api/jobs')
+def api_jobs():
+    """API-Endpoint: Liste der Hintergrund-Jobs
+    
+    Query-Parameter:
+        kind: Job-Art (remaster, software_install, tmdb_apply)
+        active: 1 = nur wartende/laufende Jobs
+    """
+    job_list = jobs.get_manager().list(
+        kind=request.args.get('kind') or None,
+        active_only=request.args.get('active') in ('1', 'true')
+    )
+    return jsonify({
+        'success': True,
+        'jobs': [job.to_dict() for job in job_list]
+    })
+
+@app.route('/api/jobs/<job_id>')
+def api_job(job_id):
+    """API-Endpoint: Status eines Hintergrund-Jobs
+    
+    Query-Parameter:
+        since: Erste gewünschte Ausgabezeile (output_next der vorherigen Antwort)
+    """
+    job = jobs.get_manager().get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'message': 'Job nicht gefunden'}), 404
+    
+    try:
+        since = int(request.args.get('since', 0))
+    except ValueError:
+        return jsonify({'success': False, 'message': 'Ungültiger Parameter since'}), 400
+    
+    return jsonify({'success': True, 'job': job.to_dict(since=since)})
+
+@app.route('/api/jobs/<job_id>/cancel', methods=['POST'])
+def api_job_cancel(job_id):
+    """API-Endpoint: Bricht einen wartenden oder laufenden Job ab"""
+    job = jobs.get_manager().get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'message': 'Job nicht gefunden'}), 404
+    
+    if not jobs.get_manager().cancel(job_id):
+        return jsonify({'success': False, 'message': 'Job ist bereits beendet', 'job': job.to_dict()}), 409
+    
+    return jsonify({'success': True, 'job': job.to_dict()})
+
 @app.route('/health')
 def health():
     """Health-Check Endpoint"""
@@ -0,0 +1,1009 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso Archive Index - Persistenter Index des Ausgabeverzeichnisses (SQLite)
+Version 1.3.0
+
+Ersetzt den os.walk() über das komplette Archiv bei jedem Request von
+"/" und "/api/status". Der Index speichert pro ISO Pfad, Typ, Größe,
+Zeitstempel, geparste .nfo Metadaten, Prüfsummen aus den Sidecar-Dateien
+(.md5/.sha256/.b3, beim Kopieren vom Daemon geschrieben) und
+Thumbnail-Vorhandensein.
+
+Aktualisierung:
+- Einmaliger Vollscan beim ersten Start (bzw. nach Wechsel des Ausgabeverzeichnisses)
+- inotify-Watcher (fswatch.py) für inkrementelle Updates
+- Fallback ohne inotify: mtime-Diff-Rescan (ein stat() pro Verzeichnis,
+  dazu ein stat() pro ISO und Begleitdatei für Änderungen an Ort und Stelle)
+- Daemon-Hook: api_notify_archive_change() (libapi.sh) schreibt geänderte
+  Pfade nach api/archive_changes.queue, die Queue wird hier abgearbeitet
+
+Bei mehreren Web-Workern (gunicorn) teilen sich alle dieselbe Datenbank;
+nur der Worker mit der Sperre 'archive_index' (shared_state) scannt und
+überwacht das Archiv, die übrigen lesen nur und übernehmen die Aufgabe,
+falls der pflegende Worker endet.
+"""
+
+import os
+import sys
+import json
+import time
+import base64
+import hashlib
+import secrets
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import fswatch
+import metrics
+import shared_state
+
+
+# Pfade (analog zu den Widget-Blueprints überschreibbar per Environment)
+INSTALL_DIR = os.environ.get('DISK2ISO_INSTALL_DIR', '/opt/disk2iso')
+API_DIR = os.path.join(INSTALL_DIR, 'api')
+CACHE_DIR = os.environ.get('DISK2ISO_CACHE_DIR', os.path.join(INSTALL_DIR, 'cache'))
+DB_PATH = os.path.join(CACHE_DIR, 'archive_index.db')
+QUEUE_FILE = os.path.join(API_DIR, 'archive_changes.queue')
+
+# Archiv-Typen in der Reihenfolge der bisherigen API-Ausgabe
+ARCHIVE_TYPES = ('audio', 'dvd', 'bluray', 'data')
+
+# Polling-Intervall für den mtime-Diff-Rescan (ohne inotify)
+RESCAN_INTERVAL = int(os.environ.get('DISK2ISO_ARCHIVE_RESCAN_INTERVAL', '60'))
+
+# Abstand, in dem nur lesende Worker die Sperre erneut versuchen (Sekunden)
+FOLLOWER_POLL = 2
+
+# stop(): maximale Wartezeit auf das Ende des Hintergrund-Threads (Sekunden)
+STOP_TIMEOUT = 10
+
+# Sortierbare Felder der Archiv-API -> Spalte im Index
+SORT_COLUMNS = {'modified': 'mtime', 'created': 'ctime', 'name': 'name', 'size': 'size'}
+
+# Obergrenze für die Seitengröße einer Abfrage
+MAX_PAGE_SIZE = 500
+
+# Sammelzeit für inotify-Events bevor Verzeichnisse abgeglichen werden
+EVENT_DEBOUNCE = 0.5
+
+# Gecachte Zählungen (Treffer gesamt pro Filter, counts()) pro Index-Stand
+_COUNT_CACHE_MAX = 256
+
+# Schema-Version (PRAGMA user_version) - bei Änderung wird der Index neu aufgebaut
+SCHEMA_VERSION = 3
+
+# Prüfsummen-Sidecars neben der ISO (Endung -> Algorithmus)
+CHECKSUM_SIDECARS = (('.md5', 'md5'), ('.sha256', 'sha256'), ('.b3', 'blake3'))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS isos (
+    path       TEXT PRIMARY KEY,
+    dir        TEXT NOT NULL,
+    name       TEXT NOT NULL,
+    type       TEXT NOT NULL,
+    size       INTEGER NOT NULL,
+    mtime      REAL NOT NULL,
+    ctime      REAL NOT NULL,
+    metadata   TEXT,
+    nfo_mtime  INTEGER,
+    thumbnail  TEXT,
+    thumb_mtime INTEGER,
+    thumb_hash TEXT,
+    checksums  TEXT,
+    sums_mtime INTEGER
+);
+CREATE INDEX IF NOT EXISTS isos_type_mtime ON isos (type, mtime DESC);
+CREATE INDEX IF NOT EXISTS isos_dir ON isos (dir);
+CREATE INDEX IF NOT EXISTS isos_mtime ON isos (mtime, path);
+CREATE INDEX IF NOT EXISTS isos_ctime ON isos (ctime, path);
+CREATE INDEX IF NOT EXISTS isos_size ON isos (size, path);
+CREATE INDEX IF NOT EXISTS isos_name ON isos (name, path);
+CREATE INDEX IF NOT EXISTS isos_thumbnail ON isos (thumbnail);
+CREATE TABLE IF NOT EXISTS dirs (
+    path       TEXT PRIMARY KEY,
+    mtime_ns   INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key        TEXT PRIMARY KEY,
+    value      TEXT
+);
+"""
+
+
+def classify(rel_dir: str, filename: str) -> str:
+    """
+    Bestimmt den Archiv-Typ einer ISO-Datei.
+
+    Primär über die Ordnerstruktur (audio/dvd/bluray), Fallback über
+    das Dateinamen-Pattern - identisch zur bisherigen Logik in
+    get_iso_files_by_type(), aber relativ zum Ausgabeverzeichnis.
+
+    Args:
+        rel_dir: Verzeichnis relativ zum Ausgabeverzeichnis
+        filename: Dateiname der ISO
+
+    Returns:
+        str: 'audio', 'dvd', 'bluray' oder 'data'
+    """
+    path_parts = os.path.normpath(rel_dir).split(os.sep)
+    filename_lower = filename.lower()
+
+    if 'audio' in path_parts:
+        return 'audio'
+    if 'dvd' in path_parts:
+        return 'dvd'
+    if 'bluray' in path_parts or 'blu-ray' in path_parts or 'bd' in path_parts:
+        return 'bluray'
+    if 'data' in path_parts:
+        return 'data'
+    if '_audio-cd_' in filename_lower or '_audiocd_' in filename_lower:
+        return 'audio'
+    if '_bluray_' in filename_lower or '_bd_' in filename_lower or '_blu-ray_' in filename_lower:
+        return 'bluray'
+    if '_dvd_' in filename_lower or '_dvd-video_' in filename_lower:
+        return 'dvd'
+    return 'data'
+
+
+def _parse_nfo(nfo_path: str) -> Optional[Dict[str, str]]:
+    """Liest eine .nfo Datei (KEY=Wert, Schlüssel in Kleinbuchstaben)."""
+    try:
+        nfo_data = {}
+        with open(nfo_path, 'r', encoding='utf-8') as nfo:
+            for line in nfo:
+                if '=' in line:
+                    key, value = line.strip().split('=', 1)
+                    nfo_data[key.lower()] = value
+        return nfo_data
+    except (OSError, UnicodeDecodeError, ValueError):
+        return None
+
+
+def _read_checksum(path: str) -> Optional[str]:
+    """Liest den Hash aus einer md5sum/sha256sum/b3sum-Datei ("<hex>  <iso>")."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            value = f.readline().split(maxsplit=1)
+    except (OSError, UnicodeDecodeError):
+        return None
+    return value[0].lower() if value else None
+
+
+def _encode_cursor(values: list) -> str:
+    """Kodiert die Position einer Seite als undurchsichtigen Cursor."""
+    raw = json.dumps(values, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def _decode_cursor(cursor: str) -> list:
+    """
+    Dekodiert einen Cursor aus _encode_cursor().
+
+    Raises:
+        ValueError: Cursor ist ungültig
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(raw.decode('utf-8'))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f'Ungültiger Cursor: {e}')
+    if not isinstance(values, list) or len(values) != 4:
+        raise ValueError('Ungültiger Cursor')
+    return values
+
+
+def file_hash(path: str) -> Optional[str]:
+    """
+    Content-Hash einer (kleinen) Datei, z.B. eines Thumbnails.
+
+    Returns:
+        Erste 16 Hex-Zeichen des SHA-256 oder None bei Lesefehler
+    """
+    try:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                digest.update(chunk)
+        return digest.hexdigest()[:16]
+    except OSError:
+        return None
+
+
+# Prozess-Cache für Content-Hashes: Pfad -> ((mtime_ns, size), hash)
+_hash_cache: Dict[str, Tuple[Tuple[int, int], Optional[str]]] = {}
+_hash_cache_lock = threading.Lock()
+_HASH_CACHE_MAX = 4096
+
+# Größere Dateien werden nicht gehasht (Thumbnails sind wenige hundert KB)
+MAX_HASH_SIZE = 16 * 1024 * 1024
+
+
+def cached_file_hash(path: str) -> Optional[str]:
+    """
+    Wie file_hash(), aber gecacht solange mtime und Größe unverändert sind
+    (ein stat() pro Aufruf). Dateien über MAX_HASH_SIZE liefern None.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if st.st_size > MAX_HASH_SIZE:
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+
+    with _hash_cache_lock:
+        cached = _hash_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            metrics.record_cache('file_hash', True)
+            return cached[1]
+
+    metrics.record_cache('file_hash', False)
+    content_hash = file_hash(path)
+    with _hash_cache_lock:
+        if len(_hash_cache) >= _HASH_CACHE_MAX:
+            _hash_cache.clear()
+        _hash_cache[path] = (stamp, content_hash)
+    return content_hash
+
+
+def thumbnail_url(name: str, content_hash: str) -> str:
+    """URL eines Thumbnails mit Content-Hash (unveränderlich cachebar)."""
+    return f'/api/archive/thumbnail/{name}?v={content_hash}'
+
+
+def _format_time(timestamp: float) -> str:
+    """Formatiert Zeitstempel wie die bisherige Archiv-API."""
+    return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
+
+
+class ArchiveIndex:
+    """
+    SQLite-Index eines Ausgabeverzeichnisses.
+
+    Lesezugriffe laufen über Thread-lokale Verbindungen (WAL-Modus),
+    Schreibzugriffe sind über einen Lock serialisiert. Jede inhaltliche
+    Änderung erhöht den Änderungszähler (change_counter), der sich
+    zusammen mit der Generation (generation, neu bei jedem Neuaufbau des
+    Index) als Grundlage für ETags eignet.
+    """
+
+    def __init__(self, root: str, db_path: str = DB_PATH):
+        self.root = os.path.normpath(root)
+        self.db_path = db_path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._watcher: Optional['fswatch.Watcher'] = None
+        self.watch_mode = 'none'
+        # COUNT(*)-Ergebnisse, gültig solange (generation, change_counter) gleich bleibt
+        self._count_cache: Dict[tuple, object] = {}
+        self._count_state: Optional[Tuple[str, int]] = None
+        self._count_lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        conn = self._conn()
+        with self._write_lock:
+            # Der Index ist reiner Cache: bei neuem Schema verwerfen und neu aufbauen
+            if conn.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+                conn.executescript('DROP TABLE IF EXISTS isos; DROP TABLE IF EXISTS dirs; '
+                                   'DROP TABLE IF EXISTS meta;')
+                conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            conn.executescript(_SCHEMA)
+            # Anderes Ausgabeverzeichnis als beim letzten Lauf -> Index verwerfen
+            if self._get_meta(conn, 'root') != self.root:
+                conn.execute('DELETE FROM isos')
+                conn.execute('DELETE FROM dirs')
+                conn.execute('DELETE FROM meta')
+                self._set_meta(conn, 'root', self.root)
+                self._set_meta(conn, 'change_counter', '0')
+            # Zähler beginnt nach Neuaufbau wieder bei 0 -> eigene Generation
+            if not self._get_meta(conn, 'generation'):
+                self._set_meta(conn, 'generation', secrets.token_hex(6))
+            conn.commit()
+
+        if self._get_meta(conn, 'last_scan'):
+            self._ready.set()
+
+    # ------------------------------------------------------------------
+    # Datenbank-Helfer
+    # ------------------------------------------------------------------
+
+    def _conn(self) -> sqlite3.Connection:
+        """Liefert die Verbindung des aktuellen Threads."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _get_meta(conn: sqlite3.Connection, key: str) -> Optional[str]:
+        row = conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_meta(conn: sqlite3.Connection, key: str, value: str):
+        conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, value))
+
+    def _bump(self, conn: sqlite3.Connection):
+        """Erhöht den Änderungszähler (innerhalb der laufenden Transaktion)."""
+        conn.execute(
+            "UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'change_counter'"
+        )
+        self._set_meta(conn, 'last_change', str(time.time()))
+
+    # ------------------------------------------------------------------
+    # Abgleich
+    # ------------------------------------------------------------------
+
+    def _is_hidden(self, path: str) -> bool:
+        """Versteckte Verzeichnisse (.temp, .log) gehören nicht zum Archiv."""
+        rel = os.path.relpath(path, self.root)
+        return rel != '.' and any(part.startswith('.') for part in rel.split(os.sep))
+
+    def _sync_dir(self, conn: sqlite3.Connection, dirpath: str) -> List[str]:
+        """
+        Gleicht ein einzelnes Verzeichnis mit dem Index ab.
+
+        Pro ISO werden .nfo und Prüfsummen-Sidecars nur neu gelesen, wenn
+        sie neu sind oder sich ihre mtime geändert hat. .nfo, Sidecars und
+        Thumbnail werden über das Verzeichnis-Listing erkannt (kein
+        zusätzlicher stat() für fehlende Dateien).
+
+        Args:
+            conn: Verbindung mit offener Schreib-Transaktion
+            dirpath: Absoluter Verzeichnispfad
+
+        Returns:
+            Liste der (nicht versteckten) Unterverzeichnisse
+        """
+        try:
+            dir_mtime = os.stat(dirpath).st_mtime_ns
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError:
+            self._drop_dir(conn, dirpath)
+            return []
+
+        names = {entry.name: entry for entry in entries}
+        subdirs = [e.path for e in entries
+                   if not e.name.startswith('.') and e.is_dir(follow_symlinks=False)]
+
+        known = {
+            row[0]: row[1:]
+            for row in conn.execute(
+                'SELECT path, size, mtime, nfo_mtime, thumbnail, thumb_mtime, thumb_hash, sums_mtime '
+                'FROM isos WHERE dir = ?',
+                (dirpath,))
+        }
+        rel_dir = os.path.relpath(dirpath, self.root)
+        changed = False
+        seen = set()
+
+        for entry in entries:
+            if not entry.name.lower().endswith('.iso'):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+
+            seen.add(entry.path)
+            base = entry.name[:-4]
+
+            nfo_entry = names.get(base + '.nfo')
+            nfo_mtime = None
+            if nfo_entry is not None:
+                try:
+                    nfo_mtime = nfo_entry.stat().st_mtime_ns
+                except OSError:
+                    nfo_entry = None
+            thumb_entry = names.get(base + '-thumb.jpg')
+            thumbnail = thumb_mtime = thumb_hash = None
+            if thumb_entry is not None:
+                try:
+                    thumb_mtime = thumb_entry.stat().st_mtime_ns
+                    thumbnail = thumb_entry.name
+                except OSError:
+                    thumb_entry = None
+
+            # Prüfsummen-Sidecars (Summe der mtimes erkennt auch gelöschte)
+            sums = []
+            sums_mtime = None
+            for ext, algorithm in CHECKSUM_SIDECARS:
+                sum_entry = names.get(base + ext)
+                if sum_entry is None:
+                    continue
+                try:
+                    sums_mtime = (sums_mtime or 0) + sum_entry.stat().st_mtime_ns
+                except OSError:
+                    continue
+                sums.append((algorithm, sum_entry.path))
+
+            old = known.get(entry.path)
+            if old is not None and old[0] == st.st_size and old[1] == st.st_mtime \
+                    and old[2] == nfo_mtime and old[3] == thumbnail and old[4] == thumb_mtime \
+                    and old[6] == sums_mtime:
+                continue
+
+            # Content-Hash des Thumbnails nur bei geändertem Bild neu berechnen
+            if thumb_entry is not None:
+                if old is not None and old[3] == thumbnail and old[4] == thumb_mtime:
+                    thumb_hash = old[5]
+                else:
+                    thumb_hash = file_hash(thumb_entry.path)
+
+            metadata = None
+            if nfo_entry is not None:
+                nfo_data = _parse_nfo(nfo_entry.path)
+                if nfo_data is not None:
+                    metadata = json.dumps(nfo_data, ensure_ascii=False)
+
+            checksums = {}
+            for algorithm, sum_path in sums:
+                value = _read_checksum(sum_path)
+                if value:
+                    checksums[algorithm] = value
+
+            conn.execute(
+                'INSERT OR REPLACE INTO isos '
+                '(path, dir, name, type, size, mtime, ctime, metadata, nfo_mtime, '
+                'thumbnail, thumb_mtime, thumb_hash, checksums, sums_mtime) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (entry.path, dirpath, entry.name, classify(rel_dir, entry.name),
+                 st.st_size, st.st_mtime, st.st_ctime, metadata, nfo_mtime,
+                 thumbnail, thumb_mtime, thumb_hash,
+                 json.dumps(checksums) if checksums else None, sums_mtime))
+            changed = True
+
+        removed = [path for path in known if path not in seen]
+        if removed:
+            conn.executemany('DELETE FROM isos WHERE path = ?', [(p,) for p in removed])
+            changed = True
+
+        conn.execute('INSERT OR REPLACE INTO dirs (path, mtime_ns) VALUES (?, ?)',
+                     (dirpath, dir_mtime))
+        if changed:
+            self._bump(conn)
+        return subdirs
+
+    def _files_changed(self, conn: sqlite3.Connection, dirpath: str) -> bool:
+        """
+        Prüft die indizierten Dateien eines Verzeichnisses auf Änderungen an
+        Ort und Stelle (gleicher Name, neue Größe/mtime), die die mtime des
+        Verzeichnisses nicht ändern.
+        """
+        rows = conn.execute(
+            'SELECT path, size, mtime, nfo_mtime, thumbnail, thumb_mtime, sums_mtime '
+            'FROM isos WHERE dir = ?', (dirpath,))
+        try:
+            for path, size, mtime, nfo_mtime, thumbnail, thumb_mtime, sums_mtime in rows:
+                st = os.stat(path)
+                if st.st_size != size or st.st_mtime != mtime:
+                    return True
+                base = path[:-4]
+                if nfo_mtime is not None and os.stat(base + '.nfo').st_mtime_ns != nfo_mtime:
+                    return True
+                if thumbnail is not None and \
+                        os.stat(os.path.join(dirpath, thumbnail)).st_mtime_ns != thumb_mtime:
+                    return True
+                if sums_mtime is not None:
+                    current = 0
+                    for ext, _ in CHECKSUM_SIDECARS:
+                        try:
+                            current += os.stat(base + ext).st_mtime_ns
+                        except FileNotFoundError:
+                            pass
+                    if current != sums_mtime:
+                        return True
+        except OSError:
+            return True
+        return False
+
+    def _drop_dir(self, conn: sqlite3.Connection, dirpath: str):
+        """Entfernt ein (gelöschtes) Verzeichnis samt Unterverzeichnissen aus dem Index."""
+        prefix = dirpath.rstrip(os.sep) + os.sep
+        cur = conn.execute(
+            'DELETE FROM isos WHERE dir = ? OR substr(dir, 1, ?) = ?',
+            (dirpath, len(prefix), prefix))
+        conn.execute('DELETE FROM dirs WHERE path = ? OR substr(path, 1, ?) = ?',
+                     (dirpath, len(prefix), prefix))
+        if cur.rowcount:
+            self._bump(conn)
+
+    def _scan_tree(self, conn: sqlite3.Connection, start: str, visited: Optional[Set[str]] = None):
+        """Gleicht einen Verzeichnisbaum ab (iterativ, ohne versteckte Ordner)."""
+        stack = [start]
+        while stack and not self._stop.is_set():
+            dirpath = stack.pop()
+            if visited is not None:
+                visited.add(dirpath)
+            stack.extend(self._sync_dir(conn, dirpath))
+
+    def full_scan(self):
+        """Kompletter Abgleich des Ausgabeverzeichnisses."""
+        with self._write_lock:
+            conn = self._conn()
+            visited: Set[str] = set()
+            if os.path.isdir(self.root):
+                self._scan_tree(conn, self.root, visited)
+
+            # Verzeichnisse die nicht mehr existieren entfernen
+            stale = [row[0] for row in conn.execute('SELECT path FROM dirs')
+                     if row[0] not in visited]
+            for dirpath in stale:
+                self._drop_dir(conn, dirpath)
+
+            self._set_meta(conn, 'last_scan', str(time.time()))
+            conn.commit()
+        self._ready.set()
+
+    def rescan(self):
+        """
+        mtime-Diff-Rescan: ein stat() pro bekanntem Verzeichnis, nur
+        geänderte Verzeichnisse werden gelistet. In unveränderten
+        Verzeichnissen werden die indizierten Dateien per stat() geprüft
+        (überschriebene ISO, neue .nfo-Inhalte, neues Thumbnail).
+        """
+        with self._write_lock:
+            conn = self._conn()
+            known = dict(conn.execute('SELECT path, mtime_ns FROM dirs').fetchall())
+            if not known:
+                if os.path.isdir(self.root):
+                    self._scan_tree(conn, self.root)
+            for dirpath, mtime_ns in known.items():
+                if self._stop.is_set():
+                    break
+                try:
+                    current = os.stat(dirpath).st_mtime_ns
+                except OSError:
+                    self._drop_dir(conn, dirpath)
+                    continue
+                if current == mtime_ns and not self._files_changed(conn, dirpath):
+                    continue
+                for subdir in self._sync_dir(conn, dirpath):
+                    if subdir not in known:
+                        self._scan_tree(conn, subdir)
+
+            self._set_meta(conn, 'last_scan', str(time.time()))
+            conn.commit()
+        self._ready.set()
+
+    def refresh_paths(self, paths: Iterable[str]):
+        """
+        Gleicht die Verzeichnisse geänderter Pfade ab.
+
+        Args:
+            paths: Datei- oder Verzeichnispfade (ISO, .nfo, Thumbnail, Ordner)
+        """
+        dirs = set()
+        for path in paths:
+            path = os.path.normpath(path)
+            if path != self.root and not path.startswith(self.root + os.sep):
+                continue
+            dirs.add(path if os.path.isdir(path) else os.path.dirname(path))
+
+        if not dirs:
+            return
+
+        with self._write_lock:
+            conn = self._conn()
+            for dirpath in sorted(dirs):
+                if self._is_hidden(dirpath):
+                    continue
+                if not os.path.isdir(dirpath):
+                    self._drop_dir(conn, dirpath)
+                    continue
+                known = conn.execute('SELECT 1 FROM dirs WHERE path = ?', (dirpath,)).fetchone()
+                if known:
+                    for subdir in self._sync_dir(conn, dirpath):
+                        if not conn.execute('SELECT 1 FROM dirs WHERE path = ?', (subdir,)).fetchone():
+                            self._scan_tree(conn, subdir)
+                else:
+                    self._scan_tree(conn, dirpath)
+            conn.commit()
+
+    def process_queue(self):
+        """
+        Übernimmt die vom Daemon geschriebene Änderungs-Queue.
+
+        Die Datei wird per rename() übernommen, damit gleichzeitige
+        Appends des Daemons in einer neuen Queue-Datei landen.
+        """
+        if not os.path.exists(QUEUE_FILE):
+            return
+        work_file = f'{QUEUE_FILE}.{os.getpid()}.{threading.get_ident()}'
+        try:
+            os.rename(QUEUE_FILE, work_file)
+        except OSError:
+            return
+        try:
+            with open(work_file, 'r', encoding='utf-8', errors='replace') as f:
+                paths = [line.strip() for line in f if line.strip()]
+        finally:
+            try:
+                os.unlink(work_file)
+            except OSError:
+                pass
+        self.refresh_paths(paths)
+
+    # ------------------------------------------------------------------
+    # Hintergrund-Aktualisierung
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Startet den Hintergrund-Thread (Erstscan + Watcher/Polling)."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name='archive-index', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Beendet den Hintergrund-Thread und wartet darauf (Watcher wird
+        geweckt, laufende Scans brechen ab). Danach ist die Sperre
+        'archive_index' frei und der Index des neuen Ausgabeverzeichnisses
+        übernimmt sofort - ohne dass der alte Thread noch in die gemeinsame
+        Datenbank schreibt.
+        """
+        self._stop.set()
+        watcher = self._watcher
+        if watcher is not None:
+            watcher.wake()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(STOP_TIMEOUT)
+
+    def _run(self):
+        # Nur ein Worker pflegt den Index, die anderen warten als Leser
+        lock = shared_state.try_lock('archive_index')
+        while lock is None:
+            self.watch_mode = 'follower'
+            if not self._ready.is_set() and self._get_meta(self._conn(), 'last_scan'):
+                self._ready.set()
+            if self._stop.wait(FOLLOWER_POLL):
+                return
+            lock = shared_state.try_lock('archive_index')
+        try:
+            self._maintain()
+        finally:
+            shared_state.release(lock)
+
+    def _maintain(self):
+        # Watches vor dem Scan anlegen, damit keine Änderung dazwischen verloren geht
+        watcher = None
+        if fswatch.available():
+            try:
+                watcher = fswatch.Watcher()
+                if os.path.isdir(self.root):
+                    watcher.add(self.root, recursive=True)
+                if os.path.isdir(API_DIR):
+                    watcher.add(API_DIR)
+                self.watch_mode = 'inotify'
+            except OSError as e:
+                print(f"inotify nicht nutzbar ({e}), nutze Polling", file=sys.stderr)
+                if watcher is not None:
+                    watcher.close()
+                watcher = None
+        if watcher is None:
+            self.watch_mode = 'polling'
+
+        try:
+            if self._ready.is_set():
+                self.rescan()
+            else:
+                self.full_scan()
+        except Exception as e:
+            print(f"Fehler beim Archiv-Scan: {e}", file=sys.stderr)
+            self._ready.set()
+
+        self._watcher = watcher
+        try:
+            if watcher is not None:
+                self._watch_loop(watcher)
+            else:
+                self._poll_loop()
+        finally:
+            self._watcher = None
+            if watcher is not None:
+                watcher.close()
+
+    def _watch_loop(self, watcher: 'fswatch.Watcher'):
+        while not self._stop.is_set():
+            events = watcher.read_events(timeout=RESCAN_INTERVAL)
+            if not events:
+                continue
+            # Kurz sammeln, damit zusammenhängende Events (ISO + .nfo + Thumbnail)
+            # in einem Abgleich landen
+            time.sleep(EVENT_DEBOUNCE)
+            events.extend(watcher.read_events(timeout=0))
+
+            try:
+                if any(mask & fswatch.IN_Q_OVERFLOW for _, mask in events):
+                    self.rescan()
+                if any(path == QUEUE_FILE for path, _ in events):
+                    self.process_queue()
+                self.refresh_paths(path for path, _ in events
+                                   if path and not path.startswith(API_DIR + os.sep))
+            except Exception as e:
+                print(f"Fehler beim Archiv-Update: {e}", file=sys.stderr)
+
+    def _poll_loop(self):
+        while not self._stop.wait(RESCAN_INTERVAL):
+            try:
+                self.process_queue()
+                self.rescan()
+            except Exception as e:
+                print(f"Fehler beim Archiv-Rescan: {e}", file=sys.stderr)
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Wartet bis der Index mindestens einmal gefüllt wurde."""
+        return self._ready.wait(timeout)
+
+    # ------------------------------------------------------------------
+    # Abfragen
+    # ------------------------------------------------------------------
+
+    @property
+    def change_counter(self) -> int:
+        """Änderungszähler (steigt bei jeder inhaltlichen Index-Änderung)."""
+        value = self._get_meta(self._conn(), 'change_counter')
+        return int(value) if value else 0
+
+    @property
+    def generation(self) -> str:
+        """Kennung des Index-Aufbaus (neu nach Schema-/Verzeichniswechsel oder neuer Datenbank)."""
+        return self._get_meta(self._conn(), 'generation') or ''
+
+    @property
+    def last_change(self) -> float:
+        """Zeitpunkt der letzten inhaltlichen Index-Änderung (Unix-Zeit)."""
+        value = self._get_meta(self._conn(), 'last_change') or self._get_meta(self._conn(), 'last_scan')
+        return float(value) if value else 0.0
+
+    def _cached_count(self, key: tuple, compute):
+        """
+        Liefert ein Zählergebnis aus dem Cache oder berechnet es.
+
+        Der Cache gilt für einen Index-Stand (generation, change_counter) -
+        Zählungen über die ganze Tabelle laufen so nur einmal pro Änderung.
+        """
+        conn = self._conn()
+        state = (self._get_meta(conn, 'generation') or '', self._get_meta(conn, 'change_counter'))
+        with self._count_lock:
+            if state != self._count_state:
+                self._count_cache.clear()
+                self._count_state = state
+            elif key in self._count_cache:
+                return self._count_cache[key]
+        value = compute()
+        with self._count_lock:
+            if state == self._count_state:
+                if len(self._count_cache) >= _COUNT_CACHE_MAX:
+                    self._count_cache.clear()
+                self._count_cache[key] = value
+        return value
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Anzahl ISOs je Typ (gecacht bis zur nächsten Index-Änderung).
+
+        Returns:
+            Dict mit 'data', 'audio', 'dvd', 'bluray' -> Anzahl
+        """
+        def compute():
+            result = {key: 0 for key in ('data', 'audio', 'dvd', 'bluray')}
+            for type_key, count in self._conn().execute(
+                    'SELECT type, COUNT(*) FROM isos GROUP BY type'):
+                result[type_key] = count
+            return result
+        return dict(self._cached_count(('counts',), compute))
+
+    def total(self) -> int:
+        """Gesamtanzahl ISOs im Archiv."""
+        return self._cached_count(
+            ('total', '', ()),
+            lambda: self._conn().execute('SELECT COUNT(*) FROM isos').fetchone()[0])
+
+    @staticmethod
+    def _row_to_file_info(row) -> Dict:
+        path, name, size, mtime, ctime, metadata, thumbnail, thumb_hash, checksums = row
+        file_info = {
+            'name': name,
+            'path': path,
+            'size': size,
+            'created': _format_time(ctime),
+            'modified': _format_time(mtime)
+        }
+        if metadata is not None:
+            file_info['metadata'] = json.loads(metadata)
+        if checksums is not None:
+            file_info['checksums'] = json.loads(checksums)
+        if thumbnail:
+            file_info['thumbnail'] = thumbnail
+            if thumb_hash:
+                file_info['thumbnail_url'] = thumbnail_url(thumbnail, thumb_hash)
+        return file_info
+
+    def find_thumbnail(self, name: str) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Löst einen Thumbnail-Dateinamen über den Index auf.
+
+        Args:
+            name: Dateiname (z.B. "Movie-thumb.jpg")
+
+        Returns:
+            (absoluter Pfad, Content-Hash) oder None
+        """
+        row = self._conn().execute(
+            'SELECT dir, thumb_hash FROM isos WHERE thumbnail = ? LIMIT 1', (name,)).fetchone()
+        if row is None:
+            return None
+        return os.path.join(row[0], name), row[1]
+
+    def files_by_type(self) -> Dict[str, List[Dict]]:
+        """
+        Alle ISOs gruppiert nach Typ, neueste zuerst.
+
+        Returns:
+            Dict im Format der bisherigen get_iso_files_by_type()
+        """
+        result = {key: [] for key in ARCHIVE_TYPES}
+        for type_key in ARCHIVE_TYPES:
+            rows = self._conn().execute(
+                'SELECT path, name, size, mtime, ctime, metadata, thumbnail, thumb_hash, checksums '
+                'FROM isos WHERE type = ? ORDER BY mtime DESC', (type_key,))
+            result[type_key] = [self._row_to_file_info(row) for row in rows]
+        return result
+
+
+    def query(self, types: Optional[Iterable[str]] = None, name: Optional[str] = None,
+              modified_from: Optional[float] = None, modified_to: Optional[float] = None,
+              size_min: Optional[int] = None, size_max: Optional[int] = None,
+              sort: str = 'modified', order: str = 'desc', limit: int = 50,
+              cursor: Optional[str] = None) -> Dict:
+        """
+        Gefilterte, sortierte Abfrage mit Keyset-Pagination.
+
+        Die Seitenposition steckt im Cursor (letzter Sortierwert + Pfad),
+        daher ist der Aufwand pro Seite unabhängig von der Archivgröße. Die
+        Trefferzahl (total) wird pro Filter und Index-Stand nur einmal
+        gezählt.
+
+        Args:
+            types: Archiv-Typen (None = alle)
+            name: Teilstring im Dateinamen (ohne Beachtung der Groß-/Kleinschreibung)
+            modified_from: Untere Grenze für mtime (inklusive)
+            modified_to: Obere Grenze für mtime (exklusive)
+            size_min: Minimale Größe in Bytes
+            size_max: Maximale Größe in Bytes
+            sort: 'modified', 'created', 'name' oder 'size'
+            order: 'asc' oder 'desc'
+            limit: Seitengröße (1..MAX_PAGE_SIZE)
+            cursor: next_cursor der vorherigen Seite
+
+        Returns:
+            Dict mit 'items', 'total' (Treffer gesamt) und 'next_cursor'
+
+        Raises:
+            ValueError: Ungültige Parameter oder Cursor
+        """
+        column = SORT_COLUMNS.get(sort)
+        if column is None:
+            raise ValueError(f'Ungültige Sortierung: {sort}')
+        if order not in ('asc', 'desc'):
+            raise ValueError(f'Ungültige Sortierrichtung: {order}')
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+
+        where = []
+        params: list = []
+        if types:
+            types = list(types)
+            unknown = [t for t in types if t not in ARCHIVE_TYPES]
+            if unknown:
+                raise ValueError(f'Ungültiger Typ: {unknown[0]}')
+            where.append(f'type IN ({",".join("?" * len(types))})')
+            params.extend(types)
+        if name:
+            escaped = name.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            where.append("name LIKE ? ESCAPE '\\'")
+            params.append(f'%{escaped}%')
+        if modified_from is not None:
+            where.append('mtime >= ?')
+            params.append(modified_from)
+        if modified_to is not None:
+            where.append('mtime < ?')
+            params.append(modified_to)
+        if size_min is not None:
+            where.append('size >= ?')
+            params.append(size_min)
+        if size_max is not None:
+            where.append('size <= ?')
+            params.append(size_max)
+
+        conn = self._conn()
+        filter_sql = f' WHERE {" AND ".join(where)}' if where else ''
+        total = self._cached_count(
+            ('total', filter_sql, tuple(params)),
+            lambda: conn.execute(f'SELECT COUNT(*) FROM isos{filter_sql}', params).fetchone()[0])
+
+        page_where = list(where)
+        page_params = list(params)
+        if cursor:
+            c_sort, c_order, last_value, last_path = _decode_cursor(cursor)
+            if c_sort != sort or c_order != order:
+                raise ValueError('Cursor passt nicht zur Sortierung')
+            op = '<' if order == 'desc' else '>'
+            page_where.append(f'({column} {op} ? OR ({column} = ? AND path {op} ?))')
+            page_params.extend([last_value, last_value, last_path])
+
+        direction = order.upper()
+        page_sql = f' WHERE {" AND ".join(page_where)}' if page_where else ''
+        rows = conn.execute(
+            f'SELECT path, name, size, mtime, ctime, metadata, thumbnail, thumb_hash, checksums, type, {column} '
+            f'FROM isos{page_sql} ORDER BY {column} {direction}, path {direction} LIMIT ?',
+            page_params + [limit + 1]).fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = _encode_cursor([sort, order, last[10], last[0]])
+
+        items = []
+        for row in rows:
+            file_info = self._row_to_file_info(row[:9])
+            file_info['type'] = row[9]
+            items.append(file_info)
+
+        return {'items': items, 'total': total, 'next_cursor': next_cursor}
+
+
+# Index-Registry (ein Index pro Prozess, Wechsel bei neuem Ausgabeverzeichnis)
+_index: Optional[ArchiveIndex] = None
+_index_lock = threading.Lock()
+
+# Wartezeit auf den Erstscan, danach wird mit dem Teilstand geantwortet
+INITIAL_SCAN_TIMEOUT = 30
+
+
+def get_index(output_dir: str) -> ArchiveIndex:
+    """
+    Liefert den Index für das Ausgabeverzeichnis und startet bei Bedarf
+    den Hintergrund-Thread.
+
+    Beim allerersten Aufruf (leere Datenbank) wird auf den Erstscan
+    gewartet, danach antworten Abfragen sofort aus dem Index. Die
+    Daemon-Queue wird bei jedem Aufruf übernommen (ein stat()), damit
+    frisch kopierte ISOs auch im Polling-Modus sofort erscheinen.
+
+    Args:
+        output_dir: Ausgabeverzeichnis (DEFAULT_OUTPUT_DIR)
+
+    Returns:
+        ArchiveIndex Instanz
+    """
+    global _index
+    root = os.path.normpath(output_dir)
+
+    with _index_lock:
+        if _index is None or _index.root != root:
+            if _index is not None:
+                _index.stop()
+            _index = ArchiveIndex(root)
+            _index.start()
+        index = _index
+
+    index.wait_ready(INITIAL_SCAN_TIMEOUT)
+    if index.watch_mode != 'inotify':
+        index.process_queue()
+    return index
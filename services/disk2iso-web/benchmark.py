@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso Web Benchmark - Latenz, Forks und Speicher der Web-API messen
+Version 1.3.0
+
+Baut eine Fake-Installation (conf, lib, lang, api/*.json) und ein
+synthetisches Ausgabeverzeichnis mit ISOs (sparse), .nfo-Dateien und
+Thumbnails in audio/, dvd/, bluray/ und data/. Danach werden über
+app.test_client() die Seiten und APIs abgefragt:
+
+- /, /api/status, /api/archive, /api/metadata/pending
+- alle Widget-Endpoints ohne URL-Parameter (/api/widgets/...)
+
+Pro Endpoint werden erster Aufruf (kalt), p50/p95, Prozessstarts und
+Bash-Aufrufe pro Request (metrics.py) ausgegeben, pro Archivgröße der
+maximale RSS des Web-Prozesses. Jede Archivgröße läuft in einem eigenen
+Prozess, da die Module ihre Pfade beim Import lesen. Einmal erzeugte
+Archive werden im Arbeitsverzeichnis wiederverwendet.
+
+Aufruf:
+    python3 benchmark.py
+    python3 benchmark.py --isos 1000,10000,100000 --requests 100
+    python3 benchmark.py --workdir /var/tmp/d2i-bench --json ergebnis.json
+"""
+
+import os
+import re
+import sys
+import json
+import math
+import time
+import random
+import shutil
+import argparse
+import resource
+import subprocess
+from typing import Dict, List
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(os.path.dirname(APP_DIR))
+
+ARCHIVE_TYPES = ('audio', 'dvd', 'bluray', 'data')
+
+# Typische Abbild-Größen (Dateien werden sparse angelegt)
+ISO_SIZES = {
+    'audio': 700 * 1024 ** 2,
+    'dvd': 4700 * 1024 ** 2,
+    'bluray': 25000 * 1024 ** 2,
+    'data': 650 * 1024 ** 2,
+}
+
+FIXED_ENDPOINTS = ('/', '/api/status', '/api/archive', '/api/metadata/pending')
+
+# Minimales JPEG (SOI + APP0 + EOI) als Thumbnail-Platzhalter
+THUMBNAIL = bytes.fromhex('ffd8ffe000104a46494600010100000100010000ffd9')
+
+BUILD_MARKER = '.benchmark.json'
+
+
+# ============================================================================
+# Fake-Installation und synthetisches Archiv
+# ============================================================================
+
+def build_install_tree(install_dir: str, output_dir: str):
+    """Legt conf, lib, lang, api und VERSION wie unter /opt/disk2iso an."""
+    for name in ('conf', 'api', 'cache'):
+        os.makedirs(os.path.join(install_dir, name), exist_ok=True)
+
+    for name in ('lib', 'lang'):
+        link = os.path.join(install_dir, name)
+        if not os.path.lexists(link):
+            os.symlink(os.path.join(REPO_DIR, name), link)
+
+    conf_dir = os.path.join(REPO_DIR, 'conf')
+    for name in os.listdir(conf_dir):
+        with open(os.path.join(conf_dir, name), 'r', encoding='utf-8') as f:
+            text = f.read()
+        if name == 'disk2iso.conf':
+            text = re.sub(r'^DEFAULT_OUTPUT_DIR=.*$', f'DEFAULT_OUTPUT_DIR="{output_dir}"', text, flags=re.MULTILINE)
+        with open(os.path.join(install_dir, 'conf', name), 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    api_dir = os.path.join(REPO_DIR, 'api')
+    for name in os.listdir(api_dir):
+        if name.endswith('.json'):
+            shutil.copy(os.path.join(api_dir, name), os.path.join(install_dir, 'api', name))
+    shutil.copy(os.path.join(REPO_DIR, 'VERSION'), os.path.join(install_dir, 'VERSION'))
+
+
+def _nfo(archive_type: str, index: int) -> str:
+    year = 1970 + index % 55
+    if archive_type == 'audio':
+        return (f'ARTIST=Artist {index % 997}\nALBUM=Album {index}\nYEAR={year}\n'
+                f'TRACKS={8 + index % 12}\nGENRE=Rock\n')
+    if archive_type in ('dvd', 'bluray'):
+        return f'TITLE=Film {index}\nYEAR={year}\nTYPE=movie\nRUNTIME={80 + index % 90}\n'
+    return f'LABEL=Backup {index}\nDATE={year}-01-01\n'
+
+
+def build_archive(output_dir: str, count: int, nfo_ratio: float, thumb_ratio: float, seed: int = 1):
+    """
+    Erzeugt count ISOs gleichmäßig verteilt auf die Archiv-Typen.
+
+    Ein Teil der ISOs bekommt .nfo und -thumb.jpg, die mtimes werden über
+    mehrere Jahre verteilt. Dazu kommt eine offene Metadaten-Auswahl im
+    Spool-Verzeichnis.
+    """
+    rng = random.Random(seed)
+    now = time.time()
+    for archive_type in ARCHIVE_TYPES:
+        os.makedirs(os.path.join(output_dir, archive_type), exist_ok=True)
+
+    for i in range(count):
+        archive_type = ARCHIVE_TYPES[i % len(ARCHIVE_TYPES)]
+        base = os.path.join(output_dir, archive_type, f'{archive_type}_disc_{i:06d}')
+        with open(base + '.iso', 'wb') as f:
+            f.truncate(ISO_SIZES[archive_type] + rng.randrange(1024 ** 2))
+        mtime = now - rng.randrange(5 * 365 * 86400)
+        os.utime(base + '.iso', (mtime, mtime))
+        if rng.random() < nfo_ratio:
+            with open(base + '.nfo', 'w', encoding='utf-8') as f:
+                f.write(_nfo(archive_type, i))
+        if rng.random() < thumb_ratio:
+            with open(base + '-thumb.jpg', 'wb') as f:
+                f.write(THUMBNAIL)
+
+    spool = os.path.join(output_dir, '.temp', 'metadata')
+    os.makedirs(spool, exist_ok=True)
+    query = {
+        'track_count': 12,
+        'releases': [{'id': f'release-{n}', 'title': f'Album {n}', 'artist': f'Artist {n}'} for n in range(10)]
+    }
+    with open(os.path.join(spool, 'benchmark_mb.mbquery'), 'w', encoding='utf-8') as f:
+        json.dump(query, f)
+
+
+def prepare(workdir: str, count: int, nfo_ratio: float, thumb_ratio: float) -> str:
+    """Baut (oder verwendet) den Baum für eine Archivgröße, liefert dessen Pfad."""
+    tree = os.path.join(workdir, f'isos-{count}')
+    install_dir = os.path.join(tree, 'install')
+    output_dir = os.path.join(tree, 'output')
+    marker = os.path.join(output_dir, BUILD_MARKER)
+    params = {'count': count, 'nfo_ratio': nfo_ratio, 'thumb_ratio': thumb_ratio}
+
+    try:
+        with open(marker, 'r', encoding='utf-8') as f:
+            reuse = json.load(f) == params
+    except (OSError, ValueError):
+        reuse = False
+
+    if not reuse:
+        shutil.rmtree(tree, ignore_errors=True)
+        start = time.monotonic()
+        build_archive(output_dir, count, nfo_ratio, thumb_ratio)
+        with open(marker, 'w', encoding='utf-8') as f:
+            json.dump(params, f)
+        print(f"Archiv mit {count} ISOs erzeugt ({time.monotonic() - start:.1f} s)", file=sys.stderr)
+
+    # Installation immer frisch (Cache/Index-DB aus vorherigen Läufen verwerfen)
+    shutil.rmtree(install_dir, ignore_errors=True)
+    build_install_tree(install_dir, output_dir)
+    return tree
+
+
+# ============================================================================
+# Messung (läuft im Kind-Prozess)
+# ============================================================================
+
+def percentile(values: List[float], p: float) -> float:
+    """Perzentil nach Nearest-Rank."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p * len(ordered)) - 1)]
+
+
+def _counter_total(counter) -> float:
+    return sum(counter.values().values())
+
+
+def measure(requests: int) -> Dict:
+    """Importiert die App und misst alle Endpoints."""
+    start = time.perf_counter()
+    import app as web
+    import metrics
+    import_ms = (time.perf_counter() - start) * 1000
+
+    client = web.app.test_client()
+    widgets = sorted(rule.rule for rule in web.app.url_map.iter_rules()
+                     if rule.rule.startswith('/api/widgets/') and 'GET' in rule.methods
+                     and not rule.arguments)
+
+    results = []
+    for endpoint in (*FIXED_ENDPOINTS, *widgets):
+        start = time.perf_counter()
+        status = client.get(endpoint).status_code
+        cold_ms = (time.perf_counter() - start) * 1000
+
+        forks = _counter_total(metrics.PROCESS_STARTS)
+        calls = _counter_total(metrics.SUBPROCESS_CALLS)
+        timings = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            client.get(endpoint)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        results.append({
+            'endpoint': endpoint,
+            'status': status,
+            'cold_ms': cold_ms,
+            'p50_ms': percentile(timings, 0.50),
+            'p95_ms': percentile(timings, 0.95),
+            'forks_per_request': (_counter_total(metrics.PROCESS_STARTS) - forks) / requests,
+            'bash_calls_per_request': (_counter_total(metrics.SUBPROCESS_CALLS) - calls) / requests,
+        })
+
+    return {
+        'import_ms': import_ms,
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        'forks_total': _counter_total(metrics.PROCESS_STARTS),
+        'endpoints': results,
+    }
+
+
+def run_child(tree: str, requests: int) -> Dict:
+    """Startet die Messung für einen Baum in einem eigenen Prozess."""
+    result_file = os.path.join(tree, 'result.json')
+    log_file = os.path.join(tree, 'benchmark.log')
+    env = {
+        **os.environ,
+        'DISK2ISO_INSTALL_DIR': os.path.join(tree, 'install'),
+        'DISK2ISO_CACHE_DIR': os.path.join(tree, 'install', 'cache'),
+        'DISK2ISO_MODULE_BASE_DIR': os.path.join(tree, 'modules'),
+        'PYTHONPATH': APP_DIR,
+    }
+    with open(log_file, 'w', encoding='utf-8') as log:
+        returncode = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--child', tree,
+             '--requests', str(requests), '--result', result_file],
+            env=env, cwd=APP_DIR, stdout=log, stderr=subprocess.STDOUT
+        ).returncode
+    if returncode != 0:
+        raise SystemExit(f"Messung fehlgeschlagen (Exit-Code {returncode}), siehe {log_file}")
+    with open(result_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def print_report(count: int, result: Dict):
+    print(f"\n=== {count} ISOs - Import {result['import_ms']:.0f} ms, "
+          f"Peak RSS {result['peak_rss_kb'] / 1024:.1f} MiB, {result['forks_total']:.0f} Prozessstarts ===")
+    print(f"{'Endpoint':<48} {'HTTP':>4} {'kalt':>9} {'p50':>9} {'p95':>9} {'Forks/Req':>10} {'Bash/Req':>9}")
+    for entry in result['endpoints']:
+        print(f"{entry['endpoint']:<48} {entry['status']:>4} {entry['cold_ms']:>7.1f}ms "
+              f"{entry['p50_ms']:>7.2f}ms {entry['p95_ms']:>7.2f}ms "
+              f"{entry['forks_per_request']:>10.2f} {entry['bash_calls_per_request']:>9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='disk2iso Web-API Benchmark')
+    parser.add_argument('--isos', default='1000', help='Archivgrößen, kommagetrennt (z.B. 1000,10000,100000)')
+    parser.add_argument('--requests', type=int, default=50, help='Requests pro Endpoint (nach dem kalten Aufruf)')
+    parser.add_argument('--workdir', default=os.path.join('/var/tmp', 'disk2iso-benchmark'),
+                        help='Arbeitsverzeichnis für Fake-Installation und Archive')
+    parser.add_argument('--nfo-ratio', type=float, default=0.8, help='Anteil der ISOs mit .nfo')
+    parser.add_argument('--thumb-ratio', type=float, default=0.5, help='Anteil der ISOs mit Thumbnail')
+    parser.add_argument('--json', help='Ergebnisse zusätzlich als JSON speichern')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--result', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        result = measure(args.requests)
+        with open(args.result, 'w', encoding='utf-8') as f:
+            json.dump(result, f)
+        import lib_broker
+        lib_broker.shutdown()
+        # Hintergrund-Threads (Index, Watcher) nicht abwarten
+        os._exit(0)
+
+    results = {}
+    for count in (int(value) for value in args.isos.split(',') if value.strip()):
+        tree = prepare(args.workdir, count, args.nfo_ratio, args.thumb_ratio)
+        results[count] = run_child(tree, args.requests)
+        print_report(count, results[count])
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
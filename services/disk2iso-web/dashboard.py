@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso Dashboard - Aggregierte Widget-Payloads
+Version 1.3.0
+
+Sammelt die Payloads mehrerer Widget-Endpoints in einer Antwort. Die
+Endpoints werden dabei nicht dupliziert, sondern intern über die Flask
+URL-Map aufgerufen - jedes Widget bleibt auch einzeln abrufbar.
+
+- Parallel auf einem begrenzten Thread-Pool (langsame Shell-Aufrufe
+  blockieren sich nicht gegenseitig, aber der Host wird nicht geflutet)
+- Pro Widget eine eigene Gültigkeitsdauer (TTL); innerhalb der TTL wird
+  der zuletzt erzeugte Payload geliefert
+- Gleichzeitige Anfragen für dasselbe Widget teilen sich eine Berechnung
+"""
+
+import sys
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future, TimeoutError as FutureTimeout
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import request_timeouts
+
+
+# Widget-Name -> (Endpoint, TTL in Sekunden)
+WIDGETS: Dict[str, Tuple[str, float]] = {
+    'live_status': ('/api/status', 2),
+    'disk2iso_status': ('/api/widgets/disk2iso/status', 10),
+    'disk2iso_web_status': ('/api/widgets/disk2iso-web/status', 10),
+    'sysinfo': ('/api/widgets/systeminfo/sysinfo', 30),
+    'outputdir': ('/api/widgets/systeminfo/outputdir', 30),
+    'archiv': ('/api/widgets/systeminfo/archiv', 60),
+    'softwarecheck': ('/api/widgets/systeminfo/softwarecheck', 300),
+    'dependencies': ('/api/widgets/systeminfo/dependencies', 300),
+}
+
+# Maximale Anzahl gleichzeitig erzeugter Widget-Payloads
+MAX_WORKERS = 4
+
+# Maximale Wartezeit auf die Widgets eines Requests - unter dem Budget der
+# Routen-Klasse 'fast' von /api/dashboard (request_timeouts.py, 10 s) und
+# zusätzlich auf dessen Rest gekürzt, damit langsame Widgets als Fehler
+# gemeldet werden statt den ganzen Request zu überziehen
+WIDGET_TIMEOUT = 8
+
+# Zeit, die vom Request-Budget für die Antwort übrig bleiben soll
+RESPONSE_RESERVE = 0.5
+
+
+def register_widget(name: str, path: str, ttl: float):
+    """
+    Registriert ein zusätzliches Widget (z.B. aus optionalen Modulen).
+
+    Args:
+        name: Name im Dashboard-Payload
+        path: URL des Widget-Endpoints (GET, liefert JSON)
+        ttl: Gültigkeitsdauer in Sekunden
+    """
+    WIDGETS[name] = (path, ttl)
+
+
+class Dashboard:
+    """Erzeugt und cached Widget-Payloads über die Endpoints der App."""
+
+    def __init__(self, app, max_workers: int = MAX_WORKERS):
+        self.app = app
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='dashboard')
+        self._lock = threading.Lock()
+        self._cache: Dict[str, Tuple[float, Dict]] = {}
+        self._inflight: Dict[str, Future] = {}
+
+    def available(self) -> List[str]:
+        """Liefert alle Widgets, deren Endpoint in der App registriert ist."""
+        adapter = self.app.url_map.bind('localhost')
+        names = []
+        for name, (path, _) in WIDGETS.items():
+            try:
+                adapter.match(path, method='GET')
+            except Exception:
+                continue
+            names.append(name)
+        return names
+
+    def invalidate(self, name: Optional[str] = None):
+        """Verwirft gecachte Payloads (alle oder ein bestimmtes Widget)."""
+        with self._lock:
+            if name is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(name, None)
+
+    def _render(self, name: str) -> Dict:
+        """Ruft den Widget-Endpoint intern auf und liefert dessen JSON."""
+        path, _ = WIDGETS[name]
+        with self.app.test_request_context(path, method='GET'):
+            response = self.app.full_dispatch_request()
+        data = response.get_json(silent=True)
+        if response.status_code != 200 or not isinstance(data, dict):
+            raise RuntimeError(f'HTTP {response.status_code}')
+        return data
+
+    def _compute(self, name: str) -> Dict:
+        try:
+            data = self._render(name)
+        finally:
+            with self._lock:
+                self._inflight.pop(name, None)
+        with self._lock:
+            self._cache[name] = (time.monotonic(), data)
+        return data
+
+    def _submit(self, name: str) -> Tuple[Optional[Dict], Optional[Future]]:
+        """Liefert (Payload aus dem Cache, None) oder (None, laufende Berechnung)."""
+        _, ttl = WIDGETS[name]
+        with self._lock:
+            cached = self._cache.get(name)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1], None
+            future = self._inflight.get(name)
+            if future is None:
+                future = self._executor.submit(self._compute, name)
+                self._inflight[name] = future
+            return None, future
+
+    def collect(self, names: Optional[Iterable[str]] = None) -> Dict[str, Dict]:
+        """
+        Liefert die Payloads der angeforderten Widgets.
+
+        Args:
+            names: Widget-Namen (None = alle verfügbaren)
+
+        Returns:
+            Dict Widget-Name -> Payload; fehlgeschlagene Widgets liefern
+            {'success': False, 'error': ...}
+
+        Raises:
+            ValueError: Bei unbekannten Widget-Namen
+        """
+        if names is None:
+            names = self.available()
+        else:
+            names = list(dict.fromkeys(names))
+            unknown = [name for name in names if name not in WIDGETS]
+            if unknown:
+                raise ValueError(f"Unbekannte Widgets: {', '.join(unknown)}")
+
+        results: Dict[str, Dict] = {}
+        pending: Dict[str, Future] = {}
+        for name in names:
+            data, future = self._submit(name)
+            if future is None:
+                results[name] = data
+            else:
+                pending[name] = future
+
+        timeout = request_timeouts.clamp(WIDGET_TIMEOUT + RESPONSE_RESERVE) - RESPONSE_RESERVE
+        deadline = time.monotonic() + timeout
+        for name, future in pending.items():
+            try:
+                results[name] = future.result(timeout=max(0, deadline - time.monotonic()))
+            except FutureTimeout:
+                results[name] = {'success': False, 'error': 'Timeout'}
+            except Exception as e:
+                print(f"Fehler beim Erzeugen von Dashboard-Widget '{name}': {e}", file=sys.stderr)
+                results[name] = {'success': False, 'error': str(e)}
+
+        return results
+
+
+_dashboard: Optional[Dashboard] = None
+_dashboard_lock = threading.Lock()
+
+
+def get_dashboard(app) -> Dashboard:
+    """Liefert das Dashboard des Prozesses (lazy erzeugt)."""
+    global _dashboard
+    with _dashboard_lock:
+        if _dashboard is None:
+            _dashboard = Dashboard(app)
+        return _dashboard
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso FS-Watch - Minimaler inotify-Wrapper (ctypes, keine Abhängigkeiten)
+Version 1.3.0
+
+Stellt Dateisystem-Benachrichtigungen über die Linux inotify-API bereit,
+ohne zusätzliche Python-Pakete (pyinotify/watchdog) zu benötigen.
+Ist inotify nicht verfügbar (kein Linux, Limit erreicht, Netzwerk-FS ohne
+Unterstützung), liefert available() False und Aufrufer fallen auf
+Polling zurück.
+"""
+
+import os
+import errno
+import ctypes
+import ctypes.util
+import select
+import struct
+import threading
+from typing import Dict, List, Optional, Tuple
+
+
+# inotify Event-Masken (aus <sys/inotify.h>)
+IN_ACCESS = 0x00000001
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# Standard-Maske für Verzeichnis-Inhalte (Datei fertig geschrieben/verschoben/gelöscht)
+CONTENT_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+
+_EVENT_HEADER = struct.Struct('iIII')
+
+_libc = None
+_libc_lock = threading.Lock()
+
+
+def _get_libc():
+    """Lädt libc einmalig (None wenn nicht verfügbar)."""
+    global _libc
+    with _libc_lock:
+        if _libc is None:
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+                libc.inotify_init1.argtypes = [ctypes.c_int]
+                libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+                libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+                _libc = libc
+            except (OSError, AttributeError):
+                _libc = False
+        return _libc or None
+
+
+def available() -> bool:
+    """Prüft ob inotify auf diesem System nutzbar ist."""
+    return _get_libc() is not None
+
+
+class Watcher:
+    """
+    inotify-Instanz mit optional rekursiver Verzeichnis-Überwachung.
+
+    Beispiel:
+        watcher = Watcher()
+        watcher.add('/opt/disk2iso/api')
+        for path, mask in watcher.read_events(timeout=30):
+            ...
+
+    Rekursive Watches werden für neu angelegte Unterverzeichnisse
+    automatisch ergänzt. Versteckte Verzeichnisse (".temp", ".log")
+    werden bei rekursiver Überwachung übersprungen.
+    """
+
+    def __init__(self, mask: int = CONTENT_MASK):
+        libc = _get_libc()
+        if libc is None:
+            raise OSError(errno.ENOSYS, 'inotify nicht verfügbar')
+
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+        self._libc = libc
+        self.fd = fd
+        self.mask = mask
+        # Self-Pipe: wake() beendet ein blockierendes read_events() sofort
+        self._wake_r, self._wake_w = os.pipe2(os.O_NONBLOCK | os.O_CLOEXEC)
+        self._wd_paths: Dict[int, str] = {}
+        self._recursive: Dict[int, bool] = {}
+        self._lock = threading.Lock()
+
+    def add(self, path: str, recursive: bool = False):
+        """
+        Fügt einen Watch für ein Verzeichnis hinzu.
+
+        Args:
+            path: Verzeichnispfad
+            recursive: Unterverzeichnisse ebenfalls überwachen
+
+        Raises:
+            OSError: Watch konnte nicht angelegt werden (z.B. ENOSPC bei
+                     erreichtem fs.inotify.max_user_watches)
+        """
+        mask = self.mask | (IN_ONLYDIR if recursive else 0)
+        if recursive:
+            mask |= IN_CREATE | IN_MOVED_TO
+
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f'{os.strerror(err)}: {path}')
+
+        with self._lock:
+            self._wd_paths[wd] = path
+            self._recursive[wd] = recursive
+
+        if recursive:
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.'):
+                            self.add(entry.path, recursive=True)
+            except FileNotFoundError:
+                pass
+
+    def read_events(self, timeout: Optional[float] = None) -> List[Tuple[str, int]]:
+        """
+        Wartet auf Events und liefert sie als Liste.
+
+        Args:
+            timeout: Maximale Wartezeit in Sekunden (None = unbegrenzt)
+
+        Returns:
+            Liste von (vollständiger Pfad, Event-Maske). Bei Queue-Overflow
+            enthält die Liste einen Eintrag ('', IN_Q_OVERFLOW). Nach wake()
+            ggf. leer.
+        """
+        ready, _, _ = select.select([self.fd, self._wake_r], [], [], timeout)
+        if self._wake_r in ready:
+            try:
+                while os.read(self._wake_r, 64):
+                    pass
+            except BlockingIOError:
+                pass
+        if self.fd not in ready:
+            return []
+
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        events = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                events.append(('', IN_Q_OVERFLOW))
+                continue
+
+            with self._lock:
+                base = self._wd_paths.get(wd)
+                recursive = self._recursive.get(wd, False)
+                if mask & IN_IGNORED:
+                    self._wd_paths.pop(wd, None)
+                    self._recursive.pop(wd, None)
+            if base is None:
+                continue
+
+            path = os.path.join(base, os.fsdecode(name)) if name else base
+
+            # Neues Unterverzeichnis bei rekursiver Überwachung mitnehmen
+            if recursive and mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO) \
+                    and not os.path.basename(path).startswith('.'):
+                try:
+                    self.add(path, recursive=True)
+                except OSError:
+                    pass
+
+            if not mask & IN_IGNORED:
+                events.append((path, mask))
+
+        return events
+
+    def wake(self):
+        """Weckt einen Thread, der in read_events() wartet (aus anderem Thread)."""
+        with self._lock:
+            if self.fd < 0:
+                return
+            try:
+                os.write(self._wake_w, b'x')
+            except OSError:
+                pass
+
+    def close(self):
+        """Schließt die inotify-Instanz."""
+        with self._lock:
+            if self.fd >= 0:
+                os.close(self.fd)
+                self.fd = -1
+                os.close(self._wake_r)
+                os.close(self._wake_w)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso Web - gunicorn Konfiguration
+Version 1.3.0
+
+Wird von serve.py verwendet (gunicorn -c gunicorn.conf.py app:app).
+Worker und Threads kommen aus disk2iso.conf (WEB_WORKERS, WEB_THREADS);
+'systemctl reload disk2iso-web' (SIGHUP) liest diese Datei neu und ersetzt
+die Worker, ohne laufende Requests abzubrechen.
+
+Die Datei importiert bewusst keine Module des Web-Service: der Master
+würde sie sonst an alle Worker vererben, und ein Reload nach einem Update
+liefe mit dem alten Code weiter.
+"""
+
+import os
+import re
+import sys
+import shutil
+
+INSTALL_DIR = os.environ.get('DISK2ISO_INSTALL_DIR', '/opt/disk2iso')
+CONF_FILE = os.path.join(INSTALL_DIR, 'conf', 'disk2iso.conf')
+# Metrik-Dateien der Worker (wie metrics.METRICS_DIR)
+CACHE_DIR = os.environ.get('DISK2ISO_CACHE_DIR', os.path.join(INSTALL_DIR, 'cache'))
+METRICS_DIR = os.path.join(CACHE_DIR, 'metrics')
+
+
+def _conf_int(key: str, default: int) -> int:
+    """Ganzzahl aus disk2iso.conf (erste Zeile KEY=..., wie settings_cache)."""
+    try:
+        with open(CONF_FILE, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                match = re.match(rf'^{key}="?(\d+)"?\s*$', line.rstrip('\n'))
+                if match:
+                    return max(1, int(match.group(1)))
+                if line.startswith(f'{key}='):
+                    break
+    except OSError:
+        pass
+    return default
+
+
+bind = '0.0.0.0:8080'
+
+# Threads pro Worker: SSE-Verbindungen (/api/events) belegen je einen Thread
+worker_class = 'gthread'
+workers = _conf_int('WEB_WORKERS', 2)
+threads = _conf_int('WEB_THREADS', 8)
+
+# Bei gthread nur Heartbeat-Timeout des Workers - das Zeitbudget einzelner
+# Requests regelt request_timeouts.py
+timeout = max(_conf_int('WEB_TIMEOUT_ONLINE', 60), _conf_int('WEB_TIMEOUT_DEFAULT', 30)) + 30
+graceful_timeout = _conf_int('WEB_GRACEFUL_TIMEOUT', 30)
+keepalive = 5
+
+# App erst im Worker laden (eigene Broker-Pools, Watcher und Threads)
+preload_app = False
+
+# Logs ins Journal (stdout/stderr des Service)
+errorlog = '-'
+accesslog = None
+capture_output = True
+
+
+def on_starting(server):
+    """Dienststart: Metriken beginnen bei null (Reload behält sie)."""
+    shutil.rmtree(METRICS_DIR, ignore_errors=True)
+
+
+def worker_exit(server, worker):
+    """Worker-Ende: laufende Jobs samt Prozessgruppe beenden (jobs.py)."""
+    jobs = sys.modules.get('jobs')
+    if jobs is not None:
+        jobs.shutdown()
@@ -2,144 +2,215 @@
 # -*- coding: utf-8 -*-
 """
 disk2iso i18n Module - Bash Language File Parser
-Version 1.2.0 - 11.01.2026
+Version 1.3.0
 
 Lädt Sprachdateien aus dem Bash-Format (readonly MSG_XYZ="...")
 und stellt sie als Python-Dictionary für Flask/Jinja2-Templates bereit.
+
+Pro Sprache wird ein Katalog einmal kompiliert (lang/libweb.<lang> plus
+Backend-Dateien) und im Speicher gehalten. Neu geladen wird nur, wenn sich
+eine der Sprachdateien (mtime/Inode/Größe) oder die LANGUAGE-Einstellung
+ändert - geprüft höchstens alle CHECK_INTERVAL Sekunden. Das Objekt
+'translations' lädt den Katalog erst beim ersten Zugriff, JSON-APIs ohne
+Übersetzungen lesen also keine Sprachdateien.
 """
 
 import re
 import os
-from functools import lru_cache
-from typing import Dict, Optional
+import sys
+import time
+import threading
+from collections.abc import Mapping
+from typing import Dict, Iterator, Optional, Tuple
 
+import profiling
 
-def read_config_language() -> str:
+# Pfade (analog zu den Widget-Blueprints überschreibbar per Environment)
+INSTALL_DIR = os.environ.get('DISK2ISO_INSTALL_DIR', '/opt/disk2iso')
+LANG_DIR = os.path.join(INSTALL_DIR, 'lang')
+CONFIG_FILE = os.path.join(INSTALL_DIR, 'conf', 'disk2iso.conf')
+
+SUPPORTED_LANGUAGES = ('de', 'en', 'es', 'fr')
+DEFAULT_LANGUAGE = 'de'
+
+# Sprachdateien pro Katalog, absteigende Priorität (Web-Texte zuerst,
+# Backend-Dateien nur für noch fehlende Keys)
+CATALOG_FILES = ('libweb', 'libcommon', 'libsysteminfo')
+
+# Mindestabstand zwischen zwei Änderungsprüfungen (Sekunden)
+CHECK_INTERVAL = 2.0
+
+# readonly MSG_XYZ="Beliebiger Text" (auch Sonderzeichen in den Werten)
+_PATTERN = re.compile(r'^[ \t]*readonly\s+MSG_(\w+)="([^"]*)"', re.MULTILINE)
+
+# LANGUAGE="de" bzw. readonly LANGUAGE="de" (settings_cache ignoriert readonly)
+_LANGUAGE_PATTERN = re.compile(r'^[ \t]*(?:readonly\s+)?LANGUAGE=["\']?(\w+)', re.MULTILINE)
+
+
+def parse_lang_file(text: str) -> Dict[str, str]:
     """
-    Liest die LANGUAGE-Einstellung aus config.sh.
-    
+    Parst MSG_* Konstanten aus dem Inhalt einer Bash-Sprachdatei.
+
     Returns:
-        str: Sprachcode (de, en, es, fr), Fallback: 'de'
+        Dict mit MSG_KEY (ohne Präfix) -> "Wert" Mappings
     """
-    # Pfad zur config.sh relativ zu diesem Modul
-    config_path = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)),  # Gehe von www/ zu disk2iso/
-        'lib',
-        'config.sh'
-    )
-    
+    return {match.group(1): match.group(2) for match in _PATTERN.finditer(text)}
+
+
+def _file_stamp(path: str) -> Optional[Tuple[int, int, int]]:
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                # Unterstütze sowohl "LANGUAGE=" als auch "readonly LANGUAGE="
-                if 'LANGUAGE=' in line and not line.startswith('#'):
-                    # Entferne LANGUAGE=, Quotes und Whitespace
-                    lang = line.split('=', 1)[1].strip().strip('"\'')
-                    # Validiere Sprachcode
-                    if lang in ['de', 'en', 'es', 'fr']:
-                        return lang
-    except FileNotFoundError:
-        print(f"Warning: {config_path} not found, using default language 'de'")
-    except Exception as e:
-        print(f"Error reading config.sh: {e}, using default language 'de'")
-    
-    return 'de'  # Fallback
-
-
-@lru_cache(maxsize=16)
-def _load_lang_file(filepath: str) -> Dict[str, str]:
+        st = os.stat(path)
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+class _Catalog:
+    """Kompilierter Übersetzungskatalog einer Sprache."""
+
+    def __init__(self, lang: str):
+        self.lang = lang
+        self.paths = [os.path.join(LANG_DIR, f'{name}.{lang}') for name in CATALOG_FILES]
+        self._stamps = None
+        self._data: Dict[str, str] = {}
+        self._checked = 0.0
+        self._lock = threading.Lock()
+
+    def _compile(self) -> Dict[str, str]:
+        translations: Dict[str, str] = {}
+        for path in self.paths:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    parsed = parse_lang_file(f.read())
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                print(f"Error reading {path}: {e}", file=sys.stderr)
+                continue
+            # Nur hinzufügen, wenn Key noch nicht existiert (Web hat Priorität)
+            for key, value in parsed.items():
+                translations.setdefault(key, value)
+        return translations
+
+    def get(self) -> Dict[str, str]:
+        now = time.monotonic()
+        if now - self._checked < CHECK_INTERVAL:
+            return self._data
+        with self._lock:
+            stamps = tuple(_file_stamp(path) for path in self.paths)
+            if stamps != self._stamps:
+                with profiling.span('file', f'lang/*.{self.lang}'):
+                    self._data = self._compile()
+                self._stamps = stamps
+                if stamps[0] is None:
+                    print(f"Warning: Language file {self.paths[0]} not found", file=sys.stderr)
+            self._checked = now
+            return self._data
+
+
+_catalogs: Dict[str, _Catalog] = {}
+_catalogs_lock = threading.Lock()
+_language = (DEFAULT_LANGUAGE, None, 0.0)
+
+
+def read_config_language() -> str:
     """
-    Lädt eine einzelne Bash-Sprachdatei und parst MSG_* Konstanten.
-    
-    Args:
-        filepath: Absoluter Pfad zur Sprachdatei
-    
+    Liest die LANGUAGE-Einstellung aus disk2iso.conf.
+
+    Die Datei wird nur nach einer Änderung (mtime/Inode/Größe) erneut
+    gelesen und höchstens alle CHECK_INTERVAL Sekunden geprüft.
+
     Returns:
-        Dict mit MSG_KEY -> "Wert" Mappings
+        str: Sprachcode (de, en, es, fr), Fallback: 'de'
     """
-    translations = {}
-    # Regex für: readonly MSG_XYZ="Beliebiger Text"
-    # Unterstützt auch Sonderzeichen in den Werten
-    pattern = re.compile(r'readonly\s+MSG_(\w+)="([^"]*)"')
-    
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            for line in f:
-                match = pattern.match(line.strip())
-                if match:
-                    key = match.group(1)      # z.B. NAV_HOME
-                    value = match.group(2)    # z.B. Startseite
-                    translations[key] = value
-    except FileNotFoundError:
-        print(f"Warning: Language file {filepath} not found")
-    except Exception as e:
-        print(f"Error reading {filepath}: {e}")
-    
-    return translations
-
-
-@lru_cache(maxsize=4)
+    global _language
+    lang, stamp, checked = _language
+    now = time.monotonic()
+    if now - checked < CHECK_INTERVAL:
+        return lang
+
+    current = _file_stamp(CONFIG_FILE)
+    if current != stamp:
+        lang = DEFAULT_LANGUAGE
+        try:
+            with open(CONFIG_FILE, 'r', encoding='utf-8', errors='replace') as f:
+                match = _LANGUAGE_PATTERN.search(f.read())
+            if match and match.group(1) in SUPPORTED_LANGUAGES:
+                lang = match.group(1)
+        except FileNotFoundError:
+            print(f"Warning: {CONFIG_FILE} not found, using default language '{DEFAULT_LANGUAGE}'", file=sys.stderr)
+        except Exception as e:
+            print(f"Error reading {CONFIG_FILE}: {e}, using default language '{DEFAULT_LANGUAGE}'", file=sys.stderr)
+    _language = (lang, current, now)
+    return lang
+
+
 def load_web_translations(lang: str) -> Dict[str, str]:
     """
-    Lädt alle Web-Interface Übersetzungen für die angegebene Sprache.
-    
-    Lädt lib-web.{lang} und optional auch Backend-Dateien zur Wiederverwendung.
-    
+    Liefert den kompilierten Katalog für die angegebene Sprache.
+
     Args:
         lang: Sprachcode (de, en, es, fr)
-    
+
     Returns:
         Dict mit allen MSG_* Konstanten
     """
-    translations = {}
-    
-    # Basis-Pfad zum lang/-Ordner
-    lang_dir = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)),  # Gehe von www/ zu disk2iso/
-        'lang'
-    )
-    
-    # 1. Lade Web-spezifische Texte (Priorität)
-    web_file = os.path.join(lang_dir, f'lib-web.{lang}')
-    translations.update(_load_lang_file(web_file))
-    
-    # 2. Optional: Lade Backend-Dateien zur Wiederverwendung
-    # Diese haben niedrigere Priorität (werden NICHT überschrieben)
-    backend_files = [
-        f'lib-common.{lang}',      # MSG_ERROR, MSG_SUCCESS etc.
-        f'lib-systeminfo.{lang}',  # MSG_VERSION, MSG_UPTIME etc.
-    ]
-    
-    for filename in backend_files:
-        filepath = os.path.join(lang_dir, filename)
-        backend_trans = _load_lang_file(filepath)
-        # Nur hinzufügen, wenn Key noch nicht existiert (Web hat Priorität)
-        for key, value in backend_trans.items():
-            if key not in translations:
-                translations[key] = value
-    
-    return translations
+    catalog = _catalogs.get(lang)
+    if catalog is None:
+        with _catalogs_lock:
+            catalog = _catalogs.setdefault(lang, _Catalog(lang))
+    return catalog.get()
 
 
 def get_translations(lang: Optional[str] = None) -> Dict[str, str]:
     """
     Gibt Übersetzungen für die konfigurierte oder angegebene Sprache zurück.
-    
+
     Args:
-        lang: Optional Sprachcode, sonst aus config.sh
-    
+        lang: Optional Sprachcode, sonst aus disk2iso.conf
+
     Returns:
         Dict mit allen MSG_* Konstanten
     """
     if lang is None:
         lang = read_config_language()
-    
     return load_web_translations(lang)
 
 
+class Translations(Mapping):
+    """
+    Übersetzungen der konfigurierten Sprache, aufgelöst erst beim Zugriff.
+
+    Unterstützt t.get('KEY', 'Default'), t['KEY'] und in Templates t.KEY.
+    """
+
+    def __getitem__(self, key: str) -> str:
+        return get_translations()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(get_translations())
+
+    def __len__(self) -> int:
+        return len(get_translations())
+
+    def get(self, key: str, default=None):
+        return get_translations().get(key, default)
+
+    def __getattr__(self, key: str) -> str:
+        try:
+            return get_translations()[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
+
+# Gemeinsames Objekt für Requests (g.t) und Widget-Templates
+translations = Translations()
+t = translations
+
+
 def clear_cache():
-    """Leert den i18n-Cache (z.B. nach config.sh-Änderung)."""
-    read_config_language.cache_clear()
-    load_web_translations.cache_clear()
-    _load_lang_file.cache_clear()
+    """Leert den i18n-Cache (z.B. nach Änderung der Sprache)."""
+    global _language
+    with _catalogs_lock:
+        _catalogs.clear()
+    _language = (DEFAULT_LANGUAGE, None, 0.0)
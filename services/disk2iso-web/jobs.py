@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso Jobs - Hintergrund-Ausführung langlaufender Bash-Operationen
+Version 1.3.0
+
+Remaster, Software-Installation und Metadaten-Übernahme dauern Minuten.
+Statt einen Request-Thread so lange zu blockieren, startet die Route einen
+Job und antwortet sofort mit dessen ID. Der Client fragt den Zustand über
+/api/jobs/<id> ab (Status, Ausgabe ab Zeile X, Fortschritt) und kann den
+Job abbrechen.
+
+- Begrenzte Parallelität pro Job-Art (KIND_LIMITS), weitere Jobs warten;
+  die Slots sind Datei-Sperren und gelten damit über alle Web-Worker
+- Ausgabe (stdout + stderr) wird zeilenweise mitgeschnitten (begrenzt)
+- Fortschritt aus Prozentangaben der Ausgabe ("... 42%")
+- Jobs leben im Web-Prozess und überstehen damit einen Browser-Reload
+- Jeder Job veröffentlicht seinen Zustand in shared_state, damit andere
+  Worker (gunicorn) ihn anzeigen und abbrechen können (RemoteJob)
+- Endet ein Worker (Reload, max_requests), beendet er vorher die
+  Prozessgruppen seiner Jobs (shutdown(), atexit bzw. gunicorn worker_exit).
+  Läuft die Prozessgruppe eines abgestürzten Workers weiter, bleibt der Job
+  aktiv und belegt weiterhin einen Slot seiner Art
+"""
+
+import atexit
+import os
+import re
+import sys
+import time
+import uuid
+import signal
+import threading
+import subprocess
+from collections import deque
+from typing import Dict, List, Optional, Sequence
+
+import metrics
+import shared_state
+
+# Maximale Anzahl gleichzeitig laufender Jobs pro Art
+KIND_LIMITS = {
+    'remaster': 1,
+    'software_install': 1,
+    'tmdb_apply': 2,
+}
+DEFAULT_LIMIT = 1
+
+# Anzahl mitgeschnittener Ausgabezeilen pro Job
+MAX_OUTPUT_LINES = 2000
+
+# Abgeschlossene Jobs werden so lange aufbewahrt (Sekunden)
+FINISHED_RETENTION = 3600
+
+# Wartezeit zwischen SIGTERM und SIGKILL beim Abbruch
+KILL_GRACE = 5
+
+# Veröffentlichung in shared_state: Mindestabstand und Umfang der Ausgabe
+PUBLISH_INTERVAL = 0.5
+SHARED_OUTPUT_LINES = 500
+
+STATE_QUEUED = 'queued'
+STATE_RUNNING = 'running'
+STATE_SUCCEEDED = 'succeeded'
+STATE_FAILED = 'failed'
+STATE_CANCELLED = 'cancelled'
+FINAL_STATES = (STATE_SUCCEEDED, STATE_FAILED, STATE_CANCELLED)
+
+_PERCENT = re.compile(r'(\d{1,3}(?:\.\d+)?)\s*%')
+
+
+def group_alive(pgid: Optional[int]) -> bool:
+    """Prüft ob eine Prozessgruppe (Job eines anderen Workers) noch existiert."""
+    if not pgid:
+        return False
+    try:
+        os.killpg(pgid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class Job:
+    """Ein Hintergrund-Job (Bash-Kommando mit mitgeschnittener Ausgabe)."""
+
+    def __init__(self, kind: str, command: Sequence[str], title: str = '',
+                 timeout: Optional[float] = None, success_marker: Optional[str] = None,
+                 params: Optional[Dict] = None, env: Optional[Dict] = None):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.title = title
+        self.command = list(command)
+        self.timeout = timeout
+        self.success_marker = success_marker
+        self.params = params or {}
+        self.env = env
+        self.state = STATE_QUEUED
+        self.created = time.time()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.returncode: Optional[int] = None
+        self.progress: Optional[float] = None
+        self.error: Optional[str] = None
+        self._output: deque = deque(maxlen=MAX_OUTPUT_LINES)
+        self._line_count = 0
+        self._process: Optional[subprocess.Popen] = None
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+        self._published = 0.0
+
+    def _append(self, line: str):
+        with self._lock:
+            self._output.append(line)
+            self._line_count += 1
+            match = None
+            for match in _PERCENT.finditer(line):
+                pass
+            if match:
+                self.progress = min(100.0, float(match.group(1)))
+
+    def output_since(self, since: int = 0) -> Dict:
+        """
+        Liefert die Ausgabezeilen ab Zeilennummer 'since'.
+
+        Returns:
+            Dict mit 'lines' und 'next' (Cursor für den nächsten Abruf)
+        """
+        with self._lock:
+            first = self._line_count - len(self._output)
+            start = max(since, first) - first
+            lines = list(self._output)[start:] if start < len(self._output) else []
+            return {'lines': lines, 'next': self._line_count}
+
+    def last_line(self) -> str:
+        with self._lock:
+            for line in reversed(self._output):
+                if line.strip():
+                    return line.strip()
+        return ''
+
+    def to_dict(self, since: Optional[int] = None) -> Dict:
+        """Serialisiert den Job für die API (Ausgabe nur mit 'since')."""
+        data = {
+            'id': self.id,
+            'kind': self.kind,
+            'title': self.title,
+            'params': self.params,
+            'state': self.state,
+            'done': self.state in FINAL_STATES,
+            'created': self.created,
+            'started': self.started,
+            'finished': self.finished,
+            'returncode': self.returncode,
+            'progress': self.progress,
+            'error': self.error,
+        }
+        if since is not None:
+            output = self.output_since(since)
+            data['output'] = output['lines']
+            data['output_next'] = output['next']
+        return data
+
+    def snapshot(self) -> Dict:
+        """Zustand für shared_state (inkl. Ausgabe-Ende und Prozessgruppe)."""
+        data = self.to_dict()
+        with self._lock:
+            tail = list(self._output)[-SHARED_OUTPUT_LINES:]
+            data['output_tail'] = tail
+            data['output_next'] = self._line_count
+        process = self._process
+        data['pgid'] = process.pid if process is not None and process.returncode is None else None
+        data['owner'] = os.getpid()
+        return data
+
+
+class RemoteJob:
+    """Job eines anderen Web-Workers (Snapshot aus shared_state)."""
+
+    def __init__(self, data: Dict):
+        self._data = data
+        self.id = data['id']
+        self.kind = data['kind']
+        self.state = data['state']
+        self.created = data['created']
+        self.pgid = data.get('pgid')
+        # Worker beendet (Absturz), Prozessgruppe läuft aber noch weiter
+        self.orphaned = False
+        if self.state not in FINAL_STATES and not shared_state.pid_alive(data.get('owner')):
+            if group_alive(self.pgid):
+                self.orphaned = True
+            else:
+                # Job wird nicht mehr verfolgt
+                self.state = STATE_FAILED
+                data.update(state=STATE_FAILED, done=True, error=data.get('error') or 'Web-Worker beendet')
+
+    def to_dict(self, since: Optional[int] = None) -> Dict:
+        data = {key: value for key, value in self._data.items()
+                if key not in ('output_tail', 'output_next', 'pgid', 'owner')}
+        data['state'] = self.state
+        if since is not None:
+            tail = self._data.get('output_tail', [])
+            line_count = self._data.get('output_next', 0)
+            start = max(since, line_count - len(tail)) - (line_count - len(tail))
+            data['output'] = tail[start:]
+            data['output_next'] = line_count
+        return data
+
+
+class JobManager:
+    """Verwaltet und startet Jobs mit begrenzter Parallelität pro Art."""
+
+    def __init__(self):
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        atexit.register(self.shutdown)
+
+    @staticmethod
+    def _orphans(kind: str) -> int:
+        """Anzahl weiterlaufender Jobs abgestürzter Worker (ohne Slot-Sperre)."""
+        return sum(1 for _key, data in shared_state.get_store().items('job:')
+                   if data.get('kind') == kind and RemoteJob(data).orphaned)
+
+    def _acquire_slot(self, kind: str) -> Optional[int]:
+        """
+        Belegt einen freien Slot der Job-Art (über alle Worker).
+
+        Die Sperre eines abgestürzten Workers ist frei, seine Prozessgruppe
+        kann aber noch laufen - solche Jobs zählen als belegte Slots.
+        """
+        free = []
+        for n in range(KIND_LIMITS.get(kind, DEFAULT_LIMIT)):
+            fd = shared_state.try_lock(f'job-{kind}-{n}')
+            if fd is not None:
+                free.append(fd)
+        slot = None
+        if free and len(free) > self._orphans(kind):
+            slot = free.pop()
+        for fd in free:
+            shared_state.release(fd)
+        return slot
+
+    @staticmethod
+    def _publish(job: Job, force: bool = False):
+        """Veröffentlicht den Job-Zustand (gedrosselt) für andere Worker."""
+        now = time.monotonic()
+        if not force and now - job._published < PUBLISH_INTERVAL:
+            return
+        job._published = now
+        store = shared_state.get_store()
+        try:
+            ttl = FINISHED_RETENTION if job.state in FINAL_STATES else None
+            store.set(f'job:{job.id}', job.snapshot(), ttl=ttl)
+            # Abbruch durch einen anderen Worker
+            if not job._cancel.is_set() and store.get(f'job_cancel:{job.id}'):
+                job._cancel.set()
+        except Exception as e:
+            print(f"Job {job.id} konnte nicht veröffentlicht werden: {e}", file=sys.stderr)
+
+    def _prune(self):
+        cutoff = time.time() - FINISHED_RETENTION
+        with self._lock:
+            for job_id in [j.id for j in self._jobs.values() if j.finished and j.finished < cutoff]:
+                del self._jobs[job_id]
+
+    def submit(self, kind: str, command: Sequence[str], **kwargs) -> Job:
+        """
+        Legt einen Job an und startet ihn im Hintergrund.
+
+        Args:
+            kind: Job-Art (bestimmt die Parallelität)
+            command: Argumentliste für subprocess
+            **kwargs: title, timeout, success_marker, params, env
+
+        Returns:
+            Der neue Job (state 'queued' oder bereits 'running')
+        """
+        self._prune()
+        job = Job(kind, command, **kwargs)
+        with self._lock:
+            self._jobs[job.id] = job
+        self._publish(job, force=True)
+        threading.Thread(target=self._run, args=(job,), name=f'job-{job.id}', daemon=True).start()
+        return job
+
+    def get(self, job_id: str):
+        """Liefert einen Job dieses Workers oder den RemoteJob eines anderen."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None:
+            return job
+        data = shared_state.get_store().get(f'job:{job_id}')
+        return RemoteJob(data) if data else None
+
+    def list(self, kind: Optional[str] = None, active_only: bool = False) -> List:
+        """Liefert Jobs aller Worker (neueste zuerst), optional nach Art/aktiv gefiltert."""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        local_ids = {j.id for j in jobs}
+        jobs += [RemoteJob(data) for key, data in shared_state.get_store().items('job:')
+                 if data['id'] not in local_ids]
+        if kind:
+            jobs = [j for j in jobs if j.kind == kind]
+        if active_only:
+            jobs = [j for j in jobs if j.state not in FINAL_STATES]
+        return sorted(jobs, key=lambda j: j.created, reverse=True)
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Bricht einen Job ab (wartend oder laufend).
+
+        Returns:
+            False wenn der Job unbekannt oder bereits beendet ist
+        """
+        job = self.get(job_id)
+        if job is None or job.state in FINAL_STATES:
+            return False
+        if isinstance(job, RemoteJob):
+            # Besitzender Worker übernimmt den Abbruch beim nächsten Publish,
+            # ein laufender Prozess wird direkt beendet
+            shared_state.get_store().set(f'job_cancel:{job.id}', True, ttl=FINISHED_RETENTION)
+            if job.pgid:
+                threading.Thread(target=self._terminate_group, args=(job.pgid,), daemon=True).start()
+            return True
+        job._cancel.set()
+        process = job._process
+        if process is not None and process.poll() is None:
+            # SIGTERM/SIGKILL-Eskalation nicht im Request-Thread abwarten
+            threading.Thread(target=self._terminate, args=(process,), daemon=True).start()
+        return True
+
+    @staticmethod
+    def _terminate(process: subprocess.Popen):
+        """Beendet die komplette Prozessgruppe (bash + Kindprozesse)."""
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+            try:
+                process.wait(timeout=KILL_GRACE)
+            except subprocess.TimeoutExpired:
+                os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+    @staticmethod
+    def _terminate_group(pgid: int):
+        """Wie _terminate(), für die Prozessgruppe eines anderen Workers."""
+        try:
+            os.killpg(pgid, signal.SIGTERM)
+            deadline = time.monotonic() + KILL_GRACE
+            while time.monotonic() < deadline:
+                time.sleep(0.2)
+                os.killpg(pgid, 0)
+            os.killpg(pgid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def shutdown(self):
+        """
+        Beendet alle Jobs dieses Workers (Worker-Ende): Prozessgruppen
+        terminieren, damit sie nicht ohne Slot und mit geschlossener
+        Ausgabe-Pipe weiterlaufen, und den Endzustand veröffentlichen.
+        """
+        with self._lock:
+            jobs = [job for job in self._jobs.values() if job.state not in FINAL_STATES]
+        for job in jobs:
+            job.error = job.error or 'Web-Worker beendet'
+            job._cancel.set()
+            process = job._process
+            if process is not None and process.poll() is None:
+                self._terminate(process)
+            job.state = STATE_FAILED
+            job.finished = time.time()
+            self._publish(job, force=True)
+
+    def _run(self, job: Job):
+        # Warten bis ein Slot frei ist - Abbruch auch in der Warteschlange
+        slot = self._acquire_slot(job.kind)
+        while slot is None and not job._cancel.is_set():
+            time.sleep(0.5)
+            self._publish(job)
+            slot = self._acquire_slot(job.kind)
+        if slot is not None:
+            try:
+                if not job._cancel.is_set():
+                    self._execute(job)
+            finally:
+                shared_state.release(slot)
+
+        # Bei Worker-Ende hat shutdown() den Endzustand bereits gesetzt
+        if job._cancel.is_set() and job.state not in FINAL_STATES:
+            job.state = STATE_CANCELLED
+            job.error = job.error or 'Abgebrochen'
+        job.finished = time.time()
+        self._publish(job, force=True)
+
+    def _execute(self, job: Job):
+        job.state = STATE_RUNNING
+        job.started = time.time()
+        timer = None
+        try:
+            job._process = subprocess.Popen(
+                job.command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                stdin=subprocess.DEVNULL,
+                text=True,
+                errors='replace',
+                bufsize=1,
+                env=job.env,
+                start_new_session=True
+            )
+            metrics.record_process_start('job')
+            self._publish(job, force=True)
+
+            if job.timeout:
+                def on_timeout():
+                    job.error = f'Timeout nach {int(job.timeout)}s'
+                    self._terminate(job._process)
+                timer = threading.Timer(job.timeout, on_timeout)
+                timer.daemon = True
+                timer.start()
+
+            for line in job._process.stdout:
+                job._append(line.rstrip('\n'))
+                self._publish(job)
+            job.returncode = job._process.wait()
+            self._publish(job, force=True)
+        except Exception as e:
+            print(f"Fehler in Job {job.id} ({job.kind}): {e}", file=sys.stderr)
+            job.error = str(e)
+        finally:
+            if timer is not None:
+                timer.cancel()
+
+        if job._cancel.is_set():
+            metrics.record_subprocess(f'job_{job.kind}', time.time() - job.started, 'cancelled')
+            return
+        succeeded = job.returncode == 0 and job.error is None
+        if succeeded and job.success_marker:
+            succeeded = job.last_line() == job.success_marker
+        metrics.record_subprocess(f'job_{job.kind}', time.time() - job.started, 'ok' if succeeded else 'error')
+        if succeeded:
+            job.state = STATE_SUCCEEDED
+            job.progress = 100.0
+        else:
+            job.state = STATE_FAILED
+            if job.error is None:
+                job.error = job.last_line() or f'Exit-Code {job.returncode}'
+
+
+_manager: Optional[JobManager] = None
+_manager_lock = threading.Lock()
+
+
+def shutdown():
+    """Beendet die Jobs dieses Workers (gunicorn worker_exit, atexit)."""
+    if _manager is not None:
+        _manager.shutdown()
+
+
+def get_manager() -> JobManager:
+    """Liefert den JobManager des Prozesses (lazy erzeugt)."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = JobManager()
+        return _manager
@@ -0,0 +1,520 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso Lib Broker - Persistenter Bash-Worker-Pool für lib*.sh Funktionen
+Version 1.3.0
+
+Statt pro Aufruf 'bash -c "source ... && funktion"' zu starten, hält der
+Broker einen kleinen Pool langlebiger Bash-Prozesse, die die Core-Libraries
+bereits geladen haben. Python sendet Funktionsname + Argumente (NUL-getrennt)
+und erhält Exit-Code, stdout und stderr zurück.
+
+Protokoll (pro Aufruf):
+    Python -> Worker (stdin):  "<argc>\\0<funktion>\\0<arg1>\\0...<argN>\\0"
+    Worker -> Python (stdout): "<exit-code>\\n"
+    stdout/stderr der Funktion landen in worker-eigenen Dateien (tmpfs),
+    die Python nach Erhalt des Exit-Codes direkt ausliest.
+
+Eigenschaften:
+    - Per-Call Timeout (Worker wird bei Überschreitung beendet und ersetzt)
+    - Recycling nach Absturz oder nach MAX_CALLS Aufrufen
+    - Begrenzte Parallelität (max. POOL_SIZE gleichzeitige Aufrufe)
+    - Fallback auf Einzel-Subprocess, falls kein Worker startet
+    - Jeder Aufruf wird mit Funktionsname und Laufzeit gezählt (metrics.py),
+      Kommandos außerhalb der Libraries laufen über run()
+    - Timeouts werden auf das Zeitbudget des Requests gekürzt
+      (request_timeouts.py)
+"""
+
+import os
+import re
+import atexit
+import sys
+import time
+import queue
+import shutil
+import select
+import signal
+import tempfile
+import threading
+import subprocess
+from typing import Iterable, List, Optional, Sequence
+
+import metrics
+import profiling
+import request_timeouts
+
+
+# Pfade (analog zu den Widget-Blueprints überschreibbar per Environment)
+INSTALL_DIR = os.environ.get('DISK2ISO_INSTALL_DIR', '/opt/disk2iso')
+
+# Core-Libraries, die jeder Worker beim Start lädt
+CORE_LIBS = (
+    'liblogging.sh',
+    'libfolders.sh',
+    'libfiles.sh',
+    'libsettings.sh',
+    'libsysteminfo.sh',
+    'libservice.sh',
+)
+
+# Pool-Parameter
+POOL_SIZE = int(os.environ.get('DISK2ISO_BROKER_WORKERS', '3'))
+MAX_CALLS = int(os.environ.get('DISK2ISO_BROKER_MAX_CALLS', '500'))
+DEFAULT_TIMEOUT = 5
+START_TIMEOUT = 10
+
+PATH_ENV = '/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin'
+
+# Nur gültige Bash-Funktionsnamen zulassen (kein Code-Injection-Pfad)
+_FUNC_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+# Worker-Hauptschleife: liest Requests von stdin, meldet Exit-Code auf fd 3.
+# Libraries und Funktionen laufen mit geschlossenem fd 3 (3>&-), damit sie
+# das Protokoll nicht mit eigenen Ausgaben stören können
+_WORKER_SCRIPT = r'''
+exec 3>&1 1>/dev/null 2>/dev/null
+_broker_out="$1"; _broker_err="$2"; shift 2
+for _broker_lib in "$@"; do
+    source "$_broker_lib" </dev/null 3>&-
+done
+printf 'READY\n' >&3
+while IFS= read -r -d '' _broker_argc; do
+    _broker_args=()
+    for (( _broker_i=0; _broker_i<_broker_argc; _broker_i++ )); do
+        IFS= read -r -d '' _broker_arg || exit 1
+        _broker_args+=("$_broker_arg")
+    done
+    if [[ "${_broker_args[0]}" == "source" ]]; then
+        source "${_broker_args[1]}" </dev/null >"$_broker_out" 2>"$_broker_err" 3>&-
+        _broker_rc=$?
+    elif declare -F "${_broker_args[0]}" >/dev/null; then
+        "${_broker_args[@]}" </dev/null >"$_broker_out" 2>"$_broker_err" 3>&-
+        _broker_rc=$?
+    else
+        : >"$_broker_out"
+        printf '%s: function not found\n' "${_broker_args[0]}" >"$_broker_err"
+        _broker_rc=127
+    fi
+    printf '%d\n' "$_broker_rc" >&3
+done
+'''
+
+
+class BrokerResult:
+    """
+    Ergebnis eines Broker-Aufrufs (kompatibel zu subprocess.CompletedProcess).
+
+    Attributes:
+        args: Funktionsname + Argumente
+        returncode: Exit-Code der Bash-Funktion
+        stdout: Ausgabe (str)
+        stderr: Fehlerausgabe (str)
+        duration: Laufzeit in Sekunden
+    """
+
+    def __init__(self, args, returncode, stdout, stderr, duration=0.0):
+        self.args = args
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.duration = duration
+
+
+class _Worker:
+    """
+    Ein langlebiger Bash-Prozess mit geladenen Core-Libraries.
+
+    Jeder Worker besitzt ein eigenes tmpfs-Verzeichnis für stdout/stderr
+    und eine eigene Prozessgruppe, damit bei Timeout auch Kindprozesse
+    der Bash-Funktion beendet werden.
+    """
+
+    def __init__(self, libs: Iterable[str]):
+        base = '/dev/shm' if os.path.isdir('/dev/shm') else None
+        self.tmpdir = tempfile.mkdtemp(prefix='disk2iso-broker-', dir=base)
+        self.out_file = os.path.join(self.tmpdir, 'stdout')
+        self.err_file = os.path.join(self.tmpdir, 'stderr')
+        self.calls = 0
+        self.sourced = set()
+
+        lib_paths = [os.path.join(INSTALL_DIR, 'lib', lib) for lib in libs]
+        env = {**os.environ, 'PATH': PATH_ENV, 'INSTALL_DIR': INSTALL_DIR, 'LC_ALL': 'C.UTF-8'}
+
+        self.proc = subprocess.Popen(
+            ['/bin/bash', '-c', _WORKER_SCRIPT, 'disk2iso-broker',
+             self.out_file, self.err_file, *lib_paths],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+            start_new_session=True
+        )
+        metrics.record_process_start('broker_worker')
+
+        try:
+            ready = self._read_line(START_TIMEOUT)
+        except RuntimeError:
+            ready = None
+        if ready != 'READY':
+            self.kill()
+            raise RuntimeError('Broker-Worker konnte nicht gestartet werden')
+
+    def _read_line(self, timeout: float) -> Optional[str]:
+        """
+        Liest eine Kontrollzeile vom Worker (mit Timeout).
+
+        Args:
+            timeout: Maximale Wartezeit in Sekunden
+
+        Returns:
+            Zeile ohne Zeilenumbruch, None bei Timeout
+
+        Raises:
+            RuntimeError: Worker hat die Pipe geschlossen (beendet)
+        """
+        fd = self.proc.stdout.fileno()
+        deadline = time.monotonic() + timeout
+        line = b''
+
+        while not line.endswith(b'\n'):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                return None
+            chunk = os.read(fd, 64)
+            if not chunk:
+                raise RuntimeError('Broker-Worker beendet')
+            line += chunk
+
+        return line.decode('ascii', errors='replace').strip()
+
+    def alive(self) -> bool:
+        """Prüft ob der Bash-Prozess noch läuft."""
+        return self.proc.poll() is None
+
+    def call(self, args: List[str], timeout: float) -> BrokerResult:
+        """
+        Führt einen Aufruf im Worker aus.
+
+        Args:
+            args: [funktion, arg1, ...]
+            timeout: Timeout in Sekunden
+
+        Returns:
+            BrokerResult
+
+        Raises:
+            subprocess.TimeoutExpired: Aufruf hat Timeout überschritten
+            RuntimeError: Worker ist abgestürzt oder Statuszeile ungültig
+        """
+        start = time.monotonic()
+        payload = f'{len(args)}\0'.encode() + b''.join(
+            a.encode('utf-8', errors='surrogateescape') + b'\0' for a in args
+        )
+
+        try:
+            self.proc.stdin.write(payload)
+            self.proc.stdin.flush()
+        except (BrokenPipeError, OSError):
+            raise RuntimeError('Broker-Worker nicht erreichbar')
+
+        self.calls += 1
+        line = self._read_line(timeout)
+        if line is None:
+            raise subprocess.TimeoutExpired(args, timeout)
+        try:
+            returncode = int(line)
+        except ValueError:
+            # Protokoll gestört - Worker ist nicht mehr verwendbar
+            raise RuntimeError(f'ungültige Statuszeile vom Broker-Worker: {line[:80]!r}')
+
+        with open(self.out_file, 'r', encoding='utf-8', errors='replace') as f:
+            stdout = f.read()
+        with open(self.err_file, 'r', encoding='utf-8', errors='replace') as f:
+            stderr = f.read()
+
+        return BrokerResult(args, returncode, stdout, stderr, time.monotonic() - start)
+
+    def kill(self):
+        """Beendet den Worker inkl. Prozessgruppe und räumt tmpfs auf."""
+        try:
+            os.killpg(self.proc.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+        try:
+            self.proc.wait(timeout=2)
+        except Exception:
+            pass
+        for stream in (self.proc.stdin, self.proc.stdout):
+            try:
+                stream.close()
+            except Exception:
+                pass
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+
+class LibBroker:
+    """
+    Pool aus Bash-Workern mit begrenzter Parallelität.
+
+    Workers werden lazy gestartet, nach MAX_CALLS Aufrufen oder nach einem
+    Absturz/Timeout ersetzt. Ist kein Worker verfügbar, wartet der Aufrufer
+    bis ein Slot frei wird (max. Timeout des Aufrufs).
+    """
+
+    def __init__(self, size: int = POOL_SIZE, libs: Iterable[str] = CORE_LIBS,
+                 max_calls: int = MAX_CALLS):
+        self.size = max(1, size)
+        self.libs = tuple(libs)
+        self.max_calls = max_calls
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._idle: 'queue.LifoQueue[_Worker]' = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._workers: List[_Worker] = []
+        self.stats = {'calls': 0, 'timeouts': 0, 'crashes': 0, 'recycled': 0, 'fallbacks': 0}
+
+    def _count(self, key: str):
+        """Erhöht einen Statistik-Zähler (Aufrufe kommen aus mehreren Request-Threads)."""
+        with self._lock:
+            self.stats[key] += 1
+
+    def get_stats(self) -> dict:
+        """Liefert eine konsistente Kopie der Statistik-Zähler."""
+        with self._lock:
+            return dict(self.stats)
+
+    def _acquire_worker(self) -> _Worker:
+        """Holt einen freien Worker oder startet einen neuen."""
+        try:
+            worker = self._idle.get_nowait()
+            if worker.alive():
+                return worker
+            self._discard(worker)
+        except queue.Empty:
+            pass
+
+        worker = _Worker(self.libs)
+        with self._lock:
+            self._workers.append(worker)
+        return worker
+
+    def _release_worker(self, worker: _Worker):
+        """Gibt Worker zurück in den Pool oder recycelt ihn."""
+        if worker.calls >= self.max_calls:
+            self._count('recycled')
+            self._discard(worker)
+        else:
+            self._idle.put(worker)
+
+    def _discard(self, worker: _Worker):
+        """Entfernt Worker endgültig."""
+        worker.kill()
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+
+    def call(self, function: str, *args, timeout: float = DEFAULT_TIMEOUT,
+             libs: Iterable[str] = ()) -> BrokerResult:
+        """
+        Ruft eine Bash-Funktion aus den geladenen Libraries auf.
+
+        Args:
+            function: Name der Bash-Funktion (z.B. "systeminfo_get_os_info")
+            *args: Positionsparameter (werden als str übergeben)
+            timeout: Timeout in Sekunden für diesen Aufruf
+            libs: Zusätzliche Libraries (absolute Pfade), die vor dem Aufruf
+                  einmalig im Worker geladen werden (z.B. Modul-Libraries)
+
+        Returns:
+            BrokerResult mit returncode, stdout, stderr
+
+        Raises:
+            ValueError: Ungültiger Funktionsname
+            subprocess.TimeoutExpired: Timeout überschritten
+        """
+        if not _FUNC_PATTERN.match(function):
+            raise ValueError(f'Ungültiger Funktionsname: {function}')
+
+        start = time.monotonic()
+        outcome = 'error'
+        try:
+            timeout = request_timeouts.clamp(timeout)
+            if timeout <= 0:
+                # Zeitbudget des Requests bereits verbraucht
+                outcome = 'deadline'
+                raise subprocess.TimeoutExpired([function, *args], 0)
+            result = self._call(function, args, timeout, libs)
+            outcome = 'ok' if result.returncode == 0 else 'error'
+            return result
+        except subprocess.TimeoutExpired:
+            if outcome != 'deadline':
+                outcome = 'timeout'
+            raise
+        finally:
+            duration = time.monotonic() - start
+            metrics.record_subprocess(function, duration, outcome)
+            profiling.record('sub', function, duration)
+
+    def _call(self, function: str, args, timeout: float, libs: Iterable[str]) -> BrokerResult:
+        argv = [function, *(str(a) for a in args)]
+        extra_libs = [str(lib) for lib in libs]
+        deadline = time.monotonic() + timeout
+
+        if not self._slots.acquire(timeout=timeout):
+            raise subprocess.TimeoutExpired(argv, timeout)
+
+        try:
+            self._count('calls')
+            try:
+                worker = self._acquire_worker()
+            except Exception as e:
+                print(f"WARNING: Lib-Broker Worker-Start fehlgeschlagen: {e}", file=sys.stderr)
+                self._count('fallbacks')
+                return self._call_oneshot(argv, extra_libs, max(0.1, deadline - time.monotonic()))
+
+            try:
+                for lib in extra_libs:
+                    if lib not in worker.sourced:
+                        worker.call(['source', lib], max(0.1, deadline - time.monotonic()))
+                        worker.sourced.add(lib)
+                result = worker.call(argv, max(0.1, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                self._count('timeouts')
+                self._discard(worker)
+                raise
+            except RuntimeError as e:
+                # Worker verwerfen, der nächste Aufruf startet einen neuen
+                print(f"WARNING: Lib-Broker Worker verworfen ({function}): {e}", file=sys.stderr)
+                self._count('crashes')
+                self._discard(worker)
+                return BrokerResult(argv, 1, '', f'{function}: worker crashed ({e})')
+
+            self._release_worker(worker)
+            return result
+        finally:
+            self._slots.release()
+
+    def _call_oneshot(self, argv: List[str], extra_libs: List[str], timeout: float) -> BrokerResult:
+        """
+        Fallback: klassischer Einzelaufruf via 'bash -c'.
+
+        Args:
+            argv: [funktion, arg1, ...]
+            extra_libs: Zusätzliche Libraries
+            timeout: Timeout in Sekunden
+
+        Returns:
+            BrokerResult
+        """
+        libs = [os.path.join(INSTALL_DIR, 'lib', lib) for lib in self.libs] + extra_libs
+        script = ''.join(f'source "{lib}" 2>/dev/null\n' for lib in libs) + '"$@"'
+        start = time.monotonic()
+        metrics.record_process_start('oneshot')
+        result = subprocess.run(
+            ['/bin/bash', '-c', script, 'disk2iso-broker', *argv],
+            capture_output=True, text=True, timeout=timeout,
+            env={**os.environ, 'PATH': PATH_ENV, 'INSTALL_DIR': INSTALL_DIR}
+        )
+        return BrokerResult(argv, result.returncode, result.stdout, result.stderr,
+                            time.monotonic() - start)
+
+    def shutdown(self):
+        """Beendet alle Worker (z.B. beim Prozess-Ende)."""
+        with self._lock:
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            worker.kill()
+        while not self._idle.empty():
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+
+
+# Globaler Broker (lazy, ein Pool pro Web-Prozess)
+_broker: Optional[LibBroker] = None
+_broker_lock = threading.Lock()
+
+
+def get_broker() -> LibBroker:
+    """Liefert den globalen Broker (wird beim ersten Zugriff erzeugt)."""
+    global _broker
+    with _broker_lock:
+        if _broker is None:
+            _broker = LibBroker()
+        return _broker
+
+
+def call(function: str, *args, timeout: float = DEFAULT_TIMEOUT,
+         libs: Iterable[str] = ()) -> BrokerResult:
+    """
+    Kurzform für get_broker().call(...).
+
+    Beispiel:
+        result = lib_broker.call('service_get_status', 'disk2iso')
+        if result.returncode == 0:
+            data = json.loads(result.stdout)
+    """
+    return get_broker().call(function, *args, timeout=timeout, libs=libs)
+
+
+def run(cmd: Sequence[str], label: Optional[str] = None, deadline: bool = True,
+        **kwargs) -> subprocess.CompletedProcess:
+    """
+    subprocess.run() mit Zählung und Laufzeitmessung.
+
+    Für Kommandos, die nicht über den Worker-Pool laufen können (eigene
+    Skripte, journalctl, mount, ...). Parameter wie bei subprocess.run().
+
+    Args:
+        cmd: Kommando als Liste
+        label: Name in den Metriken (z.B. Bash-Funktion), sonst cmd[0]
+        deadline: False = nicht auf das Request-Budget kürzen (Aufräumen
+                  wie umount muss auch nach Ablauf noch laufen)
+
+    Raises:
+        Wie subprocess.run() (TimeoutExpired, FileNotFoundError, ...)
+    """
+    label = label or os.path.basename(str(cmd[0]))
+    start = time.monotonic()
+    outcome = 'error'
+    try:
+        if deadline:
+            timeout = request_timeouts.clamp(kwargs.get('timeout'))
+            if timeout is not None and timeout <= 0:
+                outcome = 'deadline'
+                raise subprocess.TimeoutExpired(list(cmd), 0)
+            kwargs['timeout'] = timeout
+        result = subprocess.run(list(cmd), **kwargs)
+        outcome = 'ok' if result.returncode == 0 else 'error'
+        return result
+    except FileNotFoundError:
+        # Kommando nicht installiert - kein Prozess gestartet
+        outcome = 'not_found'
+        raise
+    except subprocess.TimeoutExpired:
+        if outcome != 'deadline':
+            outcome = 'timeout'
+        raise
+    finally:
+        duration = time.monotonic() - start
+        if outcome not in ('not_found', 'deadline'):
+            metrics.record_process_start('subprocess')
+        metrics.record_subprocess(label, duration, outcome)
+        profiling.record('sub', label, duration)
+
+
+def shutdown():
+    """Beendet den globalen Broker."""
+    global _broker
+    with _broker_lock:
+        if _broker is not None:
+            _broker.shutdown()
+            _broker = None
+
+
+atexit.register(shutdown)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso Log Tail - Speicherschonendes Lesen von Log-Dateien
+Version 1.3.0
+
+Liest das Ende einer Log-Datei rückwärts in Blöcken ab EOF, statt die
+ganze Datei per readlines() zu laden. Zusätzlich können über einen
+Byte-Offset nur die seit dem letzten Abruf angehängten Zeilen gelesen
+werden. Der Speicherbedarf pro Abruf ist unabhängig von der Dateigröße
+durch MAX_TAIL_BYTES bzw. MAX_CHUNK_BYTES begrenzt.
+"""
+
+import os
+from typing import Dict, Optional
+
+# Blockgröße beim Rückwärtslesen
+BLOCK_SIZE = 64 * 1024
+
+# Obergrenze für einen Tail-Abruf (sehr lange Zeilen werden abgeschnitten)
+MAX_TAIL_BYTES = 2 * 1024 * 1024
+
+# Obergrenze für inkrementelle Abrufe; ist mehr hinzugekommen, wird neu
+# ab dem Tail geladen (reset)
+MAX_CHUNK_BYTES = 1024 * 1024
+
+
+def _decode(data: bytes) -> str:
+    return data.decode('utf-8', errors='replace')
+
+
+def _count_lines(text: str) -> int:
+    if not text:
+        return 0
+    return text.count('\n') + (0 if text.endswith('\n') else 1)
+
+
+def tail(path: str, max_lines: int, max_bytes: int = MAX_TAIL_BYTES) -> Dict:
+    """
+    Liest die letzten Zeilen einer Datei.
+
+    Args:
+        path: Pfad der Log-Datei
+        max_lines: Maximale Anzahl Zeilen
+        max_bytes: Maximale Anzahl gelesener Bytes
+
+    Returns:
+        Dict mit 'logs' (Text), 'lines' (Anzahl), 'offset' (Cursor für
+        read_from) und 'truncated' (ältere Zeilen ausgelassen). Wie bei
+        read_from() endet der Cursor hinter der letzten vollständigen Zeile.
+    """
+    with open(path, 'rb') as f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        data = b''
+        while position > 0 and len(data) < max_bytes:
+            size = min(BLOCK_SIZE, position, max_bytes - len(data))
+            position -= size
+            f.seek(position)
+            data = f.read(size) + data
+            # Genug Zeilenumbrüche vor den letzten max_lines Zeilen gefunden?
+            if data.count(b'\n', 0, len(data) - 1) >= max_lines:
+                break
+
+    # Unvollständige letzte Zeile erst mit dem nächsten read_from() liefern
+    # (nur wenn sie vollständig im gelesenen Bereich beginnt)
+    complete = data.rfind(b'\n') + 1
+    if complete < len(data) and (complete > 0 or position == 0):
+        data = data[:complete]
+        end = position + complete
+
+    lines = data.split(b'\n') if data else []
+    if data.endswith(b'\n'):
+        lines.pop()
+    if position > 0 and len(lines) > 1:
+        # Erste Zeile beginnt vor dem gelesenen Bereich
+        lines = lines[1:]
+    truncated = position > 0 or len(lines) > max_lines
+    lines = lines[-max_lines:] if max_lines > 0 else []
+
+    text = _decode(b'\n'.join(lines) + (b'\n' if lines and data.endswith(b'\n') else b''))
+    return {
+        'logs': text,
+        'lines': len(lines),
+        'offset': end,
+        'truncated': truncated
+    }
+
+
+def read_from(path: str, offset: int, max_lines: int,
+              max_bytes: int = MAX_CHUNK_BYTES) -> Dict:
+    """
+    Liest die seit 'offset' angehängten, vollständigen Zeilen.
+
+    Ist die Datei kürzer als offset (rotiert/neu angelegt) oder sind mehr
+    als max_bytes hinzugekommen, wird stattdessen tail() geliefert und
+    'reset' gesetzt - der Client ersetzt dann seine Anzeige.
+
+    Args:
+        path: Pfad der Log-Datei
+        offset: Byte-Offset aus dem vorherigen Abruf
+        max_lines: Zeilenlimit für den Tail im Reset-Fall
+        max_bytes: Maximale Anzahl neu gelesener Bytes
+
+    Returns:
+        Dict wie tail() plus 'reset' (bool)
+    """
+    size = os.path.getsize(path)
+    if offset < 0 or offset > size or size - offset > max_bytes:
+        result = tail(path, max_lines)
+        result['reset'] = True
+        return result
+
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        data = f.read(size - offset)
+
+    # Unvollständige letzte Zeile beim nächsten Abruf liefern
+    complete = data.rfind(b'\n') + 1
+    data = data[:complete]
+    text = _decode(data)
+    return {
+        'logs': text,
+        'lines': _count_lines(text),
+        'offset': offset + complete,
+        'truncated': False,
+        'reset': False
+    }
+
+
+def parse_offset(value: Optional[str]) -> Optional[int]:
+    """
+    Parst den ?offset= Parameter (None = nicht angegeben).
+
+    Raises:
+        ValueError: Kein ganzzahliger Wert
+    """
+    if value is None or value == '':
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f'Ungültiger Parameter offset: {value[:40]}')
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso Metadata Cache - Lokale Datenbank für MusicBrainz/TMDB-Suchen
+Version 1.3.0
+
+Siehe todo/Metadata-Cache-DB.md. Jede Online-Suche kostet 500-2000 ms und
+wurde bisher nie wiederverwendet. Dieser Cache speichert die Antworten in
+SQLite (CACHE_DIR/metadata_cache.db):
+
+- lookups: Antwort pro (Provider, Schlüsseltyp, Schlüssel) - Schlüssel
+  sind normalisierte Suchbegriffe, Disc-IDs oder TOCs
+- entries: Einzelne Treffer (Releases/Filme) im FTS5-Volltextindex, damit
+  der Auswahl-Dialog auch offline passende Einträge findet
+
+Einträge älter als CACHE_TTL gelten als veraltet und werden online neu
+abgefragt; schlägt das fehl, wird der veraltete Eintrag geliefert.
+Überschreitet der Cache MAX_CACHE_BYTES, werden die am längsten nicht
+genutzten Lookups entfernt.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import sqlite3
+import threading
+import unicodedata
+from typing import Dict, Iterable, List, Optional
+
+import metrics
+
+# Pfade (analog zu archive_index.py)
+INSTALL_DIR = os.environ.get('DISK2ISO_INSTALL_DIR', '/opt/disk2iso')
+CACHE_DIR = os.environ.get('DISK2ISO_CACHE_DIR', os.path.join(INSTALL_DIR, 'cache'))
+DB_PATH = os.path.join(CACHE_DIR, 'metadata_cache.db')
+
+# Gültigkeit eines Lookups (danach Online-Refresh)
+CACHE_TTL = int(os.environ.get('DISK2ISO_METADATA_CACHE_TTL', str(30 * 24 * 3600)))
+
+# Obergrenze für gespeicherte Antworten (Summe der JSON-Größen)
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+# Nach einer Verdrängung wird bis auf diesen Anteil geleert
+EVICT_TARGET = 0.9
+
+SCHEMA_VERSION = 1
+
+# Schlüsseltypen
+KEY_QUERY = 'query'
+KEY_DISCID = 'discid'
+KEY_TOC = 'toc'
+
+# Disc-Angaben im Suchbegriff ("Staffel 10 Disc 5" == "Staffel 10 Disc 1")
+_DISC_SUFFIX = re.compile(r'\b(?:disc|disk|cd|dvd|bd|d)\s*\d+\b')
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+
+def normalize_query(*parts: str) -> str:
+    """
+    Normalisiert einen Suchbegriff zum Cache-Schlüssel.
+
+    Kleinbuchstaben, ohne Akzente, Sonderzeichen/Unterstriche als ein
+    Leerzeichen. Mehrere Teile werden mit '|' verbunden.
+    """
+    normalized = []
+    for part in parts:
+        text = unicodedata.normalize('NFKD', str(part or '')).encode('ascii', 'ignore').decode('ascii')
+        normalized.append(_NON_ALNUM.sub(' ', text.lower()).strip())
+    return '|'.join(normalized)
+
+
+def strip_disc_number(query: str) -> str:
+    """Entfernt Disc-Nummern aus einem normalisierten Suchbegriff."""
+    return re.sub(r'\s+', ' ', _DISC_SUFFIX.sub(' ', query)).strip()
+
+
+def _fts_query(text: str) -> str:
+    """Baut eine FTS5-Abfrage (Wörter als Präfix, ODER-verknüpft)."""
+    words = normalize_query(text).split()
+    return ' OR '.join(f'"{word}"*' for word in words)
+
+
+class MetadataCache:
+    """SQLite-Cache für Metadaten-Lookups mit Volltextsuche."""
+
+    def __init__(self, db_path: str = DB_PATH):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self.fts = True
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._init_schema()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        conn = self._conn()
+        with self._write_lock, conn:
+            if conn.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+                conn.execute('DROP TABLE IF EXISTS lookups')
+                conn.execute('DROP TABLE IF EXISTS entries')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS lookups (
+                    id INTEGER PRIMARY KEY,
+                    provider TEXT NOT NULL,
+                    key_type TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    fetched REAL NOT NULL,
+                    accessed REAL NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0,
+                    size INTEGER NOT NULL,
+                    UNIQUE (provider, key_type, key)
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_lookups_accessed ON lookups(accessed)')
+            try:
+                conn.execute('''
+                    CREATE VIRTUAL TABLE IF NOT EXISTS entries USING fts5(
+                        provider UNINDEXED, entry_id UNINDEXED, lookup_id UNINDEXED,
+                        title, artist, extra, data UNINDEXED
+                    )
+                ''')
+            except sqlite3.OperationalError:
+                # SQLite ohne FTS5: normale Tabelle, Suche per LIKE
+                self.fts = False
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS entries (
+                        provider TEXT, entry_id TEXT, lookup_id INTEGER,
+                        title TEXT, artist TEXT, extra TEXT, data TEXT
+                    )
+                ''')
+            conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def get(self, provider: str, key_type: str, key: str, ttl: float = CACHE_TTL) -> Optional[Dict]:
+        """
+        Liest einen Lookup aus dem Cache.
+
+        Returns:
+            None oder Dict mit 'payload', 'fetched', 'age' und 'fresh'
+            (False = älter als ttl, sollte online aktualisiert werden)
+        """
+        if not key:
+            return None
+        conn = self._conn()
+        row = conn.execute(
+            'SELECT id, payload, fetched FROM lookups WHERE provider = ? AND key_type = ? AND key = ?',
+            (provider, key_type, key)
+        ).fetchone()
+        if row is None:
+            metrics.record_cache(f'metadata_{provider}', False)
+            return None
+
+        now = time.time()
+        with self._write_lock, conn:
+            conn.execute('UPDATE lookups SET accessed = ?, hits = hits + 1 WHERE id = ?', (now, row['id']))
+        age = now - row['fetched']
+        metrics.record_cache(f'metadata_{provider}', age < ttl)
+        return {
+            'payload': json.loads(row['payload']),
+            'fetched': row['fetched'],
+            'age': age,
+            'fresh': age < ttl
+        }
+
+    def put(self, provider: str, keys: Dict[str, str], payload: Dict,
+            entries: Iterable[Dict] = ()):
+        """
+        Speichert eine Antwort unter einem oder mehreren Schlüsseln.
+
+        Args:
+            provider: 'musicbrainz' oder 'tmdb'
+            keys: Schlüsseltyp -> Schlüssel (z.B. {'query': ..., 'discid': ...})
+            payload: JSON-serialisierbare Antwort
+            entries: Einzeltreffer für die Volltextsuche, je Dict mit
+                     'id', 'title', 'artist', 'extra' und 'data'
+        """
+        data = json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+        now = time.time()
+        conn = self._conn()
+        with self._write_lock, conn:
+            lookup_id = None
+            for key_type, key in keys.items():
+                if not key:
+                    continue
+                conn.execute('''
+                    INSERT INTO lookups (provider, key_type, key, payload, fetched, accessed, size)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (provider, key_type, key) DO UPDATE SET
+                        payload = excluded.payload, fetched = excluded.fetched,
+                        accessed = excluded.accessed, size = excluded.size
+                ''', (provider, key_type, key, data, now, now, len(data)))
+                if lookup_id is None:
+                    lookup_id = conn.execute(
+                        'SELECT id FROM lookups WHERE provider = ? AND key_type = ? AND key = ?',
+                        (provider, key_type, key)
+                    ).fetchone()[0]
+
+            for entry in entries:
+                entry_id = str(entry.get('id', ''))
+                if not entry_id:
+                    continue
+                conn.execute('DELETE FROM entries WHERE provider = ? AND entry_id = ?', (provider, entry_id))
+                conn.execute(
+                    'INSERT INTO entries (provider, entry_id, lookup_id, title, artist, extra, data) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (provider, entry_id, lookup_id, entry.get('title') or '', entry.get('artist') or '',
+                     entry.get('extra') or '', json.dumps(entry.get('data', {}), ensure_ascii=False))
+                )
+
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Entfernt die am längsten ungenutzten Lookups über MAX_CACHE_BYTES."""
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM lookups').fetchone()[0]
+        if total <= MAX_CACHE_BYTES:
+            return
+        target = MAX_CACHE_BYTES * EVICT_TARGET
+        evicted = 0
+        for row in conn.execute('SELECT id, size FROM lookups ORDER BY accessed').fetchall():
+            if total <= target:
+                break
+            conn.execute('DELETE FROM lookups WHERE id = ?', (row['id'],))
+            conn.execute('DELETE FROM entries WHERE lookup_id = ?', (row['id'],))
+            total -= row['size']
+            evicted += 1
+        print(f"Metadaten-Cache: {evicted} Einträge verdrängt", file=sys.stderr)
+
+    def search(self, provider: str, text: str, limit: int = 25) -> List[Dict]:
+        """
+        Volltextsuche über alle gecachten Treffer eines Providers.
+
+        Ein Treffer muss nur eines der Wörter enthalten (Suchbegriffe aus
+        Dateinamen enthalten oft Zusätze wie "s10"), sortiert wird nach
+        Relevanz (bm25).
+
+        Returns:
+            Liste der gespeicherten 'data'-Dicts (beste Treffer zuerst)
+        """
+        conn = self._conn()
+        if self.fts:
+            query = _fts_query(text)
+            if not query:
+                return []
+            rows = conn.execute(
+                'SELECT data FROM entries WHERE entries MATCH ? AND provider = ? ORDER BY rank LIMIT ?',
+                (f'{{title artist extra}}: {query}', provider, limit)
+            ).fetchall()
+        else:
+            words = normalize_query(text).split()
+            if not words:
+                return []
+            condition = ' OR '.join(["(title || ' ' || artist || ' ' || extra) LIKE ?"] * len(words))
+            rows = conn.execute(
+                f'SELECT data FROM entries WHERE provider = ? AND ({condition}) LIMIT ?',
+                (provider, *[f'%{word}%' for word in words], limit)
+            ).fetchall()
+        return [json.loads(row['data']) for row in rows]
+
+    def stats(self) -> Dict:
+        """Anzahl und Größe der Cache-Einträge pro Provider."""
+        conn = self._conn()
+        result = {}
+        for row in conn.execute(
+            'SELECT provider, COUNT(*) AS count, SUM(size) AS size, SUM(hits) AS hits FROM lookups GROUP BY provider'
+        ):
+            result[row['provider']] = {'lookups': row['count'], 'bytes': row['size'], 'hits': row['hits']}
+        return result
+
+
+_cache: Optional[MetadataCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> MetadataCache:
+    """Liefert den Metadaten-Cache des Prozesses (lazy erzeugt)."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = MetadataCache()
+        return _cache
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso Metadata Spool - Index der offenen Metadaten-Auswahlen
+Version 1.3.0
+
+/api/metadata/pending hat bei jedem Aufruf das komplette Archiv per
+glob('**/*.mbquery') und glob('**/*.tmdbquery') durchsucht. Der SpoolIndex
+hält die Query-Dateien stattdessen im Speicher:
+
+- Query-Dateien entstehen nur im Temp-Verzeichnis des Daemons: .temp/
+  bzw. .temp/<laufwerk>/ (mehrere Laufwerke) und im Spool-Verzeichnis
+  .temp/metadata. Nur diese Verzeichnisse (ohne Unterverzeichnisse) werden
+  gescannt und per inotify (fswatch.py) überwacht - nicht das Archiv
+- pending() beantwortet Anfragen ohne Dateisystem-Zugriff, der Inhalt der
+  Query-Datei wird nur bei Änderung neu gelesen
+- Neue oder entfernte Query-Dateien lösen den Callback aus (SSE-Event)
+- Ohne inotify scannt der Hintergrund-Thread alle RESCAN_INTERVAL Sekunden
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+import fswatch
+
+# Query-Datei-Endung -> Suffix im Dateinamen vor der Endung (disc_id)
+QUERY_SUFFIXES = {
+    '.mbquery': '_mb',
+    '.tmdbquery': '_tmdb',
+}
+
+# Reihenfolge bei mehreren offenen Auswahlen (Audio-CD zuerst, wie bisher)
+QUERY_ORDER = ('.mbquery', '.tmdbquery')
+
+# Temp-Verzeichnis des Daemons und eigenes Spool-Verzeichnis darin
+TEMP_SUBDIR = '.temp'
+SPOOL_SUBDIR = os.path.join(TEMP_SUBDIR, 'metadata')
+
+# Ohne inotify: Abstand zwischen zwei Scans (Sekunden)
+RESCAN_INTERVAL = 5.0
+
+# Mit inotify: vollständiger Scan als Absicherung (verlorene Events)
+FULL_RESCAN_INTERVAL = 600.0
+
+# Sammelzeit für zusammengehörige Events (create + close_write)
+COALESCE_DELAY = 0.05
+
+
+def query_type(path: str) -> Optional[str]:
+    """Liefert die Query-Endung einer Datei oder None."""
+    ext = os.path.splitext(path)[1]
+    return ext if ext in QUERY_SUFFIXES else None
+
+
+class SpoolIndex:
+    """Hält die offenen Query-Dateien eines Ausgabeverzeichnisses im Speicher."""
+
+    def __init__(self, output_dir: str, on_change: Optional[Callable[[], None]] = None):
+        self.output_dir = output_dir
+        self.temp_dir = os.path.join(output_dir, TEMP_SUBDIR)
+        self.spool_dir = os.path.join(output_dir, SPOOL_SUBDIR)
+        self.on_change = on_change
+        self.watch_mode = 'none'
+        self._files: Dict[str, float] = {}
+        self._payloads: Dict[str, Tuple[float, Dict]] = {}
+        self._lock = threading.Lock()
+        self._scanned = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Erster Scan und Start des Watcher-Threads."""
+        try:
+            os.makedirs(self.spool_dir, exist_ok=True)
+        except OSError:
+            # Kein Schreibrecht - Spool wird nur genutzt, wenn er existiert
+            pass
+        self.rescan()
+        self._thread = threading.Thread(target=self._run, name='metadata-spool', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _query_dirs(self) -> List[str]:
+        """Verzeichnisse mit Query-Dateien: .temp und .temp/<name> (inkl. Spool)."""
+        dirs = [self.temp_dir]
+        try:
+            with os.scandir(self.temp_dir) as entries:
+                dirs.extend(entry.path for entry in entries if entry.is_dir(follow_symlinks=False))
+        except OSError:
+            pass
+        return dirs
+
+    def _scan(self) -> Dict[str, float]:
+        """Sucht Query-Dateien in den Query-Verzeichnissen (nicht rekursiv)."""
+        found = {}
+        for dirpath in self._query_dirs():
+            try:
+                with os.scandir(dirpath) as entries:
+                    for entry in entries:
+                        if query_type(entry.name) and entry.is_file():
+                            found[entry.path] = entry.stat().st_mtime
+            except OSError:
+                continue
+        return found
+
+    def rescan(self):
+        """Vollständiger Scan, ersetzt den Index."""
+        found = self._scan()
+        with self._lock:
+            changed = found.keys() != self._files.keys()
+            self._files = found
+            self._scanned = time.monotonic()
+        if changed:
+            self._notify()
+
+    def _update(self, path: str):
+        """Aktualisiert einen einzelnen Eintrag nach einem inotify-Event."""
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            mtime = None
+        with self._lock:
+            known = path in self._files
+            if mtime is None:
+                self._files.pop(path, None)
+                self._payloads.pop(path, None)
+            else:
+                self._files[path] = mtime
+        if known != (mtime is not None):
+            self._notify()
+
+    def _notify(self):
+        if self.on_change is None:
+            return
+        try:
+            self.on_change()
+        except Exception as e:
+            print(f"Fehler im Metadata-Spool Callback: {e}", file=sys.stderr)
+
+    def _read(self, path: str, mtime: float) -> Optional[Dict]:
+        """Liest eine Query-Datei (gecacht bis zur nächsten Änderung)."""
+        cached = self._payloads.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            # Datei wird evtl. noch geschrieben
+            return None
+        self._payloads[path] = (mtime, data)
+        return data
+
+    def pending(self) -> Optional[Dict]:
+        """
+        Liefert die offene Metadaten-Auswahl.
+
+        Returns:
+            None oder Dict mit 'path', 'type' (Endung), 'disc_id', 'mtime'
+            und 'data' (Inhalt der Query-Datei)
+        """
+        with self._lock:
+            files = dict(self._files)
+
+        for ext in QUERY_ORDER:
+            candidates = sorted((p for p in files if p.endswith(ext)), key=files.get, reverse=True)
+            for path in candidates:
+                data = self._read(path, files[path])
+                if data is None:
+                    continue
+                stem = os.path.splitext(os.path.basename(path))[0]
+                return {
+                    'path': path,
+                    'type': ext,
+                    'disc_id': stem.replace(QUERY_SUFFIXES[ext], ''),
+                    'mtime': files[path],
+                    'data': data
+                }
+        return None
+
+    def _run(self):
+        watcher = None
+        if fswatch.available() and os.path.isdir(self.temp_dir):
+            try:
+                # IN_CREATE: neue Laufwerks-Verzeichnisse in .temp erkennen
+                watcher = fswatch.Watcher(fswatch.IN_CLOSE_WRITE | fswatch.IN_MOVED_TO |
+                                          fswatch.IN_MOVED_FROM | fswatch.IN_DELETE |
+                                          fswatch.IN_CREATE)
+                for dirpath in self._query_dirs():
+                    watcher.add(dirpath)
+                self.watch_mode = 'inotify'
+            except OSError as e:
+                print(f"inotify für {self.temp_dir} nicht nutzbar ({e}), nutze Polling", file=sys.stderr)
+                if watcher is not None:
+                    watcher.close()
+                watcher = None
+
+        if watcher is None:
+            # Polling im Hintergrund, nicht im Request-Thread von pending()
+            self.watch_mode = 'polling'
+            while not self._stop.wait(RESCAN_INTERVAL):
+                try:
+                    self.rescan()
+                except Exception as e:
+                    print(f"Fehler beim Scan des Metadata-Spools: {e}", file=sys.stderr)
+            self.watch_mode = 'none'
+            return
+
+        # Events seit dem ersten Scan nicht verpassen
+        self.rescan()
+        try:
+            while not self._stop.is_set():
+                events = watcher.read_events(timeout=1.0)
+                if events:
+                    events.extend(watcher.read_events(timeout=COALESCE_DELAY))
+                new_dirs = [path for path, mask in events
+                            if mask & fswatch.IN_ISDIR and mask & (fswatch.IN_CREATE | fswatch.IN_MOVED_TO)
+                            and os.path.dirname(path) == self.temp_dir]
+                for dirpath in new_dirs:
+                    try:
+                        watcher.add(dirpath)
+                    except OSError:
+                        pass
+                if new_dirs or any(mask & fswatch.IN_Q_OVERFLOW for _, mask in events) \
+                        or time.monotonic() - self._scanned > FULL_RESCAN_INTERVAL:
+                    self.rescan()
+                    continue
+                for path in {path for path, _ in events if path and query_type(path)}:
+                    self._update(path)
+        finally:
+            watcher.close()
+            self.watch_mode = 'none'
+
+
+_index: Optional[SpoolIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_index(output_dir: str, on_change: Optional[Callable[[], None]] = None) -> SpoolIndex:
+    """
+    Liefert den SpoolIndex für das Ausgabeverzeichnis (lazy erzeugt).
+
+    Ändert sich das Ausgabeverzeichnis, wird der alte Index beendet.
+    """
+    global _index
+    with _index_lock:
+        if _index is None or _index.output_dir != output_dir:
+            if _index is not None:
+                _index.stop()
+            _index = SpoolIndex(output_dir, on_change)
+            _index.start()
+        return _index
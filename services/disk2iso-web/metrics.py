@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso Metrics - Prometheus-Textformat für /metrics
+Version 1.3.0
+
+Kleine eigene Implementierung von Countern, Gauges und Histogrammen (ohne
+prometheus_client), ausgegeben im Text-Exposition-Format 0.0.4:
+
+- Requests pro Route (URL-Regel, nicht konkreter Pfad) mit Latenz
+- Bash-/Subprozess-Aufrufe und Laufzeit pro Library-Funktion
+  (lib_broker.call / lib_broker.run)
+- Cache-Zugriffe (Treffer/Fehlschläge) pro Cache
+- Größe der JSON-Dateien in api/ (beim Abruf ermittelt)
+
+Unter gunicorn zählt jeder Worker für sich. Counter und Histogramme
+schreibt jeder Worker daher regelmäßig nach CACHE_DIR/metrics/<pid>-<start>.json;
+/metrics summiert diese Dateien, egal welcher Worker den Abruf bedient.
+Dateien beendeter Worker werden in archived.json zusammengefasst, damit die
+Summen beim Austausch von Workern nicht zurückgehen. gunicorn.conf.py leert
+das Verzeichnis beim Dienststart.
+"""
+
+import os
+import json
+import math
+import time
+import atexit
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from flask import Flask, Response, g, request
+
+import shared_state
+
+# Pfade (analog zu archive_index.py)
+INSTALL_DIR = os.environ.get('DISK2ISO_INSTALL_DIR', '/opt/disk2iso')
+API_DIR = os.path.join(INSTALL_DIR, 'api')
+
+METRICS_DIR = os.path.join(shared_state.CACHE_DIR, 'metrics')
+ARCHIVE_FILE = 'archived.json'
+
+# Eigene Werte höchstens so oft in METRICS_DIR schreiben (Sekunden)
+FLUSH_INTERVAL = 5
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Latenz-Buckets in Sekunden (Requests und Subprozesse)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Routen, die nicht gemessen werden (eigener Abruf, Dauerverbindung)
+EXCLUDED_ROUTES = ('/metrics', '/api/events')
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric(ABC):
+    kind = 'untyped'
+    # Werte werden über alle Worker summiert (siehe _aggregate)
+    shared = False
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.kind}']
+
+    def values(self) -> Dict[Tuple[str, ...], Any]:
+        """Eigene Werte dieses Prozesses."""
+        return {}
+
+    def rows(self, values: Dict[Tuple[str, ...], Any]) -> List[list]:
+        """Werte als JSON-fähige Zeilen (für METRICS_DIR)."""
+        return []
+
+    def merge(self, total: Dict[Tuple[str, ...], Any], rows: List[list]):
+        """Addiert Zeilen eines Workers zu total."""
+
+    @abstractmethod
+    def render(self, merged: Dict[str, Dict]) -> List[str]:
+        """Ausgabezeilen; merged enthält die über alle Worker summierten Werte."""
+
+
+class Counter(_Metric):
+    """Monoton steigender Zähler pro Label-Kombination."""
+
+    kind = 'counter'
+    shared = True
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1):
+        key = tuple(str(label) for label in labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+        _changed()
+
+    def values(self) -> Dict[Tuple[str, ...], float]:
+        with self._lock:
+            return dict(self._values)
+
+    def rows(self, values: Dict[Tuple[str, ...], float]) -> List[list]:
+        return [[list(key), value] for key, value in values.items()]
+
+    def merge(self, total: Dict[Tuple[str, ...], float], rows: List[list]):
+        for labels, value in rows:
+            key = tuple(labels)
+            total[key] = total.get(key, 0) + value
+
+    def render(self, merged: Dict[str, Dict]) -> List[str]:
+        return [f'{self.name}{_labels(self.labelnames, key)} {_number(value)}'
+                for key, value in sorted(merged.get(self.name, {}).items())]
+
+
+class Histogram(_Metric):
+    """Histogramm mit festen Buckets pro Label-Kombination."""
+
+    kind = 'histogram'
+    shared = True
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._values: Dict[Tuple[str, ...], List] = {}
+
+    def observe(self, value: float, *labels: str):
+        key = tuple(str(label) for label in labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[0][i] += 1
+                    break
+            entry[1] += value
+            entry[2] += 1
+        _changed()
+
+    def values(self) -> Dict[Tuple[str, ...], List]:
+        with self._lock:
+            return {key: [list(entry[0]), entry[1], entry[2]] for key, entry in self._values.items()}
+
+    def rows(self, values: Dict[Tuple[str, ...], List]) -> List[list]:
+        return [[list(key)] + entry for key, entry in values.items()]
+
+    def merge(self, total: Dict[Tuple[str, ...], List], rows: List[list]):
+        for labels, counts, value_sum, count in rows:
+            # Bucket-Grenzen geändert (Update) - alte Werte nicht mischen
+            if len(counts) != len(self.buckets):
+                continue
+            key = tuple(labels)
+            entry = total.get(key)
+            if entry is None:
+                total[key] = [list(counts), value_sum, count]
+                continue
+            entry[0] = [a + b for a, b in zip(entry[0], counts)]
+            entry[1] += value_sum
+            entry[2] += count
+
+    def render(self, merged: Dict[str, Dict]) -> List[str]:
+        lines = []
+        for key, (counts, total, count) in sorted(merged.get(self.name, {}).items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                le = f'le="{_number(bound)}"'
+                lines.append(f'{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}')
+            lines.append(f'{self.name}_sum{_labels(self.labelnames, key)} {_number(total)}')
+            lines.append(f'{self.name}_count{_labels(self.labelnames, key)} {count}')
+        return lines
+
+
+class Gauge(_Metric):
+    """Momentwert, beim Abruf über eine Funktion ermittelt."""
+
+    kind = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 collect: Optional[Callable[[Dict[str, Dict]], Iterable[Tuple[Tuple[str, ...], float]]]] = None):
+        super().__init__(name, documentation, labelnames)
+        self.collect = collect
+
+    def render(self, merged: Dict[str, Dict]) -> List[str]:
+        try:
+            samples = sorted(self.collect(merged)) if self.collect else []
+        except Exception as e:
+            return [f'# {self.name}: {_escape(e)}']
+        return [f'{self.name}{_labels(self.labelnames, key)} {_number(value)}' for key, value in samples]
+
+
+_registry: List[_Metric] = []
+
+
+def register(metric: _Metric) -> _Metric:
+    _registry.append(metric)
+    return metric
+
+
+# ============================================================================
+# Zusammenführung über alle Worker (METRICS_DIR)
+# ============================================================================
+
+_flush_lock = threading.Lock()
+_flush_state = {'pid': None, 'file': None, 'dirty': False}
+
+
+def _own_file() -> str:
+    """Datei dieses Prozesses (Startzeit im Namen, falls die PID wiederkehrt)."""
+    pid = os.getpid()
+    if _flush_state['pid'] != pid:
+        _flush_state['pid'] = pid
+        _flush_state['file'] = f'{pid}-{time.time_ns()}.json'
+        threading.Thread(target=_flush_loop, name='metrics-flush', daemon=True).start()
+        atexit.register(_flush)
+    return _flush_state['file']
+
+
+def _changed():
+    _flush_state['dirty'] = True
+    if _flush_state['pid'] != os.getpid():
+        with _flush_lock:
+            _own_file()
+
+
+def _flush_loop():
+    while True:
+        time.sleep(FLUSH_INTERVAL)
+        if _flush_state['dirty']:
+            _flush()
+
+
+def _write_json(path: str, data: Dict[str, List[list]]):
+    tmp = f'{path}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def _read_json(path: str) -> Dict[str, List[list]]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _flush() -> bool:
+    """Schreibt die eigenen Werte nach METRICS_DIR. False wenn nicht möglich."""
+    with _flush_lock:
+        _flush_state['dirty'] = False
+        data = {metric.name: metric.rows(metric.values()) for metric in _registry if metric.shared}
+        try:
+            os.makedirs(METRICS_DIR, exist_ok=True)
+            _write_json(os.path.join(METRICS_DIR, _own_file()), data)
+        except OSError:
+            return False
+        return True
+
+
+def _merge_into(totals: Dict[str, Dict], data: Dict[str, List[list]]):
+    by_name = {metric.name: metric for metric in _registry if metric.shared}
+    for name, rows in data.items():
+        metric = by_name.get(name)
+        if metric is not None:
+            try:
+                metric.merge(totals.setdefault(name, {}), rows)
+            except (TypeError, ValueError):
+                continue
+
+
+def _compact(dead: List[str]):
+    """Fasst Dateien beendeter Worker in ARCHIVE_FILE zusammen."""
+    archive_path = os.path.join(METRICS_DIR, ARCHIVE_FILE)
+    totals: Dict[str, Dict] = {}
+    _merge_into(totals, _read_json(archive_path))
+    for path in dead:
+        _merge_into(totals, _read_json(path))
+    by_name = {metric.name: metric for metric in _registry if metric.shared}
+    _write_json(archive_path, {name: by_name[name].rows(values) for name, values in totals.items()})
+    for path in dead:
+        os.remove(path)
+
+
+def _aggregate() -> Dict[str, Dict]:
+    """Summiert die Werte aller Worker (eigene Werte vorher geschrieben)."""
+    totals: Dict[str, Dict] = {}
+    if not _flush():
+        # METRICS_DIR nicht beschreibbar (z.B. Entwicklung) - nur eigene Werte
+        for metric in _registry:
+            if metric.shared:
+                metric.merge(totals.setdefault(metric.name, {}), metric.rows(metric.values()))
+        return totals
+    with shared_state.file_lock('metrics', timeout=2) as locked:
+        try:
+            names = [name for name in os.listdir(METRICS_DIR) if name.endswith('.json')]
+        except OSError:
+            names = []
+        if locked:
+            dead = []
+            for name in names:
+                pid = name.split('-', 1)[0]
+                if name != ARCHIVE_FILE and pid.isdigit() and not shared_state.pid_alive(int(pid)):
+                    dead.append(os.path.join(METRICS_DIR, name))
+            if dead:
+                try:
+                    _compact(dead)
+                    names = [ARCHIVE_FILE] + [name for name in names
+                                              if os.path.join(METRICS_DIR, name) not in dead and name != ARCHIVE_FILE]
+                except OSError:
+                    pass
+        for name in names:
+            _merge_into(totals, _read_json(os.path.join(METRICS_DIR, name)))
+    return totals
+
+
+# ============================================================================
+# Metriken des Web-Service
+# ============================================================================
+
+REQUESTS = register(Counter(
+    'disk2iso_http_requests_total', 'HTTP-Requests pro Route, Methode und Status',
+    ('route', 'method', 'status')))
+REQUEST_LATENCY = register(Histogram(
+    'disk2iso_http_request_duration_seconds', 'Bearbeitungszeit pro Route',
+    ('route', 'method')))
+
+SUBPROCESS_CALLS = register(Counter(
+    'disk2iso_subprocess_calls_total', 'Bash-/Subprozess-Aufrufe pro Funktion und Ergebnis',
+    ('function', 'outcome')))
+SUBPROCESS_LATENCY = register(Histogram(
+    'disk2iso_subprocess_duration_seconds', 'Laufzeit (wall time) pro Bash-Funktion/Kommando',
+    ('function',)))
+PROCESS_STARTS = register(Counter(
+    'disk2iso_process_starts_total', 'Gestartete Prozesse (fork) nach Art',
+    ('kind',)))
+
+CACHE_REQUESTS = register(Counter(
+    'disk2iso_cache_requests_total', 'Cache-Zugriffe pro Cache und Ergebnis',
+    ('cache', 'result')))
+
+
+def _cache_ratios(merged: Dict[str, Dict]):
+    totals: Dict[str, List[float]] = {}
+    for (cache, result), value in merged.get(CACHE_REQUESTS.name, {}).items():
+        entry = totals.setdefault(cache, [0, 0])
+        entry[0 if result == 'hit' else 1] += value
+    return [((cache,), hits / (hits + misses)) for cache, (hits, misses) in totals.items() if hits + misses]
+
+
+def _api_file_sizes(merged: Dict[str, Dict]):
+    samples = []
+    try:
+        with os.scandir(API_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json') and entry.is_file():
+                    samples.append(((entry.name,), entry.stat().st_size))
+    except OSError:
+        pass
+    return samples
+
+
+register(Gauge('disk2iso_cache_hit_ratio', 'Anteil der Cache-Treffer seit Dienststart',
+               ('cache',), _cache_ratios))
+register(Gauge('disk2iso_api_file_bytes', 'Größe der JSON-Dateien in api/',
+               ('file',), _api_file_sizes))
+
+
+def record_subprocess(function: str, duration: float, outcome: str = 'ok'):
+    """Erfasst einen Bash-/Subprozess-Aufruf (outcome: ok, error, timeout, deadline)."""
+    SUBPROCESS_CALLS.inc(function, outcome)
+    SUBPROCESS_LATENCY.observe(duration, function)
+
+
+def record_process_start(kind: str):
+    """Zählt einen neu gestarteten Prozess (z.B. 'broker_worker', 'oneshot')."""
+    PROCESS_STARTS.inc(kind)
+
+
+def record_cache(cache: str, hit: bool):
+    """Zählt einen Cache-Zugriff."""
+    CACHE_REQUESTS.inc(cache, 'hit' if hit else 'miss')
+
+
+def render() -> str:
+    """Alle Metriken im Prometheus-Textformat (summiert über alle Worker)."""
+    merged = _aggregate()
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.header())
+        lines.extend(metric.render(merged))
+    return '\n'.join(lines) + '\n'
+
+
+# ============================================================================
+# Flask-Anbindung
+# ============================================================================
+
+def _before_request():
+    g.metrics_start = time.perf_counter()
+
+
+def _after_request(response):
+    start = g.pop('metrics_start', None)
+    rule = request.url_rule.rule if request.url_rule is not None else '<unmatched>'
+    if start is not None and rule not in EXCLUDED_ROUTES:
+        REQUESTS.inc(rule, request.method, response.status_code)
+        REQUEST_LATENCY.observe(time.perf_counter() - start, rule, request.method)
+    return response
+
+
+def metrics_view():
+    return Response(render(), content_type=CONTENT_TYPE)
+
+
+def init_app(app: Flask):
+    """Registriert Request-Messung und den Endpoint /metrics."""
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.add_url_rule('/metrics', 'metrics', metrics_view)
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso Plugin Registry - Widget-Blueprints erst bei Bedarf laden
+Version 1.3.0
+
+app.py hat beim Start alle Widget-Blueprints importiert (Core-Widgets und
+optionale Module wie audio, dvd, bluray, metadata, musicbrainz, tmdb,
+mqtt) - unabhängig davon, ob je ein Request sie erreicht. Die Registry
+nutzt stattdessen ein generiertes Manifest (CACHE_DIR/plugins.json) mit
+den URL-Regeln jedes Plugins:
+
+- Beim Start werden für Plugins mit gültigem Manifest-Eintrag nur
+  URL-Stubs registriert (kein Import)
+- Der erste Request auf einen Stub importiert das Plugin und ersetzt die
+  View-Funktionen aller seiner Endpoints
+- Ist der Eintrag veraltet (Quelldatei geändert) oder fehlt er, wird das
+  Plugin wie bisher sofort importiert und das Manifest aktualisiert
+- Plugins mit Request-Hooks, Error-Handlern o.ä. werden immer sofort
+  geladen, da diese nach dem ersten Request nicht mehr registriert
+  werden können
+- Pro Plugin wird die Importzeit erfasst (/api/plugins)
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+import importlib
+import importlib.util
+from typing import Callable, Dict, List, Optional
+
+from flask import Blueprint, Flask, jsonify
+
+# Pfade (analog zu archive_index.py)
+INSTALL_DIR = os.environ.get('DISK2ISO_INSTALL_DIR', '/opt/disk2iso')
+CACHE_DIR = os.environ.get('DISK2ISO_CACHE_DIR', os.path.join(INSTALL_DIR, 'cache'))
+MANIFEST_PATH = os.path.join(CACHE_DIR, 'plugins.json')
+
+# Basis-Verzeichnis der optionalen Module (/opt/disk2iso-<modul>/www)
+MODULE_BASE_DIR = os.environ.get('DISK2ISO_MODULE_BASE_DIR', '/opt')
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+MANIFEST_VERSION = 1
+
+# Bekannte Plugins: Name (= Modul in routes/widgets), Blueprint-Variable,
+# Gruppe und optional das externe Modul-Verzeichnis
+PLUGINS: List[Dict] = [
+    # Widget Settings (Core)
+    {'name': 'settings_config', 'blueprint': 'settings_config_bp', 'group': 'core'},
+    {'name': 'settings_common', 'blueprint': 'common_settings_bp', 'group': 'core'},
+    {'name': 'settings_drivestat', 'blueprint': 'drivestat_settings_bp', 'group': 'core'},
+    {'name': 'settings_metadata', 'blueprint': 'metadata_widget_settings_bp', 'group': 'core'},
+    # Widget Status/Info (Systeminfo, Status, etc.)
+    {'name': 'status_disk2iso', 'blueprint': 'status_disk2iso_bp', 'group': 'core'},
+    {'name': 'status_disk2iso_web', 'blueprint': 'status_disk2iso_web_bp', 'group': 'core'},
+    {'name': 'sysinfo_systeminfo', 'blueprint': 'sysinfo_systeminfo_bp', 'group': 'core'},
+    {'name': 'outputdir_systeminfo', 'blueprint': 'outputdir_systeminfo_bp', 'group': 'core'},
+    {'name': 'archiv_systeminfo', 'blueprint': 'archiv_systeminfo_bp', 'group': 'core'},
+    {'name': 'softwarecheck_systeminfo', 'blueprint': 'softwarecheck_systeminfo_bp', 'group': 'core'},
+    {'name': 'dependencies_systeminfo', 'blueprint': 'dependencies_systeminfo_bp', 'group': 'core'},
+    # Optionale Module
+    {'name': 'dependencies_audio', 'blueprint': 'dependencies_audio_bp', 'group': 'audio', 'module_dir': 'disk2iso-audio'},
+    {'name': 'dependencies_dvd', 'blueprint': 'dependencies_dvd_bp', 'group': 'dvd', 'module_dir': 'disk2iso-dvd'},
+    {'name': 'dependencies_bluray', 'blueprint': 'dependencies_bluray_bp', 'group': 'bluray', 'module_dir': 'disk2iso-bluray'},
+    {'name': 'dependencies_metadata', 'blueprint': 'dependencies_metadata_bp', 'group': 'metadata', 'module_dir': 'disk2iso-metadata'},
+    {'name': 'dependencies_cdtext', 'blueprint': 'dependencies_cdtext_bp', 'group': 'metadata', 'module_dir': 'disk2iso-metadata'},
+    {'name': 'dependencies_musicbrainz', 'blueprint': 'dependencies_musicbrainz_bp', 'group': 'musicbrainz', 'module_dir': 'disk2iso-musicbrainz'},
+    {'name': 'dependencies_tmdb', 'blueprint': 'dependencies_tmdb_bp', 'group': 'tmdb', 'module_dir': 'disk2iso-tmdb'},
+    {'name': 'dependencies_mqtt', 'blueprint': 'dependencies_mqtt_bp', 'group': 'mqtt', 'module_dir': 'disk2iso-mqtt'},
+    {'name': 'status_mqtt', 'blueprint': 'status_mqtt_bp', 'group': 'mqtt', 'module_dir': 'disk2iso-mqtt'},
+]
+
+STATE_MISSING = 'missing'    # Quelldatei nicht vorhanden (Modul nicht installiert)
+STATE_LAZY = 'lazy'          # Nur Stubs registriert, noch nicht importiert
+STATE_LOADED = 'loaded'      # Importiert und aktiv
+STATE_FAILED = 'failed'      # Import fehlgeschlagen
+
+
+_HOOK_CONTAINERS = ('before_request_funcs', 'after_request_funcs', 'teardown_request_funcs',
+                    'template_context_processors', 'url_value_preprocessors',
+                    'url_default_functions', 'error_handler_spec')
+
+
+def _hook_count(app: Flask) -> int:
+    """Anzahl der App-weiten Hooks (erkennt Blueprints, die welche anlegen)."""
+    count = sum(len(getattr(app, name).get(None, ())) for name in _HOOK_CONTAINERS)
+    return count + len(app.jinja_env.filters) + len(app.jinja_env.globals) + len(app.jinja_env.tests)
+
+
+def _has_hooks(blueprint) -> bool:
+    """True, wenn der Blueprint eigene Hooks, Error-Handler oder Ordner hat."""
+    if blueprint.has_static_folder or blueprint.template_folder is not None:
+        return True
+    # Flask legt in jedem Blueprint den Standard-Context-Processor an
+    baseline = Blueprint('_baseline', __name__)
+    return any(_funcs(getattr(blueprint, name)) > _funcs(getattr(baseline, name))
+               for name in _HOOK_CONTAINERS)
+
+
+def _funcs(container: Dict) -> int:
+    return sum(len(funcs) for funcs in container.values())
+
+
+class Plugin:
+    """Ein Widget-Blueprint mit Lade-Zustand und Importzeit."""
+
+    def __init__(self, spec: Dict):
+        self.name = spec['name']
+        self.blueprint_name = spec['blueprint']
+        self.group = spec.get('group', 'core')
+        self.module_dir = spec.get('module_dir')
+        self.module = f"routes.widgets.{self.name}"
+        if self.module_dir:
+            self.www_dir = os.path.join(MODULE_BASE_DIR, self.module_dir, 'www')
+        else:
+            self.www_dir = APP_DIR
+        self.source = os.path.join(self.www_dir, 'routes', 'widgets', f'{self.name}.py')
+        self.state = STATE_MISSING
+        self.import_ms: Optional[float] = None
+        self.error: Optional[str] = None
+        self.endpoints: List[str] = []
+        self.lock = threading.Lock()
+
+    def stamp(self) -> Optional[List[int]]:
+        try:
+            st = os.stat(self.source)
+            return [st.st_mtime_ns, st.st_size]
+        except OSError:
+            return None
+
+    def import_blueprint(self):
+        """Importiert das Plugin-Modul und liefert den Blueprint (mit Zeitmessung)."""
+        start = time.perf_counter()
+        try:
+            if self.module_dir:
+                # Externe Module liegen nicht im routes-Paket der App
+                if self.www_dir not in sys.path:
+                    sys.path.append(self.www_dir)
+                module = sys.modules.get(self.module)
+                if module is None:
+                    spec = importlib.util.spec_from_file_location(self.module, self.source)
+                    module = importlib.util.module_from_spec(spec)
+                    sys.modules[self.module] = module
+                    try:
+                        spec.loader.exec_module(module)
+                    except BaseException:
+                        del sys.modules[self.module]
+                        raise
+            else:
+                module = importlib.import_module(self.module)
+            return getattr(module, self.blueprint_name)
+        finally:
+            self.import_ms = round((time.perf_counter() - start) * 1000, 1)
+
+    def to_dict(self) -> Dict:
+        return {
+            'name': self.name,
+            'group': self.group,
+            'state': self.state,
+            'import_ms': self.import_ms,
+            'endpoints': len(self.endpoints),
+            'error': self.error
+        }
+
+
+class PluginRegistry:
+    """Registriert Widget-Blueprints sofort oder als Lazy-Stubs."""
+
+    def __init__(self, app: Flask, plugins: List[Dict] = PLUGINS, manifest_path: str = MANIFEST_PATH):
+        self.app = app
+        self.plugins = [Plugin(spec) for spec in plugins]
+        self.manifest_path = manifest_path
+        self.setup_ms: Optional[float] = None
+        self._manifest: Dict = {}
+        self._views: Dict[str, Dict[str, Callable]] = {}
+
+    def _read_manifest(self) -> Dict:
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') == MANIFEST_VERSION:
+                return manifest.get('plugins', {})
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    def _write_manifest(self):
+        try:
+            os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+            tmp = f'{self.manifest_path}.{os.getpid()}.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'version': MANIFEST_VERSION, 'plugins': self._manifest}, f, indent=2)
+            os.replace(tmp, self.manifest_path)
+        except OSError as e:
+            print(f"WARNING: Plugin-Manifest nicht schreibbar: {e}", file=sys.stderr)
+
+    def setup(self):
+        """Registriert alle Plugins (Stubs aus dem Manifest oder sofortiger Import)."""
+        start = time.perf_counter()
+        self._manifest = self._read_manifest()
+        changed = False
+
+        for plugin in self.plugins:
+            stamp = plugin.stamp()
+            if stamp is None:
+                plugin.state = STATE_MISSING
+                changed |= self._manifest.pop(plugin.name, None) is not None
+                continue
+
+            entry = self._manifest.get(plugin.name)
+            if entry and entry.get('lazy') and entry.get('stamp') == stamp \
+                    and entry.get('blueprint') == plugin.blueprint_name:
+                self._register_stubs(plugin, entry['rules'])
+                continue
+
+            self._manifest[plugin.name] = self._load_eager(plugin, stamp)
+            changed = True
+
+        if changed:
+            self._write_manifest()
+
+        self.setup_ms = round((time.perf_counter() - start) * 1000, 1)
+        states = [p.state for p in self.plugins]
+        print(f"INFO: Plugins: {states.count(STATE_LAZY)} lazy, {states.count(STATE_LOADED)} geladen, "
+              f"{states.count(STATE_FAILED)} fehlerhaft ({self.setup_ms} ms)", file=sys.stderr)
+
+    def _load_eager(self, plugin: Plugin, stamp: List[int]) -> Dict:
+        """Importiert und registriert ein Plugin sofort, liefert den Manifest-Eintrag."""
+        try:
+            blueprint = plugin.import_blueprint()
+            hooks = _hook_count(self.app)
+            self.app.register_blueprint(blueprint)
+            lazy = _hook_count(self.app) == hooks and not _has_hooks(blueprint)
+        except Exception as e:
+            plugin.state = STATE_FAILED
+            plugin.error = str(e)
+            print(f"WARNING: Plugin {plugin.name} konnte nicht geladen werden: {e}", file=sys.stderr)
+            return {'stamp': stamp, 'blueprint': plugin.blueprint_name, 'lazy': False, 'rules': []}
+
+        prefix = f'{blueprint.name}.'
+        rules = [{
+            'rule': rule.rule,
+            'endpoint': rule.endpoint,
+            'methods': sorted((rule.methods or set()) - {'HEAD', 'OPTIONS'})
+        } for rule in self.app.url_map.iter_rules() if rule.endpoint.startswith(prefix)]
+        plugin.endpoints = [rule['endpoint'] for rule in rules]
+        plugin.state = STATE_LOADED
+        return {'stamp': stamp, 'blueprint': plugin.blueprint_name, 'lazy': lazy, 'rules': rules}
+
+    def _register_stubs(self, plugin: Plugin, rules: List[Dict]):
+        for rule in rules:
+            self.app.add_url_rule(rule['rule'], endpoint=rule['endpoint'],
+                                  view_func=self._stub(plugin, rule['endpoint']),
+                                  methods=rule['methods'])
+        plugin.endpoints = [rule['endpoint'] for rule in rules]
+        plugin.state = STATE_LAZY
+
+    def _stub(self, plugin: Plugin, endpoint: str) -> Callable:
+        def view(**kwargs):
+            real = self._load_lazy(plugin).get(endpoint)
+            if real is None:
+                return jsonify({
+                    'success': False,
+                    'message': f'Plugin {plugin.name} nicht verfügbar'
+                }), 503
+            return real(**kwargs)
+        view.__name__ = f'lazy_{endpoint.replace(".", "_")}'
+        return view
+
+    def _load_lazy(self, plugin: Plugin) -> Dict[str, Callable]:
+        """
+        Importiert ein Plugin beim ersten Request.
+
+        Die App nimmt nach dem ersten Request keine Blueprints mehr an. Der
+        Blueprint wird deshalb in einer Hilfs-App registriert und nur die
+        View-Funktionen werden in die Stubs der App übernommen.
+        """
+        views = self._views.get(plugin.name)
+        if views is not None:
+            return views
+
+        with plugin.lock:
+            views = self._views.get(plugin.name)
+            if views is not None:
+                return views
+            views = {}
+            try:
+                blueprint = plugin.import_blueprint()
+                helper = Flask(self.app.import_name, root_path=self.app.root_path)
+                helper.register_blueprint(blueprint)
+                for endpoint in plugin.endpoints:
+                    if endpoint in helper.view_functions:
+                        views[endpoint] = helper.view_functions[endpoint]
+                        self.app.view_functions[endpoint] = views[endpoint]
+                if len(views) != len(plugin.endpoints):
+                    # Manifest passt nicht zum Modul - beim nächsten Start neu erzeugen
+                    print(f"WARNING: Plugin-Manifest für {plugin.name} veraltet", file=sys.stderr)
+                    self._invalidate(plugin.name)
+                plugin.state = STATE_LOADED
+                print(f"INFO: Plugin {plugin.name} geladen ({plugin.import_ms} ms)", file=sys.stderr)
+            except Exception as e:
+                plugin.state = STATE_FAILED
+                plugin.error = str(e)
+                print(f"WARNING: Plugin {plugin.name} konnte nicht geladen werden: {e}", file=sys.stderr)
+                self._invalidate(plugin.name)
+            self._views[plugin.name] = views
+            return views
+
+    def _invalidate(self, name: str):
+        if self._manifest.pop(name, None) is not None:
+            self._write_manifest()
+
+    def report(self) -> Dict:
+        """Zustand und Importzeit aller Plugins."""
+        return {
+            'setup_ms': self.setup_ms,
+            'plugins': [plugin.to_dict() for plugin in self.plugins]
+        }
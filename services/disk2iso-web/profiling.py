@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso Profiling - Server-Timing und Profile langsamer Requests
+Version 1.3.0
+
+Opt-in Diagnose für einzelne Requests, aktiviert über die Einstellung
+WEB_PROFILING=true (disk2iso.conf) oder pro Request mit dem Header
+'X-Disk2iso-Profile: 1'. Ein aktiver Request liefert einen
+Server-Timing-Header (sichtbar in den Browser-Devtools) mit je einem
+Eintrag pro:
+
+- sub:  Bash-/Subprozess-Aufruf (lib_broker.call / lib_broker.run)
+- file: Dateizugriff (read_api_json, Settings- und Sprachdateien)
+- tpl:  Template-Rendering
+
+Zusätzlich kann für Requests über WEB_PROFILING_THRESHOLD_MS ein
+cProfile- oder tracemalloc-Snapshot gespeichert werden
+(WEB_PROFILING_CAPTURE=cprofile|tracemalloc bzw. Header-Wert 'cprofile'
+oder 'tracemalloc'). Die Dateien landen in CACHE_DIR/profiles, es bleiben
+die MAX_PROFILES neuesten erhalten:
+
+    python3 -m pstats <datei>.prof
+    tracemalloc.Snapshot.load('<datei>.tracemalloc').statistics('lineno')
+"""
+
+import os
+import re
+import sys
+import time
+import cProfile
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+
+from flask import Flask, request, before_render_template, template_rendered
+
+import settings_cache
+
+# Pfade (analog zu archive_index.py)
+INSTALL_DIR = os.environ.get('DISK2ISO_INSTALL_DIR', '/opt/disk2iso')
+CACHE_DIR = os.environ.get('DISK2ISO_CACHE_DIR', os.path.join(INSTALL_DIR, 'cache'))
+PROFILE_DIR = os.path.join(CACHE_DIR, 'profiles')
+
+HEADER = 'X-Disk2iso-Profile'
+
+CAPTURE_NONE = 'none'
+CAPTURE_CPROFILE = 'cprofile'
+CAPTURE_TRACEMALLOC = 'tracemalloc'
+
+DEFAULT_THRESHOLD_MS = 500
+
+# Anzahl aufbewahrter Profil-Dateien
+MAX_PROFILES = 50
+
+# Obergrenze der Server-Timing-Einträge pro Response (Header-Größe)
+MAX_ENTRIES = 40
+
+TRACEMALLOC_FRAMES = 10
+
+_SLUG = re.compile(r'[^A-Za-z0-9]+')
+
+_current: ContextVar[Optional['RequestProfile']] = ContextVar('disk2iso_profile', default=None)
+
+# tracemalloc läuft prozessweit - nur solange ein Request es braucht
+_tracemalloc_users = 0
+_tracemalloc_lock = threading.Lock()
+
+
+class RequestProfile:
+    """Messwerte eines Requests."""
+
+    def __init__(self, capture: str, threshold_ms: int):
+        self.capture = capture
+        self.threshold_ms = threshold_ms
+        self.start = time.perf_counter()
+        self.spans: List[Tuple[str, str, float]] = []
+        self.templates: List[Tuple[str, float]] = []
+        self.profiler: Optional[cProfile.Profile] = None
+        self.tracing = False
+        self.saved: Optional[str] = None
+
+    def add(self, kind: str, desc: str, seconds: float):
+        self.spans.append((kind, desc, seconds * 1000))
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.start) * 1000
+
+    def server_timing(self, total_ms: float) -> str:
+        entries = [f'{kind};dur={ms:.1f};desc="{_quote(desc)}"'
+                   for kind, desc, ms in self.spans[:MAX_ENTRIES]]
+        if len(self.spans) > MAX_ENTRIES:
+            rest = sum(ms for _, _, ms in self.spans[MAX_ENTRIES:])
+            entries.append(f'more;dur={rest:.1f};desc="{len(self.spans) - MAX_ENTRIES} weitere"')
+        if self.saved:
+            entries.append(f'profile;desc="{_quote(self.saved)}"')
+        entries.append(f'total;dur={total_ms:.1f}')
+        return ', '.join(entries)
+
+
+def _quote(text: str) -> str:
+    return str(text).replace('\\', '/').replace('"', "'")
+
+
+def record(kind: str, desc: str, seconds: float):
+    """Erfasst eine Messung für den laufenden Request (ohne Profiling: no-op)."""
+    profile = _current.get()
+    if profile is not None:
+        profile.add(kind, desc, seconds)
+
+
+@contextmanager
+def span(kind: str, desc: str):
+    """Misst einen Codeblock für den Server-Timing-Header."""
+    profile = _current.get()
+    if profile is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add(kind, desc, time.perf_counter() - start)
+
+
+def _settings() -> Tuple[bool, str, int]:
+    enabled = settings_cache.get_value_conf('disk2iso', 'WEB_PROFILING', 'false') == 'true'
+    capture = settings_cache.get_value_conf('disk2iso', 'WEB_PROFILING_CAPTURE', CAPTURE_NONE)
+    try:
+        threshold = int(settings_cache.get_value_conf('disk2iso', 'WEB_PROFILING_THRESHOLD_MS',
+                                                      str(DEFAULT_THRESHOLD_MS)))
+    except ValueError:
+        threshold = DEFAULT_THRESHOLD_MS
+    return enabled, capture, threshold
+
+
+def _tracemalloc_acquire():
+    global _tracemalloc_users
+    with _tracemalloc_lock:
+        if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        _tracemalloc_users += 1
+
+
+def _tracemalloc_release():
+    global _tracemalloc_users
+    with _tracemalloc_lock:
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0 and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+def _start():
+    header = request.headers.get(HEADER, '').lower()
+    enabled, capture, threshold = _settings()
+    if header in (CAPTURE_CPROFILE, CAPTURE_TRACEMALLOC):
+        capture = header
+    elif header in ('1', 'true'):
+        pass
+    elif not enabled:
+        return
+
+    profile = RequestProfile(capture, threshold)
+    if capture == CAPTURE_CPROFILE:
+        profile.profiler = cProfile.Profile()
+        try:
+            profile.profiler.enable()
+        except ValueError:
+            # Anderer Profiler aktiv (paralleler Request) - nur Server-Timing
+            profile.profiler = None
+    elif capture == CAPTURE_TRACEMALLOC:
+        _tracemalloc_acquire()
+        profile.tracing = True
+    request.environ['disk2iso.profile_token'] = _current.set(profile)
+
+
+def _stop_capture(profile: RequestProfile):
+    if profile.profiler is not None:
+        profile.profiler.disable()
+    if profile.tracing:
+        profile.tracing = False
+        _tracemalloc_release()
+
+
+def _save(profile: RequestProfile, total_ms: float):
+    """Speichert das Profil eines langsamen Requests und rotiert das Verzeichnis."""
+    route = request.url_rule.rule if request.url_rule is not None else request.path
+    slug = _SLUG.sub('_', route).strip('_')[:60] or 'root'
+    name = f"{time.strftime('%Y%m%d-%H%M%S')}-{int(total_ms)}ms-{request.method}-{slug}"
+    try:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        if profile.profiler is not None:
+            path = os.path.join(PROFILE_DIR, f'{name}.prof')
+            profile.profiler.dump_stats(path)
+        elif profile.capture == CAPTURE_TRACEMALLOC and tracemalloc.is_tracing():
+            path = os.path.join(PROFILE_DIR, f'{name}.tracemalloc')
+            tracemalloc.take_snapshot().dump(path)
+        else:
+            return
+        profile.saved = os.path.basename(path)
+        _rotate()
+    except OSError as e:
+        print(f"Profil konnte nicht gespeichert werden: {e}", file=sys.stderr)
+
+
+def _rotate():
+    try:
+        files = sorted((entry.stat().st_mtime, entry.path) for entry in os.scandir(PROFILE_DIR)
+                       if entry.is_file())
+    except OSError:
+        return
+    for _, path in files[:-MAX_PROFILES]:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def _after_request(response):
+    profile = _current.get()
+    if profile is None:
+        return response
+    total_ms = profile.elapsed_ms()
+    if profile.profiler is not None:
+        profile.profiler.disable()
+    if total_ms >= profile.threshold_ms:
+        _save(profile, total_ms)
+    _stop_capture(profile)
+    response.headers['Server-Timing'] = profile.server_timing(total_ms)
+    return response
+
+
+def _teardown_request(exc=None):
+    token = request.environ.pop('disk2iso.profile_token', None)
+    if token is None:
+        return
+    profile = _current.get()
+    if profile is not None:
+        _stop_capture(profile)
+    _current.reset(token)
+
+
+def _before_render(sender, template, context, **extra):
+    profile = _current.get()
+    if profile is not None:
+        profile.templates.append((template.name or '?', time.perf_counter()))
+
+
+def _rendered(sender, template, context, **extra):
+    profile = _current.get()
+    if profile is not None and profile.templates:
+        name, start = profile.templates.pop()
+        profile.add('tpl', name, time.perf_counter() - start)
+
+
+def init_app(app: Flask):
+    """Registriert die Profiling-Hooks (ohne Aktivierung nur ein Settings-Lookup pro Request)."""
+    app.before_request(_start)
+    app.after_request(_after_request)
+    app.teardown_request(_teardown_request)
+    before_render_template.connect(_before_render, app)
+    template_rendered.connect(_rendered, app)
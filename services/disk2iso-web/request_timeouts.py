@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso Request Timeouts - Zeitbudget pro Routen-Klasse
+Version 1.3.0
+
+Im Produktionsbetrieb (gunicorn mit gthread-Workern) kann ein hängender
+Request nicht von außen abgebrochen werden, ohne den ganzen Worker zu
+beenden. Stattdessen erhält jeder Request ein Zeitbudget nach Routen-Klasse:
+
+- stream:  /api/events (SSE) - ohne Budget
+- fast:    Status-, Archiv- und Widget-Abfragen (WEB_TIMEOUT_FAST)
+- online:  MusicBrainz/TMDB-Suche und Cover (WEB_TIMEOUT_ONLINE)
+- default: alle übrigen Routen (WEB_TIMEOUT_DEFAULT)
+
+lib_broker.call() und lib_broker.run() kürzen ihren Timeout auf das
+verbleibende Budget (clamp()), ein abgelaufenes Budget lässt weitere
+Aufrufe sofort mit subprocess.TimeoutExpired scheitern. Überschreitungen
+werden geloggt und in /metrics gezählt. Lange Operationen (Remaster,
+Installation) laufen als Job und sind davon nicht betroffen.
+"""
+
+import sys
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from flask import Flask, request
+
+import metrics
+import settings_cache
+
+STREAM = 'stream'
+FAST = 'fast'
+ONLINE = 'online'
+DEFAULT = 'default'
+
+# Routen-Klasse -> (Einstellung, Default in Sekunden)
+TIMEOUTS = {
+    FAST: ('WEB_TIMEOUT_FAST', 10),
+    ONLINE: ('WEB_TIMEOUT_ONLINE', 60),
+    DEFAULT: ('WEB_TIMEOUT_DEFAULT', 30),
+}
+
+# Pfad-Präfixe je Klasse (erster Treffer gewinnt)
+ROUTE_CLASSES = (
+    (STREAM, ('/api/events',)),
+    (ONLINE, ('/api/musicbrainz/', '/api/tmdb/', '/api/metadata/musicbrainz/',
+              '/api/metadata/tmdb/')),
+    (FAST, ('/api/status', '/api/live_status', '/api/drives', '/api/dashboard', '/api/archive',
+            '/api/history', '/api/jobs', '/api/plugins', '/api/metadata/pending',
+            '/api/service/status/', '/api/widgets/', '/health', '/metrics', '/static/')),
+)
+
+# Absolute Deadline (time.monotonic()) des laufenden Requests
+_deadline: ContextVar[Optional[float]] = ContextVar('disk2iso_deadline', default=None)
+
+DEADLINE_EXCEEDED = metrics.register(metrics.Counter(
+    'disk2iso_http_deadline_exceeded_total', 'Requests über dem Zeitbudget ihrer Routen-Klasse',
+    ('route_class',)))
+
+
+def classify(path: str) -> str:
+    """Routen-Klasse eines Request-Pfads."""
+    for route_class, prefixes in ROUTE_CLASSES:
+        if path.startswith(prefixes):
+            return route_class
+    return DEFAULT
+
+
+def budget(route_class: str) -> Optional[float]:
+    """Zeitbudget einer Routen-Klasse in Sekunden (None = unbegrenzt)."""
+    if route_class not in TIMEOUTS:
+        return None
+    key, default = TIMEOUTS[route_class]
+    try:
+        return float(settings_cache.get_value_conf('disk2iso', key, str(default)))
+    except ValueError:
+        return float(default)
+
+
+def remaining() -> Optional[float]:
+    """Verbleibendes Budget des laufenden Requests (None = kein Budget)."""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def clamp(timeout: Optional[float]) -> Optional[float]:
+    """
+    Kürzt einen Timeout auf das verbleibende Request-Budget.
+
+    Returns:
+        min(timeout, Restbudget) - kann <= 0 sein, wenn das Budget
+        bereits abgelaufen ist
+    """
+    left = remaining()
+    if left is None:
+        return timeout
+    return left if timeout is None else min(timeout, left)
+
+
+def _before_request():
+    route_class = classify(request.path)
+    seconds = budget(route_class)
+    request.environ['disk2iso.route_class'] = route_class
+    if seconds is not None:
+        request.environ['disk2iso.deadline_token'] = _deadline.set(time.monotonic() + seconds)
+
+
+def _after_request(response):
+    left = remaining()
+    if left is not None and left < 0:
+        route_class = request.environ.get('disk2iso.route_class', DEFAULT)
+        DEADLINE_EXCEEDED.inc(route_class)
+        print(f"[WARNING] {request.method} {request.path} hat das Zeitbudget ({route_class}) "
+              f"um {-left:.1f}s überschritten", file=sys.stderr)
+    return response
+
+
+def _teardown_request(exc=None):
+    token = request.environ.pop('disk2iso.deadline_token', None)
+    if token is not None:
+        _deadline.reset(token)
+
+
+def init_app(app: Flask):
+    """Registriert die Zeitbudgets für alle Requests."""
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.teardown_request(_teardown_request)
@@ -8,7 +8,10 @@ from flask import Blueprint
 # DEPRECATED: Core Config Blueprint removed (was: from .settings import config_bp)
 # Config is now managed via widget-specific endpoints in routes/widgets/
 
-# MQTT Blueprint wird in routes_mqtt.py definiert
-from .routes_mqtt import mqtt_bp
-
-__all__ = ['mqtt_bp']
+# MQTT Blueprint wird in routes_mqtt.py definiert (nur mit Legacy-MQTT-Modul)
+# Fehlt die Datei, muss routes.widgets trotzdem importierbar bleiben
+try:
+    from .routes_mqtt import mqtt_bp
+    __all__ = ['mqtt_bp']
+except ImportError:
+    __all__ = []
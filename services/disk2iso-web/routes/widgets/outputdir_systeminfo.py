@@ -14,7 +14,7 @@ Beschreibung:
 """
 
 from flask import Blueprint, jsonify
-import subprocess
+import lib_broker
 import json
 import os
 from datetime import datetime
@@ -36,10 +36,7 @@ def get_storage_info():
     Nutzt systeminfo_get_storage_info() aus libsysteminfo.sh
     """
     try:
-        result = subprocess.run(
-            ['bash', '-c', f'source {INSTALL_DIR}/lib/libsysteminfo.sh && source {INSTALL_DIR}/lib/libfolders.sh && systeminfo_get_storage_info'],
-            capture_output=True, text=True, timeout=5
-        )
+        result = lib_broker.call('systeminfo_get_storage_info', timeout=5)
         if result.returncode == 0:
             return json.loads(result.stdout.strip())
         return {}
@@ -7,46 +7,25 @@ import os
 import sys
 from flask import Blueprint, render_template, jsonify
 from i18n import t
+import settings_cache
 
 # Blueprint für Common Settings Widget
 common_settings_bp = Blueprint('common_settings', __name__)
 
 def get_common_settings():
     """
-    Liest Common-Einstellungen via libsettings.sh (BASH)
-    Python = Middleware ONLY - keine direkten File-Zugriffe!
+    Liest Common-Einstellungen aus dem Settings-Cache (Semantik wie libsettings.sh)
+    Schreibzugriffe erfolgen weiterhin ausschließlich via BASH
     """
+    ddrescue_retries = 1
     try:
-        import subprocess
-        
-        script = """
-        source /opt/disk2iso/lib/libsettings.sh
-        settings_get_value_conf "disk2iso" "DDRESCUE_RETRIES" "1"
-        """
-        
-        result = subprocess.run(
-            ['/bin/bash', '-c', script],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        
-        ddrescue_retries = 1
-        if result.returncode == 0 and result.stdout.strip():
-            try:
-                ddrescue_retries = int(result.stdout.strip())
-            except ValueError:
-                pass
-        
-        return {
-            "ddrescue_retries": ddrescue_retries,
-        }
-        
-    except Exception as e:
-        print(f"Fehler beim Lesen der Common-Einstellungen: {e}", file=sys.stderr)
-        return {
-            "ddrescue_retries": 1,
-        }
+        ddrescue_retries = int(settings_cache.get_value_conf("disk2iso", "DDRESCUE_RETRIES", "1"))
+    except ValueError:
+        pass
+    
+    return {
+        "ddrescue_retries": ddrescue_retries,
+    }
 
 
 @common_settings_bp.route('/api/widgets/common/settings')
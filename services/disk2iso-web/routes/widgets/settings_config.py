@@ -14,44 +14,19 @@ import os
 import sys
 from flask import Blueprint, render_template, jsonify, request
 from i18n import t
+import settings_cache
 
 # Blueprint für Config Settings Widget
 settings_config_bp = Blueprint('settings_config', __name__)
 
 def get_config_settings():
     """
-    Liest Config-Einstellungen via libsettings.sh (BASH)
-    Python = Middleware ONLY - keine direkten File-Zugriffe!
+    Liest Config-Einstellungen aus dem Settings-Cache (Semantik wie libsettings.sh)
+    Schreibzugriffe erfolgen weiterhin ausschließlich via BASH
     """
-    try:
-        import subprocess
-        
-        # Rufe libsettings.sh auf (Architektur-konform)
-        script = """
-        source /opt/disk2iso/lib/libsettings.sh
-        settings_get_value_conf "disk2iso" "DEFAULT_OUTPUT_DIR" "/media/iso"
-        """
-        
-        result = subprocess.run(
-            ['/bin/bash', '-c', script],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        
-        output_dir = "/media/iso"  # Default
-        if result.returncode == 0 and result.stdout.strip():
-            output_dir = result.stdout.strip()
-        
-        return {
-            "output_dir": output_dir,
-        }
-        
-    except Exception as e:
-        print(f"Fehler beim Lesen der Config-Einstellungen: {e}", file=sys.stderr)
-        return {
-            "output_dir": "/media/iso",
-        }
+    return {
+        "output_dir": settings_cache.get_value_conf("disk2iso", "DEFAULT_OUTPUT_DIR", "/media/iso"),
+    }
 
 
 @settings_bp.route('/api/widgets/config/settings')
@@ -14,7 +14,7 @@ Beschreibung:
 """
 
 from flask import Blueprint, jsonify
-import subprocess
+import lib_broker
 import json
 import os
 from datetime import datetime
@@ -36,10 +36,7 @@ def get_software_info():
     Nutzt systeminfo_get_software_info() aus libsysteminfo.sh
     """
     try:
-        result = subprocess.run(
-            ['bash', '-c', f'source {INSTALL_DIR}/lib/libsysteminfo.sh && systeminfo_get_software_info'],
-            capture_output=True, text=True, timeout=10
-        )
+        result = lib_broker.call('systeminfo_get_software_info', timeout=10)
         if result.returncode == 0:
             return json.loads(result.stdout.strip())
         return {}
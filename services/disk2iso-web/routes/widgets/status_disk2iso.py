@@ -14,7 +14,8 @@ Beschreibung:
 """
 
 from flask import Blueprint, jsonify
-import subprocess
+import lib_broker
+import service_status
 import json
 import os
 from datetime import datetime
@@ -33,21 +34,10 @@ INSTALL_DIR = os.environ.get('DISK2ISO_INSTALL_DIR', '/opt/disk2iso')
 def get_disk2iso_service_status():
     """
     Ruft Status des disk2iso Service ab
-    Nutzt service_get_status() aus libservice.sh
+    Nutzt service_get_status_all() aus libservice.sh (gebündelt, gecacht)
     """
     try:
-        result = subprocess.run(
-            ['bash', '-c', f'source {INSTALL_DIR}/lib/liblogging.sh && source {INSTALL_DIR}/lib/libfolders.sh && source {INSTALL_DIR}/lib/libsettings.sh && source {INSTALL_DIR}/lib/libservice.sh && service_get_status "disk2iso"'],
-            capture_output=True, text=True, timeout=5
-        )
-        
-        if result.returncode == 0:
-            return json.loads(result.stdout.strip())
-        return {
-            'status': 'unknown',
-            'running': False,
-            'enabled': False
-        }
+        return service_status.get_status('disk2iso')
     except Exception as e:
         print(f"Fehler beim Abrufen des disk2iso Service-Status: {e}")
         return {
@@ -81,10 +71,8 @@ def api_disk2iso_restart():
     Startet disk2iso Service neu
     """
     try:
-        result = subprocess.run(
-            ['bash', '-c', f'source {INSTALL_DIR}/lib/liblogging.sh && source {INSTALL_DIR}/lib/libservice.sh && service_restart "disk2iso"'],
-            capture_output=True, text=True, timeout=10
-        )
+        result = lib_broker.call('service_restart', 'disk2iso', timeout=10)
+        service_status.invalidate('disk2iso')
         
         if result.returncode == 0:
             return jsonify({
@@ -14,7 +14,8 @@ Beschreibung:
 """
 
 from flask import Blueprint, jsonify
-import subprocess
+import lib_broker
+import service_status
 import json
 import os
 from datetime import datetime
@@ -33,21 +34,10 @@ INSTALL_DIR = os.environ.get('DISK2ISO_INSTALL_DIR', '/opt/disk2iso')
 def get_disk2iso_web_service_status():
     """
     Ruft Status des disk2iso-web Service ab
-    Nutzt service_get_status() aus libservice.sh
+    Nutzt service_get_status_all() aus libservice.sh (gebündelt, gecacht)
     """
     try:
-        result = subprocess.run(
-            ['bash', '-c', f'source {INSTALL_DIR}/lib/liblogging.sh && source {INSTALL_DIR}/lib/libfolders.sh && source {INSTALL_DIR}/lib/libsettings.sh && source {INSTALL_DIR}/lib/libservice.sh && service_get_status "disk2iso-web"'],
-            capture_output=True, text=True, timeout=5
-        )
-        
-        if result.returncode == 0:
-            return json.loads(result.stdout.strip())
-        return {
-            'status': 'unknown',
-            'running': False,
-            'enabled': False
-        }
+        return service_status.get_status('disk2iso-web')
     except Exception as e:
         print(f"Fehler beim Abrufen des disk2iso-web Service-Status: {e}")
         return {
@@ -82,10 +72,8 @@ def api_disk2iso_web_restart():
     WARNUNG: Beendet die aktuelle Web-Session!
     """
     try:
-        result = subprocess.run(
-            ['bash', '-c', f'source {INSTALL_DIR}/lib/liblogging.sh && source {INSTALL_DIR}/lib/libservice.sh && service_restart "disk2iso-web"'],
-            capture_output=True, text=True, timeout=10
-        )
+        result = lib_broker.call('service_restart', 'disk2iso-web', timeout=10)
+        service_status.invalidate('disk2iso-web')
         
         if result.returncode == 0:
             return jsonify({
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso Web - Start des Web-Service (Produktionsbetrieb)
+Version 1.3.0
+
+Startet das Web-Interface mit dem besten verfügbaren WSGI-Server:
+
+1. gunicorn (mehrere Worker-Prozesse mit Threads, Konfiguration in
+   gunicorn.conf.py, Graceful Reload per SIGHUP)
+2. waitress (ein Prozess, WEB_WORKERS * WEB_THREADS Threads)
+3. Flask-Entwicklungsserver mit Threads (wie bisher 'python3 app.py')
+
+Gemeinsame Caches (Service-Status, Software-Inventar, Jobs, Archiv-Index)
+liegen in CACHE_DIR (shared_state.py), daher sehen alle Worker denselben
+Zustand.
+"""
+
+import os
+import sys
+import runpy
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+GUNICORN_CONF = os.path.join(HERE, 'gunicorn.conf.py')
+
+
+def _has_module(name: str) -> bool:
+    try:
+        __import__(name)
+    except ImportError:
+        return False
+    return True
+
+
+def main():
+    os.chdir(HERE)
+    if HERE not in sys.path:
+        sys.path.insert(0, HERE)
+
+    if _has_module('gunicorn'):
+        # exec: gunicorn wird Hauptprozess des Service (ExecReload -> SIGHUP)
+        os.execv(sys.executable, [sys.executable, '-m', 'gunicorn',
+                                  '--config', GUNICORN_CONF, 'app:app'])
+
+    # Ohne gunicorn: gleiche Einstellungen, aber nur ein Prozess
+    conf = runpy.run_path(GUNICORN_CONF)
+    host, port = conf['bind'].rsplit(':', 1)
+    threads = conf['workers'] * conf['threads']
+
+    from app import app
+
+    if _has_module('waitress'):
+        import waitress
+        print(f"gunicorn nicht installiert - starte waitress ({threads} Threads)", file=sys.stderr)
+        waitress.serve(app, host=host, port=int(port), threads=threads,
+                       channel_timeout=conf['timeout'])
+    else:
+        print("[WARNING] Weder gunicorn noch waitress installiert - "
+              "starte Flask-Entwicklungsserver", file=sys.stderr)
+        app.run(host=host, port=int(port), debug=False, threaded=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso Service Status - Gebündelter, gecachter systemd-Status
+Version 1.3.0
+
+Fragt alle disk2iso Units mit einem einzigen Aufruf von
+service_get_status_all() aus libservice.sh ab (ein `systemctl show` für
+alle Units) und hält das Ergebnis kurz im Speicher. Widget-Routen,
+Dashboard und Status-Seiten teilen sich so eine Abfrage statt je
+`systemctl list-unit-files` + `systemctl is-active` pro Service.
+
+Der Cache liegt in shared_state, damit sich auch mehrere Web-Worker
+(gunicorn) eine Abfrage teilen; die Neuabfrage läuft unter einer
+Datei-Sperre, sodass nur ein Worker systemctl aufruft.
+
+Nach einem Neustart über die Web-UI wird der Cache per invalidate()
+verworfen, damit der neue Zustand sofort sichtbar ist.
+"""
+
+import re
+import sys
+import json
+import threading
+from typing import Dict, Iterable, Optional
+
+import lib_broker
+import metrics
+import shared_state
+
+
+# Units, die immer gemeinsam abgefragt werden
+SERVICES = ('disk2iso', 'disk2iso-web', 'disk2iso-updater')
+
+# Gültigkeitsdauer des Caches in Sekunden
+STATUS_TTL = 5
+
+# Erlaubte Service-Namen (verhindert Optionen/Pfade als systemctl-Argument)
+_SERVICE_NAME = re.compile(r'^[A-Za-z0-9][A-Za-z0-9@._-]*$')
+
+# Maximale Wartezeit auf einen anderen Worker, der gerade abfragt
+REFRESH_LOCK_TIMEOUT = 6
+
+# Letzter bekannter Status pro Prozess (Fallback bei Fehlern)
+_last: Dict[str, Dict] = {}
+_lock = threading.Lock()
+
+
+def _key(name: str) -> str:
+    return f'service_status:{name}'
+
+
+def _cached(names) -> Dict[str, Optional[Dict]]:
+    store = shared_state.get_store()
+    return {name: store.get(_key(name)) for name in names}
+
+
+def _error_status(message: str) -> Dict:
+    return {'status': 'error', 'running': False, 'enabled': False, 'error': message}
+
+
+def get_statuses(names: Optional[Iterable[str]] = None) -> Dict[str, Dict]:
+    """
+    Liefert den Status mehrerer Services.
+
+    Ist ein angefragter Service nicht mehr frisch, werden er und alle
+    Standard-Units gemeinsam mit einem Aufruf neu abgefragt.
+
+    Args:
+        names: Service-Namen ohne .service (None = SERVICES)
+
+    Returns:
+        Dict Service-Name -> {'status', 'running', 'enabled'}
+
+    Raises:
+        ValueError: Bei ungültigem Service-Namen
+    """
+    names = list(names) if names is not None else list(SERVICES)
+    for name in names:
+        if not _SERVICE_NAME.match(name):
+            raise ValueError(f'Ungültiger Service-Name: {name}')
+
+    with _lock:
+        cached = _cached(names)
+        stale = [name for name in names if cached[name] is None]
+        metrics.record_cache('service_status', not stale)
+        if stale:
+            with shared_state.file_lock('service_status', timeout=REFRESH_LOCK_TIMEOUT):
+                # Ein anderer Worker hat eventuell gerade abgefragt
+                cached = _cached(names)
+                stale = [name for name in names if cached[name] is None]
+                if stale:
+                    query = list(dict.fromkeys(list(SERVICES) + stale))
+                    try:
+                        result = lib_broker.call('service_get_status_all', *query, timeout=5)
+                        if result.returncode != 0:
+                            raise RuntimeError(result.stderr.strip() or 'systemctl nicht verfügbar')
+                        statuses = json.loads(result.stdout.strip())
+                    except Exception as e:
+                        print(f"Fehler beim Abrufen des Service-Status: {e}", file=sys.stderr)
+                        # Fehler nicht cachen - nächste Anfrage versucht es erneut
+                        return {name: dict(_last.get(name) or _error_status(str(e))) for name in names}
+
+                    store = shared_state.get_store()
+                    for name in query:
+                        if name in statuses:
+                            store.set(_key(name), statuses[name], ttl=STATUS_TTL)
+                            cached[name] = statuses[name]
+
+        for name, status in cached.items():
+            if status is not None:
+                _last[name] = status
+        return {name: dict(cached[name] or _error_status('Kein Status')) for name in names}
+
+
+def get_status(name: str) -> Dict:
+    """
+    Liefert den Status eines Services.
+
+    Args:
+        name: Service-Name ohne .service
+
+    Returns:
+        Dict mit 'status' (not_installed|inactive|active|error), 'running'
+        und 'enabled'
+    """
+    return get_statuses([name])[name]
+
+
+def invalidate(name: Optional[str] = None):
+    """Verwirft den gecachten Status (nach Start/Stop/Neustart)."""
+    store = shared_state.get_store()
+    if name is None:
+        store.delete_prefix('service_status:')
+    else:
+        store.delete(_key(name))
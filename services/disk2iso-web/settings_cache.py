@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso Settings Cache - In-Process Parser für .conf und .ini Dateien
+Version 1.3.0
+
+Liest conf/disk2iso.conf und die Modul-INI-Dateien (conf/lib<modul>.ini)
+direkt im Web-Prozess, mit derselben Quoting- und Default-Semantik wie
+settings_get_value_conf() / settings_get_value_ini() aus libsettings.sh.
+
+Geparste Dateien werden im Speicher gehalten und nur neu eingelesen, wenn
+sich mtime, Inode oder Größe der Datei ändern. Schreibzugriffe laufen
+weiterhin über die Bash-Setter (Architektur-Prinzip: BASH = Settings-Logic).
+"""
+
+import os
+import re
+import sys
+import threading
+from typing import Dict, Optional, Tuple
+
+import lib_broker
+import metrics
+import profiling
+
+
+# Pfade (analog zu den Widget-Blueprints überschreibbar per Environment)
+INSTALL_DIR = os.environ.get('DISK2ISO_INSTALL_DIR', '/opt/disk2iso')
+CONF_DIR = os.path.join(INSTALL_DIR, 'conf')
+
+# Bibliotheken die für die Bash-Setter geladen sein müssen
+# (get_module_conf_path/get_module_ini_path -> libfiles.sh -> libfolders.sh)
+_SETTER_LIBS = ('liblogging.sh', 'libfolders.sh', 'libfiles.sh', 'libsettings.sh')
+
+# Cache-Statistik (für Diagnose/Metriken)
+stats = {'hits': 0, 'misses': 0, 'reloads': 0}
+
+
+class _CachedFile:
+    """
+    Hält den geparsten Inhalt einer Settings-Datei im Speicher.
+
+    Die Datei wird bei jedem Zugriff per os.stat() geprüft und nur neu
+    geparst, wenn sich (st_ino, st_mtime_ns, st_size) geändert haben.
+    Damit werden sowohl In-Place-Änderungen (sed -i erzeugt einen neuen
+    Inode) als auch Editor-Speicherungen zuverlässig erkannt.
+    """
+
+    def __init__(self, path: str, parser):
+        self.path = path
+        self._parser = parser
+        self._stamp: Optional[Tuple[int, int, int]] = None
+        self._data = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        """
+        Liefert die geparsten Daten, lädt bei Bedarf neu.
+
+        Returns:
+            Geparste Datenstruktur oder None wenn die Datei fehlt
+        """
+        try:
+            st = os.stat(self.path)
+            stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+        except OSError:
+            # Datei fehlt (noch) - Cache verwerfen, Default-Semantik greift
+            with self._lock:
+                self._stamp = None
+                self._data = None
+            return None
+
+        with self._lock:
+            if stamp == self._stamp:
+                stats['hits'] += 1
+                metrics.record_cache('settings', True)
+                return self._data
+
+            stats['misses'] += 1
+            metrics.record_cache('settings', False)
+            try:
+                with profiling.span('file', os.path.basename(self.path)), \
+                        open(self.path, 'r', encoding='utf-8', errors='replace') as f:
+                    data = self._parser(f.read())
+            except OSError as e:
+                print(f"Fehler beim Lesen von {self.path}: {e}", file=sys.stderr)
+                return self._data
+
+            if self._stamp is not None:
+                stats['reloads'] += 1
+            self._stamp = stamp
+            self._data = data
+            return data
+
+    def invalidate(self):
+        """Verwirft den Cache-Eintrag (nächster Zugriff liest neu)."""
+        with self._lock:
+            self._stamp = None
+            self._data = None
+
+
+def _parse_conf(text: str) -> Dict[str, str]:
+    """
+    Parst eine .conf Datei wie settings_get_value_conf().
+
+    Bash-Logik: sed -n "s/^KEY=\\(.*\\)/\\1/p" | head -1, danach werden
+    umschließende doppelte Quotes entfernt. Es zählt also nur die erste
+    Zeile, die exakt mit KEY= beginnt (kein "readonly", kein Whitespace),
+    und der Rest der Zeile inklusive eventueller Inline-Kommentare.
+
+    Args:
+        text: Dateiinhalt
+
+    Returns:
+        Dict mit KEY -> Wert (erster Treffer gewinnt)
+    """
+    values = {}
+    pattern = re.compile(r'^([A-Za-z_][A-Za-z0-9_]*)=(.*)$')
+
+    for line in text.splitlines():
+        match = pattern.match(line)
+        if not match:
+            continue
+        key, value = match.group(1), match.group(2)
+        if key in values:
+            continue
+        # sed 's/^"\(.*\)"$/\1/' - nur wenn Wert mit Quote beginnt UND endet
+        if len(value) >= 2 and value.startswith('"') and value.endswith('"'):
+            value = value[1:-1]
+        values[key] = value
+
+    return values
+
+
+def _parse_ini(text: str) -> Dict[str, Dict[str, str]]:
+    """
+    Parst eine .ini Datei wie settings_get_value_ini().
+
+    Bash-Logik (awk -F'='): Section-Header muss exakt "[section]" sein,
+    jede Zeile die mit "[" beginnt und "]" enthält beendet die Sektion,
+    Schlüssel werden getrimmt verglichen, der Wert ist das getrimmte
+    zweite Feld (Text bis zum nächsten "="). Erster Treffer gewinnt.
+
+    Args:
+        text: Dateiinhalt
+
+    Returns:
+        Dict mit section -> {key -> Wert}
+    """
+    sections: Dict[str, Dict[str, str]] = {}
+    current = None
+
+    for line in text.splitlines():
+        if line.startswith('[') and ']' in line:
+            # $0 == "[section]" -> nur exakte Header öffnen eine Sektion
+            if line.endswith(']') and line.count('[') == 1:
+                current = sections.setdefault(line[1:-1], {})
+            else:
+                current = None
+            continue
+
+        if current is None or '=' not in line:
+            continue
+
+        fields = line.split('=')
+        key = fields[0].strip()
+        if not key or key in current:
+            continue
+        current[key] = fields[1].strip()
+
+    return sections
+
+
+# Cache-Registry: Pfad -> _CachedFile
+_files: Dict[str, _CachedFile] = {}
+_files_lock = threading.Lock()
+
+
+def _get_cached(path: str, parser) -> _CachedFile:
+    """
+    Liefert (oder erzeugt) den Cache-Eintrag für eine Datei.
+
+    Args:
+        path: Absoluter Pfad zur Datei
+        parser: Parser-Funktion (_parse_conf oder _parse_ini)
+
+    Returns:
+        _CachedFile Instanz
+    """
+    with _files_lock:
+        cached = _files.get(path)
+        if cached is None:
+            cached = _CachedFile(path, parser)
+            _files[path] = cached
+        return cached
+
+
+def get_conf_path(module: str) -> str:
+    """Pfad zur .conf Datei eines Moduls (wie get_module_conf_path)."""
+    return os.path.join(CONF_DIR, f'{module}.conf')
+
+
+def get_ini_path(module: str) -> str:
+    """Pfad zur .ini Datei eines Moduls (wie get_module_ini_path)."""
+    return os.path.join(CONF_DIR, f'lib{module}.ini')
+
+
+def get_value_conf(module: str, key: str, default: str = "") -> str:
+    """
+    Liest einzelnen Wert aus <module>.conf (Ersatz für Bash-Aufruf).
+
+    Leere oder fehlende Werte liefern den Default - wie in
+    settings_get_value_conf(). Das dortige Self-Healing (Default in die
+    Datei schreiben) findet hier bewusst nicht statt, da Python keine
+    Settings schreibt.
+
+    Args:
+        module: Modulname ohne Suffix (z.B. "disk2iso")
+        key: Schlüssel (z.B. "DEFAULT_OUTPUT_DIR")
+        default: Fallback-Wert
+
+    Returns:
+        str: Wert oder Default
+    """
+    data = _get_cached(get_conf_path(module), _parse_conf).get()
+    if not data:
+        return default
+    value = data.get(key, '')
+    return value if value else default
+
+
+def get_value_ini(module: str, section: str, key: str, default: str = "") -> str:
+    """
+    Liest einzelnen Wert aus lib<module>.ini (Ersatz für Bash-Aufruf).
+
+    Args:
+        module: Modulname ohne Suffix (z.B. "audio")
+        section: INI-Sektion (z.B. "module")
+        key: Schlüssel (z.B. "enabled")
+        default: Fallback-Wert
+
+    Returns:
+        str: Wert oder Default
+    """
+    data = _get_cached(get_ini_path(module), _parse_ini).get()
+    if not data:
+        return default
+    value = data.get(section, {}).get(key, '')
+    return value if value else default
+
+
+def _run_setter(function: str, *args: str) -> bool:
+    """
+    Ruft einen Settings-Setter aus libsettings.sh auf.
+
+    Args:
+        function: Bash-Funktionsname (z.B. "settings_set_value_conf")
+        *args: Positionsparameter für die Funktion
+
+    Returns:
+        bool: True bei Erfolg
+    """
+    sources = ' && '.join(f'source {INSTALL_DIR}/lib/{lib}' for lib in _SETTER_LIBS)
+    script = f'{sources} && {function} "$@"'
+
+    try:
+        result = lib_broker.run(
+            ['/bin/bash', '-c', script, '--', *args],
+            label=function,
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        if result.returncode != 0:
+            print(f"Fehler bei {function}: {result.stderr.strip()}", file=sys.stderr)
+        return result.returncode == 0
+    except Exception as e:
+        print(f"Fehler bei {function}: {e}", file=sys.stderr)
+        return False
+
+
+def set_value_conf(module: str, key: str, value: str) -> bool:
+    """
+    Schreibt einzelnen Wert in <module>.conf via settings_set_value_conf.
+
+    Args:
+        module: Modulname ohne Suffix
+        key: Schlüssel
+        value: Neuer Wert (Type-Detection erfolgt in Bash)
+
+    Returns:
+        bool: True bei Erfolg
+    """
+    success = _run_setter('settings_set_value_conf', module, key, str(value))
+    _get_cached(get_conf_path(module), _parse_conf).invalidate()
+    return success
+
+
+def set_value_ini(module: str, section: str, key: str, value: str) -> bool:
+    """
+    Schreibt einzelnen Wert in lib<module>.ini via settings_set_value_ini.
+
+    Args:
+        module: Modulname ohne Suffix
+        section: INI-Sektion
+        key: Schlüssel
+        value: Neuer Wert
+
+    Returns:
+        bool: True bei Erfolg
+    """
+    success = _run_setter('settings_set_value_ini', module, section, key, str(value))
+    _get_cached(get_ini_path(module), _parse_ini).invalidate()
+    return success
+
+
+def clear_cache():
+    """Verwirft alle geparsten Settings-Dateien."""
+    with _files_lock:
+        for cached in _files.values():
+            cached.invalidate()
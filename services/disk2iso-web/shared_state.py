@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso Shared State - Gemeinsamer Zustand mehrerer Web-Worker
+Version 1.3.0
+
+Im Produktionsbetrieb (gunicorn, siehe serve.py) laufen mehrere
+Worker-Prozesse. Damit Caches und Jobs nicht pro Worker doppelt existieren,
+liegen sie hier prozessübergreifend:
+
+- SharedStore: Key/Value-Tabelle (JSON) mit Ablaufzeit in SQLite
+  (CACHE_DIR/shared_state.db, WAL) - z.B. Service-Status,
+  Software-Inventar, Job-Zustände
+- try_lock()/file_lock(): flock()-Sperren in CACHE_DIR/locks, z.B. damit
+  nur ein Worker den Archiv-Index pflegt oder einen Cache neu befüllt
+
+flock() gilt pro geöffneter Datei, die Sperren wirken also auch zwischen
+Threads desselben Prozesses. Sie verschwinden automatisch mit dem Prozess.
+"""
+
+import os
+import json
+import time
+import fcntl
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, List, Optional, Tuple
+
+# Pfade (analog zu archive_index.py)
+INSTALL_DIR = os.environ.get('DISK2ISO_INSTALL_DIR', '/opt/disk2iso')
+CACHE_DIR = os.environ.get('DISK2ISO_CACHE_DIR', os.path.join(INSTALL_DIR, 'cache'))
+DB_PATH = os.path.join(CACHE_DIR, 'shared_state.db')
+LOCK_DIR = os.path.join(CACHE_DIR, 'locks')
+
+# Abgelaufene Einträge werden höchstens so oft entfernt (Sekunden)
+PURGE_INTERVAL = 60
+
+# Wartezeit zwischen zwei Versuchen bei blockierenden Sperren
+LOCK_POLL = 0.05
+
+
+class SharedStore:
+    """JSON Key/Value-Speicher mit Ablaufzeit, gemeinsam für alle Worker."""
+
+    def __init__(self, db_path: str = DB_PATH):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._purged = 0.0
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        with self._conn() as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS kv (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    updated REAL NOT NULL,
+                    expires REAL
+                )
+            ''')
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Liest einen Wert (abgelaufene Einträge liefern den Default)."""
+        entry = self.get_entry(key)
+        return default if entry is None else entry[0]
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Liest Wert und Schreibzeitpunkt (Unix-Zeit) oder None."""
+        row = self._conn().execute(
+            'SELECT value, updated, expires FROM kv WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None or (row[2] is not None and row[2] < time.time()):
+            return None
+        return json.loads(row[0]), row[1]
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Speichert einen Wert (ttl=None: ohne Ablauf)."""
+        now = time.time()
+        expires = now + ttl if ttl is not None else None
+        data = json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+        with self._conn() as conn:
+            conn.execute('INSERT OR REPLACE INTO kv (key, value, updated, expires) VALUES (?, ?, ?, ?)',
+                         (key, data, now, expires))
+            if now - self._purged > PURGE_INTERVAL:
+                self._purged = now
+                conn.execute('DELETE FROM kv WHERE expires IS NOT NULL AND expires < ?', (now,))
+
+    def delete(self, key: str):
+        with self._conn() as conn:
+            conn.execute('DELETE FROM kv WHERE key = ?', (key,))
+
+    def delete_prefix(self, prefix: str):
+        with self._conn() as conn:
+            conn.execute("DELETE FROM kv WHERE key >= ? AND key < ?", (prefix, prefix + '\uffff'))
+
+    def items(self, prefix: str) -> List[Tuple[str, Any]]:
+        """Alle gültigen Einträge mit Schlüssel-Präfix."""
+        rows = self._conn().execute(
+            'SELECT key, value FROM kv WHERE key >= ? AND key < ? AND (expires IS NULL OR expires >= ?)',
+            (prefix, prefix + '\uffff', time.time())
+        ).fetchall()
+        return [(key, json.loads(value)) for key, value in rows]
+
+
+def _lock_path(name: str) -> str:
+    os.makedirs(LOCK_DIR, exist_ok=True)
+    return os.path.join(LOCK_DIR, f'{name}.lock')
+
+
+def try_lock(name: str) -> Optional[int]:
+    """
+    Versucht eine benannte Sperre ohne Warten zu bekommen.
+
+    Returns:
+        Dateideskriptor (für release()) oder None wenn bereits gesperrt
+    """
+    fd = os.open(_lock_path(name), os.O_RDWR | os.O_CREAT | os.O_CLOEXEC, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    return fd
+
+
+def release(fd: Optional[int]):
+    """Gibt eine mit try_lock() erhaltene Sperre frei."""
+    if fd is None:
+        return
+    try:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def file_lock(name: str, timeout: Optional[float] = None):
+    """
+    Wartet auf eine benannte Sperre (z.B. um einen Cache nur einmal neu
+    zu befüllen, während die anderen Worker warten).
+
+    Yields:
+        True wenn die Sperre gehalten wird, False nach Timeout
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    fd = try_lock(name)
+    while fd is None and (deadline is None or time.monotonic() < deadline):
+        time.sleep(LOCK_POLL)
+        fd = try_lock(name)
+    try:
+        yield fd is not None
+    finally:
+        release(fd)
+
+
+def pid_alive(pid: Optional[int]) -> bool:
+    """Prüft ob ein (Worker-)Prozess noch existiert."""
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+_store: Optional[SharedStore] = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> SharedStore:
+    """Liefert den gemeinsamen Speicher (lazy erzeugt)."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = SharedStore()
+        return _store
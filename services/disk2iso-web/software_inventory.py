@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso Software Inventory - Gebündelte, gecachte Versionsabfrage
+Version 1.3.0
+
+Die Software-Übersicht hat bisher pro Paket 'dpkg -s', 'apt-cache policy'
+und oft '<tool> --version' nacheinander gestartet (~36 Prozesse). Das
+Inventar fragt stattdessen:
+
+- alle installierten Versionen mit einem 'dpkg-query -W'
+- alle Candidate-Versionen mit einem 'apt-cache policy pkg1 pkg2 ...'
+- verbleibende '--version' Proben parallel (ThreadPoolExecutor)
+
+Das Ergebnis bleibt gültig, bis sich /var/lib/dpkg/status oder die
+apt-Listen ändern (mtime/Größe). Es liegt zusätzlich in shared_state,
+sodass mehrere Web-Worker das Inventar nur einmal erfassen.
+"""
+
+import os
+import re
+import sys
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+import lib_broker
+import metrics
+import shared_state
+
+# Dateien, deren Änderung das Inventar ungültig macht
+DPKG_STATUS = '/var/lib/dpkg/status'
+APT_LISTS_DIR = '/var/lib/apt/lists'
+APT_PKGCACHE = '/var/cache/apt/pkgcache.bin'
+
+# Maximale Anzahl paralleler '--version' Proben
+MAX_PROBE_WORKERS = 6
+
+PROBE_TIMEOUT = 3
+QUERY_TIMEOUT = 10
+
+UNKNOWN = 'Unbekannt'
+
+SHARED_KEY = 'software_inventory'
+
+# Software der Systeminfo-Seite (Anzeige-Reihenfolge)
+SOFTWARE = [
+    # Audio-CD Tools
+    {'name': 'cdparanoia', 'display_name': 'cdparanoia', 'package': 'cdparanoia',
+     'version_cmd': ['cdparanoia', '--version']},
+    {'name': 'abcde', 'display_name': 'abcde', 'package': 'abcde',
+     'version_cmd': ['abcde', '-v']},
+    {'name': 'lame', 'display_name': 'LAME MP3 Encoder', 'package': 'lame',
+     'version_cmd': ['lame', '--version']},
+    {'name': 'flac', 'display_name': 'FLAC', 'package': 'flac',
+     'version_cmd': ['flac', '--version']},
+    {'name': 'vorbis-tools', 'display_name': 'Vorbis Tools', 'package': 'vorbis-tools',
+     'version_cmd': None},  # Package version only
+    # DVD/Blu-ray Tools
+    {'name': 'makemkv', 'display_name': 'MakeMKV', 'package': 'makemkv-bin',
+     'version_cmd': ['makemkvcon', '--version']},
+    {'name': 'dvdbackup', 'display_name': 'dvdbackup', 'package': 'dvdbackup',
+     'version_cmd': None},
+    {'name': 'libbluray', 'display_name': 'libbluray', 'package': 'libbluray2',
+     'version_cmd': None},
+    # System Tools
+    {'name': 'ddrescue', 'display_name': 'GNU ddrescue', 'package': 'gddrescue',
+     'version_cmd': ['ddrescue', '--version']},
+    {'name': 'wodim', 'display_name': 'wodim', 'package': 'wodim',
+     'version_cmd': ['wodim', '--version']},
+    {'name': 'genisoimage', 'display_name': 'genisoimage', 'package': 'genisoimage',
+     'version_cmd': ['genisoimage', '--version']},
+    {'name': 'isoinfo', 'display_name': 'isoinfo', 'package': 'genisoimage',
+     'version_cmd': ['isoinfo', '--version']},
+]
+
+_VERSION = re.compile(r'(\d+\.[\d.]+)')
+
+# Subprozesse mit festem PATH (Web-Service läuft mit minimalem Environment)
+_ENV = {**os.environ, 'PATH': '/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin', 'LC_ALL': 'C'}
+
+
+def short_version(version: str) -> str:
+    """Kürzt Debian-Versionsnummern (1:2.3.4-1+deb12u1 -> 1:2.3.4)."""
+    if '-' in version:
+        version = version.split('-')[0]
+    if '+' in version:
+        version = version.split('+')[0]
+    return version
+
+
+def _run(cmd: Sequence[str], timeout: float) -> Optional[subprocess.CompletedProcess]:
+    try:
+        return lib_broker.run(cmd, capture_output=True, text=True, timeout=timeout, env=_ENV)
+    except FileNotFoundError:
+        # Tool nicht installiert
+        return None
+    except (OSError, subprocess.TimeoutExpired) as e:
+        print(f"Software-Inventar: {cmd[0]} fehlgeschlagen: {e}", file=sys.stderr)
+        return None
+
+
+def query_installed(packages: Sequence[str]) -> Dict[str, str]:
+    """
+    Installierte Versionen aller Pakete mit einem dpkg-query Aufruf.
+
+    Returns:
+        Dict Paket -> Version (nur installierte Pakete)
+    """
+    if not packages:
+        return {}
+    # Exit-Code 1 bei unbekannten Paketen - bekannte stehen trotzdem in stdout
+    result = _run(['dpkg-query', '-W', '-f=${Package}\t${Status}\t${Version}\n', *packages], QUERY_TIMEOUT)
+    if result is None:
+        return {}
+    installed = {}
+    for line in result.stdout.splitlines():
+        parts = line.split('\t')
+        if len(parts) == 3 and parts[1].endswith(' installed') and parts[2]:
+            installed[parts[0].split(':')[0]] = parts[2]
+    return installed
+
+
+def query_candidates(packages: Sequence[str]) -> Dict[str, str]:
+    """
+    Candidate-Versionen aller Pakete mit einem apt-cache policy Aufruf.
+
+    Returns:
+        Dict Paket -> Candidate-Version (ohne '(none)')
+    """
+    if not packages:
+        return {}
+    result = _run(['apt-cache', 'policy', *packages], QUERY_TIMEOUT)
+    if result is None:
+        return {}
+    candidates = {}
+    package = None
+    for line in result.stdout.splitlines():
+        if line and not line[0].isspace() and line.endswith(':'):
+            package = line[:-1].split(':')[0]
+        elif package and line.strip().startswith('Candidate:'):
+            version = line.split(':', 1)[1].strip()
+            if version and version != '(none)':
+                candidates[package] = version
+    return candidates
+
+
+def probe_version(cmd: Sequence[str]) -> Optional[str]:
+    """Version aus '<tool> --version' (None = Tool nicht vorhanden)."""
+    result = _run(cmd, PROBE_TIMEOUT)
+    if result is None:
+        return None
+    match = _VERSION.search(result.stdout + result.stderr)
+    return match.group(1) if match else 'Installiert'
+
+
+def _stamp() -> List:
+    """Änderungsstand von dpkg-Status und apt-Listen (JSON-tauglich)."""
+    stamp = []
+    for path in (DPKG_STATUS, APT_LISTS_DIR, APT_PKGCACHE):
+        try:
+            st = os.stat(path)
+            stamp.append([st.st_mtime_ns, st.st_size, st.st_ino])
+        except OSError:
+            stamp.append(None)
+    return stamp
+
+
+class Inventory:
+    """Gecachtes Versions-Inventar, invalidiert über dpkg/apt-Änderungen."""
+
+    def __init__(self, software: Sequence[Dict] = SOFTWARE):
+        self.software = list(software)
+        self._lock = threading.Lock()
+        self._stamp: Optional[List] = None
+        self._result: Optional[List[Dict]] = None
+
+    def _collect(self) -> List[Dict]:
+        packages = sorted({s['package'] for s in self.software if s.get('package')})
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            installed_future = pool.submit(query_installed, packages)
+            candidates_future = pool.submit(query_candidates, packages)
+            installed = installed_future.result()
+            candidates = candidates_future.result()
+
+        # Nur Software ohne installiertes Paket per '--version' prüfen
+        probes = {s['name']: s['version_cmd'] for s in self.software
+                  if s.get('version_cmd') and s.get('package') not in installed}
+        probed = {}
+        if probes:
+            with ThreadPoolExecutor(max_workers=min(MAX_PROBE_WORKERS, len(probes))) as pool:
+                futures = {name: pool.submit(probe_version, cmd) for name, cmd in probes.items()}
+                probed = {name: future.result() for name, future in futures.items()}
+
+        results = []
+        for soft in self.software:
+            package = soft.get('package')
+            installed_version = short_version(installed[package]) if package in installed else probed.get(soft['name'])
+            available_version = short_version(candidates[package]) if package in candidates else UNKNOWN
+            update_available = bool(installed_version and available_version != UNKNOWN
+                                    and installed_version != available_version)
+            results.append({
+                'name': soft['name'],
+                'display_name': soft['display_name'],
+                'installed_version': installed_version,
+                'available_version': available_version,
+                'update_available': update_available
+            })
+        return results
+
+    def get(self) -> List[Dict]:
+        """Liefert das Inventar (neu erfasst nur nach dpkg/apt-Änderungen)."""
+        stamp = _stamp()
+        with self._lock:
+            hit = self._result is not None and stamp == self._stamp
+            if not hit:
+                hit = self._load_shared(stamp)
+            metrics.record_cache('software_inventory', hit)
+            if not hit:
+                # Nur ein Worker erfasst, die anderen übernehmen sein Ergebnis
+                with shared_state.file_lock(SHARED_KEY, timeout=QUERY_TIMEOUT * 2):
+                    if not self._load_shared(stamp):
+                        self._result = self._collect()
+                        self._stamp = stamp
+                        shared_state.get_store().set(SHARED_KEY, {'stamp': stamp, 'result': self._result})
+            return [dict(entry) for entry in self._result]
+
+    def _load_shared(self, stamp: List) -> bool:
+        entry = shared_state.get_store().get(SHARED_KEY)
+        if not entry or entry.get('stamp') != stamp:
+            return False
+        self._result = entry['result']
+        self._stamp = stamp
+        return True
+
+    def invalidate(self):
+        """Verwirft das Inventar (z.B. nach einer Installation)."""
+        with self._lock:
+            self._result = None
+            shared_state.get_store().delete(SHARED_KEY)
+
+
+_inventory: Optional[Inventory] = None
+_inventory_lock = threading.Lock()
+
+
+def get_inventory() -> Inventory:
+    """Liefert das Software-Inventar des Prozesses (lazy erzeugt)."""
+    global _inventory
+    with _inventory_lock:
+        if _inventory is None:
+            _inventory = Inventory()
+        return _inventory
@@ -40,8 +40,9 @@ function createFileItem(file) {
     // Cover Section
     let coverHTML = '';
     if (file.metadata && file.thumbnail) {
-        const thumbUrl = `/api/archive/thumbnail/${file.thumbnail}`;
-        coverHTML = `<img src="${thumbUrl}" alt="Cover" onerror="this.style.display='none'; this.parentElement.innerHTML=getPlaceholderSVG('${mediaType}');">`;
+        // thumbnail_url enthält den Content-Hash (?v=...) und ist dauerhaft cachebar
+        const thumbUrl = file.thumbnail_url || `/api/archive/thumbnail/${file.thumbnail}`;
+        coverHTML = `<img src="${thumbUrl}" alt="Cover" loading="lazy" onerror="this.style.display='none'; this.parentElement.innerHTML=getPlaceholderSVG('${mediaType}');">`;
     } else {
         coverHTML = getPlaceholderSVG(mediaType);
     }
@@ -150,80 +151,86 @@ function getPlaceholderSVG(type) {
     return svgs[type] || svgs['data'];
 }
 
-function loadArchive() {
-    fetch('/api/archive')
-        .then(response => response.json())
-        .then(data => {
-            // Update counts
-            document.getElementById('total-count').textContent = data.total;
-            document.getElementById('audio-count').textContent = data.by_type.audio.length;
-            document.getElementById('dvd-count').textContent = data.by_type.dvd.length;
-            document.getElementById('bluray-count').textContent = data.by_type.bluray.length;
-            document.getElementById('data-count').textContent = data.by_type.data.length;
-
-            // Populate Audio section
-            const audioSection = document.getElementById('audio-section');
-            const audioList = document.getElementById('audio-list');
-            if (data.by_type.audio.length > 0) {
-                audioSection.style.display = 'block';
-                audioList.innerHTML = '';
-                data.by_type.audio.forEach(file => {
-                    audioList.appendChild(createFileItem(file));
-                });
-            } else {
-                audioSection.style.display = 'none';
-            }
+// Archiv wird pro Typ seitenweise geladen (Keyset-Pagination via next_cursor)
+const ARCHIVE_TYPES = ['audio', 'dvd', 'bluray', 'data'];
+const ARCHIVE_PAGE_SIZE = 48;
+const archiveState = {};
 
-            // Populate DVD section
-            const dvdSection = document.getElementById('dvd-section');
-            const dvdList = document.getElementById('dvd-list');
-            if (data.by_type.dvd.length > 0) {
-                dvdSection.style.display = 'block';
-                dvdList.innerHTML = '';
-                data.by_type.dvd.forEach(file => {
-                    dvdList.appendChild(createFileItem(file));
-                });
-            } else {
-                dvdSection.style.display = 'none';
+function updateArchiveCounts(counts) {
+    let total = 0;
+    ARCHIVE_TYPES.forEach(type => {
+        const count = counts[type] || 0;
+        total += count;
+        document.getElementById(`${type}-count`).textContent = count;
+    });
+    document.getElementById('total-count').textContent = total;
+}
+
+function loadArchiveSection(type, append) {
+    const state = archiveState[type] || (archiveState[type] = { etag: null, cursor: null });
+    const params = new URLSearchParams({ type: type, limit: ARCHIVE_PAGE_SIZE });
+    if (append && state.cursor) {
+        params.set('cursor', state.cursor);
+    }
+
+    return fetch(`/api/archive?${params}`)
+        .then(response => {
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}`);
             }
+            // Unverändertes Archiv (Server antwortet 304) -> nicht neu rendern
+            const etag = response.headers.get('ETag');
+            if (!append && etag && etag === state.etag) {
+                return null;
+            }
+            if (!append) {
+                state.etag = etag;
+            }
+            return response.json();
+        })
+        .then(data => {
+            if (!data) return;
 
-            // Populate Blu-ray section
-            const bluraySection = document.getElementById('bluray-section');
-            const blurayList = document.getElementById('bluray-list');
-            if (data.by_type.bluray.length > 0) {
-                bluraySection.style.display = 'block';
-                blurayList.innerHTML = '';
-                data.by_type.bluray.forEach(file => {
-                    blurayList.appendChild(createFileItem(file));
-                });
-            } else {
-                bluraySection.style.display = 'none';
+            updateArchiveCounts(data.counts);
+
+            const section = document.getElementById(`${type}-section`);
+            const list = document.getElementById(`${type}-list`);
+            if (!append) {
+                list.innerHTML = '';
+            }
+            const oldButton = list.querySelector('.archive-load-more');
+            if (oldButton) {
+                oldButton.remove();
             }
 
-            // Populate Data section
-            const dataSection = document.getElementById('data-section');
-            const dataList = document.getElementById('data-list');
-            if (data.by_type.data.length > 0) {
-                dataSection.style.display = 'block';
-                dataList.innerHTML = '';
-                data.by_type.data.forEach(file => {
-                    dataList.appendChild(createFileItem(file));
-                });
-            } else {
-                dataSection.style.display = 'none';
+            data.items.forEach(file => {
+                list.appendChild(createFileItem(file));
+            });
+            state.cursor = data.next_cursor;
+
+            if (data.next_cursor) {
+                const button = document.createElement('button');
+                button.className = 'btn archive-load-more col-6';
+                button.textContent = 'Mehr laden';
+                button.onclick = () => loadArchiveSection(type, true);
+                list.appendChild(button);
             }
+
+            section.style.display = list.children.length > 0 ? 'block' : 'none';
         })
         .catch(error => {
             console.error('Fehler beim Laden des Archivs:', error);
-            ['audio', 'dvd', 'bluray', 'data'].forEach(type => {
-                const list = document.getElementById(`${type}-list`);
-                if (list) {
-                    list.innerHTML = '<p class="error">Fehler beim Laden der Daten</p>';
-                }
-            });
+            const list = document.getElementById(`${type}-list`);
+            if (list) {
+                list.innerHTML = '<p class="error">Fehler beim Laden der Daten</p>';
+            }
         });
 }
 
+function loadArchive() {
+    ARCHIVE_TYPES.forEach(type => loadArchiveSection(type, false));
+}
+
 function escapeHtml(text) {
     const div = document.createElement('div');
     div.textContent = text;
@@ -573,10 +580,11 @@ function displayTMDBResults(results, mediaType) {
         `;
         
         // Nutze local_poster falls vorhanden (gecachtes Bild), sonst poster_url
+        // (Download lief bei der Suche noch - Server liefert es nach, lazy geladen)
         const posterSrc = item.local_poster ? `/api/archive/thumbnail/${item.local_poster}` : (item.poster_url || null);
         
         itemDiv.innerHTML = `
-            ${posterSrc ? `<img src="${posterSrc}" alt="Poster" style="width: 80px; height: 120px; object-fit: cover; border-radius: 4px; flex-shrink: 0;">` : '<div style="width: 80px; height: 120px; background: #f0f0f0; border-radius: 4px; flex-shrink: 0; display: flex; align-items: center; justify-content: center; font-size: 40px;">🎬</div>'}
+            ${posterSrc ? `<img src="${posterSrc}" alt="Poster" loading="lazy" style="width: 80px; height: 120px; object-fit: cover; border-radius: 4px; flex-shrink: 0;">` : '<div style="width: 80px; height: 120px; background: #f0f0f0; border-radius: 4px; flex-shrink: 0; display: flex; align-items: center; justify-content: center; font-size: 40px;">🎬</div>'}
             <div style="flex: 1; min-width: 0;">
                 <div style="font-size: 16px; font-weight: bold; margin-bottom: 5px; color: #333;">${escapeHtml(item.title)}</div>
                 <div style="font-size: 14px; color: #666; margin-bottom: 5px;">📅 ${item.year || 'Jahr unbekannt'}</div>
@@ -634,11 +642,9 @@ function applyMusicBrainzMetadata(releaseId) {
     .then(res => res.json())
     .then(data => {
         if (data.success) {
-            resultsDiv.innerHTML = '<p class="success">✅ Metadaten erfolgreich hinzugefügt! ISO wurde neu erstellt.</p>';
-            setTimeout(() => {
-                closeMetadataModal();
-                loadArchive();
-            }, 2000);
+            followMetadataJob(data.job_id, resultsDiv,
+                '🎵 Erstelle ISO mit korrekten Tags... (2-5 Minuten)',
+                '✅ Metadaten erfolgreich hinzugefügt! ISO wurde neu erstellt.');
         } else {
             resultsDiv.innerHTML = `<p class="error">❌ ${data.message}</p>`;
         }
@@ -666,13 +672,60 @@ function applyTMDBMetadata(tmdbId, title, mediaType) {
     .then(res => res.json())
     .then(data => {
         if (data.success) {
-            resultsDiv.innerHTML = '<p class="success">✅ Metadaten erfolgreich hinzugefügt!</p>';
+            followMetadataJob(data.job_id, resultsDiv,
+                '🎬 Erstelle Metadaten...',
+                '✅ Metadaten erfolgreich hinzugefügt!');
+        } else {
+            resultsDiv.innerHTML = `<p class="error">❌ ${data.message}</p>`;
+        }
+    })
+    .catch(err => {
+        resultsDiv.innerHTML = `<p class="error">❌ Fehler: ${err.message}</p>`;
+    });
+}
+
+/**
+ * Verfolgt einen Metadaten-Job (Remaster/TMDB) mit Fortschritt und Abbruch.
+ * Der Job läuft serverseitig weiter, auch wenn das Modal geschlossen wird.
+ */
+function followMetadataJob(jobId, resultsDiv, runningText, successText) {
+    resultsDiv.innerHTML = `
+        <p>${runningText}</p>
+        <p class="job-status" style="font-size: 0.9em; color: #666;"></p>
+        <button class="btn btn-secondary btn-cancel-job">Abbrechen</button>
+    `;
+    const statusEl = resultsDiv.querySelector('.job-status');
+    const cancelBtn = resultsDiv.querySelector('.btn-cancel-job');
+    let lastLine = '';
+    
+    cancelBtn.addEventListener('click', () => {
+        cancelBtn.disabled = true;
+        window.disk2isoJobs.cancel(jobId);
+    });
+    
+    window.disk2isoJobs.watch(jobId, {
+        key: 'metadata',
+        onOutput: lines => {
+            lastLine = lines[lines.length - 1];
+        },
+        onUpdate: job => {
+            const state = job.state === 'queued' ? '⏳ Wartet auf freien Slot' : '⚙️ Läuft';
+            const progress = job.progress !== null ? ` (${Math.round(job.progress)}%)` : '';
+            statusEl.textContent = `${state}${progress}${lastLine ? ' – ' + lastLine : ''}`;
+        }
+    })
+    .then(job => {
+        if (job.state === 'succeeded') {
+            resultsDiv.innerHTML = `<p class="success">${successText}</p>`;
             setTimeout(() => {
                 closeMetadataModal();
                 loadArchive();
             }, 2000);
         } else {
-            resultsDiv.innerHTML = `<p class="error">❌ ${data.message}</p>`;
+            resultsDiv.innerHTML = '<p class="error"></p>';
+            resultsDiv.firstChild.textContent = job.state === 'cancelled'
+                ? '❌ Abgebrochen'
+                : `❌ ${job.error || 'Unbekannter Fehler'}`;
         }
     })
     .catch(err => {
@@ -715,6 +768,12 @@ function downloadISO(isoPath) {
 document.addEventListener('DOMContentLoaded', function() {
     loadArchive();
     
+    // Nach Reload: laufenden Metadaten-Job weiter verfolgen
+    const pendingJob = window.disk2isoJobs && window.disk2isoJobs.resume('metadata');
+    if (pendingJob) {
+        pendingJob.then(() => loadArchive()).catch(() => {});
+    }
+    
     // Refresh every 60 seconds
     setInterval(loadArchive, 60000);
 });
@@ -0,0 +1,81 @@
+/**
+ * disk2iso - Server-Sent Events Client
+ * Version: 1.3.0
+ *
+ * Gemeinsame EventSource-Verbindung zu /api/events für alle Widgets.
+ * Solange die Verbindung steht, wird nicht gepollt. Ist SSE nicht
+ * verfügbar oder die Verbindung unterbrochen, laufen die übergebenen
+ * Fallback-Funktionen im angegebenen Intervall.
+ */
+
+window.disk2isoEvents = (function() {
+    const subscriptions = [];
+    let source = null;
+    let connected = false;
+
+    function startFallback(sub) {
+        if (sub.fallback && !sub.timer) {
+            sub.timer = setInterval(sub.fallback, sub.interval);
+        }
+    }
+
+    function stopFallback(sub) {
+        if (sub.timer) {
+            clearInterval(sub.timer);
+            sub.timer = null;
+        }
+    }
+
+    function connect() {
+        if (source || !window.EventSource) return;
+
+        source = new EventSource('/api/events');
+
+        source.addEventListener('open', () => {
+            connected = true;
+            subscriptions.forEach(stopFallback);
+        });
+
+        source.addEventListener('error', () => {
+            // EventSource verbindet sich selbst neu, bis dahin pollen
+            connected = false;
+            subscriptions.forEach(startFallback);
+        });
+    }
+
+    /**
+     * Abonniert einen Event-Typ.
+     *
+     * @param {string} type - Event-Typ (status, history, musicbrainz, tmdb, archive)
+     * @param {Function} handler - Wird mit dem geparsten Payload aufgerufen
+     * @param {Function} [fallback] - Polling-Funktion ohne SSE-Verbindung
+     * @param {number} [interval] - Polling-Intervall in ms
+     */
+    function subscribe(type, handler, fallback, interval) {
+        const sub = { type: type, fallback: fallback, interval: interval || 5000, timer: null };
+        subscriptions.push(sub);
+
+        if (!window.EventSource) {
+            startFallback(sub);
+            return;
+        }
+
+        connect();
+        source.addEventListener(type, (event) => {
+            try {
+                handler(JSON.parse(event.data));
+            } catch (error) {
+                console.error(`Fehler beim Verarbeiten von Event '${type}':`, error);
+            }
+        });
+
+        if (!connected && source.readyState !== EventSource.CONNECTING) {
+            startFallback(sub);
+        }
+    }
+
+    return {
+        subscribe: subscribe,
+        isConnected: () => connected
+    };
+})();
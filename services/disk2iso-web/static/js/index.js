@@ -10,7 +10,13 @@ document.addEventListener('DOMContentLoaded', function() {
     // MusicBrainz/TMDB Metadata-Auswahl prüfen (für BEFORE Copy Strategy)
     if (typeof checkMusicBrainzStatus === 'function') {
         checkMusicBrainzStatus();
-        setInterval(checkMusicBrainzStatus, 3000); // Alle 3 Sekunden prüfen
+        if (window.disk2isoEvents) {
+            // Nur bei Änderung der Auswahl-Dateien prüfen, Polling nur ohne SSE
+            window.disk2isoEvents.subscribe('musicbrainz', checkMusicBrainzStatus, checkMusicBrainzStatus, 3000);
+            window.disk2isoEvents.subscribe('tmdb', checkMusicBrainzStatus);
+        } else {
+            setInterval(checkMusicBrainzStatus, 3000); // Alle 3 Sekunden prüfen
+        }
     }
 });
 
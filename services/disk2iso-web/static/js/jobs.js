@@ -0,0 +1,117 @@
+/**
+ * disk2iso - Hintergrund-Jobs Client
+ * Version: 1.3.0
+ *
+ * Verfolgt Jobs über /api/jobs/<id> (Status, Fortschritt, Ausgabe) und
+ * merkt sich laufende Jobs im localStorage, damit sie nach einem
+ * Browser-Reload wieder aufgenommen werden können.
+ */
+
+window.disk2isoJobs = (function() {
+    const STORAGE_PREFIX = 'disk2iso.job.';
+    const POLL_INTERVAL = 1500;
+
+    function remember(key, jobId) {
+        try {
+            localStorage.setItem(STORAGE_PREFIX + key, jobId);
+        } catch (error) {
+            // localStorage nicht verfügbar (z.B. privater Modus)
+        }
+    }
+
+    function forget(key) {
+        try {
+            localStorage.removeItem(STORAGE_PREFIX + key);
+        } catch (error) {
+            // ignorieren
+        }
+    }
+
+    function stored(key) {
+        try {
+            return localStorage.getItem(STORAGE_PREFIX + key);
+        } catch (error) {
+            return null;
+        }
+    }
+
+    /**
+     * Verfolgt einen Job bis zum Ende.
+     *
+     * @param {string} jobId - ID aus der Antwort der startenden Route
+     * @param {object} [handlers]
+     * @param {Function} [handlers.onUpdate] - Erhält das Job-Objekt bei jedem Abruf
+     * @param {Function} [handlers.onOutput] - Erhält neue Ausgabezeilen (Array)
+     * @param {string} [handlers.key] - localStorage-Schlüssel (Reload-Wiederaufnahme)
+     * @returns {Promise<object>} Resolved mit dem beendeten Job
+     */
+    function watch(jobId, handlers = {}) {
+        let since = 0;
+
+        if (handlers.key) {
+            remember(handlers.key, jobId);
+        }
+
+        return new Promise((resolve, reject) => {
+            function poll() {
+                fetch(`/api/jobs/${encodeURIComponent(jobId)}?since=${since}`)
+                    .then(response => response.json())
+                    .then(data => {
+                        if (!data.success) {
+                            if (handlers.key) forget(handlers.key);
+                            reject(new Error(data.message || 'Job nicht gefunden'));
+                            return;
+                        }
+
+                        const job = data.job;
+                        since = job.output_next;
+                        if (handlers.onOutput && job.output.length > 0) {
+                            handlers.onOutput(job.output);
+                        }
+                        if (handlers.onUpdate) {
+                            handlers.onUpdate(job);
+                        }
+
+                        if (job.done) {
+                            if (handlers.key) forget(handlers.key);
+                            resolve(job);
+                        } else {
+                            setTimeout(poll, POLL_INTERVAL);
+                        }
+                    })
+                    .catch(() => {
+                        // Server kurz nicht erreichbar - weiter versuchen
+                        setTimeout(poll, POLL_INTERVAL * 2);
+                    });
+            }
+
+            poll();
+        });
+    }
+
+    /**
+     * Nimmt einen gemerkten Job nach einem Reload wieder auf.
+     *
+     * @param {string} key - localStorage-Schlüssel
+     * @param {object} [handlers] - wie bei watch()
+     * @returns {Promise<object>|null} null wenn kein Job gemerkt ist
+     */
+    function resume(key, handlers = {}) {
+        const jobId = stored(key);
+        if (!jobId) {
+            return null;
+        }
+        return watch(jobId, { ...handlers, key: key });
+    }
+
+    function cancel(jobId) {
+        return fetch(`/api/jobs/${encodeURIComponent(jobId)}/cancel`, { method: 'POST' })
+            .then(response => response.json());
+    }
+
+    return {
+        watch: watch,
+        resume: resume,
+        cancel: cancel
+    };
+})();
@@ -1,10 +1,14 @@
 /**
  * disk2iso - Logs Page JavaScript
- * Version: 1.2.0
+ * Version: 1.3.0
  */
 
 let autoRefreshInterval = null;
 let currentLogFile = null;
+let logCursor = null;  // { file, offset } des aktuellen Logs für inkrementelle Abrufe
+
+// Maximale Anzahl angezeigter Zeilen bei Auto-Refresh
+const MAX_LOG_LINES = 5000;
 
 function loadLogs() {
     const logType = document.getElementById('log-type').value;
@@ -27,6 +31,7 @@ function loadLogs() {
     }
     
     logContent.textContent = 'Lade Logs...';
+    logCursor = null;
     
     let endpoint = '/api/logs/current';
     if (logType === 'system') {
@@ -37,6 +42,9 @@ function loadLogs() {
         .then(response => response.json())
         .then(data => {
             if (data.success) {
+                if (logType === 'current' && data.filename) {
+                    logCursor = { file: data.filename, offset: data.offset };
+                }
                 displayLogs(data.logs, data.lines);
                 document.getElementById('last-update').textContent = new Date().toLocaleString('de-DE');
             } else {
@@ -50,6 +58,38 @@ function loadLogs() {
         });
 }
 
+/**
+ * Auto-Refresh: Beim aktuellen Log nur die seit dem letzten Abruf
+ * angehängten Zeilen laden (offset), sonst komplett neu laden
+ */
+function refreshLogs() {
+    const logType = document.getElementById('log-type').value;
+    
+    if (logType !== 'current' || !logCursor) {
+        loadLogs();
+        return;
+    }
+    
+    fetch(`/api/logs/current?offset=${logCursor.offset}&file=${encodeURIComponent(logCursor.file)}`)
+        .then(response => response.json())
+        .then(data => {
+            if (!data.success || !data.filename) {
+                return;
+            }
+            
+            logCursor = { file: data.filename, offset: data.offset };
+            if (data.reset) {
+                displayLogs(data.logs, data.lines);
+            } else if (data.lines > 0) {
+                appendLogs(data.logs);
+            }
+            document.getElementById('last-update').textContent = new Date().toLocaleString('de-DE');
+        })
+        .catch(error => {
+            console.error('Log-Fehler:', error);
+        });
+}
+
 function loadArchivedLogFiles() {
     fetch('/api/logs/archived')
         .then(response => response.json())
@@ -120,30 +160,7 @@ function displayLogs(logs, lineCount) {
     }
     
     // Highlighte Log-Zeilen basierend auf Keywords
-    const lines = logs.split('\n');
-    const highlightedLines = lines.map(line => {
-        let className = '';
-        const lowerLine = line.toLowerCase();
-        
-        // MQTT-Zeilen markieren (zusätzlich zur Log-Level-Klasse)
-        const isMqtt = lowerLine.includes('mqtt');
-        
-        if (lowerLine.includes('error') || lowerLine.includes('fehler') || lowerLine.includes('failed')) {
-            className = 'log-line-error';
-        } else if (lowerLine.includes('warning') || lowerLine.includes('warnung') || lowerLine.includes('warn')) {
-            className = 'log-line-warning';
-        } else if (lowerLine.includes('success') || lowerLine.includes('erfolgreich') || lowerLine.includes('completed')) {
-            className = 'log-line-success';
-        } else if (lowerLine.includes('info') || lowerLine.includes('start')) {
-            className = 'log-line-info';
-        }
-        
-        if (isMqtt) {
-            className += ' log-line-mqtt';
-        }
-        
-        return `<div class="log-line ${className}">${escapeHtml(line)}</div>`;
-    });
+    const highlightedLines = logs.replace(/\n$/, '').split('\n').map(renderLogLine);
     
     logContent.innerHTML = highlightedLines.join('');
     
@@ -155,6 +172,56 @@ function displayLogs(logs, lineCount) {
     filterLogs();
 }
 
+function renderLogLine(line) {
+    let className = '';
+    const lowerLine = line.toLowerCase();
+    
+    // MQTT-Zeilen markieren (zusätzlich zur Log-Level-Klasse)
+    const isMqtt = lowerLine.includes('mqtt');
+    
+    if (lowerLine.includes('error') || lowerLine.includes('fehler') || lowerLine.includes('failed')) {
+        className = 'log-line-error';
+    } else if (lowerLine.includes('warning') || lowerLine.includes('warnung') || lowerLine.includes('warn')) {
+        className = 'log-line-warning';
+    } else if (lowerLine.includes('success') || lowerLine.includes('erfolgreich') || lowerLine.includes('completed')) {
+        className = 'log-line-success';
+    } else if (lowerLine.includes('info') || lowerLine.includes('start')) {
+        className = 'log-line-info';
+    }
+    
+    if (isMqtt) {
+        className += ' log-line-mqtt';
+    }
+    
+    return `<div class="log-line ${className}">${escapeHtml(line)}</div>`;
+}
+
+function appendLogs(logs) {
+    const logContent = document.getElementById('log-content');
+    const viewer = document.getElementById('log-viewer');
+    const atBottom = viewer.scrollHeight - viewer.scrollTop - viewer.clientHeight < 20;
+    
+    if (logContent.querySelector('.no-logs')) {
+        logContent.innerHTML = '';
+    }
+    
+    const lines = logs.replace(/\n$/, '').split('\n');
+    logContent.insertAdjacentHTML('beforeend', lines.map(renderLogLine).join(''));
+    
+    // Anzeige begrenzen (älteste Zeilen entfernen)
+    while (logContent.childElementCount > MAX_LOG_LINES) {
+        logContent.removeChild(logContent.firstElementChild);
+    }
+    document.getElementById('log-lines').textContent = logContent.childElementCount;
+    
+    // Nur mitscrollen, wenn der Benutzer am Ende war
+    if (atBottom) {
+        viewer.scrollTop = viewer.scrollHeight;
+    }
+    
+    filterLogs();
+}
+
 function escapeHtml(text) {
     const div = document.createElement('div');
     div.textContent = text;
@@ -233,7 +300,7 @@ function toggleAutoRefresh() {
     const enabled = document.getElementById('auto-refresh').checked;
     
     if (enabled) {
-        autoRefreshInterval = setInterval(loadLogs, 5000);
+        autoRefreshInterval = setInterval(refreshLogs, 5000);
     } else {
         if (autoRefreshInterval) {
             clearInterval(autoRefreshInterval);
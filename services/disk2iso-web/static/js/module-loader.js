@@ -175,6 +175,90 @@
         return moduleConfig.files.every(file => loadedScripts.has(file));
     };
     
+    /**
+     * Dashboard-Aggregation: Alle Widgets einer Seite teilen sich einen
+     * Request auf /api/dashboard statt je einen eigenen Timer + Fetch.
+     * Pro Tick werden nur die Widgets angefragt, deren Intervall abgelaufen ist.
+     */
+    const DASHBOARD_TICK = 5000;
+    const dashboardWidgets = {};
+    let dashboardTimer = null;
+    let dashboardScheduled = false;
+    
+    function refreshDashboard(force) {
+        const now = Date.now();
+        const due = Object.keys(dashboardWidgets).filter(
+            name => force || dashboardWidgets[name].due <= now
+        );
+        if (due.length === 0) return;
+        
+        due.forEach(name => {
+            dashboardWidgets[name].due = now + dashboardWidgets[name].interval;
+        });
+        
+        fetch(`/api/dashboard?widgets=${encodeURIComponent(due.join(','))}`)
+            .then(response => response.json())
+            .then(data => {
+                const widgets = data.widgets || {};
+                due.forEach(name => {
+                    const widget = dashboardWidgets[name];
+                    if (widgets[name]) {
+                        widget.handler(widgets[name]);
+                    } else if (widget.onError) {
+                        widget.onError(new Error(data.error || 'Keine Daten'));
+                    }
+                });
+            })
+            .catch(error => {
+                console.error('[Dashboard] Fehler beim Laden der Widgets:', error);
+                due.forEach(name => {
+                    if (dashboardWidgets[name].onError) {
+                        dashboardWidgets[name].onError(error);
+                    }
+                });
+            });
+    }
+    
+    function scheduleDashboard() {
+        // Registrierungen beim Seitenaufbau in einem Request bündeln
+        if (!dashboardScheduled) {
+            dashboardScheduled = true;
+            const run = () => {
+                dashboardScheduled = false;
+                refreshDashboard(false);
+            };
+            if (document.readyState === 'loading') {
+                document.addEventListener('DOMContentLoaded', run);
+            } else {
+                setTimeout(run, 0);
+            }
+        }
+        if (!dashboardTimer) {
+            dashboardTimer = setInterval(() => refreshDashboard(false), DASHBOARD_TICK);
+        }
+    }
+    
+    window.disk2isoDashboard = {
+        /**
+         * Registriert ein Widget für die gebündelte Aktualisierung
+         * @param {string} name - Widget-Name (siehe dashboard.py)
+         * @param {Function} handler - Erhält den Payload des Widget-Endpoints
+         * @param {number} interval - Aktualisierungsintervall in ms
+         * @param {Function} [onError] - Wird bei Fehlern aufgerufen
+         */
+        register: function(name, handler, interval, onError) {
+            dashboardWidgets[name] = { handler, onError, interval, due: 0 };
+            scheduleDashboard();
+        },
+        
+        /**
+         * Aktualisiert sofort alle registrierten Widgets
+         */
+        refresh: function() {
+            refreshDashboard(true);
+        }
+    };
+    
     // Starte Loading sobald DOM bereit ist
     if (document.readyState === 'loading') {
         document.addEventListener('DOMContentLoaded', initializeModules);
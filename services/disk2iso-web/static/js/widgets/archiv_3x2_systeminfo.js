@@ -72,6 +72,14 @@ function showArchivWidgetError() {
 
 // Auto-Update alle 60 Sekunden (Archive ändern sich langsam)
 if (document.getElementById('systeminfo-archiv-widget')) {
-    loadArchivWidget();
-    setInterval(loadArchivWidget, 60000);
+    if (window.disk2isoDashboard) {
+        window.disk2isoDashboard.register('archiv', data => {
+            if (data.success && data.archive_counts) {
+                updateArchivWidget(data.archive_counts);
+            }
+        }, 60000, showArchivWidgetError);
+    } else {
+        loadArchivWidget();
+        setInterval(loadArchivWidget, 60000);
+    }
 }
@@ -110,7 +110,21 @@ if (typeof renderSoftwareRow !== 'function') {
         fetch(`/api/software/install/${softwareName}`, { method: 'POST' })
             .then(response => response.json())
             .then(data => {
-                if (data.success) {
+                if (!data.success) {
+                    return { state: 'failed', error: data.error };
+                }
+                // Installation läuft als Hintergrund-Job
+                return window.disk2isoJobs.watch(data.job_id, {
+                    key: 'software_install',
+                    onUpdate: job => {
+                        if (job.progress !== null) {
+                            buttonElement.innerHTML = `<span class="btn-icon">⌛</span> Installiere... ${Math.round(job.progress)}%`;
+                        }
+                    }
+                });
+            })
+            .then(job => {
+                if (job.state === 'succeeded') {
                     buttonElement.innerHTML = '<span class="btn-icon">✅</span> Fertig!';
                     buttonElement.classList.add('btn-success');
                     
@@ -121,7 +135,7 @@ if (typeof renderSoftwareRow !== 'function') {
                 } else {
                     buttonElement.innerHTML = '<span class="btn-icon">❌</span> Fehler';
                     buttonElement.classList.add('btn-error');
-                    console.error('Installation fehlgeschlagen:', data.error);
+                    console.error('Installation fehlgeschlagen:', job.error);
                     
                     // Button nach 3 Sekunden zurücksetzen
                     setTimeout(() => {
@@ -166,5 +180,20 @@ if (typeof toggleCategory !== 'function') {
 
 // Auto-Load (kein Auto-Update nötig, Software ändert sich nicht oft)
 if (document.getElementById('systeminfo-dependencies-widget')) {
-    loadSystemInfoDependencies();
+    if (window.disk2isoDashboard) {
+        // Einmalig mit dem gebündelten Request laden
+        window.disk2isoDashboard.register('dependencies', data => {
+            if (data.success && data.software) {
+                updateSystemInfoDependencies(data.software);
+            }
+        }, Infinity, showSystemInfoDependenciesError);
+    } else {
+        loadSystemInfoDependencies();
+    }
+    
+    // Nach Reload: laufende Installation weiter verfolgen und danach neu laden
+    const pendingInstall = window.disk2isoJobs && window.disk2isoJobs.resume('software_install');
+    if (pendingInstall) {
+        pendingInstall.then(() => loadSystemInfoDependencies()).catch(() => {});
+    }
 }
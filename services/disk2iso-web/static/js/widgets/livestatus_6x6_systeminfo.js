@@ -1,141 +1,246 @@
 /**
  * Widget: livestatus_6x6_systeminfo - Live Status Dashboard
  * Zeigt Echtzeit-Status des disk2iso Service mit Kopierfortschritt
- * Version: 1.2.0
+ * Version: 1.3.0
+ *
+ * Updates kommen per Server-Sent Events (/api/events, Typ "status"),
+ * Polling von /api/status nur ohne SSE-Verbindung.
+ *
+ * Bei mehreren Laufwerken (Liste "drives", api/drives.json) wird statt der
+ * Einzelanzeige ein Block je Laufwerk dargestellt.
  */
 
 (function() {
     let updateInterval = null;
+    let serviceRunning = false;
+    let lastTimestamp = null;
 
     /**
-     * Aktualisiert Live Status Anzeige
+     * Aktualisiert Live Status Anzeige (Polling-Fallback und Initialisierung)
      */
     function updateLiveStatus() {
         fetch('/api/status')
             .then(response => response.json())
             .then(data => {
-                const live = data.live_status;
-                const statusIndicator = document.getElementById('live-status-indicator');
-                const statusLabel = document.getElementById('live-status-label');
-                const discMediumRow = document.getElementById('disc-medium-row');
-                const discMedium = document.getElementById('disc-medium');
-                const discModeRow = document.getElementById('disc-mode-row');
-                const discMode = document.getElementById('disc-mode');
-                
-                // Prüfe ob Service läuft
-                const serviceRunning = data.service_running;
-                
-                // Intelligente Status-Erkennung
-                let statusText = window.i18n?.STATUS_UNKNOWN || 'Unknown';
-                let statusClass = 'stopped';
-                
-                if (!serviceRunning) {
-                    // Service läuft nicht
-                    statusText = window.i18n?.STATUS_SERVICE_STOPPED || 'Service stopped';
-                    statusClass = 'stopped';
-                } else if (live.status === 'idle') {
-                    // Service läuft, aber idle
-                    // Prüfe ob jemals ein Laufwerk erkannt wurde (anhand von method oder disc_type)
-                    if (!live.method || live.method === 'unknown') {
-                        statusText = window.i18n?.STATUS_NO_DRIVE || 'No drive detected';
-                        statusClass = 'stopped';
-                    } else {
-                        statusText = window.i18n?.STATUS_WAITING_MEDIA || 'Waiting for media...';
-                        statusClass = 'stopped';
-                    }
-                } else if (live.status === 'waiting') {
-                    statusText = window.i18n?.STATUS_ANALYZING || 'Analyzing media...';
-                    statusClass = 'stopped';
-                } else if (live.status === 'waiting_for_metadata') {
-                    statusText = window.i18n?.STATUS_WAITING_FOR_METADATA || 'Waiting for metadata selection...';
-                    statusClass = 'stopped';
-                } else if (live.status === 'copying') {
-                    statusText = window.i18n?.STATUS_COPYING || 'Copying...';
-                    statusClass = 'copying';
-                } else if (live.status === 'completed') {
-                    statusText = window.i18n?.STATUS_COMPLETED || 'Completed';
-                    statusClass = 'running';
-                } else if (live.status === 'error') {
-                    statusText = window.i18n?.STATUS_ERROR || 'Error occurred';
-                    statusClass = 'stopped';
-                }
-                
-                statusLabel.textContent = statusText;
-                statusIndicator.className = 'status-indicator ' + statusClass;
-                
-                // Medium anzeigen (ISO-Dateiname)
-                if (live.disc_label) {
-                    discMediumRow.classList.remove('inactive');
-                    discMedium.textContent = live.disc_label;
-                } else {
-                    discMediumRow.classList.add('inactive');
-                    discMedium.textContent = '-';
-                }
-                
-                // Modus anzeigen (Disc-Typ + Methode)
-                if (live.disc_type && live.disc_type !== '-' && live.disc_type !== '') {
-                    discModeRow.classList.remove('inactive');
-                    const method = live.method && live.method !== 'unknown' ? ` (${live.method})` : '';
-                    discMode.textContent = `${live.disc_type}${method}`;
-                } else {
-                    discModeRow.classList.add('inactive');
-                    discMode.textContent = '-';
-                }
-                
-                // Fortschritt anzeigen wenn kopiert wird
-                const progressRow = document.getElementById('progress-row');
-                const progressBarContainer = document.getElementById('progress-bar');
-                const etaRow = document.getElementById('eta-row');
-                
-                if (live.status === 'copying' && live.progress_percent > 0) {
-                    progressRow.classList.remove('inactive');
-                    progressBarContainer.classList.remove('inactive');
-                    etaRow.classList.remove('inactive');
-                    
-                    document.getElementById('progress-percent').textContent = live.progress_percent;
-                    document.getElementById('progress-mb').textContent = live.progress_mb;
-                    document.getElementById('total-mb').textContent = live.total_mb;
-                    document.getElementById('eta-text').textContent = live.eta || '-';
-                    
-                    // Einheit basierend auf Disc-Typ setzen
-                    const progressUnit = document.getElementById('progress-unit');
-                    if (live.disc_type === 'audio-cd') {
-                        progressUnit.textContent = 'Tracks';
-                    } else {
-                        progressUnit.textContent = 'MB';
-                    }
-                    
-                    // Overlay zeigt verbleibenden Teil (100 - Fortschritt)
-                    const progressOverlay = progressBarContainer.querySelector('.progress-overlay-copying');
-                    const remainingPercent = 100 - live.progress_percent;
-                    progressOverlay.style.width = remainingPercent + '%';
-                    progressBarContainer.setAttribute('data-label', live.progress_percent + '%');
-                } else {
-                    progressRow.classList.add('inactive');
-                    progressBarContainer.classList.add('inactive');
-                    etaRow.classList.add('inactive');
-                    
-                    document.getElementById('progress-percent').textContent = '0';
-                    document.getElementById('progress-mb').textContent = '0';
-                    document.getElementById('total-mb').textContent = '0';
-                    document.getElementById('eta-text').textContent = '-';
-                    
-                    // Overlay auf 100% (alles grau)
-                    const progressOverlay = progressBarContainer.querySelector('.progress-overlay-copying');
-                    if (progressOverlay) {
-                        progressOverlay.style.width = '100%';
-                    }
-                    progressBarContainer.setAttribute('data-label', '0%');
-                }
-                
-                // Live Status für globalen Zugriff speichern (für Service Restart Warning)
-                window.liveStatus = live;
+                serviceRunning = data.service_running;
+                lastTimestamp = data.live_status.timestamp;
+                renderLiveStatus(data.live_status);
+                renderDrives(data.drives || [], data.live_status);
             })
             .catch(error => {
                 console.error('Fehler beim Laden der Live-Daten:', error);
             });
     }
 
+    /**
+     * Ermittelt Statustext und CSS-Klasse des Status-Indikators
+     */
+    function describeStatus(live) {
+        // Intelligente Status-Erkennung
+        let statusText = window.i18n?.STATUS_UNKNOWN || 'Unknown';
+        let statusClass = 'stopped';
+        
+        if (!serviceRunning) {
+            // Service läuft nicht
+            statusText = window.i18n?.STATUS_SERVICE_STOPPED || 'Service stopped';
+            statusClass = 'stopped';
+        } else if (live.status === 'idle') {
+            // Service läuft, aber idle
+            // Prüfe ob jemals ein Laufwerk erkannt wurde (anhand von method oder disc_type)
+            if (!live.method || live.method === 'unknown') {
+                statusText = window.i18n?.STATUS_NO_DRIVE || 'No drive detected';
+                statusClass = 'stopped';
+            } else {
+                statusText = window.i18n?.STATUS_WAITING_MEDIA || 'Waiting for media...';
+                statusClass = 'stopped';
+            }
+        } else if (live.status === 'waiting') {
+            statusText = window.i18n?.STATUS_ANALYZING || 'Analyzing media...';
+            statusClass = 'stopped';
+        } else if (live.status === 'waiting_for_metadata') {
+            statusText = window.i18n?.STATUS_WAITING_FOR_METADATA || 'Waiting for metadata selection...';
+            statusClass = 'stopped';
+        } else if (live.status === 'copying') {
+            statusText = window.i18n?.STATUS_COPYING || 'Copying...';
+            statusClass = 'copying';
+        } else if (live.status === 'completed') {
+            statusText = window.i18n?.STATUS_COMPLETED || 'Completed';
+            statusClass = 'running';
+        } else if (live.status === 'error') {
+            statusText = window.i18n?.STATUS_ERROR || 'Error occurred';
+            statusClass = 'stopped';
+        }
+        
+        return { text: statusText, cssClass: statusClass };
+    }
+
+    /**
+     * Rendert den Live-Status
+     */
+    function renderLiveStatus(live) {
+        const statusIndicator = document.getElementById('live-status-indicator');
+        const statusLabel = document.getElementById('live-status-label');
+        const discMediumRow = document.getElementById('disc-medium-row');
+        const discMedium = document.getElementById('disc-medium');
+        const discModeRow = document.getElementById('disc-mode-row');
+        const discMode = document.getElementById('disc-mode');
+        
+        const statusInfo = describeStatus(live);
+        statusLabel.textContent = statusInfo.text;
+        statusIndicator.className = 'status-indicator ' + statusInfo.cssClass;
+        
+        // Medium anzeigen (ISO-Dateiname)
+        if (live.disc_label) {
+            discMediumRow.classList.remove('inactive');
+            discMedium.textContent = live.disc_label;
+        } else {
+            discMediumRow.classList.add('inactive');
+            discMedium.textContent = '-';
+        }
+        
+        // Modus anzeigen (Disc-Typ + Methode)
+        if (live.disc_type && live.disc_type !== '-' && live.disc_type !== '') {
+            discModeRow.classList.remove('inactive');
+            const method = live.method && live.method !== 'unknown' ? ` (${live.method})` : '';
+            discMode.textContent = `${live.disc_type}${method}`;
+        } else {
+            discModeRow.classList.add('inactive');
+            discMode.textContent = '-';
+        }
+        
+        // Fortschritt anzeigen wenn kopiert wird
+        const progressRow = document.getElementById('progress-row');
+        const progressBarContainer = document.getElementById('progress-bar');
+        const etaRow = document.getElementById('eta-row');
+        
+        if (live.status === 'copying' && live.progress_percent > 0) {
+            progressRow.classList.remove('inactive');
+            progressBarContainer.classList.remove('inactive');
+            etaRow.classList.remove('inactive');
+            
+            document.getElementById('progress-percent').textContent = live.progress_percent;
+            document.getElementById('progress-mb').textContent = live.progress_mb;
+            document.getElementById('total-mb').textContent = live.total_mb;
+            document.getElementById('eta-text').textContent = live.eta || '-';
+            
+            // Einheit basierend auf Disc-Typ setzen
+            const progressUnit = document.getElementById('progress-unit');
+            if (live.disc_type === 'audio-cd') {
+                progressUnit.textContent = 'Tracks';
+            } else {
+                progressUnit.textContent = 'MB';
+            }
+            
+            // Overlay zeigt verbleibenden Teil (100 - Fortschritt)
+            const progressOverlay = progressBarContainer.querySelector('.progress-overlay-copying');
+            const remainingPercent = 100 - live.progress_percent;
+            progressOverlay.style.width = remainingPercent + '%';
+            progressBarContainer.setAttribute('data-label', live.progress_percent + '%');
+        } else {
+            progressRow.classList.add('inactive');
+            progressBarContainer.classList.add('inactive');
+            etaRow.classList.add('inactive');
+            
+            document.getElementById('progress-percent').textContent = '0';
+            document.getElementById('progress-mb').textContent = '0';
+            document.getElementById('total-mb').textContent = '0';
+            document.getElementById('eta-text').textContent = '-';
+            
+            // Overlay auf 100% (alles grau)
+            const progressOverlay = progressBarContainer.querySelector('.progress-overlay-copying');
+            if (progressOverlay) {
+                progressOverlay.style.width = '100%';
+            }
+            progressBarContainer.setAttribute('data-label', '0%');
+        }
+        
+        // Live Status für globalen Zugriff speichern (für Service Restart Warning)
+        window.liveStatus = live;
+    }
+
+    /**
+     * Erzeugt eine Info-Zeile (Label + Wert) für einen Laufwerks-Block
+     */
+    function createRow(label, value, inactive) {
+        const row = document.createElement('div');
+        row.className = 'info-row' + (inactive ? ' inactive' : '');
+        const labelEl = document.createElement('span');
+        labelEl.className = 'info-label';
+        labelEl.textContent = label;
+        const valueEl = document.createElement('span');
+        valueEl.className = 'info-value';
+        valueEl.textContent = value;
+        row.append(labelEl, valueEl);
+        return row;
+    }
+
+    /**
+     * Rendert einen Block je Laufwerk (nur bei mehreren Laufwerken)
+     */
+    function renderDrives(drives, live) {
+        const single = document.getElementById('live-single-drive');
+        const list = document.getElementById('live-drive-list');
+        
+        if (drives.length < 2) {
+            single.hidden = false;
+            list.hidden = true;
+            list.replaceChildren();
+            return;
+        }
+        
+        const blocks = drives.map(drive => {
+            const block = document.createElement('div');
+            block.className = 'drive-block';
+            
+            // Kopfzeile: Laufwerk + Status
+            const statusInfo = describeStatus(drive);
+            const header = document.createElement('div');
+            header.className = 'info-row';
+            const name = document.createElement('span');
+            name.className = 'info-label';
+            name.textContent = drive.name;
+            const device = document.createElement('span');
+            device.className = 'drive-device';
+            device.textContent = drive.device;
+            name.append(device);
+            const status = document.createElement('span');
+            status.className = 'info-value';
+            const indicator = document.createElement('span');
+            indicator.className = 'status-indicator ' + statusInfo.cssClass;
+            status.append(indicator, document.createTextNode(' ' + statusInfo.text));
+            header.append(name, status);
+            block.append(header);
+            
+            // Medium und Modus
+            const hasDisc = drive.disc_type && drive.disc_type !== '-';
+            const method = drive.method && drive.method !== 'unknown' ? ` (${drive.method})` : '';
+            block.append(createRow(window.i18n?.INDEX_DISC_NAME || 'Media', drive.disc_label || '-', !drive.disc_label));
+            block.append(createRow(window.i18n?.INDEX_MODE || 'Mode', hasDisc ? `${drive.disc_type}${method}` : '-', !hasDisc));
+            
+            // Fortschritt nur beim Kopieren
+            if (drive.status === 'copying' && drive.progress_percent > 0) {
+                const bar = document.createElement('div');
+                bar.className = 'progress-bar';
+                const background = document.createElement('div');
+                background.className = 'progress-background-copying';
+                const overlay = document.createElement('div');
+                overlay.className = 'progress-overlay-copying';
+                overlay.style.width = (100 - drive.progress_percent) + '%';
+                bar.append(background, overlay);
+                bar.setAttribute('data-label', drive.progress_percent + '%' + (drive.eta ? ` - ${drive.eta}` : ''));
+                block.append(bar);
+            }
+            return block;
+        });
+        
+        list.replaceChildren(...blocks);
+        single.hidden = true;
+        list.hidden = false;
+        
+        // Service Restart Warning: laufender Vorgang auf irgendeinem Laufwerk
+        window.liveStatus = drives.find(d => d.status === 'copying' || d.status === 'analyzing') || live;
+    }
+
     // Widget-Initialisierung
     if (document.readyState === 'loading') {
         document.addEventListener('DOMContentLoaded', initWidget);
@@ -144,11 +249,24 @@
     }
 
     function initWidget() {
-        // Initialer Aufruf
+        // Initialer Aufruf (inkl. Service-Status)
         updateLiveStatus();
         
-        // Alle 5 Sekunden aktualisieren
-        updateInterval = setInterval(updateLiveStatus, 5000);
+        if (window.disk2isoEvents) {
+            // Push bei Änderung, Polling nur ohne SSE-Verbindung
+            window.disk2isoEvents.subscribe('status', (payload) => {
+                // Neuer Status-Zeitstempel kann nur vom laufenden Daemon stammen
+                if (payload.live_status.timestamp !== lastTimestamp) {
+                    serviceRunning = true;
+                    lastTimestamp = payload.live_status.timestamp;
+                }
+                renderLiveStatus(payload.live_status);
+                renderDrives(payload.drives || [], payload.live_status);
+            }, updateLiveStatus, 5000);
+        } else {
+            // Alle 5 Sekunden aktualisieren
+            updateInterval = setInterval(updateLiveStatus, 5000);
+        }
     }
 
     // Export für eventuellen manuellen Stop
@@ -41,6 +41,14 @@ function updateOutputDirWidget(outputDir, diskSpace) {
 
 // Auto-Update alle 30 Sekunden (Speicherplatz ändert sich langsam)
 if (document.getElementById('systeminfo-outputdir-widget')) {
-    loadOutputDirWidget();
-    setInterval(loadOutputDirWidget, 30000);
+    if (window.disk2isoDashboard) {
+        window.disk2isoDashboard.register('outputdir', data => {
+            if (data.success && data.disk_space) {
+                updateOutputDirWidget(data.output_dir, data.disk_space);
+            }
+        }, 30000);
+    } else {
+        loadOutputDirWidget();
+        setInterval(loadOutputDirWidget, 30000);
+    }
 }
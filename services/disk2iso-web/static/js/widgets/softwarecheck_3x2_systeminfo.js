@@ -113,8 +113,18 @@ function showSoftwareCheckError() {
 
 // Auto-Load + Auto-Update (alle 5 Minuten)
 if (document.getElementById('systeminfo-softwarecheck-widget')) {
-    loadSoftwareCheckStatus();
-    
-    // Aktualisiere alle 5 Minuten
-    setInterval(loadSoftwareCheckStatus, 300000);
+    if (window.disk2isoDashboard) {
+        window.disk2isoDashboard.register('softwarecheck', data => {
+            if (data.success && data.software) {
+                updateSoftwareCheckStatus(data.software);
+            } else {
+                showSoftwareCheckError();
+            }
+        }, 300000, showSoftwareCheckError);
+    } else {
+        loadSoftwareCheckStatus();
+        
+        // Aktualisiere alle 5 Minuten
+        setInterval(loadSoftwareCheckStatus, 300000);
+    }
 }
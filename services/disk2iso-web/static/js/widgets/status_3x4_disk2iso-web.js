@@ -86,6 +86,14 @@ if (typeof restartServiceWidget !== 'function') {
 
 // Auto-Update alle 10 Sekunden
 if (document.getElementById('disk2iso-web-service-widget')) {
-    loadDisk2IsoWebServiceWidget();
-    setInterval(loadDisk2IsoWebServiceWidget, 10000);
+    if (window.disk2isoDashboard) {
+        window.disk2isoDashboard.register('disk2iso_web_status', data => {
+            if (data.success) {
+                updateDisk2IsoWebServiceWidget(data);
+            }
+        }, 10000);
+    } else {
+        loadDisk2IsoWebServiceWidget();
+        setInterval(loadDisk2IsoWebServiceWidget, 10000);
+    }
 }
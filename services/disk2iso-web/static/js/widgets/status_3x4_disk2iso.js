@@ -79,6 +79,14 @@ function restartServiceWidget(serviceName) {
 
 // Auto-Update alle 10 Sekunden
 if (document.getElementById('disk2iso-service-widget')) {
-    loadDisk2IsoServiceWidget();
-    setInterval(loadDisk2IsoServiceWidget, 10000);
+    if (window.disk2isoDashboard) {
+        window.disk2isoDashboard.register('disk2iso_status', data => {
+            if (data.success) {
+                updateDisk2IsoServiceWidget(data);
+            }
+        }, 10000);
+    } else {
+        loadDisk2IsoServiceWidget();
+        setInterval(loadDisk2IsoServiceWidget, 10000);
+    }
 }
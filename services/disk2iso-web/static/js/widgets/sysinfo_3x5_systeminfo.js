@@ -31,6 +31,14 @@ function updateSystemInfoWidget(osInfo) {
 
 // Auto-Update alle 30 Sekunden (Systeminfo ändert sich selten)
 if (document.getElementById('systeminfo-widget')) {
-    loadSystemInfoWidget();
-    setInterval(loadSystemInfoWidget, 30000);
+    if (window.disk2isoDashboard) {
+        window.disk2isoDashboard.register('sysinfo', data => {
+            if (data.success && data.os) {
+                updateSystemInfoWidget(data.os);
+            }
+        }, 30000);
+    } else {
+        loadSystemInfoWidget();
+        setInterval(loadSystemInfoWidget, 30000);
+    }
 }
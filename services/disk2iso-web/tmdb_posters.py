@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso TMDB Poster - Paralleler Download mit Poster-Cache
+Version 1.3.0
+
+- Ein gemeinsamer HTTP-Session-Pool (Keep-Alive, keine TLS-Handshakes
+  pro Poster) und ein begrenzter Thread-Pool für parallele Downloads
+- Poster werden einmal pro URL gespeichert (thumbs/by-hash/<sha256>.jpg)
+  und pro ISO nur verlinkt ({iso_basename}_{tmdb_id}.jpg)
+- 404-Antworten werden negativ gecacht (NEGATIVE_TTL), damit fehlende
+  Poster nicht bei jeder Suche erneut angefragt werden
+- Gleichzeitige Anfragen für dasselbe Poster teilen sich einen Download
+"""
+
+import os
+import re
+import sys
+import time
+import shutil
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import metrics
+
+# Basis-URL der Poster (überschreibbar, z.B. für lokale Tests)
+IMAGE_BASE_URL = os.environ.get('DISK2ISO_TMDB_IMAGE_BASE', 'https://image.tmdb.org/t/p/w500')
+
+USER_AGENT = 'disk2iso/1.3.0 (DVD/Blu-ray Metadata Client)'
+
+# Maximale Anzahl paralleler Downloads (= Größe des Connection-Pools)
+MAX_WORKERS = 4
+
+REQUEST_TIMEOUT = 10
+
+# Fehlende Poster (404) so lange nicht erneut anfragen (Sekunden)
+NEGATIVE_TTL = 24 * 3600
+
+# Unterverzeichnis für die Poster-Dateien (nach URL-Hash)
+HASH_DIR = 'by-hash'
+
+# Wartezeit der Suche auf Poster, langsamere werden vom Client nachgeladen
+SEARCH_WAIT = 1.5
+
+# Erlaubte TMDB poster_path Werte (z.B. /abc123.jpg)
+POSTER_PATH_PATTERN = re.compile(r'^/[A-Za-z0-9_-]+\.(jpg|jpeg|png)$')
+
+_session = None
+_session_lock = threading.Lock()
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='tmdb-poster')
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _get_session():
+    """Liefert die gemeinsame requests.Session (lazy, Pool = MAX_WORKERS)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=MAX_WORKERS)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers['User-Agent'] = USER_AGENT
+            _session = session
+        return _session
+
+
+def poster_url(poster_path: str) -> str:
+    return f'{IMAGE_BASE_URL}{poster_path}'
+
+
+def url_hash(url: str) -> str:
+    return hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]
+
+
+class PosterCache:
+    """Poster-Cache in einem thumbs-Verzeichnis (output_dir/.temp/tmdb/thumbs)."""
+
+    def __init__(self, thumbs_dir):
+        self.thumbs_dir = Path(thumbs_dir)
+        self.hash_dir = self.thumbs_dir / HASH_DIR
+
+    def _paths(self, poster_path: str) -> Tuple[Path, Path]:
+        digest = url_hash(poster_url(poster_path))
+        suffix = Path(poster_path).suffix or '.jpg'
+        return self.hash_dir / f'{digest}{suffix}', self.hash_dir / f'{digest}.missing'
+
+    def cached(self, poster_path: str) -> Optional[Path]:
+        """Pfad des gecachten Posters oder None."""
+        target, _ = self._paths(poster_path)
+        return target if target.is_file() else None
+
+    def known_missing(self, poster_path: str) -> bool:
+        """True wenn das Poster kürzlich mit 404 beantwortet wurde."""
+        _, missing = self._paths(poster_path)
+        try:
+            return time.time() - missing.stat().st_mtime < NEGATIVE_TTL
+        except OSError:
+            return False
+
+    def _download(self, poster_path: str) -> Optional[Path]:
+        target, missing = self._paths(poster_path)
+        if target.is_file():
+            return target
+        if self.known_missing(poster_path):
+            return None
+
+        response = _get_session().get(poster_url(poster_path), timeout=REQUEST_TIMEOUT)
+        if response.status_code == 404:
+            self.hash_dir.mkdir(parents=True, exist_ok=True)
+            missing.touch()
+            return None
+        response.raise_for_status()
+
+        # Atomar schreiben - parallele Leser sehen nie halbe Dateien
+        self.hash_dir.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f'.{target.name}.{threading.get_ident()}.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(response.content)
+        os.replace(tmp, target)
+        return target
+
+    def fetch(self, poster_path: str) -> Future:
+        """
+        Startet den Download eines Posters (oder schließt sich einem
+        laufenden Download an).
+
+        Returns:
+            Future mit dem Pfad der Poster-Datei oder None (nicht vorhanden)
+        """
+        target, _ = self._paths(poster_path)
+        with _inflight_lock:
+            future = _inflight.get(str(target))
+            if future is None:
+                future = _executor.submit(self._download, poster_path)
+                _inflight[str(target)] = future
+                future.add_done_callback(lambda _: self._done(str(target)))
+            return future
+
+    @staticmethod
+    def _done(key: str):
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+    def link(self, source: Path, link_name: str) -> Path:
+        """Verlinkt ein Poster unter einem ISO-spezifischen Namen."""
+        link_path = self.thumbs_dir / link_name
+        try:
+            if os.path.samefile(link_path, source):
+                return link_path
+            link_path.unlink()
+        except FileNotFoundError:
+            pass
+        try:
+            os.link(source, link_path)
+        except FileExistsError:
+            # Parallel bereits verlinkt
+            pass
+        except OSError:
+            # Hardlinks nicht unterstützt (z.B. manche Netzwerk-Dateisysteme)
+            shutil.copyfile(source, link_path)
+        return link_path
+
+    def fetch_many(self, items: Iterable[Tuple[str, str]], timeout: float) -> Dict[str, Optional[str]]:
+        """
+        Lädt mehrere Poster parallel und verlinkt sie pro ISO.
+
+        Args:
+            items: (poster_path, link_name) Paare
+            timeout: Maximale Wartezeit; danach laufen offene Downloads im
+                     Hintergrund weiter und werden bei Abschluss verlinkt
+
+        Returns:
+            Dict link_name -> Dateiname im thumbs-Verzeichnis, None (kein
+            Poster) oder 'pending' (Download läuft noch)
+        """
+        result: Dict[str, Optional[str]] = {}
+        pending = []
+        self.thumbs_dir.mkdir(parents=True, exist_ok=True)
+
+        for poster_path, link_name in items:
+            if not POSTER_PATH_PATTERN.match(poster_path or ''):
+                result[link_name] = None
+                continue
+            cached = self.cached(poster_path)
+            metrics.record_cache('tmdb_posters', cached is not None)
+            if cached is not None:
+                result[link_name] = self.link(cached, link_name).name
+                continue
+            if self.known_missing(poster_path):
+                result[link_name] = None
+                continue
+            future = self.fetch(poster_path)
+            future.add_done_callback(lambda f, name=link_name: self._link_done(f, name))
+            pending.append((future, link_name))
+
+        done, _ = wait([future for future, _ in pending], timeout=timeout)
+        for future, link_name in pending:
+            if future not in done:
+                result[link_name] = 'pending'
+                continue
+            try:
+                path = future.result()
+            except Exception as e:
+                print(f"[WARN] Poster download failed for {link_name}: {e}", file=sys.stderr)
+                path = None
+            # Callback läuft evtl. erst nach wait() - hier direkt verlinken
+            result[link_name] = self.link(path, link_name).name if path is not None else None
+
+        return result
+
+    def _link_done(self, future: Future, link_name: str):
+        try:
+            path = future.result()
+            if path is not None:
+                self.link(path, link_name)
+        except Exception:
+            pass
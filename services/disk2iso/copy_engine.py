@@ -0,0 +1,776 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso Copy Engine - Schnelle Kopie optischer Medien in ein ISO-Image
+Version 1.3.0
+
+Ersatz für den Fallback 'dd bs=2048' (ein Syscall pro Sektor), aufgerufen
+von common_copy_data_disc_native() in libcommon.sh:
+
+- Liest große, ausgerichtete Blöcke (Standard 4 MiB, optional O_DIRECT)
+- Double-Buffering: Lese- und Schreib-Thread arbeiten parallel auf einem
+  festen Puffer-Pool (os.preadv/os.pwrite geben den GIL frei)
+- Lesefehler: der betroffene Block wird sektorweise gelesen, unlesbare
+  Sektoren werden mit Nullen aufgefüllt (wie dd conv=noerror,sync) und in
+  einer Map im ddrescue-Format festgehalten
+- Fortschritt als Statuszeilen auf stderr ("progress <bytes> <fehler>\\r"),
+  ausgewertet von common_read_copy_progress() im Format "native"
+- Prüfsummen (md5, sha256, blake3) im selben Durchlauf: je Algorithmus ein
+  Thread, der den Puffer parallel zum Schreiben verarbeitet (hashlib gibt
+  den GIL frei). Ergebnis als "<algorithmus> <hex>" Zeilen (--checksums),
+  libcommon.sh erzeugt daraus nach erfolgreicher Kopie die Sidecar-Dateien
+
+Der Modus 'verify' vergleicht eine fertige ISO mit der Disc: die Disc wird
+sequentiell in großen Blöcken gelesen, Worker-Threads lesen den passenden
+ISO-Bereich und vergleichen die Hashes beider Blöcke. Abweichende Sektoren
+werden gesammelt und mit --repair gezielt neu gelesen und in die ISO
+geschrieben (nur wenn der erneute Lesevorgang dasselbe Ergebnis liefert).
+
+Der Modus 'hash' berechnet dieselben Prüfsummen aus stdin oder einer Datei
+(dd ... | tee ISO | copy_engine.py hash) für die Methoden dd und ddrescue.
+
+Quelle kann auch eine Image-Datei oder ein Loop-Device sein:
+
+    copy_engine.py copy /dev/sr0 /media/iso/data/disc.iso --size 4700000000
+    copy_engine.py bench disc.img     # Vergleich mit dd bs=2048
+    copy_engine.py hash --algorithms md5,sha256 --checksums out.sums < disc.iso
+    copy_engine.py verify /dev/sr0 disc.iso --repair --report verify.json
+"""
+
+import os
+import sys
+import json
+import mmap
+import time
+import queue
+import signal
+import hashlib
+import argparse
+import collections
+import tempfile
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+# BLAKE3 ist nicht in hashlib enthalten (optional: pip install blake3)
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+SECTOR_SIZE = 2048
+DEFAULT_CHUNK_MB = 4
+BUFFERS = 2
+DEFAULT_RETRIES = 1
+
+# Abstand der Statuszeilen (Sekunden)
+PROGRESS_INTERVAL = 0.5
+
+# Unterstützte Prüfsummen-Algorithmen
+HASH_ALGORITHMS = ('md5', 'sha256', 'blake3')
+
+# Worker-Threads der Verifikation
+DEFAULT_VERIFY_WORKERS = 2
+
+# Höchstens so viele Bereiche je Art in Log und Bericht
+MAX_REPORTED_RANGES = 100
+
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_MISMATCH = 2
+EXIT_INTERRUPTED = 130
+
+
+class CopyError(Exception):
+    """Nicht behebbarer Fehler (Quelle/Ziel nicht nutzbar, Schreibfehler)."""
+
+
+def new_hash(algorithm: str):
+    """Erzeugt ein Hash-Objekt (None wenn der Algorithmus nicht verfügbar ist)."""
+    if algorithm == 'blake3':
+        return blake3.blake3(max_threads=blake3.blake3.AUTO) if blake3 is not None else None
+    if algorithm in HASH_ALGORITHMS:
+        return hashlib.new(algorithm)
+    raise ValueError(f'Unbekannter Prüfsummen-Algorithmus: {algorithm}')
+
+
+def parse_algorithms(text: Optional[str]) -> List[str]:
+    """Zerlegt "md5,sha256" bzw. "md5 sha256" (nicht verfügbare werden übersprungen)."""
+    result = []
+    for algorithm in (text or '').replace(',', ' ').lower().split():
+        if algorithm in result:
+            continue
+        if new_hash(algorithm) is None:
+            print(f'copy_engine: {algorithm} nicht verfügbar - übersprungen', file=sys.stderr)
+            continue
+        result.append(algorithm)
+    return result
+
+
+def read_sectors(fd: int, buf: memoryview, offset: int, sector_size: int, retries: int,
+                 stop: Optional[threading.Event] = None) -> Tuple[int, List[Tuple[int, int]]]:
+    """
+    Liest einen Bereich sektorweise (nach einem Lesefehler im ganzen Block).
+
+    Unlesbare Sektoren werden mit Nullen gefüllt (wie dd conv=noerror,sync).
+
+    Returns:
+        (gelesene Bytes, Liste der unlesbaren Bereiche als (offset, länge))
+    """
+    done = 0
+    bad = []
+    length = len(buf)
+    while done < length and not (stop is not None and stop.is_set()):
+        count = min(sector_size, length - done)
+        view = buf[done:done + count]
+        n = None
+        for _ in range(max(1, retries)):
+            try:
+                n = os.preadv(fd, [view], offset + done)
+                break
+            except OSError:
+                n = None
+        if n is None:
+            view[:] = bytes(count)
+            bad.append((offset + done, count))
+            n = count
+        elif n == 0:
+            break
+        done += n
+    return done, bad
+
+
+class Hasher(threading.Thread):
+    """
+    Berechnet eine Prüfsumme in einem eigenen Thread.
+
+    feed() übergibt einen Puffer, wait() wartet bis er verarbeitet ist -
+    erst danach darf der Puffer wiederverwendet werden.
+    """
+
+    def __init__(self, algorithm: str):
+        super().__init__(name=f'hash-{algorithm}', daemon=True)
+        self.algorithm = algorithm
+        self.hash = new_hash(algorithm)
+        self.queue: queue.Queue = queue.Queue()
+        self.start()
+
+    def run(self):
+        while True:
+            view = self.queue.get()
+            if view is not None:
+                self.hash.update(view)
+            self.queue.task_done()
+
+    def feed(self, view: memoryview):
+        self.queue.put(view)
+
+    def wait(self):
+        self.queue.join()
+
+    def hexdigest(self) -> str:
+        self.wait()
+        return self.hash.hexdigest()
+
+
+def write_checksums(path: str, hashers: List[Hasher]):
+    """Schreibt die Ergebnisse atomar als "<algorithmus> <hex>" Zeilen."""
+    tmp = f'{path}.tmp'
+    with open(tmp, 'w', encoding='ascii') as f:
+        for hasher in hashers:
+            f.write(f'{hasher.algorithm} {hasher.hexdigest()}\n')
+    os.replace(tmp, path)
+
+
+class CopyEngine:
+    """
+    Kopiert eine Quelle blockweise mit getrenntem Lese- und Schreib-Thread.
+
+    Args:
+        source: Device oder Image-Datei
+        dest: Ziel-Datei (wird neu angelegt)
+        size: Zu kopierende Bytes (None = bis Dateiende)
+        chunk_size: Blockgröße (Vielfaches von sector_size)
+        sector_size: Sektorgröße für die Fehlerbehandlung
+        direct: Quelle mit O_DIRECT lesen (am Page-Cache vorbei)
+        retries: Leseversuche pro Sektor nach einem Fehler
+        algorithms: Prüfsummen, die beim Schreiben mitberechnet werden
+    """
+
+    def __init__(self, source: str, dest: str, size: Optional[int] = None,
+                 chunk_size: int = DEFAULT_CHUNK_MB * 1024 * 1024,
+                 sector_size: int = SECTOR_SIZE, direct: bool = False,
+                 retries: int = DEFAULT_RETRIES, algorithms: Optional[List[str]] = None):
+        if chunk_size % sector_size:
+            raise ValueError('chunk_size muss ein Vielfaches der Sektorgröße sein')
+        self.source = source
+        self.dest = dest
+        self.size = size
+        self.chunk_size = chunk_size
+        self.sector_size = sector_size
+        self.direct = direct
+        self.retries = max(1, retries)
+        self.copied = 0
+        self.bad_sectors: List[Tuple[int, int]] = []
+        self.stop = threading.Event()
+        self.interrupted = False
+        self.error: Optional[BaseException] = None
+        self.hashers = [Hasher(algorithm) for algorithm in (algorithms or [])]
+
+    # ------------------------------------------------------------------
+    # Lesen
+    # ------------------------------------------------------------------
+
+    def _open_source(self) -> Tuple[int, int]:
+        """Öffnet die Quelle (mit O_DIRECT falls möglich) und ohne für Einzelsektoren."""
+        plain = os.open(self.source, os.O_RDONLY)
+        fd = plain
+        if self.direct and hasattr(os, 'O_DIRECT'):
+            try:
+                fd = os.open(self.source, os.O_RDONLY | os.O_DIRECT)
+            except OSError:
+                fd = plain
+        return fd, plain
+
+    def _read_sectors(self, fd: int, buf: memoryview, offset: int, length: int) -> int:
+        """Liest einen fehlerhaften Block sektorweise, unlesbare Sektoren = Nullen."""
+        done, bad = read_sectors(fd, buf[:length], offset, self.sector_size, self.retries, self.stop)
+        self.bad_sectors.extend(bad)
+        return done
+
+    def _reader(self, fd: int, plain_fd: int, free: queue.Queue, filled: queue.Queue):
+        offset = 0
+        try:
+            while not self.stop.is_set():
+                length = self.chunk_size
+                if self.size is not None:
+                    length = min(length, self.size - offset)
+                    if length <= 0:
+                        break
+                buf = free.get()
+                view = memoryview(buf)[:length]
+                try:
+                    n = os.preadv(fd, [view], offset)
+                except OSError:
+                    n = self._read_sectors(plain_fd, view, offset, length)
+                if n == 0:
+                    free.put(buf)
+                    break
+                filled.put((buf, offset, n))
+                offset += n
+                if n < length and self.size is None:
+                    break
+        except BaseException as e:
+            self.error = e
+            self.stop.set()
+        finally:
+            filled.put(None)
+
+    # ------------------------------------------------------------------
+    # Schreiben
+    # ------------------------------------------------------------------
+
+    def _writer(self, out: int, free: queue.Queue, filled: queue.Queue):
+        last_report = 0.0
+        try:
+            while True:
+                item = filled.get()
+                if item is None:
+                    break
+                buf, offset, length = item
+                view = memoryview(buf)[:length]
+                for hasher in self.hashers:
+                    hasher.feed(view)
+                written = 0
+                while written < length:
+                    written += os.pwrite(out, view[written:], offset + written)
+                for hasher in self.hashers:
+                    hasher.wait()
+                free.put(buf)
+                self.copied = offset + length
+
+                now = time.monotonic()
+                if now - last_report >= PROGRESS_INTERVAL:
+                    last_report = now
+                    self.report()
+        except BaseException as e:
+            self.error = CopyError(f'Schreibfehler: {e}')
+            self.stop.set()
+            # Leser nicht blockieren lassen (wartet evtl. auf freie Puffer)
+            while True:
+                item = filled.get()
+                if item is None:
+                    break
+                free.put(item[0])
+
+    def report(self):
+        """Statuszeile für common_read_copy_progress()."""
+        sys.stderr.write(f'progress {self.copied} {len(self.bad_sectors)}\r')
+        sys.stderr.flush()
+
+    # ------------------------------------------------------------------
+    # Ablauf
+    # ------------------------------------------------------------------
+
+    def run(self) -> float:
+        """
+        Führt die Kopie aus.
+
+        Returns:
+            Laufzeit in Sekunden
+
+        Raises:
+            CopyError: Quelle/Ziel nicht nutzbar oder Schreibfehler
+        """
+        try:
+            fd, plain_fd = self._open_source()
+        except OSError as e:
+            raise CopyError(f'Quelle nicht lesbar: {e}')
+        try:
+            out = os.open(self.dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        except OSError as e:
+            raise CopyError(f'Ziel nicht beschreibbar: {e}')
+
+        # mmap liefert page-aligned Puffer (Voraussetzung für O_DIRECT)
+        free: queue.Queue = queue.Queue()
+        for _ in range(BUFFERS):
+            free.put(mmap.mmap(-1, self.chunk_size))
+        filled: queue.Queue = queue.Queue(maxsize=BUFFERS)
+
+        start = time.monotonic()
+        reader = threading.Thread(target=self._reader, args=(fd, plain_fd, free, filled), daemon=True)
+        writer = threading.Thread(target=self._writer, args=(out, free, filled), daemon=True)
+        reader.start()
+        writer.start()
+        try:
+            while writer.is_alive():
+                writer.join(0.5)
+        finally:
+            self.stop.set()
+            reader.join()
+            for handle in {fd, plain_fd, out}:
+                os.close(handle)
+        self.report()
+
+        if self.error is not None:
+            if isinstance(self.error, CopyError):
+                raise self.error
+            raise CopyError(str(self.error))
+        if self.size is not None and self.copied < self.size:
+            raise CopyError(f'Quelle endet nach {self.copied} von {self.size} Bytes')
+        return time.monotonic() - start
+
+    def write_map(self, path: str):
+        """Schreibt die Sektor-Map im ddrescue-Format (+ gelesen, - defekt)."""
+        blocks = []
+        pos = 0
+        for bad_pos, bad_size in sorted(self.bad_sectors):
+            if blocks and blocks[-1][2] == '-' and blocks[-1][0] + blocks[-1][1] == bad_pos:
+                blocks[-1] = (blocks[-1][0], blocks[-1][1] + bad_size, '-')
+            else:
+                if bad_pos > pos:
+                    blocks.append((pos, bad_pos - pos, '+'))
+                blocks.append((bad_pos, bad_size, '-'))
+            pos = bad_pos + bad_size
+        if self.copied > pos:
+            blocks.append((pos, self.copied - pos, '+'))
+
+        tmp = f'{path}.tmp'
+        with open(tmp, 'w', encoding='ascii') as f:
+            f.write('# Mapfile. Created by disk2iso copy_engine\n')
+            f.write('# current_pos  current_status  current_pass\n')
+            f.write(f'0x{self.copied:08X}     +               1\n')
+            f.write('#      pos        size  status\n')
+            for block_pos, block_size, status in blocks:
+                f.write(f'0x{block_pos:08X}  0x{block_size:08X}  {status}\n')
+        os.replace(tmp, path)
+
+
+class Verifier:
+    """
+    Vergleicht eine ISO mit der Quelle (Disc) und repariert Abweichungen.
+
+    Die Quelle wird vom Haupt-Thread sequentiell gelesen (optische Laufwerke
+    vertragen keine parallelen Zugriffe), ISO-Lesen und Hashen laufen auf
+    den Worker-Threads. Pro abweichendem Block werden die betroffenen
+    Sektoren mit einem kurzen Hash der gelesenen Disc-Daten gemerkt;
+    repair() liest die Daten erneut von der Disc.
+
+    Args:
+        source: Device oder Image-Datei
+        iso: Zu prüfende ISO
+        size: Zu prüfende Bytes (None = Größe der ISO)
+        chunk_size: Blockgröße (Vielfaches von sector_size)
+        sector_size: Sektorgröße (Auflösung der Abweichungen)
+        workers: Anzahl Worker-Threads
+        retries: Leseversuche pro Sektor nach einem Fehler
+    """
+
+    def __init__(self, source: str, iso: str, size: Optional[int] = None,
+                 chunk_size: int = DEFAULT_CHUNK_MB * 1024 * 1024,
+                 sector_size: int = SECTOR_SIZE, workers: int = DEFAULT_VERIFY_WORKERS,
+                 retries: int = DEFAULT_RETRIES):
+        if chunk_size % sector_size:
+            raise ValueError('chunk_size muss ein Vielfaches der Sektorgröße sein')
+        self.source = source
+        self.iso = iso
+        self.size = size
+        self.chunk_size = chunk_size
+        self.sector_size = sector_size
+        self.workers = max(1, workers)
+        self.retries = max(1, retries)
+        self.checked = 0
+        # Sektor -> Hash der Disc-Daten beim Prüfen (nicht die Daten selbst)
+        self.mismatched: Dict[int, bytes] = {}
+        self.unreadable: List[int] = []
+        self.repaired: List[int] = []
+        self.stop = threading.Event()
+        self.interrupted = False
+
+    def _compare(self, iso_fd: int, offset: int, data: bytes, skip: set) -> Dict[int, bytes]:
+        """Worker: ISO-Bereich lesen, Hashes vergleichen, ggf. sektorweise eingrenzen."""
+        iso_data = os.pread(iso_fd, len(data), offset)
+        if len(iso_data) == len(data) and \
+                hashlib.blake2b(data, digest_size=16).digest() == \
+                hashlib.blake2b(iso_data, digest_size=16).digest():
+            return {}
+        result = {}
+        for pos in range(0, len(data), self.sector_size):
+            sector = (offset + pos) // self.sector_size
+            if sector in skip:
+                continue
+            disc_sector = data[pos:pos + self.sector_size]
+            if iso_data[pos:pos + self.sector_size] != disc_sector:
+                result[sector] = _sector_digest(disc_sector)
+        return result
+
+    def run(self) -> float:
+        """
+        Prüft die komplette ISO.
+
+        Returns:
+            Laufzeit in Sekunden
+
+        Raises:
+            CopyError: Quelle/ISO nicht lesbar
+        """
+        try:
+            src_fd = os.open(self.source, os.O_RDONLY)
+        except OSError as e:
+            raise CopyError(f'Quelle nicht lesbar: {e}')
+        try:
+            iso_fd = os.open(self.iso, os.O_RDONLY)
+        except OSError as e:
+            os.close(src_fd)
+            raise CopyError(f'ISO nicht lesbar: {e}')
+
+        size = self.size if self.size is not None else os.fstat(iso_fd).st_size
+        start = time.monotonic()
+        last_report = 0.0
+        pending = collections.deque()
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='verify') as pool:
+                offset = 0
+                while offset < size and not self.stop.is_set():
+                    length = min(self.chunk_size, size - offset)
+                    buf = bytearray(length)
+                    skip = set()
+                    try:
+                        n = os.preadv(src_fd, [buf], offset)
+                    except OSError:
+                        n, bad = read_sectors(src_fd, memoryview(buf), offset,
+                                              self.sector_size, self.retries, self.stop)
+                        for bad_pos, bad_size in bad:
+                            skip.add(bad_pos // self.sector_size)
+                    if n == 0:
+                        raise CopyError(f'Quelle endet nach {offset} von {size} Bytes')
+                    self.unreadable.extend(sorted(skip))
+                    pending.append((offset + n, pool.submit(self._compare, iso_fd, offset,
+                                                            bytes(buf[:n]), skip)))
+                    offset += n
+
+                    # Höchstens zwei Blöcke pro Worker im Speicher
+                    while pending and (len(pending) > 2 * self.workers or pending[0][1].done()):
+                        end, future = pending.popleft()
+                        self.mismatched.update(future.result())
+                        self.checked = end
+                    now = time.monotonic()
+                    if now - last_report >= PROGRESS_INTERVAL:
+                        last_report = now
+                        self.report()
+
+                while pending:
+                    end, future = pending.popleft()
+                    self.mismatched.update(future.result())
+                    self.checked = end
+        finally:
+            os.close(src_fd)
+            os.close(iso_fd)
+        self.report()
+        return time.monotonic() - start
+
+    def repair(self):
+        """
+        Liest die abweichenden Sektoren erneut und schreibt sie in die ISO,
+        wenn die Disc zweimal dasselbe liefert (sonst bleibt der Sektor als
+        abweichend gemeldet).
+        """
+        if not self.mismatched:
+            return
+        src_fd = os.open(self.source, os.O_RDONLY)
+        iso_fd = os.open(self.iso, os.O_WRONLY)
+        try:
+            for first, count in ranges(self.mismatched):
+                if self.stop.is_set():
+                    break
+                offset = first * self.sector_size
+                buf = bytearray(count * self.sector_size)
+                n, bad = read_sectors(src_fd, memoryview(buf), offset,
+                                      self.sector_size, self.retries, self.stop)
+                bad_sectors = {pos // self.sector_size for pos, _ in bad}
+                for index in range(count):
+                    sector = first + index
+                    data = bytes(buf[index * self.sector_size:(index + 1) * self.sector_size])
+                    if sector in bad_sectors or _sector_digest(data) != self.mismatched[sector]:
+                        continue
+                    os.pwrite(iso_fd, data, offset + index * self.sector_size)
+                    self.repaired.append(sector)
+            os.fsync(iso_fd)
+        finally:
+            os.close(src_fd)
+            os.close(iso_fd)
+        for sector in self.repaired:
+            del self.mismatched[sector]
+
+    def report(self):
+        """Statuszeile für common_read_copy_progress() (Fehler = Abweichungen)."""
+        sys.stderr.write(f'progress {self.checked} {len(self.mismatched)}\r')
+        sys.stderr.flush()
+
+    def result(self) -> Dict:
+        """Ergebnis für attributes.json (Bereiche als [Sektor, Anzahl])."""
+        if self.mismatched:
+            status = 'mismatch'
+        elif self.repaired:
+            status = 'repaired'
+        else:
+            status = 'ok'
+        return {
+            'status': status,
+            'checked_bytes': self.checked,
+            'sector_size': self.sector_size,
+            'mismatched_sectors': len(self.mismatched),
+            'repaired_sectors': len(self.repaired),
+            'unreadable_sectors': len(self.unreadable),
+            'mismatched': [list(r) for r in ranges(self.mismatched)[:MAX_REPORTED_RANGES]],
+            'repaired': [list(r) for r in ranges(self.repaired)[:MAX_REPORTED_RANGES]],
+            'unreadable': [list(r) for r in ranges(self.unreadable)[:MAX_REPORTED_RANGES]],
+        }
+
+
+def _sector_digest(data: bytes) -> bytes:
+    """Kurzer Hash eines Sektors (Vergleich beim erneuten Lesen in repair())."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def ranges(sectors) -> List[Tuple[int, int]]:
+    """Fasst Sektornummern zu (erster Sektor, Anzahl) Bereichen zusammen."""
+    result = []
+    for sector in sorted(sectors):
+        if result and result[-1][0] + result[-1][1] == sector:
+            result[-1] = (result[-1][0], result[-1][1] + 1)
+        else:
+            result.append((sector, 1))
+    return result
+
+
+def _format_rate(size: int, seconds: float) -> str:
+    return f'{size / max(seconds, 1e-6) / 1000000:.1f} MB/s'
+
+
+def cmd_copy(args) -> int:
+    engine = CopyEngine(args.source, args.dest, size=args.size,
+                        chunk_size=args.chunk_mb * 1024 * 1024,
+                        sector_size=args.sector_size, direct=args.direct,
+                        retries=args.retries, algorithms=parse_algorithms(args.algorithms))
+
+    def _terminate(*_):
+        engine.interrupted = True
+        engine.stop.set()
+
+    signal.signal(signal.SIGTERM, _terminate)
+    try:
+        seconds = engine.run()
+    except CopyError as e:
+        if engine.interrupted:
+            print(f'\ncopy_engine: abgebrochen nach {engine.copied} Bytes', file=sys.stderr)
+            return EXIT_INTERRUPTED
+        print(f'\ncopy_engine: {e}', file=sys.stderr)
+        return EXIT_ERROR
+    finally:
+        if args.badmap:
+            engine.write_map(args.badmap)
+
+    if engine.interrupted:
+        return EXIT_INTERRUPTED
+    if args.checksums and engine.hashers:
+        write_checksums(args.checksums, engine.hashers)
+    print(f'\ncopy_engine: {engine.copied} Bytes in {seconds:.1f} s ({_format_rate(engine.copied, seconds)}), '
+          f'{len(engine.bad_sectors)} defekte Sektoren', file=sys.stderr)
+    return EXIT_OK
+
+
+def cmd_verify(args) -> int:
+    verifier = Verifier(args.source, args.iso, size=args.size,
+                        chunk_size=args.chunk_mb * 1024 * 1024,
+                        sector_size=args.sector_size, workers=args.workers,
+                        retries=args.retries)
+
+    def _terminate(*_):
+        verifier.interrupted = True
+        verifier.stop.set()
+
+    signal.signal(signal.SIGTERM, _terminate)
+    try:
+        seconds = verifier.run()
+        if args.repair and not verifier.interrupted:
+            verifier.repair()
+            verifier.report()
+    except (CopyError, OSError) as e:
+        print(f'\ncopy_engine: {e}', file=sys.stderr)
+        return EXIT_ERROR
+    if verifier.interrupted:
+        return EXIT_INTERRUPTED
+
+    result = verifier.result()
+    # Bereiche landen über common_read_copy_progress() im Kopiervorgang-Log
+    print('', file=sys.stderr)
+    for key, label in (('mismatched', 'Abweichung'), ('repaired', 'Repariert'),
+                       ('unreadable', 'Nicht lesbar')):
+        for first, count in result[key]:
+            print(f'{label}: Sektor {first}-{first + count - 1} ({count} Sektoren)', file=sys.stderr)
+    print(f'copy_engine: {verifier.checked} Bytes in {seconds:.1f} s geprüft '
+          f'({_format_rate(verifier.checked, seconds)}), {result["mismatched_sectors"]} abweichend, '
+          f'{result["repaired_sectors"]} repariert, {result["unreadable_sectors"]} nicht lesbar',
+          file=sys.stderr)
+
+    if args.report:
+        tmp = f'{args.report}.tmp'
+        with open(tmp, 'w', encoding='ascii') as f:
+            json.dump(result, f, separators=(',', ':'))
+        os.replace(tmp, args.report)
+    return EXIT_MISMATCH if result['status'] == 'mismatch' else EXIT_OK
+
+
+def cmd_hash(args) -> int:
+    """Prüfsummen aus stdin oder einer Datei (Double-Buffering wie beim Kopieren)."""
+    hashers = [Hasher(algorithm) for algorithm in parse_algorithms(args.algorithms)]
+    if not hashers:
+        print('copy_engine: keine Prüfsumme ausgewählt', file=sys.stderr)
+        return EXIT_ERROR
+    chunk_size = args.chunk_mb * 1024 * 1024
+    buffers = [bytearray(chunk_size) for _ in range(BUFFERS)]
+    current = 0
+    try:
+        if args.input:
+            source = open(args.input, 'rb', buffering=0)
+        else:
+            source = open(sys.stdin.fileno(), 'rb', buffering=0, closefd=False)
+        with source:
+            while True:
+                # Nächsten Puffer lesen, während der vorige gehasht wird
+                buf = buffers[current]
+                filled = 0
+                while filled < chunk_size:
+                    n = source.readinto(memoryview(buf)[filled:])
+                    if not n:
+                        break
+                    filled += n
+                for hasher in hashers:
+                    hasher.wait()
+                if filled:
+                    view = memoryview(buf)[:filled]
+                    for hasher in hashers:
+                        hasher.feed(view)
+                if filled < chunk_size:
+                    break
+                current = (current + 1) % BUFFERS
+    except OSError as e:
+        print(f'copy_engine: {e}', file=sys.stderr)
+        return EXIT_ERROR
+    write_checksums(args.checksums, hashers)
+    return EXIT_OK
+
+
+def cmd_bench(args) -> int:
+    """Vergleicht die Engine mit 'dd bs=2048' auf derselben Quelle."""
+    size = args.size or os.stat(args.source).st_size
+    with tempfile.TemporaryDirectory(dir=args.tmpdir) as tmp:
+        target = os.path.join(tmp, 'bench.iso')
+
+        engine = CopyEngine(args.source, target, size=size,
+                            chunk_size=args.chunk_mb * 1024 * 1024, direct=args.direct)
+        engine.report = lambda: None
+        seconds = engine.run()
+        print(f'copy_engine ({args.chunk_mb} MiB{", O_DIRECT" if args.direct else ""}): '
+              f'{seconds:.2f} s, {_format_rate(size, seconds)}')
+
+        start = time.monotonic()
+        subprocess.run(['dd', f'if={args.source}', f'of={target}', f'bs={SECTOR_SIZE}',
+                        f'count={size // SECTOR_SIZE}', 'conv=noerror,sync', 'status=none'], check=True)
+        seconds = time.monotonic() - start
+        print(f'dd bs={SECTOR_SIZE}: {seconds:.2f} s, {_format_rate(size, seconds)}')
+    return EXIT_OK
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='disk2iso Copy Engine')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    copy = sub.add_parser('copy', help='Quelle in ein Image kopieren')
+    copy.add_argument('source')
+    copy.add_argument('dest')
+    copy.add_argument('--size', type=int, help='Anzahl Bytes (Standard: bis Dateiende)')
+    copy.add_argument('--chunk-mb', type=int, default=DEFAULT_CHUNK_MB)
+    copy.add_argument('--sector-size', type=int, default=SECTOR_SIZE)
+    copy.add_argument('--direct', action='store_true', help='Quelle mit O_DIRECT lesen')
+    copy.add_argument('--retries', type=int, default=DEFAULT_RETRIES)
+    copy.add_argument('--badmap', help='Sektor-Map (ddrescue-Format) schreiben')
+    copy.add_argument('--algorithms', help='Prüfsummen, z.B. "md5,sha256,blake3"')
+    copy.add_argument('--checksums', help='Ergebnisdatei der Prüfsummen')
+    copy.set_defaults(func=cmd_copy)
+
+    verify = sub.add_parser('verify', help='ISO mit der Quelle vergleichen')
+    verify.add_argument('source')
+    verify.add_argument('iso')
+    verify.add_argument('--size', type=int, help='Anzahl Bytes (Standard: Größe der ISO)')
+    verify.add_argument('--chunk-mb', type=int, default=DEFAULT_CHUNK_MB)
+    verify.add_argument('--sector-size', type=int, default=SECTOR_SIZE)
+    verify.add_argument('--workers', type=int, default=DEFAULT_VERIFY_WORKERS)
+    verify.add_argument('--retries', type=int, default=DEFAULT_RETRIES)
+    verify.add_argument('--repair', action='store_true', help='Abweichende Sektoren neu lesen und schreiben')
+    verify.add_argument('--report', help='Ergebnis als JSON schreiben')
+    verify.set_defaults(func=cmd_verify)
+
+    hash_cmd = sub.add_parser('hash', help='Prüfsummen aus stdin oder Datei berechnen')
+    hash_cmd.add_argument('--input', help='Datei (Standard: stdin)')
+    hash_cmd.add_argument('--algorithms', default='md5 sha256')
+    hash_cmd.add_argument('--checksums', required=True, help='Ergebnisdatei der Prüfsummen')
+    hash_cmd.add_argument('--chunk-mb', type=int, default=DEFAULT_CHUNK_MB)
+    hash_cmd.set_defaults(func=cmd_hash)
+
+    bench = sub.add_parser('bench', help='Durchsatz im Vergleich zu dd bs=2048 messen')
+    bench.add_argument('source')
+    bench.add_argument('--size', type=int)
+    bench.add_argument('--chunk-mb', type=int, default=DEFAULT_CHUNK_MB)
+    bench.add_argument('--direct', action='store_true')
+    bench.add_argument('--tmpdir', help='Verzeichnis für das Test-Image')
+    bench.set_defaults(func=cmd_bench)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
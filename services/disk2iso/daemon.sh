@@ -17,6 +17,7 @@
 #   - MD5-Checksummen für Datenintegrität
 #   - Fortschrittsanzeige mit pv (optional)
 #   - Service-Modus für automatischen Betrieb
+#   - Mehrere Laufwerke parallel (eine State Machine je Laufwerk)
 #   - Modulare Struktur mit lazy-loading
 
 # ============================================================================
@@ -44,6 +45,11 @@ readonly POLL_REMOVAL_INTERVAL=5
 # Globale State-Variable
 CURRENT_STATE="$STATE_INITIALIZING"
 
+# Mehrfach-Betrieb: Worker-PID je Laufwerk (Device-Pfad → PID) und
+# Reihenfolge der Laufwerke (erstes = primär)
+declare -A DRIVE_WORKERS=()
+DRIVE_ORDER=()
+
 # ============================================================================
 # DEBUG-MODUS
 # ============================================================================
@@ -246,6 +252,7 @@ fi
 copy_disc_to_iso() {
     #-- Ermittle Disc-Typ ---------------------------------------------------
     local disc_type="$(discinfo_get_type)"
+    local iso_file="$(discinfo_get_iso_filename)"
     local exit_code=0
     
     #-- Audio-CD: Delegiere an libaudio.sh ----------------------------------
@@ -264,6 +271,13 @@ copy_disc_to_iso() {
     else
         common_copy_data_disc
         exit_code=$?
+        
+        #-- Optional: 1:1-Kopie gegen die Disc prüfen (VERIFY_COPY) --------
+        # Verbleibende Abweichungen stehen in Log und attributes.json, die
+        # ISO bleibt erhalten (enthält mehr als ein erneuter Versuch)
+        if [[ $exit_code -eq 0 ]] && [[ "${VERIFY_COPY:-false}" == "true" ]]; then
+            common_verify_copy
+        fi
     fi
     
     #-- Cleanup mit explizitem Status (Success/Failure basierend auf Return-Code)
@@ -273,6 +287,9 @@ copy_disc_to_iso() {
         common_cleanup_disc_operation "failure"
     fi
     
+    #-- Archiv-Index der Web-UI informieren (neue oder entfernte ISO) -------
+    api_notify_archive_change "$iso_file"
+    
     return $exit_code
 }
 
@@ -328,8 +345,8 @@ run_state_machine() {
     
     transition_to_state "$STATE_INITIALIZING" "Initialisiere Service..."
     
-    # Sammle initiale System-Informationen
-    if declare -f collect_system_information >/dev/null 2>&1; then
+    # Sammle initiale System-Informationen (im Mehrfach-Betrieb nur primär)
+    if [[ "$DRIVE_PRIMARY" == "true" ]] && declare -f collect_system_information >/dev/null 2>&1; then
         collect_system_information
     fi
     
@@ -355,7 +372,7 @@ run_state_machine() {
                 # Laufwerk gefunden - stelle sicher dass es bereit ist
                 if ensure_device_ready "$CD_DEVICE"; then
                     # Aktualisiere System-Info mit Laufwerk-Informationen
-                    if declare -f collect_system_information >/dev/null 2>&1; then
+                    if [[ "$DRIVE_PRIMARY" == "true" ]] && declare -f collect_system_information >/dev/null 2>&1; then
                         collect_system_information
                     fi
                     transition_to_state "$STATE_WAITING_FOR_MEDIA" "$MSG_DRIVE_MONITORING_STARTED"
@@ -456,6 +473,117 @@ run_state_machine() {
     done
 }
 
+# ============================================================================
+# MEHRERE LAUFWERKE
+# ============================================================================
+
+# ===========================================================================
+# run_drive_worker()
+# ---------------------------------------------------------------------------
+# Funktion.: Worker für ein Laufwerk im Mehrfach-Betrieb - führt eine
+# .........  eigene State Machine aus (läuft als Subshell des Supervisors)
+# Parameter: $1 = Device-Pfad (z.B. /dev/sr1, Loop-Device oder Image-Datei)
+# .........  $2 = primär ("true"/"false", default: false)
+# Rückgabe.: läuft endlos (Exit nur via Signal SIGTERM)
+# Extras...: Eigener Prozess = eigenes DISC_INFO und CURRENT_STATE
+# .........  DRIVE_NAME trennt Temp-Verzeichnis (.temp/<name>) und
+# .........  API-Namensraum (api/drives/<name>/), LOG_PREFIX die Log-Zeilen
+# ===========================================================================
+run_drive_worker() {
+    CD_DEVICE="$1"
+    DRIVE_PRIMARY="${2:-false}"
+    DRIVE_NAME="$(drivestat_drive_name "$CD_DEVICE")"
+    LOG_PREFIX="[${DRIVE_NAME}] "
+    CURRENT_STATE="$STATE_INITIALIZING"
+    
+    # Subshells erben keine Signal-Handler
+    trap cleanup_drive_worker SIGTERM SIGINT
+    
+    if ! api_init_drive; then
+        log_error "$MSG_ERROR_DRIVE_API_INIT ${API_DIR}/drives/${DRIVE_NAME}"
+        exit 1
+    fi
+    
+    run_state_machine
+}
+
+# ===========================================================================
+# run_drive_supervisor()
+# ---------------------------------------------------------------------------
+# Funktion.: Startet je Laufwerk einen Worker (run_drive_worker) und
+# .........  überwacht diese
+# Parameter: $@ = Device-Pfade beim Start (erstes = primäres Laufwerk)
+# Rückgabe.: läuft endlos (Exit nur via Signal SIGTERM/SIGINT)
+# Extras...: Sucht alle POLL_DRIVE_INTERVAL Sekunden nach neuen Laufwerken
+# .........  (drivestat_list_drives) und startet beendete Worker neu
+# .........  Schreibt die Laufwerksliste nach api/drives.json
+# ===========================================================================
+run_drive_supervisor() {
+    local drives=("$@")
+    local device pid changed
+    
+    log_info "$MSG_MULTI_DRIVE_STARTED ${drives[*]}"
+    
+    while true; do
+        changed=false
+        
+        for device in "${drives[@]}"; do
+            pid="${DRIVE_WORKERS[$device]:-}"
+            
+            #-- Worker läuft noch ---------------------------------------------
+            if [[ -n "$pid" ]] && kill -0 "$pid" 2>/dev/null; then
+                continue
+            fi
+            
+            #-- Neues Laufwerk oder Worker beendet ----------------------------
+            if [[ -n "$pid" ]]; then
+                wait "$pid" 2>/dev/null
+                log_warning "$MSG_DRIVE_WORKER_RESTARTED $device"
+            else
+                DRIVE_ORDER+=("$device")
+                changed=true
+            fi
+            
+            if [[ "$device" == "${DRIVE_ORDER[0]}" ]]; then
+                run_drive_worker "$device" "true" &
+            else
+                run_drive_worker "$device" "false" &
+            fi
+            DRIVE_WORKERS[$device]=$!
+            log_info "$MSG_DRIVE_WORKER_STARTED $device (PID $!)"
+        done
+        
+        if [[ "$changed" == "true" ]]; then
+            api_write_drives "${DRIVE_ORDER[@]}"
+        fi
+        
+        # Unterbrechbar warten, damit SIGTERM sofort behandelt wird
+        sleep "$POLL_DRIVE_INTERVAL" &
+        wait $!
+        
+        # Bekannte Laufwerke bleiben (Worker wartet selbst auf Wiederkehr)
+        mapfile -t drives < <(drivestat_list_drives)
+        drives=("${DRIVE_ORDER[@]}" "${drives[@]}")
+    done
+}
+
+# ===========================================================================
+# cleanup_drive_worker()
+# ---------------------------------------------------------------------------
+# Funktion.: Signal-Handler des Laufwerks-Workers
+# Parameter: keine (wird von trap aufgerufen)
+# Rückgabe.: exit 0 (beendet Worker)
+# Extras...: Tötet die Kopierprozesse dieses Workers ($BASHPID, nicht $$ -
+# .........  das wäre der Supervisor) und räumt dessen Disc-Operation auf
+# ===========================================================================
+cleanup_drive_worker() {
+    pkill -P "$BASHPID" 2>/dev/null
+    sleep 2
+    
+    common_cleanup_disc_operation "interrupted"
+    exit 0
+}
+
 # ============================================================================
 # START & SIGNAL-HANDLING
 # ============================================================================
@@ -471,7 +599,8 @@ run_state_machine() {
 # Extras...: Verhindert manuelle Ausführung (nur systemd-Service)
 # .........  Validiert OUTPUT_DIR Existenz und Schreibrechte
 # .........  Alle Module bereits geladen (Zeile 74-184)
-# .........  Startet endlose State Machine Loop
+# .........  Startet endlose State Machine Loop, bei mehreren Laufwerken
+# .........  (oder gesetztem OPTICAL_DRIVES) eine je Laufwerk
 # ===========================================================================
 main() {
     # Prüfe ob als systemd-Service gestartet
@@ -592,6 +721,16 @@ main() {
     # Audio-CD: audio_check_dependencies() (optional)
     # Video-DVD/BD: dvd_check_dependencies(), bluray_check_dependencies() (optional)
     
+    # Mehrfach-Betrieb: eine State Machine je Laufwerk (Supervisor + Worker)
+    local drives=()
+    mapfile -t drives < <(drivestat_list_drives)
+    if [[ -n "${OPTICAL_DRIVES:-}" ]] || [[ ${#drives[@]} -gt 1 ]]; then
+        run_drive_supervisor "${drives[@]}"
+    fi
+    
+    # Einzelbetrieb: keine Laufwerksliste für die Web-UI
+    api_write_drives
+    
     # Starte State Machine (läuft endlos)
     # Die State Machine kümmert sich selbst um Laufwerk-Erkennung und Retry-Logik
     run_state_machine
@@ -617,6 +756,17 @@ cleanup_service() {
         mqtt_cleanup
     fi
     
+    # Mehrfach-Betrieb: Worker räumen selbst auf (cleanup_drive_worker)
+    if [[ ${#DRIVE_WORKERS[@]} -gt 0 ]]; then
+        local pid
+        for pid in "${DRIVE_WORKERS[@]}"; do
+            kill "$pid" 2>/dev/null      # Trap greift nach Ende des Kindprozesses
+            pkill -P "$pid" 2>/dev/null  # Laufende Kopie/sleep des Workers
+        done
+        wait "${DRIVE_WORKERS[@]}" 2>/dev/null
+        exit 0
+    fi
+    
     # Töte alle laufenden Kopierprozesse (dvdbackup, ddrescue, etc.)
     pkill -P $$ 2>/dev/null  # Töte alle Child-Prozesse
     sleep 2  # Warte bis Prozesse beendet sind